@@ -0,0 +1,58 @@
+# Copyright (c) 2025 Jonathon Fletcher
+import argparse
+import asyncio
+import logging
+import time
+
+import dotenv
+
+import common.messaging
+
+
+async def measure(batched: bool, count: int, size: int, /) -> float:
+    # msg/s from the first publish to the last payload received, through NATS - one
+    # MessageService publishing, another subscribed.
+    publisher = common.messaging.MessageService()
+    subscriber = common.messaging.MessageService()
+    received = 0
+    done = asyncio.Event()
+
+    async def cb(topic: str, payload: bytes, /) -> bytes:
+        nonlocal received
+        received += 1
+        if received == count:
+            done.set()
+
+    await subscriber.subscribe("PUB.BENCHMARK.BATCHING", cb, False)
+    await subscriber.start()
+    await publisher.start()
+    try:
+        payload = bytes(size)
+        start = time.perf_counter()
+        for _ in range(count):
+            if batched:
+                await publisher.publish_batched("PUB.BENCHMARK.BATCHING", payload)
+            else:
+                await publisher.publish("PUB.BENCHMARK.BATCHING", payload, False)
+        await asyncio.wait_for(done.wait(), 60)
+        return count / (time.perf_counter() - start)
+    finally:
+        await publisher.stop()
+        await subscriber.stop()
+
+
+async def async_main(count: int, size: int, /) -> None:
+    print(f"{'mode':<10} {'count':>8} {'bytes':>6} {'msg/s':>10}")
+    for batched in (False, True):
+        print(f"{'batched' if batched else 'single':<10} {count:>8} {size:>6} {await measure(batched, count, size):>10.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput of publish against publish_batched through NATS.")
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--size", type=int, default=40, help="payload bytes")
+    args = parser.parse_args()
+    dotenv.load_dotenv()
+    # The connections closing after each run are logged as warnings.
+    logging.basicConfig(level=logging.ERROR)
+    asyncio.run(async_main(args.count, args.size))
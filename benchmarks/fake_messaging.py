@@ -0,0 +1,83 @@
+# Copyright (c) 2025 Jonathon Fletcher
+import asyncio
+import collections
+import typing
+
+import nats.errors
+
+import common.messaging
+
+
+class FakeMessageService:
+    # Stands in for common.messaging.MessageService without NATS. Publishes are counted
+    # per topic, and requests are answered from canned replies keyed by topic pattern.
+
+    def __init__(self, /):
+        self.topic_callbacks: dict[str, list[typing.Callable]] = dict()
+        self.replies: dict[str, bytes | typing.Callable[[str, bytes], bytes]] = dict()
+        self.published: collections.Counter = collections.Counter()
+        self.published_bytes: collections.Counter = collections.Counter()
+        self.requested: collections.Counter = collections.Counter()
+        self.connected = asyncio.Event()
+        self.connected.set()
+        self.registry: typing.Any = None
+
+    def reply(self, pattern: str, response: bytes | typing.Callable[[str, bytes], bytes], /) -> None:
+        self.replies[pattern] = response
+
+    def reset(self, /) -> None:
+        self.published.clear()
+        self.published_bytes.clear()
+        self.requested.clear()
+
+    async def subscribe(self, topic: str, callback: typing.Callable, isqueue: bool, /, concurrent: bool = False) -> bool:
+        callbacks = self.topic_callbacks.setdefault(topic, list())
+        if callback in callbacks:
+            return False
+        callbacks.append(callback)
+        return True
+
+    async def unsubscribe(self, topic: str, callback: typing.Callable = None, /) -> None:
+        callbacks = self.topic_callbacks.get(topic, list())
+        if callback is not None and callback in callbacks:
+            callbacks.remove(callback)
+        if callback is None or not callbacks:
+            self.topic_callbacks.pop(topic, None)
+
+    def _record(self, topic: str, payload: bytes, /) -> None:
+        self.published[topic] += 1
+        self.published_bytes[topic] += len(payload)
+
+    async def publish(self, topic: str, payload: bytes, reply: bool, /, headers: dict = None, timeout: float = 10, hedge: float | None = None,
+                      raise_errors: bool = False) -> bytes:
+        if not reply:
+            self._record(topic, payload)
+            return None
+        self.requested[topic] += 1
+        for pattern, response in self.replies.items():
+            if common.messaging.MessageService.topic_match(pattern, topic):
+                return response(topic, payload) if callable(response) else response
+        if raise_errors:
+            raise nats.errors.NoRespondersError
+        return None
+
+    async def publish_latest(self, topic: str, payload: bytes, /) -> None:
+        self._record(topic, payload)
+
+    async def publish_batched(self, topic: str, payload: bytes, /) -> None:
+        self._record(topic, payload)
+
+    async def publish_batch(self, topic: str, payloads: typing.Sequence[bytes], /) -> None:
+        for payload in payloads:
+            self._record(topic, payload)
+
+    async def request_many(self, requests: typing.Iterable[tuple[str, bytes]], /, concurrency: int = 64, timeout: float = 10, hedge: float | None = None) -> list[common.messaging.Reply]:
+        replies = list()
+        for index, (topic, payload) in enumerate(requests):
+            try:
+                data = await self.publish(topic, payload, True, raise_errors=True)
+            except Exception as ex:
+                replies.append(common.messaging.Reply(index, topic, None, type(ex).__name__))
+                continue
+            replies.append(common.messaging.Reply(index, topic, data, None if data is not None else "no reply"))
+        return replies
@@ -0,0 +1,248 @@
+# Copyright (c) 2025 Jonathon Fletcher
+import argparse
+import asyncio
+import dataclasses
+import gc
+import json
+import logging
+import subprocess
+import time
+import tracemalloc
+import typing
+
+import benchmarks.fake_messaging
+import common.service
+import common.universe
+import poq_pb2 as poq
+import services.character_service
+import services.chatter_service
+import services.session_service
+import services.system_service
+
+
+@dataclasses.dataclass(frozen=True)
+class Result:
+    handler: str
+    population: int
+    ops: int
+    ops_per_sec: float
+    p50_us: float
+    p99_us: float
+    bytes_per_op: float
+    peak_kib: float
+
+
+Operation = typing.Callable[[int], typing.Awaitable]
+
+
+def make_universe(size: int, /) -> dict[int, common.universe.System]:
+    # A ring with a chord every few systems - about the shape of universe.json.
+    universe = dict()
+    for system_id in range(1, size + 1):
+        neighbours = {(system_id % size) + 1, ((system_id - 2) % size) + 1}
+        if system_id % 7 == 0:
+            neighbours.add(((system_id + size // 2 - 1) % size) + 1)
+        neighbours.discard(system_id)
+        universe[system_id] = common.universe.System(system_id=system_id, name=f"System {system_id}", neighbours=frozenset(neighbours))
+    return universe
+
+
+def make_characters(size: int, /) -> dict[int, common.universe.Character]:
+    return {character_id: common.universe.Character(character_id=character_id, name=f"Character {character_id}") for character_id in range(1, size + 1)}
+
+
+def system_topics(topic: str, payload: bytes, /) -> bytes:
+    request = poq.SystemTopicRequest.FromString(payload)
+    return poq.SystemTopicResponse(ok=True, system_id=request.system_id, system_topics=poq.TopicMessage(
+        subscribe_topic=f"PUB.SYSTEM.OUT.{request.system_id}",
+        publish_topic=f"PUB.SYSTEM.IN.{request.system_id}",
+        request_topic=f"REQ.SYSTEM.LIVE.{request.system_id}")).SerializeToString()
+
+
+async def system_in(msg_service: benchmarks.fake_messaging.FakeMessageService, population: int, /) -> tuple[Operation, typing.Callable]:
+    # One character arriving in / leaving a system that already holds population others.
+    presence_index: dict[int, int] = dict()
+    system = services.system_service.SystemInstance(msg_service, common.universe.System(system_id=1, name="System 1", neighbours=frozenset({2})), presence_index)
+    await system.start()
+    await system.update_presence(set(range(1000, 1000 + population)), set())
+    payloads = [poq.SystemSetLiveCharacterRequest(character_id=1, system_id=1, present=present).SerializeToString() for present in (True, False)]
+
+    async def op(i: int, /):
+        await system.system_in_cb(system.subscribe_topic, payloads[i % 2])
+
+    return op, system.stop
+
+
+async def system_universe(msg_service: benchmarks.fake_messaging.FakeMessageService, population: int, /) -> tuple[Operation, typing.Callable]:
+    # A client without the universe asking for all of it - bypassing the memoized reply.
+    service = services.system_service.SystemService(msg_service, make_universe(population))
+    payload = poq.UniverseRequest().SerializeToString()
+    uncached = services.system_service.SystemService.system_universe_cb.__wrapped__
+
+    async def op(i: int, /):
+        await uncached(service, "REQ.UNIVERSE.STATIC", payload)
+
+    async def teardown():
+        pass
+
+    return op, teardown
+
+
+async def system_universe_memoized(msg_service: benchmarks.fake_messaging.FakeMessageService, population: int, /) -> tuple[Operation, typing.Callable]:
+    service = services.system_service.SystemService(msg_service, make_universe(population))
+    payload = poq.UniverseRequest().SerializeToString()
+
+    async def op(i: int, /):
+        await service.system_universe_cb("REQ.UNIVERSE.STATIC", payload)
+
+    async def teardown():
+        common.service.invalidate_responses(service)
+
+    return op, teardown
+
+
+async def character_login(msg_service: benchmarks.fake_messaging.FakeMessageService, population: int, /) -> tuple[Operation, typing.Callable]:
+    # A character logging in (again) alongside population logged in characters.
+    msg_service.reply("REQ.SYSTEM.TOPIC", system_topics)
+    service = services.character_service.CharacterService(msg_service, make_characters(population + 16))
+    for character_id in range(1, population + 1):
+        await service.character_login_cb("REQ.CHARACTER.LOGIN", poq.CharacterLoginRequest(character_id=character_id).SerializeToString())
+    payloads = [poq.CharacterLoginRequest(character_id=population + 1 + n).SerializeToString() for n in range(16)]
+
+    async def op(i: int, /):
+        await service.character_login_cb("REQ.CHARACTER.LOGIN", payloads[i % len(payloads)])
+
+    async def teardown():
+        await service.stop_characters(list(service.active_character_id.keys()))
+
+    return op, teardown
+
+
+async def session_start(msg_service: benchmarks.fake_messaging.FakeMessageService, population: int, /) -> tuple[Operation, typing.Callable]:
+    # A login alongside population active sessions - replacing the user's previous session.
+    accounts = {f"user{n}": n for n in range(1, population + 17)}
+    service = services.session_service.SessionService(msg_service, accounts)
+    await service.start()
+    for n in range(1, population + 1):
+        await service.session_start_cb("REQ.SESSION.START", poq.SessionStartRequest(username=f"user{n}").SerializeToString())
+    payloads = [poq.SessionStartRequest(username=f"user{population + 1 + n}").SerializeToString() for n in range(16)]
+
+    async def op(i: int, /):
+        await service.session_start_cb("REQ.SESSION.START", payloads[i % len(payloads)])
+
+    return op, service.stop
+
+
+async def chatter_inbound(msg_service: benchmarks.fake_messaging.FakeMessageService, population: int, /) -> tuple[Operation, typing.Callable]:
+    chatter = services.chatter_service.ChatterInstance(msg_service, 1)
+    await chatter.start()
+    payload = poq.ChatterMessage(character_id=1, system_id=1, text="o7").SerializeToString()
+
+    async def op(i: int, /):
+        await chatter.chatter_inbound_cb(chatter.subscribe_topic, payload)
+
+    return op, chatter.stop
+
+
+# name -> (setup, scales with population)
+SCENARIOS: dict[str, tuple[typing.Callable, bool]] = {
+    "system_in_cb": (system_in, True),
+    "system_universe_cb": (system_universe, True),
+    "system_universe_cb[memoized]": (system_universe_memoized, True),
+    "character_login_cb": (character_login, True),
+    "session_start_cb": (session_start, True),
+    "chatter_inbound_cb": (chatter_inbound, False),
+}
+
+
+async def measure(name: str, population: int, ops: int, /) -> Result:
+    setup, _ = SCENARIOS[name]
+    msg_service = benchmarks.fake_messaging.FakeMessageService()
+    op, teardown = await setup(msg_service, population)
+    try:
+        for i in range(min(ops // 10, 100)):
+            await op(i)
+
+        gc.collect()
+        timings = list()
+        for i in range(ops):
+            start = time.perf_counter_ns()
+            await op(i)
+            timings.append(time.perf_counter_ns() - start)
+
+        # Allocations are measured on a separate, shorter run - tracemalloc slows everything down.
+        alloc_ops = max(ops // 10, 10)
+        gc.collect()
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        for i in range(alloc_ops):
+            await op(i)
+        after, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        await teardown()
+
+    timings.sort()
+    return Result(handler=name, population=population, ops=ops,
+                  ops_per_sec=ops / (sum(timings) / 1e9),
+                  p50_us=timings[len(timings) // 2] / 1e3,
+                  p99_us=timings[min(len(timings) - 1, len(timings) * 99 // 100)] / 1e3,
+                  bytes_per_op=(after - before) / alloc_ops,
+                  peak_kib=(peak - before) / 1024)
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def report(results: list[Result], baseline: dict[tuple[str, int], dict] = None, /) -> str:
+    lines = [f"{'handler':<30} {'population':>10} {'ops/s':>12} {'p50 us':>10} {'p99 us':>10} {'B/op':>10} {'peak KiB':>10}" + ("  vs baseline" if baseline else "")]
+    for result in results:
+        line = f"{result.handler:<30} {result.population:>10} {result.ops_per_sec:>12.0f} {result.p50_us:>10.1f} {result.p99_us:>10.1f} {result.bytes_per_op:>10.0f} {result.peak_kib:>10.1f}"
+        previous = (baseline or dict()).get((result.handler, result.population))
+        if previous:
+            line += f"  ops/s {100 * (result.ops_per_sec / previous['ops_per_sec'] - 1):+.1f}%, p99 {100 * (result.p99_us / previous['p99_us'] - 1):+.1f}%"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+async def async_main(names: list[str], sizes: list[int], ops: int, /) -> list[Result]:
+    results = list()
+    for name in names:
+        _, scales = SCENARIOS[name]
+        for population in (sizes if scales else [0]):
+            results.append(await measure(name, population, ops))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-handler microbenchmarks against an in-memory MessageService.")
+    parser.add_argument("handlers", nargs="*", help=f"any of {', '.join(SCENARIOS.keys())} (default all)")
+    parser.add_argument("--sizes", default="10,100,1000", help="comma separated population sizes")
+    parser.add_argument("--ops", type=int, default=2000)
+    parser.add_argument("--json", help="write the results (and git revision) to this file")
+    parser.add_argument("--compare", help="results file from an earlier --json run to compare against")
+    args = parser.parse_args()
+    for name in args.handlers:
+        if name not in SCENARIOS:
+            parser.error(f"unknown handler: {name}")
+
+    # Handlers still format their log lines - only the output is suppressed.
+    logging.basicConfig(level=logging.WARNING)
+    results = asyncio.run(async_main(args.handlers or list(SCENARIOS.keys()), [int(size) for size in args.sizes.split(",")], args.ops))
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as ifp:
+            previous = json.load(ifp)
+        print(f"baseline: {previous['revision']}")
+        baseline = {(r["handler"], r["population"]): r for r in previous["results"]}
+    print(f"revision: {git_revision()}")
+    print(report(results, baseline))
+
+    if args.json:
+        with open(args.json, "w") as ofp:
+            json.dump({"revision": git_revision(), "results": [dataclasses.asdict(result) for result in results]}, ofp, indent=2)
@@ -0,0 +1,82 @@
+# Copyright (c) 2025 Jonathon Fletcher
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ENTRY_POINTS = [
+    "services.system_service",
+    "services.character_service",
+    "services.session_service",
+    "services.chatter_service",
+    "services.all_service",
+    "client.main",
+]
+
+# name -> OTEL_* settings
+TELEMETRY_MODES: dict[str, dict[str, str]] = {
+    "none": {"OTEL_TRACES_EXPORTER": "none"},
+    "otlp-grpc": {"OTEL_TRACES_EXPORTER": "otlp", "OTEL_EXPORTER_OTLP_PROTOCOL": "grpc"},
+    "otlp-http": {"OTEL_TRACES_EXPORTER": "otlp", "OTEL_EXPORTER_OTLP_PROTOCOL": "http/protobuf"},
+}
+
+
+def environment(mode: str, /) -> dict[str, str]:
+    env = {k: v for k, v in os.environ.items() if not k.startswith("OTEL_")}
+    env["PYTHONPATH"] = os.getcwd()
+    env.setdefault("NATS_ENDPOINT", "nats://127.0.0.1:4222")
+    env.update(TELEMETRY_MODES[mode])
+    return env
+
+
+def startup_command(entry_point: str, /) -> list[str]:
+    # Everything an entry point does before it connects - imports and telemetry set up.
+    grpc_client = entry_point.startswith("client.")
+    code = f"import {entry_point}, common.telemetry; common.telemetry.initialize_telemetry(grpc_client={grpc_client})"
+    return [sys.executable, "-c", code]
+
+
+def measure(entry_point: str, mode: str, repeat: int, /) -> list[float]:
+    timings = list()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(startup_command(entry_point), env=environment(mode), check=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def heaviest_imports(entry_point: str, mode: str, count: int, /) -> list[tuple[int, str]]:
+    # -X importtime lines are "import time: self [us] | cumulative | imported package".
+    result = subprocess.run([sys.executable, "-X", "importtime"] + startup_command(entry_point)[1:],
+                            env=environment(mode), check=True, capture_output=True, text=True)
+    imports = list()
+    for line in result.stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            imports.append((int(fields[1]), fields[2].rstrip()))
+    # Only the top level of each import tree - cumulative times nest.
+    top = [(us, name) for us, name in imports if not name.startswith("  ")]
+    return sorted(top, reverse=True)[:count]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cold start time (imports and telemetry set up) per entry point.")
+    parser.add_argument("entry_points", nargs="*", help=f"any of {', '.join(ENTRY_POINTS)} (default all)")
+    parser.add_argument("--modes", default=",".join(TELEMETRY_MODES.keys()), help="comma separated telemetry modes")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--imports", type=int, default=0, help="also list this many of the slowest top level imports")
+    args = parser.parse_args()
+    modes = args.modes.split(",")
+    for mode in modes:
+        if mode not in TELEMETRY_MODES:
+            parser.error(f"unknown telemetry mode: {mode}")
+
+    print(f"{'entry point':<30} {'telemetry':<10} {'median ms':>10} {'min ms':>10}")
+    for entry_point in args.entry_points or ENTRY_POINTS:
+        for mode in modes:
+            timings = measure(entry_point, mode, args.repeat)
+            print(f"{entry_point:<30} {mode:<10} {statistics.median(timings) * 1e3:>10.0f} {min(timings) * 1e3:>10.0f}")
+            for us, name in heaviest_imports(entry_point, mode, args.imports) if args.imports else ():
+                print(f"    {us / 1e3:>8.1f} ms  {name.strip()}")
@@ -0,0 +1,89 @@
+# Copyright (c) 2025 Jonathon Fletcher
+import inspect
+import json
+import logging
+import sqlite3
+import typing
+
+import common.cache
+import common.universe
+
+
+class StaticDataCache:
+
+    db: sqlite3.Connection
+    systems: common.cache.LRUCache
+    characters: common.cache.LRUCache
+
+    def __init__(self, path: str, /, system_capacity: int = 4096, character_capacity: int = 4096):
+        self.logger = logging.getLogger()
+        self.path = path
+        # Several clients on one host can share the same cache file.
+        self.db = sqlite3.connect(path, timeout=15)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        with self.db:
+            self.db.execute("CREATE TABLE IF NOT EXISTS version (store TEXT PRIMARY KEY, version TEXT NOT NULL)")
+            self.db.execute("CREATE TABLE IF NOT EXISTS system (system_id INTEGER PRIMARY KEY, name TEXT NOT NULL, neighbours TEXT NOT NULL)")
+            self.db.execute("CREATE TABLE IF NOT EXISTS character (character_id INTEGER PRIMARY KEY, name TEXT NOT NULL)")
+        self.systems = common.cache.LRUCache(system_capacity)
+        self.characters = common.cache.LRUCache(character_capacity)
+        self.versions: dict[str, str] = dict(self.db.execute("SELECT store, version FROM version").fetchall())
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(path:{self.path}, universe_version:{self.universe_version}, character_version:{self.character_version})"
+
+    @property
+    def universe_version(self) -> str:
+        return self.versions.get("system", "")
+
+    @property
+    def character_version(self) -> str:
+        return self.versions.get("character", "")
+
+    def _check_version(self, store: str, version: str, lru: common.cache.LRUCache, /) -> None:
+        # A new server-side version invalidates everything held for that store.
+        if not version or self.versions.get(store) == version:
+            return
+        self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {store}:{self.versions.get(store)} -> {version}")
+        with self.db:
+            self.db.execute(f"DELETE FROM {store}")
+            self.db.execute("INSERT OR REPLACE INTO version (store, version) VALUES (?, ?)", (store, version))
+        self.versions[store] = version
+        lru.clear()
+
+    def update_universe(self, version: str, systems: typing.Iterable[common.universe.System], /) -> None:
+        self._check_version("system", version, self.systems)
+        rows = list()
+        for system in systems:
+            self.systems.put(system.system_id, system)
+            rows.append((system.system_id, system.name, json.dumps(sorted(system.neighbours))))
+        with self.db:
+            self.db.executemany("INSERT OR REPLACE INTO system (system_id, name, neighbours) VALUES (?, ?, ?)", rows)
+
+    def system(self, system_id: int, /) -> common.universe.System | None:
+        system = self.systems.get(system_id)
+        if system is None:
+            row = self.db.execute("SELECT name, neighbours FROM system WHERE system_id = ?", (system_id,)).fetchone()
+            if row:
+                system = common.universe.System(system_id=system_id, name=row[0], neighbours=frozenset(json.loads(row[1])))
+                self.systems.put(system_id, system)
+        return system
+
+    def update_character(self, version: str, character: common.universe.Character, /) -> None:
+        self._check_version("character", version, self.characters)
+        self.characters.put(character.character_id, character)
+        with self.db:
+            self.db.execute("INSERT OR REPLACE INTO character (character_id, name) VALUES (?, ?)", (character.character_id, character.name))
+
+    def character(self, character_id: int, /) -> common.universe.Character | None:
+        character = self.characters.get(character_id)
+        if character is None:
+            row = self.db.execute("SELECT name FROM character WHERE character_id = ?", (character_id,)).fetchone()
+            if row:
+                character = common.universe.Character(character_id=character_id, name=row[0])
+                self.characters.put(character_id, character)
+        return character
+
+    def close(self, /) -> None:
+        self.db.close()
@@ -3,12 +3,16 @@ import asyncio
 import inspect
 import itertools
 import logging
+import os
+import random
 import sys
+import typing
 
 import dotenv
 import google.protobuf.message
 import grpc.aio
 
+import client.cache
 import common.telemetry
 import common.universe
 import poq_pb2 as poq
@@ -38,6 +42,42 @@ class QueueIterator:
         await self.q.put(self.eof)
 
 
+class ConflatingQueueIterator(QueueIterator):
+
+    def __init__(self, key: typing.Callable[[google.protobuf.message.Message], typing.Hashable], /, maxsize: int = 1024):
+        # Messages with a key hold one place in the queue - a newer message for the
+        # same key replaces the one waiting there. Anything else waits its turn.
+        self.q = asyncio.Queue(maxsize)
+        self.key = key
+        self.latest: dict[typing.Hashable, google.protobuf.message.Message] = dict()
+
+    async def __anext__(self):
+        n = await self.q.get()
+        if n is self.eof:
+            raise StopAsyncIteration
+        if isinstance(n, tuple):
+            return self.latest.pop(n)
+        return n
+
+    async def put(self, message: google.protobuf.message.Message, /):
+        key = self.key(message)
+        if key is None:
+            await self.q.put(message)
+        elif key in self.latest:
+            self.latest[key] = message
+        else:
+            self.latest[key] = message
+            await self.q.put(key)
+
+
+def live_info_key(event: poq.SessionMessageResponse, /) -> tuple | None:
+    if event.type == poq.SessionMessageType.CHARACTER_LIVE_INFO:
+        return (event.type, event.character_live_info.character_id)
+    if event.type == poq.SessionMessageType.SYSTEM_LIVE_INFO:
+        return (event.type, event.system_live_info.system_id)
+    return None
+
+
 class ClientSessionState:
 
     character_id: int
@@ -45,13 +85,15 @@ class ClientSessionState:
     system_id: int
     locals: set[int]
     session_id: str
+    requested_static: set[int]
 
-    def __init__(self, character_id: int, session_id: str, universe: dict[int, common.universe.System], /):
+    def __init__(self, character_id: int, session_id: str, universe: client.cache.StaticDataCache, /):
         self.active = False
         self.character_id = character_id
         self.system_id = 0
         self.locals = set()
         self.session_id = session_id
+        self.requested_static = set()
 
     @property
     def metadata(self) -> dict:
@@ -73,9 +115,24 @@ class Client:
         self.logger = logging.getLogger()
         self.username = username
         self.endpoint = "127.0.0.1:50051"
+        self.cache = client.cache.StaticDataCache(os.environ.get("POQ_CLIENT_CACHE", "poq_client_cache.sqlite3"))
+        # The universe is fetched region by region, this many jumps around the character.
+        self.region_jumps = 2
+        self.stub: poq_grpc.PoQStub = None
 
         pass
 
+    def character_name(self, character_id: int, /) -> str:
+        character = self.cache.character(character_id)
+        return character.name if character else str(character_id)
+
+    async def prefetch_character_static_info(self, character_ids: typing.Iterable[int], state: ClientSessionState, to_server: QueueIterator, /):
+        for character_id in character_ids:
+            if character_id in state.requested_static or self.cache.character(character_id):
+                continue
+            state.requested_static.add(character_id)
+            await to_server.put(poq.SessionMessageRequest(type=poq.SessionMessageType.CHARACTER_STATIC_INFO, character_id=character_id))
+
     async def stream_task(self, to_client: QueueIterator, from_server, /):
         try:
             async for e in from_server:
@@ -89,6 +146,14 @@ class Client:
         state.system_id = event.character_live_info.system_id
         state.active = True
         self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {state!s}")
+        # Always asked for at login, however much is cached - the reply carries the
+        # current universe version, so a stale cache is dropped once per session.
+        await self.universe_region(state.system_id, True)
+
+        # Always ask for our own static info - the reply carries the current
+        # server-side version and so validates (or invalidates) the cached names.
+        state.requested_static.add(state.character_id)
+        await to_server.put(poq.SessionMessageRequest(type=poq.SessionMessageType.CHARACTER_STATIC_INFO, character_id=state.character_id))
 
         chatter_msg = poq.ChatterMessage(character_id=state.character_id, system_id=state.system_id, text="HELLO WORLD")
         msg = poq.SessionMessageRequest(type=poq.SessionMessageType.CHATTER, chatter=chatter_msg)
@@ -96,6 +161,10 @@ class Client:
         return True
 
     async def on_message_character_static_info(self, event: poq.SessionMessageResponse, state: ClientSessionState, to_server: QueueIterator, /):
+        if event.ok:
+            static_info = event.character_static_info
+            state.requested_static.discard(static_info.character_id)
+            self.cache.update_character(static_info.version, common.universe.Character(character_id=static_info.character_id, name=static_info.name))
         self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {event=}")
         return True
 
@@ -104,12 +173,15 @@ class Client:
             state.character_id = event.character_live_info.character_id
             state.system_id = event.character_live_info.system_id
             self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {state!s}")
+            await self.universe_region(state.system_id)
         else:
-            self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: character_id:{event.character_live_info.character_id}, active:{event.character_live_info.active}")
+            self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: character_id:{event.character_live_info.character_id},"
+                             f" name:{self.character_name(event.character_live_info.character_id)}, active:{event.character_live_info.active}")
         return True
 
     async def on_message_system_live_info(self, event: poq.SessionMessageResponse, state: ClientSessionState, to_server: QueueIterator, /):
         system_locals = frozenset(event.system_live_info.character_id)
+        await self.prefetch_character_static_info(system_locals, state, to_server)
         if system_locals != state.locals:
             self.logger.info(
                 f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}:"
@@ -119,6 +191,13 @@ class Client:
             state.locals = system_locals
         return True
 
+    async def on_message_join_system(self, event: poq.SessionMessageResponse, state: ClientSessionState, to_server: QueueIterator, /):
+        if event.ok:
+            state.system_id = event.character_live_info.system_id
+            await self.universe_region(state.system_id)
+        self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: ok:{event.ok}, {state!s}")
+        return True
+
     async def on_message_chatter(self, event: poq.SessionMessageResponse, state: ClientSessionState, to_server: QueueIterator, /):
         if event.chatter:
             if state.character_id != event.chatter.character_id:
@@ -129,6 +208,13 @@ class Client:
                     f" text:{event.chatter.text}")
         return True
 
+    async def on_message_pong(self, event: poq.SessionMessageResponse, state: ClientSessionState, to_server: QueueIterator, /):
+        # Only an answered ping gets a pong - not ok means the session has expired on the
+        # server, so give up on the stream.
+        if not event.ok:
+            self.logger.error(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {state!s}")
+        return event.ok
+
     async def on_message_default(self, event: poq.SessionMessageResponse, state: ClientSessionState, to_server: QueueIterator, /):
         self.logger.error(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {event=}")
         return True
@@ -141,14 +227,29 @@ class Client:
             msg = poq.SessionMessageRequest(type=poq.SessionMessageType.CHATTER, chatter=chatter_msg)
             await queue.put(msg)
 
+    async def ping_task(self, queue: QueueIterator, interval: int, /):
+        while True:
+            await asyncio.sleep(interval)
+            await queue.put(poq.SessionMessageRequest(type=poq.SessionMessageType.PING))
+
+    async def jump_task(self, queue: QueueIterator, state: ClientSessionState, interval: int, /):
+        while True:
+            await asyncio.sleep(interval)
+            system = self.cache.system(state.system_id)
+            if state.active and system and system.neighbours:
+                system_id = random.choice(sorted(system.neighbours))
+                await queue.put(poq.SessionMessageRequest(type=poq.SessionMessageType.JOIN_SYSTEM, system_id=system_id))
+
     async def session(self, channel: grpc.aio.Channel, stub: poq_grpc.PoQStub, state: ClientSessionState, /):
         to_server = QueueIterator()
-        to_client = QueueIterator()
+        to_client = ConflatingQueueIterator(live_info_key)
 
         session_task = asyncio.create_task(self.stream_task(to_client, stub.StreamSession(to_server, metadata=tuple(state.metadata.items()))))
         tasklist = list()
 
         chatter_task = asyncio.create_task(self.chatter_task(to_server, state, 25))
+        jump_task = asyncio.create_task(self.jump_task(to_server, state, 60))
+        ping_task = asyncio.create_task(self.ping_task(to_server, 15))
 
         await to_server.put(poq.SessionMessageRequest(type=poq.SessionMessageType.LOGIN))
         dispatch_table = {
@@ -156,7 +257,9 @@ class Client:
             poq.SessionMessageType.CHARACTER_STATIC_INFO: self.on_message_character_static_info,
             poq.SessionMessageType.CHARACTER_LIVE_INFO: self.on_message_character_live_info,
             poq.SessionMessageType.SYSTEM_LIVE_INFO: self.on_message_system_live_info,
+            poq.SessionMessageType.JOIN_SYSTEM: self.on_message_join_system,
             poq.SessionMessageType.CHATTER: self.on_message_chatter,
+            poq.SessionMessageType.PONG: self.on_message_pong,
         }
         async for in_event in to_client:
             handler_function = dispatch_table.get(in_event.type, self.on_message_default)
@@ -169,33 +272,42 @@ class Client:
             await asyncio.gather(*tasklist)
 
         chatter_task.cancel()
+        jump_task.cancel()
+        ping_task.cancel()
 
         # character_task.cancel()
         session_task.cancel()
         pass
 
-    async def universe(self, channel: grpc.aio.Channel, stub: poq_grpc.PoQStub, /):
-        r: poq.UniverseResponse = await stub.GetUniverse(poq.UniverseRequest())
+    async def universe_region(self, system_id: int, /, revalidate: bool = False) -> bool:
+        # Fetched when the character reaches a system whose neighbours are not all cached,
+        # so the cache fills in as it moves whatever the size of the universe.
+        system = self.cache.system(system_id)
+        if not revalidate and system and all(self.cache.system(neighbour_id) for neighbour_id in system.neighbours):
+            return True
+        r: poq.UniverseResponse = await self.stub.GetUniverse(poq.UniverseRequest(version=self.cache.universe_version, system_id=system_id, jumps=self.region_jumps))
         if r.ok:
-            u = dict()
+            u = list()
             for s in r.systems:
                 s: poq.SystemStaticInfoMessage
-                u[s.system_id] = common.universe.System(system_id=s.system_id, name=s.name, neighbours=frozenset(s.neighbours))
-            return u
-        return None
+                u.append(common.universe.System(system_id=s.system_id, name=s.name, neighbours=frozenset(s.neighbours)))
+            self.cache.update_universe(r.version, u)
+            self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: system_id:{system_id}, systems:{len(u)}")
+        return r.ok
 
     async def run(self):
         async with grpc.aio.insecure_channel(self.endpoint) as channel:
             stub = poq_grpc.PoQStub(channel)
+            self.stub = stub
             session: poq.SessionStartResponse = await stub.StartSession(poq.SessionStartRequest(username=self.username))
             if session.ok:
-                universe = await self.universe(channel, stub)
-                print(f"{universe=}")
+                print(f"{self.cache=}")
 
-                state = ClientSessionState(session.character_id, session.session_id, universe)
+                state = ClientSessionState(session.character_id, session.session_id, self.cache)
                 await self.session(channel, stub, state)
             print(f"{session=}")
             pass
+        self.cache.close()
         pass
 
 
@@ -218,7 +330,7 @@ async def async_main(username: str, /):
 
 if __name__ == "__main__":
     dotenv.load_dotenv()
-    common.telemetry.initialize_telemetry()
+    common.telemetry.initialize_telemetry(grpc_client=True)
     logging.basicConfig(level=logging.INFO)
     username = "userone"
     if len(sys.argv) > 1:
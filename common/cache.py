@@ -0,0 +1,37 @@
+# Copyright (c) 2025 Jonathon Fletcher
+import collections
+import typing
+
+
+class LRUCache:
+
+    capacity: int
+    entries: collections.OrderedDict
+
+    def __init__(self, capacity: int, /):
+        self.capacity = capacity
+        self.entries = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: typing.Hashable, /) -> bool:
+        return key in self.entries
+
+    def get(self, key: typing.Hashable, /) -> typing.Any:
+        value = self.entries.get(key)
+        if value is not None:
+            self.entries.move_to_end(key)
+        return value
+
+    def put(self, key: typing.Hashable, value: typing.Any, /) -> None:
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+
+    def pop(self, key: typing.Hashable, /) -> typing.Any:
+        return self.entries.pop(key, None)
+
+    def clear(self, /) -> None:
+        self.entries.clear()
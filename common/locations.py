@@ -0,0 +1,108 @@
+# Copyright (c) 2025 Jonathon Fletcher
+import asyncio
+import inspect
+import logging
+import sqlite3
+import threading
+
+
+class LocationStore:
+
+    reader: sqlite3.Connection
+    writer: sqlite3.Connection
+    flush_interval: float
+    flush_size: int
+
+    def __init__(self, path: str, /, flush_interval: float = 1.0, flush_size: int = 1000):
+        self.logger = logging.getLogger()
+        self.path = path
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        # Writes and reads happen on worker threads, each with their own connection - in
+        # WAL mode the reads are not blocked by the writes.
+        self.writer = sqlite3.connect(path, timeout=15, check_same_thread=False)
+        self.writer.execute("PRAGMA journal_mode=WAL")
+        self.writer.execute("PRAGMA synchronous=NORMAL")
+        with self.writer:
+            self.writer.execute("CREATE TABLE IF NOT EXISTS location (character_id INTEGER PRIMARY KEY, system_id INTEGER NOT NULL)")
+        self.write_lock = threading.Lock()
+        self.read_lock = threading.Lock()
+        self.reader = sqlite3.connect(path, timeout=15, check_same_thread=False)
+        # character_id -> system_id not yet written. Repeat moves only keep the latest.
+        self.pending: dict[int, int] = dict()
+        self.flushing: dict[int, int] = dict()
+        self.flush_now = asyncio.Event()
+        # One flush at a time, so batches are committed in the order they were taken.
+        self.flush_lock = asyncio.Lock()
+        self.flush_task: asyncio.Task = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(path:{self.path}, pending:{len(self.pending)})"
+
+    def _read(self, character_id: int, /) -> int | None:
+        with self.read_lock:
+            row = self.reader.execute("SELECT system_id FROM location WHERE character_id = ?", (character_id,)).fetchone()
+        return row[0] if row else None
+
+    async def get(self, character_id: int, /) -> int | None:
+        # The buffers first, then the file - off the event loop, so a slow disk only holds
+        # up the login that asked.
+        system_id = self.pending.get(character_id, self.flushing.get(character_id))
+        if system_id is None:
+            system_id = await asyncio.to_thread(self._read, character_id)
+        return system_id
+
+    def put(self, character_id: int, system_id: int, /) -> None:
+        self.pending[character_id] = system_id
+        if len(self.pending) >= self.flush_size:
+            self.flush_now.set()
+
+    def _write(self, rows: list[tuple[int, int]], /) -> None:
+        # A write cancelled on the event loop still finishes on its thread.
+        with self.write_lock, self.writer:
+            self.writer.executemany("INSERT OR REPLACE INTO location (character_id, system_id) VALUES (?, ?)", rows)
+
+    async def flush(self, /) -> int:
+        async with self.flush_lock:
+            if not self.pending:
+                return 0
+            batch, self.pending = self.pending, dict()
+            # Still readable from flushing until the batch is committed.
+            self.flushing = batch
+            try:
+                await asyncio.to_thread(self._write, list(batch.items()))
+            except Exception:
+                # Put the batch back, unless a newer location has arrived since.
+                for character_id, system_id in batch.items():
+                    self.pending.setdefault(character_id, system_id)
+                raise
+            finally:
+                self.flushing = dict()
+            return len(batch)
+
+    async def run(self, /) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self.flush_now.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self.flush_now.clear()
+            try:
+                # Shielded - a write cancelled here would still run on its thread, racing
+                # the next one. Cancelling run leaves it to finish, and stop waits for it.
+                await asyncio.shield(self.flush())
+            except Exception as ex:
+                self.logger.error(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {ex!s}")
+
+    async def start(self, /) -> None:
+        self.flush_task = asyncio.create_task(self.run())
+
+    async def stop(self, /) -> None:
+        if self.flush_task:
+            self.flush_task.cancel()
+            self.flush_task = None
+        count = await self.flush()
+        with self.read_lock:
+            self.reader.close()
+        self.writer.close()
+        self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: flushed:{count}")
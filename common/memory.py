@@ -0,0 +1,147 @@
+# Copyright (c) 2025 Jonathon Fletcher
+import collections
+import itertools
+import os
+import sys
+import threading
+import typing
+
+import google.protobuf.message
+
+import common.messaging
+import poq_pb2 as poq
+
+# Imported by every service - tracemalloc (and resource) are only imported once a memory
+# request needs them, and the command line is in common.memory_report.
+
+# The tracemalloc snapshot the next heap diff is taken against - tracing is per process,
+# shared by every service in it, so the snapshot is swapped under a lock.
+_HEAP_SNAPSHOT: typing.Any = None
+_HEAP_LOCK = threading.Lock()
+HEAP_FRAMES = 1
+
+
+def _heap_filters() -> tuple:
+    import linecache
+    import tracemalloc
+    return (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, linecache.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    )
+
+
+def estimate_size(obj: typing.Any, /, exclude: typing.Iterable[int] = (), sample: int = 64, depth: int = 4) -> int:
+    # Bytes held by obj and what it refers to, down to depth. Bigger containers are
+    # estimated from their first sample entries. Objects in exclude (by id) - eg the
+    # MessageService every instance refers to - and functions, classes and modules are
+    # not counted.
+    return _size(obj, set(exclude), sample, depth)
+
+
+def _size(obj: typing.Any, seen: set[int], sample: int, depth: int, /) -> int:
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if depth == 0 or callable(obj) or isinstance(obj, (str, bytes, bytearray, memoryview, int, float)):
+        return size
+    if isinstance(obj, google.protobuf.message.Message):
+        return size + obj.ByteSize()
+    if isinstance(obj, dict):
+        # Keys and values - not the (key, value) tuples, which only live for a moment.
+        items = itertools.chain.from_iterable(obj.items())
+        per_entry = 2
+    elif isinstance(obj, (list, tuple, set, frozenset, collections.deque)):
+        items = iter(obj)
+        per_entry = 1
+    elif hasattr(obj, "__dict__"):
+        # The attributes are a level down from the container holding the object, not two.
+        return size + _size(vars(obj), seen, sample, depth)
+    else:
+        return size
+    sampled = 0
+    total = 0
+    for item in itertools.islice(items, sample * per_entry):
+        total += _size(item, seen, sample, depth - 1)
+        sampled += 1
+    sampled //= per_entry
+    if sampled:
+        size += total * len(obj) // sampled
+    return size
+
+
+def structure(name: str, obj: typing.Any, /, exclude: typing.Iterable[int] = ()) -> poq.MemoryStructure:
+    count = len(obj) if hasattr(obj, "__len__") else 1
+    return poq.MemoryStructure(name=name, count=count, size=estimate_size(obj, exclude=exclude))
+
+
+def messaging_structures(msg_service: common.messaging.MessageService, /) -> dict[str, typing.Any]:
+    structures = {
+        "messaging.topic_callbacks": msg_service.topic_callbacks,
+        "messaging.topic_subscriptions": getattr(msg_service, "topic_subscriptions", dict()),
+        "messaging.tasks": getattr(msg_service, "tasks", set()),
+        "messaging.latest": getattr(msg_service, "latest", dict()),
+        "messaging.batches": getattr(msg_service, "batches", dict()),
+        "messaging.topic_lanes": getattr(msg_service, "topic_lanes", dict()),
+        "messaging.topic_compression": getattr(msg_service, "topic_compression", dict()),
+    }
+    # Callbacks by the class of their owner - more instance callbacks than instances is
+    # a leak.
+    owners: dict[str, list[typing.Callable]] = dict()
+    for callbacks in msg_service.topic_callbacks.values():
+        for callback in callbacks:
+            owner = getattr(callback, "__self__", None)
+            owners.setdefault(type(owner).__name__ if owner is not None else "function", list()).append(callback)
+    for owner, callbacks in sorted(owners.items()):
+        structures[f"messaging.callbacks.{owner}"] = callbacks
+    return structures
+
+
+def process_memory() -> tuple[int, int]:
+    # (rss, peak rss) in bytes.
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != "darwin":
+        peak *= 1024
+    try:
+        with open("/proc/self/statm") as statm:
+            rss = int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        rss = peak
+    return rss, max(rss, peak)
+
+
+def heap_diff(top: int, /) -> list[poq.HeapStatistic]:
+    # The top allocations by line since the previous call. The first call starts tracing,
+    # and only takes the snapshot to compare against.
+    global _HEAP_SNAPSHOT
+    import tracemalloc
+    with _HEAP_LOCK:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(HEAP_FRAMES)
+            _HEAP_SNAPSHOT = None
+        snapshot = tracemalloc.take_snapshot().filter_traces(_heap_filters())
+        previous, _HEAP_SNAPSHOT = _HEAP_SNAPSHOT, snapshot
+    if previous is None:
+        return list()
+    return [poq.HeapStatistic(location=str(stat.traceback), size=stat.size, size_diff=stat.size_diff, count=stat.count, count_diff=stat.count_diff)
+            for stat in snapshot.compare_to(previous, "lineno")[:top]]
+
+
+def heap_stop() -> None:
+    global _HEAP_SNAPSHOT
+    import tracemalloc
+    with _HEAP_LOCK:
+        _HEAP_SNAPSHOT = None
+        tracemalloc.stop()
+
+
+def heap_traced() -> tuple[int, int] | None:
+    # (traced, peak) bytes while tracing - without importing tracemalloc if nothing has.
+    tracemalloc = sys.modules.get("tracemalloc")
+    if tracemalloc is None or not tracemalloc.is_tracing():
+        return None
+    return tracemalloc.get_traced_memory()
+
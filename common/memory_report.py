@@ -0,0 +1,57 @@
+# Copyright (c) 2025 Jonathon Fletcher
+import argparse
+import asyncio
+import logging
+
+import dotenv
+
+import common.messaging
+import poq_pb2 as poq
+
+
+def format_response(response: poq.ServiceMemoryResponse, /) -> str:
+    lines = [f"{poq.ServiceType.Name(response.type)} {response.instance_id}: rss:{response.rss / 2**20:.1f}MiB, peak_rss:{response.peak_rss / 2**20:.1f}MiB"]
+    for s in sorted(response.structures, key=lambda s: s.size, reverse=True):
+        lines.append(f"  {s.name:<48} {s.count:>10} {s.size / 1024:>12.1f}KiB")
+    if response.heap_tracing:
+        lines.append(f"  heap traced:{response.heap_traced / 2**20:.1f}MiB, peak:{response.heap_peak / 2**20:.1f}MiB")
+        for h in response.heap:
+            lines.append(f"  {h.size_diff / 1024:>+12.1f}KiB {h.count_diff:>+8} {h.location} (size:{h.size / 1024:.1f}KiB, count:{h.count})")
+    return "\n".join(lines)
+
+
+async def async_main(msg_service: common.messaging.MessageService, instance_ids: list[str], heap_top: int, stop: bool, listen: float, /) -> None:
+    await msg_service.start()
+    try:
+        if not instance_ids:
+            # Every service instance heartbeats - listen for them.
+            heard: dict[str, None] = dict()
+
+            async def heartbeat_cb(topic: str, payload: bytes, /) -> bytes:
+                heard[poq.ServiceStart.FromString(payload).instance_id] = None
+
+            await msg_service.subscribe("PUB.SERVICE.HEARTBEAT", heartbeat_cb, False)
+            await asyncio.sleep(listen)
+            await msg_service.unsubscribe("PUB.SERVICE.HEARTBEAT", heartbeat_cb)
+            instance_ids = list(heard.keys())
+        request = poq.ServiceMemoryRequest(heap_top=heap_top, heap_stop=stop)
+        for instance_id in instance_ids:
+            response_bytes = await msg_service.publish(f"REQ.SERVICE.MEMORY.{instance_id}", request.SerializeToString(), True)
+            if not response_bytes:
+                print(f"{instance_id}: no reply")
+                continue
+            print(format_response(poq.ServiceMemoryResponse.FromString(response_bytes)))
+    finally:
+        await msg_service.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Memory accounting of running services.")
+    parser.add_argument("instance_ids", nargs="*", help="service instance ids (default every instance heard from)")
+    parser.add_argument("--heap", type=int, default=0, help="also list the top N allocations since the previous --heap request (the first starts tracing)")
+    parser.add_argument("--heap-stop", action="store_true", help="stop tracing allocations")
+    parser.add_argument("--listen", type=float, default=6.0, help="seconds to listen for heartbeats when no instance ids are given")
+    args = parser.parse_args()
+    dotenv.load_dotenv()
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(async_main(common.messaging.MessageService(), args.instance_ids, args.heap, args.heap_stop, args.listen))
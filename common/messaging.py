@@ -1,10 +1,15 @@
 # Copyright (c) 2025 Jonathon Fletcher
 import asyncio
+import contextvars
+import dataclasses
 import enum
 import inspect
 import logging
 import os
+import struct
+import time
 import typing
+import zlib
 
 import nats
 import nats.aio.client
@@ -14,6 +19,137 @@ import opentelemetry.context
 import opentelemetry.propagate
 import opentelemetry.trace
 
+import common.cache
+
+
+# A batch is one NATS message carrying several payloads for the same topic, each
+# prefixed with its length. The header holds the number of payloads.
+BATCH_HEADER = "Poq-Batch"
+
+
+def pack_batch(payloads: typing.Sequence[bytes], /) -> bytes:
+    return b"".join(struct.pack(">I", len(payload)) + payload for payload in payloads)
+
+
+def unpack_batch(data: bytes, /, count: int | None = None) -> list[bytes]:
+    # A truncated or malformed batch is refused whole, rather than delivered in part.
+    payloads = list()
+    view = memoryview(data)
+    offset = 0
+    while offset < len(view):
+        if offset + 4 > len(view):
+            raise ValueError(f"batch truncated in a length prefix at {offset}/{len(view)}")
+        (length,) = struct.unpack_from(">I", view, offset)
+        offset += 4
+        if offset + length > len(view):
+            raise ValueError(f"batch truncated in payload {len(payloads)}: {length} bytes at {offset}/{len(view)}")
+        payloads.append(bytes(view[offset:offset + length]))
+        offset += length
+    if count is not None and count != len(payloads):
+        raise ValueError(f"batch of {len(payloads)} payloads, header says {count}")
+    return payloads
+
+
+# Requests carry an absolute deadline (epoch seconds) next to the trace context. Handlers
+# run with it set, so any request they make in turn only gets what is left of the budget.
+DEADLINE_HEADER = "Poq-Deadline"
+
+request_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar("request_deadline", default=None)
+
+
+def remaining_budget() -> float | None:
+    deadline = request_deadline.get()
+    return None if deadline is None else deadline - time.time()
+
+
+@dataclasses.dataclass(frozen=True)
+class Reply:
+    index: int
+    topic: str
+    data: bytes | None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclasses.dataclass(frozen=True)
+class Lane:
+    # A lane is a NATS connection of its own - socket, pending buffer, flusher and read
+    # loop - for the subjects matching its patterns. Patterns should be whole subtrees
+    # (ending in ">") so that a wildcard subscription lands on the same lane as the
+    # subjects published under it.
+    name: str
+    patterns: tuple[str, ...] = ()
+    pending_size: int = 2 * 1024 * 1024
+    flusher_queue_size: int = 1024
+    pending_msgs_limit: int = 512 * 1024
+    pending_bytes_limit: int = 128 * 1024 * 1024
+
+
+# Requests and service control stay on the first lane. Broadcast fan-out has a lane
+# with deeper buffers, so a flood of it never queues in front of a login. Ordering only
+# holds within a lane - presence changes (PUB.SYSTEM.IN.*, PUB.SYSTEM.PRESENCE) stay on
+# the first lane with REQ.SYSTEM.MOVE, so a move never overtakes the login it follows.
+DEFAULT_LANES = (
+    Lane("control"),
+    Lane("bulk", ("PUB.CHATTER.>", "PUB.CHARACTER.OUT.>", "PUB.SYSTEM.OUT.>", "PUB.SYSTEM.FEED.>"),
+         pending_size=8 * 1024 * 1024, flusher_queue_size=8192),
+)
+
+
+# A compressed payload names its codec in the encoding header. Requests list the codecs
+# the requester can decode, and a reply is only compressed with one of them.
+ENCODING_HEADER = "Poq-Encoding"
+ACCEPT_ENCODING_HEADER = "Poq-Accept-Encoding"
+
+
+@dataclasses.dataclass(frozen=True)
+class Codec:
+    name: str
+    encode: typing.Callable[[bytes], bytes]
+    decode: typing.Callable[[bytes], bytes]
+
+
+# name -> codec. Every process (and the server) has to know a codec before any
+# publisher uses it.
+CODECS: dict[str, Codec] = {
+    "zlib": Codec("zlib", lambda data: zlib.compress(data, 1), zlib.decompress),
+}
+
+
+def register_codec(codec: Codec, /) -> None:
+    CODECS[codec.name] = codec
+
+
+@dataclasses.dataclass(frozen=True)
+class Compression:
+    # Payloads of at least min_size bytes on subjects matching patterns are sent with codec.
+    patterns: tuple[str, ...]
+    min_size: int = 1024
+    codec: str = "zlib"
+
+
+# The big ones - system presence and feeds (fanned out to every server), the universe,
+# and the bulk requests / replies between the services.
+DEFAULT_COMPRESSION = (
+    Compression(("PUB.SYSTEM.>", "PUB.CHARACTER.OUT.>", "REQ.UNIVERSE.>", "REQ.SYSTEM.>", "REQ.CHARACTER.PRESENCE", "REQ.CHARACTER.LOGOUT.BULK")),
+)
+
+
+@dataclasses.dataclass
+class CompressionStats:
+    # Sent - bytes before and after compression of the payloads that were compressed.
+    compressed: int = 0
+    uncompressed_bytes: int = 0
+    compressed_bytes: int = 0
+    # Compression did not make them any smaller.
+    incompressible: int = 0
+    # Received.
+    decoded: int = 0
+    decoded_bytes: int = 0
+
 
 class MessageServiceState(enum.Enum):
     INIT = 0
@@ -24,41 +160,216 @@ class MessageServiceState(enum.Enum):
 
 class MessageService:
 
-    def __init__(self):
+    def __init__(self, /, local_delivery: bool = False, conflation_window: float = 0.05,
+                 batch_linger: float = 0.005, batch_max_bytes: int = 64 * 1024, lanes: typing.Sequence[Lane] = DEFAULT_LANES,
+                 compression: typing.Sequence[Compression] = DEFAULT_COMPRESSION):
         self.nats_options = {
             "servers": os.environ['NATS_ENDPOINT'],
             "connect_timeout": 15,
             "reconnect_time_wait": 15,
             "max_reconnect_attempts": 100,
             "error_cb": self._nats_error,
-            "closed_cb": self._nats_closed,
-            "reconnected_cb": self._nats_reconnected,
-            "disconnected_cb": self._nats_disconnected,
         }
         self.logger = logging.getLogger()
         self.state = MessageServiceState.INIT
-        self.nc = nats.aio.client.Client()
+        # Subjects that match no lane's patterns go on the first lane.
+        self.lanes = tuple(lanes)
+        self.lane_clients: dict[str, nats.aio.client.Client] = {lane.name: nats.aio.client.Client() for lane in self.lanes}
+        # Connected only while every lane is.
+        self.lane_states: dict[str, MessageServiceState] = {lane.name: MessageServiceState.INIT for lane in self.lanes}
+        self.topic_lanes = common.cache.LRUCache(4096)
+        self.nc = self.lane_clients[self.lanes[0].name]
+        self.compression_rules = tuple(compression)
+        self.topic_compression = common.cache.LRUCache(4096)
+        self.compression_stats = CompressionStats()
+        # Subjects with a subscriber in this process are delivered in-process. NATS
+        # must not echo our own publishes back, or local subscribers see them twice.
+        self.local_delivery = local_delivery
+        if self.local_delivery:
+            self.nats_options["no_echo"] = True
         self.topic_subscriptions: dict[str, nats.aio.client.Subscription] = dict()
-        self.topic_callbacks: dict[str, typing.Callable] = dict()
+        self.topic_callbacks: dict[str, list[typing.Callable]] = dict()
         self.topic_queues: set[str] = set()
+        self.topic_concurrent: set[str] = set()
+        self.topic_wildcards: set[str] = set()
+        self.tasks: set[asyncio.Task] = set()
+        self.connected = asyncio.Event()
+        # topic -> newest payload not yet sent by publish_latest.
+        self.conflation_window = conflation_window
+        self.latest: dict[str, bytes] = dict()
+        self.latest_task: asyncio.Task = None
+        # topic -> payloads waiting to go out together from publish_batched.
+        self.batch_linger = batch_linger
+        self.batch_max_bytes = batch_max_bytes
+        self.batches: dict[str, list[bytes]] = dict()
+        self.batch_bytes: dict[str, int] = dict()
+        self.batch_task: asyncio.Task = None
+        # Set by common.service - knows whether anything serves a request topic.
+        self.registry: typing.Any = None
 
     async def _nats_error(self, e, /) -> None:
         self.logger.error(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {e}")
 
-    async def _nats_closed(self, /) -> None:
-        self.logger.warning(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}")
-        self.state = MessageServiceState.CLOSED
+    def _lane_state(self, lane_name: str, state: MessageServiceState, /) -> None:
+        self.lane_states[lane_name] = state
+        states = set(self.lane_states.values())
+        if states == {MessageServiceState.CONNECTED}:
+            self.state = MessageServiceState.CONNECTED
+            self.connected.set()
+        else:
+            self.state = MessageServiceState.CLOSED if MessageServiceState.CLOSED in states else MessageServiceState.DISCONNECTED
+            self.connected.clear()
 
-    async def _nats_reconnected(self, /) -> None:
-        self.logger.warning(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {self.nc.connected_url.netloc}")
-        await self.resubscribe()
-        self.state = MessageServiceState.CONNECTED
+    async def _nats_closed(self, lane_name: str, /) -> None:
+        self.logger.warning(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {lane_name}")
+        self._lane_state(lane_name, MessageServiceState.CLOSED)
+
+    async def _nats_reconnected(self, lane_name: str, /) -> None:
+        self.logger.warning(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {lane_name}: {self.lane_clients[lane_name].connected_url.netloc}")
+        await self.resubscribe(lane_name)
+        self._lane_state(lane_name, MessageServiceState.CONNECTED)
+
+    async def _nats_disconnected(self, lane_name: str, /) -> None:
+        self.logger.warning(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {lane_name}")
+        self._lane_state(lane_name, MessageServiceState.DISCONNECTED)
+
+    def _lane_callbacks(self, lane_name: str, /) -> dict[str, typing.Callable]:
+        async def closed_cb() -> None:
+            await self._nats_closed(lane_name)
+
+        async def reconnected_cb() -> None:
+            await self._nats_reconnected(lane_name)
+
+        async def disconnected_cb() -> None:
+            await self._nats_disconnected(lane_name)
+
+        return {"closed_cb": closed_cb, "reconnected_cb": reconnected_cb, "disconnected_cb": disconnected_cb}
+
+    @staticmethod
+    def topic_match(pattern: str, topic: str, /) -> bool:
+        pattern_tokens = pattern.split(".")
+        topic_tokens = topic.split(".")
+        for i, token in enumerate(pattern_tokens):
+            if token == ">":
+                return len(topic_tokens) > i
+            if i >= len(topic_tokens) or (token != "*" and token != topic_tokens[i]):
+                return False
+        return len(pattern_tokens) == len(topic_tokens)
+
+    def subscribed_topics(self, subject: str, /) -> list[str]:
+        topics = list()
+        if subject in self.topic_callbacks:
+            topics.append(subject)
+        for topic in self.topic_wildcards:
+            if self.topic_match(topic, subject):
+                topics.append(topic)
+        return topics
+
+    async def _deliver(self, topic: str, subject: str, payload: bytes, /) -> bytes:
+        # A queue topic is handled once, like a NATS queue group - anything else by every callback.
+        callbacks = list(self.topic_callbacks.get(topic, list()))
+        if topic in self.topic_queues:
+            callbacks = callbacks[:1]
+        response = None
+        for cb in callbacks:
+            cb_response = await cb(subject, payload)
+            if response is None:
+                response = cb_response
+        return response
+
+    async def _local_deliver(self, topic: str, subject: str, payload: bytes, /) -> bytes:
+        try:
+            return await self._deliver(topic, subject, payload)
+        except Exception as ex:
+            # Logged as NATS delivery logs a failed handler - a request gets no reply.
+            self.logger.error(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {topic=}, {subject=}, {ex!r}", exc_info=ex)
+            return None
+
+    async def _local_publish(self, topics: list[str], subject: str, payload: bytes, reply: bool, /) -> bytes:
+        response = None
+        for topic in topics:
+            if topic in self.topic_concurrent:
+                # As over NATS, a concurrent handler runs as a task of its own - it does not
+                # hold up a plain publisher, and outlives a requester that gives up.
+                task = asyncio.create_task(self._local_deliver(topic, subject, payload))
+                self.tasks.add(task)
+                task.add_done_callback(self.tasks.discard)
+                if not reply:
+                    continue
+                topic_response = await asyncio.shield(task)
+            else:
+                topic_response = await self._local_deliver(topic, subject, payload)
+            if response is None:
+                response = topic_response
+        return response
+
+    def _nats_callback(self, topic: str, /) -> typing.Callable:
+        async def cb(msg: nats.aio.client.Msg) -> None:
+            await self._nats_message(topic, msg)
+        return cb
+
+    def lane(self, topic: str, /) -> Lane:
+        lane = self.topic_lanes.get(topic)
+        if lane is None:
+            lane = next((lane for lane in self.lanes if any(self.topic_match(pattern, topic) for pattern in lane.patterns)), self.lanes[0])
+            self.topic_lanes.put(topic, lane)
+        return lane
+
+    def client(self, topic: str, /) -> nats.aio.client.Client:
+        return self.lane_clients[self.lane(topic).name]
 
-    async def _nats_disconnected(self, /) -> None:
-        self.logger.warning(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}")
-        self.state = MessageServiceState.DISCONNECTED
+    def compression(self, topic: str, /) -> Compression | None:
+        if topic not in self.topic_compression:
+            self.topic_compression.put(topic, next((rule for rule in self.compression_rules if any(self.topic_match(pattern, topic) for pattern in rule.patterns)), None))
+        return self.topic_compression.get(topic)
 
-    async def _nats_message(self, msg: nats.aio.client.Msg, /) -> None:
+    def encode(self, topic: str, payload: bytes, headers: dict, /, accept: str | None = None) -> bytes:
+        # Compresses payload if the rules for topic (and the requester, for a reply) allow,
+        # marking headers.
+        rule = self.compression(topic)
+        if rule is None or len(payload) < rule.min_size:
+            return payload
+        if accept is not None and rule.codec not in accept.split(","):
+            return payload
+        data = CODECS[rule.codec].encode(payload)
+        if len(data) >= len(payload):
+            self.compression_stats.incompressible += 1
+            return payload
+        headers[ENCODING_HEADER] = rule.codec
+        self.compression_stats.compressed += 1
+        self.compression_stats.uncompressed_bytes += len(payload)
+        self.compression_stats.compressed_bytes += len(data)
+        return data
+
+    def decode(self, msg: nats.aio.client.Msg, /) -> bytes:
+        encoding = msg.headers.get(ENCODING_HEADER) if msg.headers else None
+        if not encoding:
+            return msg.data
+        data = CODECS[encoding].decode(msg.data)
+        self.compression_stats.decoded += 1
+        self.compression_stats.decoded_bytes += len(data)
+        return data
+
+    async def _nats_subscribe(self, topic: str, /) -> None:
+        lane = self.lane(topic)
+        limits = {"pending_msgs_limit": lane.pending_msgs_limit, "pending_bytes_limit": lane.pending_bytes_limit}
+        if topic in self.topic_queues:
+            self.topic_subscriptions[topic] = await self.lane_clients[lane.name].subscribe(f"{topic!s}", f"{topic!s}", cb=self._nats_callback(topic), **limits)
+        else:
+            self.topic_subscriptions[topic] = await self.lane_clients[lane.name].subscribe(f"{topic!s}", cb=self._nats_callback(topic), **limits)
+
+    async def _nats_message(self, topic: str, msg: nats.aio.client.Msg, /) -> None:
+        # NATS delivers the messages of a subscription one after the other. Handlers
+        # that wait on other work (eg a movement tick) are run as tasks instead so
+        # that they do not hold up the rest of the subscription.
+        if topic in self.topic_concurrent:
+            task = asyncio.create_task(self._nats_dispatch(topic, msg))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+        else:
+            await self._nats_dispatch(topic, msg)
+
+    async def _nats_dispatch(self, topic: str, msg: nats.aio.client.Msg, /) -> None:
 
         context: opentelemetry.trace.Context = None
         if msg.headers:
@@ -66,65 +377,124 @@ class MessageService:
             propagator = opentelemetry.propagate.get_global_textmap()
             context: opentelemetry.trace.Context = propagator.extract(headers)
 
-        token = opentelemetry.context.attach(context)
+        deadline: float = None
+        if msg.headers and DEADLINE_HEADER in msg.headers:
+            deadline = float(msg.headers[DEADLINE_HEADER])
+            if deadline <= time.time():
+                # The requester has already given up - don't spend any time on it.
+                self.logger.warning(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: topic={msg.subject} expired {time.time() - deadline:.3f}s ago")
+                return
+
         try:
-            topic = msg.subject
-            cb = self.topic_callbacks.get(topic)
-            if cb:
-                response = await cb(msg.subject, msg.data)
+            data = self.decode(msg)
+            payloads = unpack_batch(data, int(msg.headers[BATCH_HEADER])) if msg.headers and BATCH_HEADER in msg.headers else None
+        except (KeyError, ValueError, zlib.error) as ex:
+            self.logger.error(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: topic={msg.subject} undecodable {ex!r}")
+            return
+
+        token = opentelemetry.context.attach(context) if context is not None else None
+        deadline_token = request_deadline.set(deadline)
+        try:
+            if self.topic_callbacks.get(topic):
+                if payloads is not None:
+                    for payload in payloads:
+                        await self._deliver(topic, msg.subject, payload)
+                    return
+                response = await self._deliver(topic, msg.subject, data)
                 if msg.reply:
-                    await msg.respond(response)
+                    # Only what the reply needs - its encoding, if compressed.
+                    headers = dict()
+                    accept = msg.headers.get(ACCEPT_ENCODING_HEADER, "") if msg.headers else ""
+                    if response:
+                        response = self.encode(topic, response, headers, accept=accept)
+                    await self.client(topic).publish(msg.reply, response or b"", headers=headers or None)
             else:
-                self.logger.error(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {topic=} has no callback")
+                self.logger.error(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: topic={msg.subject} has no callback")
         finally:
-            opentelemetry.context.detach(token)
+            request_deadline.reset(deadline_token)
+            if token is not None:
+                opentelemetry.context.detach(token)
 
-    async def resubscribe(self, /):
-        for topic in self.topic_subscriptions.keys():
-            await self.topic_subscriptions[topic].unsubscribe()
+    async def resubscribe(self, lane_name: str | None = None, /):
+        # Every topic, or just those on one lane.
+        for topic in list(self.topic_subscriptions.keys()):
+            if lane_name is None or self.lane(topic).name == lane_name:
+                await self.topic_subscriptions[topic].unsubscribe()
         for topic in self.topic_callbacks.keys():
-            if topic in self.topic_queues:
-                self.topic_subscriptions[topic] = await self.nc.subscribe(f"{topic!s}", f"{topic!s}", cb=self._nats_message)
-            else:
-                self.topic_subscriptions[topic] = await self.nc.subscribe(f"{topic!s}", cb=self._nats_message)
+            if lane_name is None or self.lane(topic).name == lane_name:
+                await self._nats_subscribe(topic)
 
-    async def subscribe(self, topic: str, callback: typing.Callable, isqueue: bool, /) -> bool:
-        if topic in self.topic_callbacks:
-            return False
-        self.topic_callbacks[topic] = callback
+    async def subscribe(self, topic: str, callback: typing.Callable, isqueue: bool, /, concurrent: bool = False) -> bool:
+        # One NATS subscription per topic, whatever the number of callbacks in the process.
+        callbacks = self.topic_callbacks.get(topic)
+        if callbacks:
+            # The topic shares one subscription, so every callback must agree on how it is made.
+            if isqueue != (topic in self.topic_queues) or concurrent != (topic in self.topic_concurrent):
+                raise ValueError(f"{topic} is already subscribed with isqueue:{topic in self.topic_queues}, concurrent:{topic in self.topic_concurrent}")
+            if callback in callbacks:
+                return False
+            callbacks.append(callback)
+            return True
+        self.topic_callbacks[topic] = [callback]
         if isqueue:
             self.topic_queues.add(topic)
+        if concurrent:
+            self.topic_concurrent.add(topic)
+        if "*" in topic or ">" in topic:
+            self.topic_wildcards.add(topic)
         if self.state == MessageServiceState.CONNECTED:
-            if topic in self.topic_queues:
-                self.topic_subscriptions[topic] = await self.nc.subscribe(f"{topic!s}", f"{topic!s}", cb=self._nats_message)
-            else:
-                self.topic_subscriptions[topic] = await self.nc.subscribe(f"{topic!s}", cb=self._nats_message)
+            await self._nats_subscribe(topic)
         return True
 
-    async def unsubscribe(self, topic: str, /) -> bool:
-        if topic not in self.topic_callbacks:
+    async def unsubscribe(self, topic: str, callback: typing.Callable = None, /) -> bool:
+        callbacks = self.topic_callbacks.get(topic)
+        if not callbacks:
             return False
+        if callback is not None:
+            if callback not in callbacks:
+                return False
+            callbacks.remove(callback)
+            if callbacks:
+                return True
         if topic in self.topic_subscriptions:
-            await self.topic_subscriptions[topic].unsubscribe()
+            await self.topic_subscriptions.pop(topic).unsubscribe()
         if topic in self.topic_callbacks:
             del self.topic_callbacks[topic]
         if topic in self.topic_queues:
             self.topic_queues.remove(topic)
+        self.topic_concurrent.discard(topic)
+        self.topic_wildcards.discard(topic)
         return True
 
     async def start(self, /) -> None:
-        await self.nc.connect(**self.nats_options)
+        for lane in self.lanes:
+            options = dict(self.nats_options, name=lane.name, pending_size=lane.pending_size, flusher_queue_size=lane.flusher_queue_size,
+                           **self._lane_callbacks(lane.name))
+            await self.lane_clients[lane.name].connect(**options)
+            self.lane_states[lane.name] = MessageServiceState.CONNECTED
         self.state = MessageServiceState.CONNECTED
         await self.resubscribe()
+        self.connected.set()
 
     async def stop(self, /) -> None:
+        if self.latest_task:
+            self.latest_task.cancel()
+            self.latest_task = None
+        await self._flush_latest()
+        if self.batch_task:
+            self.batch_task.cancel()
+            self.batch_task = None
+        await self._flush_batches()
         for topic in self.topic_subscriptions.keys():
             await self.topic_subscriptions[topic].unsubscribe()
-        try:
-            await self.nc.close()
-        except nats.errors.FlushTimeoutError as ex:
-            self.logger.error(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {ex!s}")
+        for lane in reversed(self.lanes):
+            try:
+                await self.lane_clients[lane.name].close()
+            except nats.errors.FlushTimeoutError as ex:
+                self.logger.error(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {lane.name}: {ex!s}")
+        self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {self.compression_stats}")
         self.state = MessageServiceState.CLOSED
+        self.connected.clear()
 
     async def run(self, /) -> None:
         event = asyncio.Event()
@@ -135,34 +505,186 @@ class MessageService:
             pass
         await self.stop()
 
-    async def publish(self, topic: str, payload: bytes, reply: bool, /, headers: dict = None, timeout: int = 10) -> bytes:
-        if self.state != MessageServiceState.CONNECTED:
+    async def _nats_request(self, topic: str, payload: bytes, headers: dict, timeout: float, hedge: float | None, /) -> nats.aio.client.Msg:
+        nc = self.client(topic)
+        if hedge is None or hedge >= timeout:
+            return await nc.request(topic, payload=payload, headers=headers, timeout=timeout)
+
+        # Hedged - if there is no reply after hedge seconds the same request goes out again
+        # (to whichever queue member picks it up) and the first reply wins. Idempotent only.
+        loop = asyncio.get_running_loop()
+        expires = loop.time() + timeout
+        pending = {asyncio.create_task(nc.request(topic, payload=payload, headers=headers, timeout=timeout))}
+        done, _ = await asyncio.wait(pending, timeout=hedge)
+        if not done:
+            self.logger.debug(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: topic={topic} hedged after {hedge}s")
+            pending.add(asyncio.create_task(nc.request(topic, payload=payload, headers=headers, timeout=expires - loop.time())))
+        error: BaseException = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def publish(self, topic: str, payload: bytes, reply: bool, /, headers: dict = None, timeout: float = 10, hedge: float | None = None,
+                      raise_errors: bool = False) -> bytes:
+        # A request that fails returns None, or with raise_errors raises why (a nats.errors
+        # timeout, no responders or closed connection).
+        local_topics = self.subscribed_topics(topic) if self.local_delivery else list()
+        if not local_topics and self.state != MessageServiceState.CONNECTED:
+            if reply and raise_errors:
+                raise nats.errors.ConnectionClosedError
             return None
 
+        deadline = request_deadline.get()
+        if reply:
+            now = time.time()
+            if deadline is not None:
+                if deadline <= now:
+                    self.logger.warning(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: topic={topic} no budget left")
+                    if raise_errors:
+                        raise nats.errors.TimeoutError
+                    return None
+                timeout = min(timeout, deadline - now)
+            deadline = now + timeout
+
         tracer = opentelemetry.trace.get_tracer_provider().get_tracer(self.__module__)
         with tracer.start_span(inspect.currentframe().f_code.co_name) as span:
             span.set_attribute("nats.topic", topic)
             span.set_attribute("nats.message.length", len(payload))
+            if local_topics:
+                span.set_attribute("nats.local", True)
+                if headers and BATCH_HEADER in headers:
+                    response = None
+                    for item in unpack_batch(payload, int(headers[BATCH_HEADER])):
+                        await self._local_publish(local_topics, topic, item, False)
+                else:
+                    deadline_token = request_deadline.set(deadline)
+                    try:
+                        response = await self._local_publish(local_topics, topic, payload, reply)
+                    finally:
+                        request_deadline.reset(deadline_token)
+                # Requests and queue work are handled here. Plain publishes still go out
+                # to NATS for any subscribers in other processes.
+                if reply:
+                    return response
+                if self.state != MessageServiceState.CONNECTED or any(t in self.topic_queues for t in local_topics):
+                    return None
+            if reply and self.registry is not None and not await self.registry.wait_available(topic):
+                # Nothing serves this request - fail now rather than wait out the timeout.
+                span.set_attribute("nats.unavailable", True)
+                self.logger.warning(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: topic={topic} no service available")
+                if raise_errors:
+                    raise nats.errors.NoRespondersError
+                return None
             try:
                 headers = headers or dict()
                 propagator = opentelemetry.propagate.get_global_textmap()
                 propagator.inject(headers)
                 # opentelemetry.propagate.inject(headers)
+                payload = self.encode(topic, payload, headers)
                 if reply:
-                    res = await self.nc.request(topic, payload=payload, headers=headers, timeout=timeout)
+                    headers[DEADLINE_HEADER] = f"{deadline:.6f}"
+                    headers[ACCEPT_ENCODING_HEADER] = ",".join(CODECS.keys())
+                    res = await self._nats_request(topic, payload, headers, timeout, hedge)
                     if res:
-                        return res.data
+                        return self.decode(res)
                     else:
                         return b''
                 else:
-                    return await self.nc.publish(topic, payload=payload, headers=headers)
+                    return await self.client(topic).publish(topic, payload=payload, headers=headers)
             except (nats.errors.TimeoutError, nats.errors.NoRespondersError) as ex:
                 if span.is_recording():
                     span.record_exception(ex)
                 self.logger.error(f"{self.__init__.__class__}.{inspect.currentframe().f_code.co_name}: {ex=}")
+                if raise_errors:
+                    raise ex
             except (nats.errors.Error) as ex:
                 if span.is_recording():
                     span.record_exception(ex)
                 self.logger.error(f"{self.__init__.__class__}.{inspect.currentframe().f_code.co_name}: {ex=}")
                 raise ex
             return None
+
+    async def _request(self, index: int, topic: str, payload: bytes, semaphore: asyncio.Semaphore, timeout: float, hedge: float | None, /) -> Reply:
+        async with semaphore:
+            try:
+                data = await self.publish(topic, payload, True, timeout=timeout, hedge=hedge, raise_errors=True)
+            except Exception as ex:
+                return Reply(index, topic, None, type(ex).__name__)
+        if data is None:
+            return Reply(index, topic, None, "no reply")
+        return Reply(index, topic, data)
+
+    async def request_iter(self, requests: typing.Iterable[tuple[str, bytes]], /, concurrency: int = 64, timeout: float = 10, hedge: float | None = None) -> typing.AsyncIterator[Reply]:
+        # Requests go out together (at most concurrency in flight) over the shared reply
+        # inbox. Replies are yielded as they arrive - Reply.index is the request position.
+        semaphore = asyncio.Semaphore(concurrency)
+        tasks = [asyncio.create_task(self._request(index, topic, payload, semaphore, timeout, hedge)) for index, (topic, payload) in enumerate(requests)]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def request_many(self, requests: typing.Iterable[tuple[str, bytes]], /, concurrency: int = 64, timeout: float = 10, hedge: float | None = None) -> list[Reply]:
+        replies = [reply async for reply in self.request_iter(requests, concurrency=concurrency, timeout=timeout, hedge=hedge)]
+        return sorted(replies, key=lambda reply: reply.index)
+
+    async def publish_latest(self, topic: str, payload: bytes, /) -> None:
+        # For state snapshots: within the conflation window only the newest payload
+        # for a topic is sent, whatever the number of updates.
+        self.latest[topic] = payload
+        if self.latest_task is None:
+            self.latest_task = asyncio.create_task(self._publish_latest())
+
+    async def _publish_latest(self, /) -> None:
+        try:
+            await asyncio.sleep(self.conflation_window)
+        finally:
+            self.latest_task = None
+        await self._flush_latest()
+
+    async def _flush_latest(self, /) -> None:
+        latest, self.latest = self.latest, dict()
+        for topic, payload in latest.items():
+            await self.publish(topic, payload, False)
+
+    async def publish_batch(self, topic: str, payloads: typing.Sequence[bytes], /) -> None:
+        if len(payloads) == 1:
+            await self.publish(topic, payloads[0], False)
+        elif payloads:
+            await self.publish(topic, pack_batch(payloads), False, headers={BATCH_HEADER: str(len(payloads))})
+
+    async def publish_batched(self, topic: str, payload: bytes, /) -> None:
+        # Payloads for a topic are held for up to batch_linger (or until batch_max_bytes)
+        # and then sent as one batch. Subscribers see them one by one, in order.
+        self.batches.setdefault(topic, list()).append(payload)
+        self.batch_bytes[topic] = self.batch_bytes.get(topic, 0) + len(payload) + 4
+        if self.batch_bytes[topic] >= self.batch_max_bytes:
+            await self._flush_batch(topic)
+        elif self.batch_task is None:
+            self.batch_task = asyncio.create_task(self._publish_batches())
+
+    async def _publish_batches(self, /) -> None:
+        try:
+            await asyncio.sleep(self.batch_linger)
+        finally:
+            self.batch_task = None
+        await self._flush_batches()
+
+    async def _flush_batch(self, topic: str, /) -> None:
+        payloads = self.batches.pop(topic, list())
+        self.batch_bytes.pop(topic, None)
+        await self.publish_batch(topic, payloads)
+
+    async def _flush_batches(self, /) -> None:
+        for topic in list(self.batches.keys()):
+            await self._flush_batch(topic)
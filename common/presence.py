@@ -0,0 +1,168 @@
+# Copyright (c) 2025 Jonathon Fletcher
+import array
+import inspect
+import itertools
+import logging
+import multiprocessing.resource_tracker
+import multiprocessing.shared_memory
+import struct
+import time
+
+# Layout (little endian):
+#   header: magic, layout version, number of systems, character slots per system
+#   per system: sequence, system_id, population, then the character_id slots
+# A system's sequence is odd while it is being written. Readers copy the record and
+# retry if the sequence was odd or changed meanwhile (a seqlock). Only the first
+# slots characters of a bigger population are listed - population is always the total.
+# A table that has been replaced (eg by a standby taking over) or closed loses its magic,
+# and readers attach again by name. The magic also marks ownership - a writer only unlinks
+# the name while its own segment still has it, so a service standing down after a takeover
+# on the same host leaves the new table alone.
+HEADER = struct.Struct("<4sIII")
+RECORD = struct.Struct("<QiI")
+SEQUENCE = struct.Struct("<Q")
+POPULATION = struct.Struct("<I")
+MAGIC = b"POQP"
+LAYOUT_VERSION = 1
+
+
+def attach(name: str, /, create: bool = False, size: int = 0) -> multiprocessing.shared_memory.SharedMemory:
+    # Segments are never left to the resource tracker - it unlinks by name when the process
+    # exits, which may by then be another service's table. One left behind by a crash is
+    # retired by the next writer.
+    try:
+        return multiprocessing.shared_memory.SharedMemory(name, create=create, size=size, track=False)
+    except TypeError:
+        # Before python 3.13 every segment is tracked.
+        segment = multiprocessing.shared_memory.SharedMemory(name, create=create, size=size)
+        multiprocessing.resource_tracker.unregister(segment._name, "shared_memory")
+        return segment
+
+
+def retire(segment: multiprocessing.shared_memory.SharedMemory, /) -> None:
+    segment.buf[0:len(MAGIC)] = bytes(len(MAGIC))
+    segment.close()
+    try:
+        # Not segment.unlink() - before python 3.13 that unregisters it from the resource
+        # tracker too, which it is not registered with.
+        multiprocessing.shared_memory._posixshmem.shm_unlink(segment._name)
+    except FileNotFoundError:
+        pass
+
+
+class PresenceTable:
+
+    slots: int
+    offsets: dict[int, int]
+
+    def __init__(self, name: str, system_ids: list[int], /, slots: int = 1024):
+        self.logger = logging.getLogger()
+        self.name = name
+        self.slots = slots
+        self.record_size = RECORD.size + 4 * slots
+        size = HEADER.size + len(system_ids) * self.record_size
+        try:
+            self.segment = attach(name, create=True, size=size)
+        except FileExistsError:
+            # Left behind by a service that did not stop cleanly, or still held by one that
+            # is about to stand down.
+            retire(attach(name))
+            self.segment = attach(name, create=True, size=size)
+        self.buf = self.segment.buf
+        self.offsets = dict()
+        for i, system_id in enumerate(system_ids):
+            offset = HEADER.size + i * self.record_size
+            RECORD.pack_into(self.buf, offset, 0, system_id, 0)
+            self.offsets[system_id] = offset
+        # Written last - readers check the magic before anything else.
+        HEADER.pack_into(self.buf, 0, MAGIC, LAYOUT_VERSION, len(system_ids), slots)
+        self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: name:{name}, systems:{len(system_ids)}, slots:{slots}, size:{size}")
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(name:{self.name}, systems:{len(self.offsets)}, slots:{self.slots})"
+
+    def write(self, system_id: int, character_ids: set[int], /) -> None:
+        offset = self.offsets.get(system_id)
+        if offset is None:
+            return
+        sequence, = SEQUENCE.unpack_from(self.buf, offset)
+        SEQUENCE.pack_into(self.buf, offset, sequence + 1)
+        listed = array.array("i", itertools.islice(character_ids, self.slots))
+        start = offset + RECORD.size
+        self.buf[start:start + 4 * len(listed)] = listed.tobytes()
+        POPULATION.pack_into(self.buf, offset + 12, len(character_ids))
+        SEQUENCE.pack_into(self.buf, offset, sequence + 2)
+
+    def owned(self, /) -> bool:
+        return self.buf[0:len(MAGIC)] == MAGIC
+
+    def close(self, /) -> None:
+        owned = self.owned()
+        self.buf = None
+        if owned:
+            retire(self.segment)
+        else:
+            # Replaced by another writer since - the name is theirs now.
+            self.segment.close()
+
+
+class PresenceReader:
+
+    slots: int
+    offsets: dict[int, int]
+    # A record still mid-write after this many tries is given up on - the writer died
+    # during an update and left its sequence odd.
+    max_retries: int = 1000
+
+    def __init__(self, name: str, /):
+        self.segment = attach(name)
+        self.buf = self.segment.buf
+        magic, layout_version, systems, self.slots = HEADER.unpack_from(self.buf, 0)
+        if magic != MAGIC or layout_version != LAYOUT_VERSION:
+            self.close()
+            raise ValueError(f"not a presence table: {name}")
+        record_size = RECORD.size + 4 * self.slots
+        self.offsets = dict()
+        for i in range(systems):
+            offset = HEADER.size + i * record_size
+            _, system_id, _ = RECORD.unpack_from(self.buf, offset)
+            self.offsets[system_id] = offset
+
+    def read(self, system_id: int, /) -> tuple[int, list[int]] | None:
+        # (population, character_ids) as of one consistent moment. None for an unknown
+        # system, a retired table or a record that stays mid-write.
+        offset = self.offsets.get(system_id)
+        if offset is None:
+            return None
+        for _ in range(self.max_retries):
+            if self.retired():
+                return None
+            before, _, population = RECORD.unpack_from(self.buf, offset)
+            if before & 1:
+                time.sleep(0)
+                continue
+            start = offset + RECORD.size
+            listed = array.array("i")
+            listed.frombytes(self.buf[start:start + 4 * min(population, self.slots)])
+            after, = SEQUENCE.unpack_from(self.buf, offset)
+            if before == after:
+                return population, listed.tolist()
+        return None
+
+    def retired(self, /) -> bool:
+        return self.buf[0:len(MAGIC)] != MAGIC
+
+    def population(self, system_id: int, /) -> int:
+        offset = self.offsets.get(system_id)
+        if offset is None:
+            return 0
+        population, = POPULATION.unpack_from(self.buf, offset + 12)
+        return population
+
+    def snapshot(self, /) -> dict[int, tuple[int, list[int]]]:
+        # Each system is consistent on its own - not all of them together.
+        return {system_id: self.read(system_id) for system_id in self.offsets.keys()}
+
+    def close(self, /) -> None:
+        self.buf = None
+        self.segment.close()
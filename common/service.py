@@ -1,21 +1,213 @@
 # Copyright (c) 2025 Jonathon Fletcher
+import asyncio
+import dataclasses
+import functools
 import inspect
 import logging
+import time
+import typing
+import uuid
 
 import google.protobuf.timestamp_pb2
 
+import common.cache
+import common.memory
 import common.messaging
+import common.telemetry
 import poq_pb2 as poq
 
 
+class ResponseCache:
+
+    ttl: float | None
+    hits: int
+    misses: int
+
+    def __init__(self, capacity: int, /, ttl: float | None = None):
+        self.entries = common.cache.LRUCache(capacity)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(size:{len(self.entries)}, hits:{self.hits}, misses:{self.misses})"
+
+    def get(self, key: typing.Hashable, /) -> bytes | None:
+        entry = self.entries.get(key)
+        if entry is not None:
+            expires, response = entry
+            if expires is None or expires > time.monotonic():
+                self.hits += 1
+                return response
+            self.entries.pop(key)
+        self.misses += 1
+        return None
+
+    def put(self, key: typing.Hashable, response: bytes, /) -> None:
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        self.entries.put(key, (expires, response))
+
+    def invalidate(self, key: typing.Hashable = None, /) -> None:
+        if key is None:
+            self.entries.clear()
+        else:
+            self.entries.pop(key)
+
+
+def memoize(capacity: int = 1024, /, ttl: float | None = None) -> typing.Callable:
+    # For request callbacks whose reply depends only on (topic, payload). The serialized
+    # reply is kept per owner in owner.response_caches under the callback name. Put it
+    # outside common.telemetry.trace so that a hit skips the handler span too.
+    def decorator(func: typing.Callable) -> typing.Callable:
+
+        @functools.wraps(func)
+        async def wrapfn(self, topic: str, payload: bytes, /) -> bytes:
+            cache = self.response_caches.get(func.__name__)
+            if cache is None:
+                cache = self.response_caches[func.__name__] = ResponseCache(capacity, ttl=ttl)
+            key = (topic, payload)
+            response = cache.get(key)
+            if response is None:
+                response = await func(self, topic, payload)
+                cache.put(key, response)
+            return response
+
+        return wrapfn
+
+    return decorator
+
+
+def invalidate_responses(owner: typing.Any, /, *names: str) -> None:
+    for name, cache in owner.response_caches.items():
+        if not names or name in names:
+            cache.invalidate()
+
+
+@dataclasses.dataclass(frozen=True)
+class ServiceRecord:
+    instance_id: str
+    type: poq.ServiceType
+    load: int
+    seen: float
+
+
+class ServiceRegistry:
+
+    # Request topics are named for the service type that answers them.
+    topic_types: dict[str, poq.ServiceType] = {
+        "REQ.SESSION": poq.ServiceType.SESSION_SERVICE,
+        "REQ.CHARACTER": poq.ServiceType.CHARACTER_SERVICE,
+        "REQ.SYSTEM": poq.ServiceType.SYSTEM_SERVICE,
+        "REQ.UNIVERSE": poq.ServiceType.SYSTEM_SERVICE,
+        "REQ.CHATTER": poq.ServiceType.CHATTER_SERVICE,
+    }
+
+    expiry: float
+    wait_timeout: float
+
+    def __init__(self, /, expiry: float = 15.0, wait_timeout: float = 0.0):
+        self.logger = logging.getLogger()
+        self.expiry = expiry
+        self.wait_timeout = wait_timeout
+        self.services: dict[poq.ServiceType, dict[str, ServiceRecord]] = dict()
+        self.available_events: dict[poq.ServiceType, asyncio.Event] = dict()
+        self.started: float = None
+        self.users = 0
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({', '.join(f'{poq.ServiceType.Name(t)}:{len(r)}' for t, r in self.services.items())})"
+
+    def service_type(self, topic: str, /) -> poq.ServiceType | None:
+        return self.topic_types.get(".".join(topic.split(".", 2)[:2]))
+
+    def instances(self, service_type: poq.ServiceType, /) -> list[ServiceRecord]:
+        records = self.services.get(service_type, dict())
+        now = time.monotonic()
+        for instance_id in [i for i, r in records.items() if now - r.seen > self.expiry]:
+            self.logger.warning(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {poq.ServiceType.Name(service_type)}:{instance_id} expired")
+            del records[instance_id]
+        if not records and service_type in self.available_events:
+            self.available_events[service_type].clear()
+        return list(records.values())
+
+    def load(self, service_type: poq.ServiceType, /) -> int:
+        return sum(record.load for record in self.instances(service_type))
+
+    def available(self, service_type: poq.ServiceType, /) -> bool:
+        if self.instances(service_type):
+            return True
+        # Until a full expiry has passed, a type not heard from yet may just not have
+        # sent its first heartbeat.
+        return service_type not in self.services and self.started is not None and time.monotonic() - self.started < self.expiry
+
+    async def wait_available(self, topic: str, /) -> bool:
+        service_type = self.service_type(topic)
+        if service_type is None or self.available(service_type):
+            return True
+        if self.wait_timeout <= 0:
+            return False
+        event = self.available_events.setdefault(service_type, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), self.wait_timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def update(self, msg: poq.ServiceStart, /) -> None:
+        records = self.services.setdefault(msg.type, dict())
+        if msg.instance_id not in records:
+            self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {poq.ServiceType.Name(msg.type)}:{msg.instance_id} up")
+        records[msg.instance_id] = ServiceRecord(msg.instance_id, msg.type, msg.load, time.monotonic())
+        self.available_events.setdefault(msg.type, asyncio.Event()).set()
+
+    def remove(self, msg: poq.ServiceStart, /) -> None:
+        records = self.services.setdefault(msg.type, dict())
+        if records.pop(msg.instance_id, None) is not None:
+            self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {poq.ServiceType.Name(msg.type)}:{msg.instance_id} down")
+        if not records and msg.type in self.available_events:
+            self.available_events[msg.type].clear()
+
+    async def service_up_cb(self, topic: str, payload: bytes, /) -> bytes:
+        self.update(poq.ServiceStart.FromString(payload))
+
+    async def service_down_cb(self, topic: str, payload: bytes, /) -> bytes:
+        self.remove(poq.ServiceStart.FromString(payload))
+
+    async def start(self, msg_service: common.messaging.MessageService, /) -> None:
+        # Shared by every Service on the MessageService - subscribed by the first to start.
+        self.users += 1
+        if self.users > 1:
+            return
+        self.started = time.monotonic()
+        await msg_service.subscribe("PUB.SERVICE.START", self.service_up_cb, False)
+        await msg_service.subscribe("PUB.SERVICE.HEARTBEAT", self.service_up_cb, False)
+        await msg_service.subscribe("PUB.SERVICE.STOP", self.service_down_cb, False)
+
+    async def stop(self, msg_service: common.messaging.MessageService, /) -> None:
+        self.users -= 1
+        if self.users > 0:
+            return
+        await msg_service.unsubscribe("PUB.SERVICE.STOP", self.service_down_cb)
+        await msg_service.unsubscribe("PUB.SERVICE.HEARTBEAT", self.service_up_cb)
+        await msg_service.unsubscribe("PUB.SERVICE.START", self.service_up_cb)
+
+
+def service_registry(msg_service: common.messaging.MessageService, /) -> ServiceRegistry:
+    if msg_service.registry is None:
+        msg_service.registry = ServiceRegistry()
+    return msg_service.registry
+
+
 class ServiceInstance:
 
     msg_service: common.messaging.MessageService
     logger: logging.Logger
+    response_caches: dict[str, ResponseCache]
 
     def __init__(self, msg_service: common.messaging.MessageService, /):
         self.msg_service = msg_service
         self.logger = logging.getLogger()
+        self.response_caches = dict()
 
     async def start(self):
         pass
@@ -29,31 +221,142 @@ class ServiceManager:
     msg_service: common.messaging.MessageService
     logger: logging.Logger
     service_type: poq.ServiceType
+    lifecycle_concurrency: int = 64
+    heartbeat_interval: float = 5.0
+    response_caches: dict[str, ResponseCache]
 
     def __init__(self, msg_service: common.messaging.MessageService, service_type: poq.ServiceType, /):
         self.msg_service = msg_service
         self.service_type = service_type
+        self.instance_id = uuid.uuid4().hex
         self.logger = logging.getLogger()
+        self.response_caches = dict()
+        self.registry = service_registry(msg_service)
+        self.connected_task: asyncio.Task = None
+        self.heartbeat_task: asyncio.Task = None
+
+    def load(self) -> int:
+        return 0
+
+    def service_message(self) -> poq.ServiceStart:
+        return poq.ServiceStart(type=self.service_type, timestamp=google.protobuf.timestamp_pb2.Timestamp().GetCurrentTime(),
+            instance_id=self.instance_id, load=self.load())
+
+    def memory_structures(self) -> dict[str, typing.Any]:
+        # name -> the structures memory accounting reports on. Services add their instance
+        # maps and caches.
+        structures = common.memory.messaging_structures(self.msg_service)
+        for name, cache in self.response_caches.items():
+            structures[f"response_caches.{name}"] = cache.entries
+        return structures
+
+    @common.telemetry.trace
+    async def service_memory_cb(self, topic: str, payload: bytes, /) -> bytes:
+        request = poq.ServiceMemoryRequest.FromString(payload)
+        # What everything refers back to is accounted once, under its own name - not in
+        # every instance that refers to it.
+        shared = {id(self), id(self.msg_service), id(self.logger)}
+        shared.update(id(value) for value in vars(self).values())
+        shared.update(id(value) for value in vars(self.msg_service).values())
+        structures = [common.memory.structure(name, obj, exclude=shared - {id(obj)}) for name, obj in self.memory_structures().items()]
+        rss, peak_rss = common.memory.process_memory()
+        response = poq.ServiceMemoryResponse(instance_id=self.instance_id, type=self.service_type, rss=rss, peak_rss=peak_rss, structures=structures)
+        if request.heap_stop:
+            common.memory.heap_stop()
+        elif request.heap_top > 0:
+            # Snapshots of a big heap take a while - off the event loop.
+            response.heap.extend(await asyncio.to_thread(common.memory.heap_diff, request.heap_top))
+        traced = common.memory.heap_traced()
+        if traced is not None:
+            response.heap_tracing = True
+            response.heap_traced, response.heap_peak = traced
+        self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: rss:{rss}, structures:{len(structures)}, heap:{len(response.heap)}")
+        return response.SerializeToString()
 
     async def service_startup_cb(self, topic: str, payload: bytes, /) -> bytes:
         msg = poq.ServiceStart.FromString(payload)
         ts = msg.timestamp.ToDatetime()
         self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: type:{msg.type}, timestamp:{ts}")
 
-    async def start(self):
-        start_msg = poq.ServiceStart(type=self.service_type, timestamp=google.protobuf.timestamp_pb2.Timestamp().GetCurrentTime())
-        await self.msg_service.publish("PUB.SERVICE.START", start_msg.SerializeToString(), False)
+    async def bounded(self, aws: typing.Iterable[typing.Awaitable], /) -> list:
+        # Runs the awaitables at most lifecycle_concurrency at a time. Failures are
+        # logged and returned in place rather than abandoning the rest.
+        semaphore = asyncio.Semaphore(self.lifecycle_concurrency)
+
+        async def run(aw: typing.Awaitable):
+            async with semaphore:
+                return await aw
+
+        results = await asyncio.gather(*(run(aw) for aw in aws), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {result!r}")
+        return results
+
+    async def start_instances(self, instances: typing.Iterable[ServiceInstance], /) -> list:
+        return await self.bounded(instance.start() for instance in instances)
+
+    async def stop_instances(self, instances: typing.Iterable[ServiceInstance], /) -> list:
+        return await self.bounded(instance.stop() for instance in instances)
+
+    async def service_connected(self):
+        pass
 
+    async def _service_connected(self):
+        # Services are started before the message service connects, so anything that
+        # needs to send (including the start announcement) waits for the connection.
+        await self.msg_service.connected.wait()
+        try:
+            await self.service_connected()
+        except Exception as ex:
+            self.logger.error(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {ex!r}")
+
+        try:
+            await self.msg_service.publish("PUB.SERVICE.START", self.service_message().SerializeToString(), False)
+        except Exception as ex:
+            self.logger.error(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {ex!r}")
+
+        self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}")
+
+    async def heartbeat(self, /) -> None:
+        # On its own from the connection on - however service_connected goes, and whatever
+        # a beat runs into, the other processes keep seeing this instance.
+        await self.msg_service.connected.wait()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        while True:
+            deadline += self.heartbeat_interval
+            await asyncio.sleep(max(0, deadline - loop.time()))
+            try:
+                await self.msg_service.publish("PUB.SERVICE.HEARTBEAT", self.service_message().SerializeToString(), False)
+            except Exception as ex:
+                self.logger.error(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {ex!r}")
+
+    async def start(self):
+        await self.registry.start(self.msg_service)
         await self.msg_service.subscribe("PUB.SERVICE.START", self.service_startup_cb, False)
+        await self.msg_service.subscribe(f"REQ.SERVICE.MEMORY.{self.instance_id}", self.service_memory_cb, False)
+        self.connected_task = asyncio.create_task(self._service_connected())
+        self.heartbeat_task = asyncio.create_task(self.heartbeat())
 
         self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}")
 
     async def stop(self):
-        await self.msg_service.unsubscribe("PUB.SERVICE.START")
+        for name, cache in self.response_caches.items():
+            self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {name}:{cache}")
+        invalidate_responses(self)
 
-        stop_msg = poq.ServiceStart(type=self.service_type, timestamp=google.protobuf.timestamp_pb2.Timestamp().GetCurrentTime())
+        if self.heartbeat_task:
+            self.heartbeat_task.cancel()
+            self.heartbeat_task = None
+        if self.connected_task:
+            self.connected_task.cancel()
+            self.connected_task = None
+        await self.msg_service.unsubscribe(f"REQ.SERVICE.MEMORY.{self.instance_id}", self.service_memory_cb)
+        await self.msg_service.unsubscribe("PUB.SERVICE.START", self.service_startup_cb)
 
-        await self.msg_service.publish("PUB.SERVICE.STOP", stop_msg.SerializeToString(), False)
+        await self.msg_service.publish("PUB.SERVICE.STOP", self.service_message().SerializeToString(), False)
+        await self.registry.stop(self.msg_service)
 
         self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}")
 
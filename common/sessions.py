@@ -0,0 +1,91 @@
+# Copyright (c) 2025 Jonathon Fletcher
+import dataclasses
+import hashlib
+import hmac
+import logging
+import os
+import secrets
+import struct
+import time
+
+import poq_pb2 as poq
+
+# A token is the hex of character_id, generation and expiry (epoch seconds) followed by
+# a truncated HMAC-SHA256 of them - hex so that it can be used in topic names.
+TOKEN_PAYLOAD = struct.Struct(">iQI")
+TOKEN_MAC_SIZE = 16
+
+
+@dataclasses.dataclass(frozen=True)
+class SessionClaims:
+    character_id: int
+    generation: int
+    expires: int
+
+
+def session_key() -> bytes:
+    key = os.environ.get("POQ_SESSION_KEY")
+    if not key:
+        # Only this process can verify its tokens.
+        logging.getLogger().warning("POQ_SESSION_KEY not set - using a random key")
+        return secrets.token_bytes(32)
+    return key.encode()
+
+
+class SessionTokens:
+
+    key: bytes
+    min_generation: int
+    revoked: dict[int, tuple[int, int]]
+
+    def __init__(self, key: bytes, /):
+        self.key = key
+        # Tokens of an earlier generation than this are all revoked (eg issued before
+        # the SessionService restarted).
+        self.min_generation = 0
+        # character_id -> (newest revoked generation, its expiry). Tokens are only
+        # revoked until they expire anyway, so expired entries are dropped.
+        self.revoked = dict()
+
+    def _mac(self, payload: bytes, /) -> bytes:
+        return hmac.new(self.key, payload, hashlib.sha256).digest()[:TOKEN_MAC_SIZE]
+
+    def issue(self, claims: SessionClaims, /) -> str:
+        payload = TOKEN_PAYLOAD.pack(claims.character_id, claims.generation, claims.expires)
+        return (payload + self._mac(payload)).hex()
+
+    def verify(self, token: str, /, check_expiry: bool = True) -> SessionClaims | None:
+        # Without check_expiry only the signature and revocations are checked - for a
+        # session that is already running, which is kept alive by its pings instead.
+        try:
+            raw = bytes.fromhex(token)
+        except ValueError:
+            return None
+        if len(raw) != TOKEN_PAYLOAD.size + TOKEN_MAC_SIZE:
+            return None
+        payload, mac = raw[:TOKEN_PAYLOAD.size], raw[TOKEN_PAYLOAD.size:]
+        if not hmac.compare_digest(mac, self._mac(payload)):
+            return None
+        claims = SessionClaims(*TOKEN_PAYLOAD.unpack(payload))
+        if (check_expiry and claims.expires < time.time()) or claims.generation < self.min_generation:
+            return None
+        revoked = self.revoked.get(claims.character_id)
+        if revoked and claims.generation <= revoked[0]:
+            return None
+        return claims
+
+    def revoke(self, claims: SessionClaims, /) -> None:
+        revoked = self.revoked.get(claims.character_id)
+        if revoked is None or revoked[0] < claims.generation:
+            self.revoked[claims.character_id] = (claims.generation, claims.expires)
+
+    def revocations(self, claims: list[SessionClaims] = None, /) -> poq.SessionRevocationMessage:
+        # The given claims, or the whole set.
+        if claims is None:
+            now = time.time()
+            for character_id in [c for c, (_, expires) in self.revoked.items() if expires < now]:
+                del self.revoked[character_id]
+            claims = [SessionClaims(character_id, generation, expires) for character_id, (generation, expires) in self.revoked.items()]
+        return poq.SessionRevocationMessage(min_generation=self.min_generation, revoked=[
+            poq.SessionRevoked(character_id=c.character_id, generation=c.generation, expires=c.expires) for c in claims])
+
@@ -1,38 +1,75 @@
 # Copyright (c) 2025 Jonathon Fletcher
 import functools
 import inspect
+import os
 import typing
 
-import opentelemetry.exporter.otlp.proto.grpc.trace_exporter
-import opentelemetry.exporter.otlp.proto.http.trace_exporter
-import opentelemetry.instrumentation
-import opentelemetry.instrumentation.grpc
-import opentelemetry.sdk.resources
-import opentelemetry.sdk.trace
-import opentelemetry.sdk.trace.export
-import opentelemetry.semconv.resource
 import opentelemetry.trace
 
 _OTEL_INITIALIZED: bool = False
+# Set once initialize_telemetry has installed a tracer provider - until then (and when
+# tracing is off) traced functions are called straight through.
+_OTEL_TRACING: bool = False
 
 
-def initialize_telemetry() -> opentelemetry.trace.Tracer:
+def telemetry_disabled() -> bool:
+    return os.environ.get("OTEL_SDK_DISABLED", "").lower() == "true" or os.environ.get("OTEL_TRACES_EXPORTER", "").lower() == "none"
 
-    global _OTEL_INITIALIZED
-    if _OTEL_INITIALIZED is False:
-        trace_exporter = opentelemetry.exporter.otlp.proto.grpc.trace_exporter.OTLPSpanExporter()
 
-        span_processor = opentelemetry.sdk.trace.export.BatchSpanProcessor(trace_exporter)
+def span_exporter() -> typing.Any:
+    # The standard OTEL_* settings pick the exporter. Only the chosen one is imported -
+    # the OTLP exporters pull in grpc / requests and the generated protobufs.
+    if telemetry_disabled():
+        return None
+    exporter = os.environ.get("OTEL_TRACES_EXPORTER", "otlp").lower()
+    match exporter:
+        case "otlp":
+            protocol = os.environ.get("OTEL_EXPORTER_OTLP_TRACES_PROTOCOL", os.environ.get("OTEL_EXPORTER_OTLP_PROTOCOL", "grpc")).lower()
+            if protocol.startswith("http"):
+                import opentelemetry.exporter.otlp.proto.http.trace_exporter
+                return opentelemetry.exporter.otlp.proto.http.trace_exporter.OTLPSpanExporter()
+            import opentelemetry.exporter.otlp.proto.grpc.trace_exporter
+            return opentelemetry.exporter.otlp.proto.grpc.trace_exporter.OTLPSpanExporter()
+        case "console":
+            import opentelemetry.sdk.trace.export
+            return opentelemetry.sdk.trace.export.ConsoleSpanExporter()
+        case _:
+            raise ValueError(f"unsupported OTEL_TRACES_EXPORTER: {exporter}")
+
+
+def tracer_provider(trace_exporter: typing.Any, /) -> opentelemetry.trace.TracerProvider:
+    import opentelemetry.sdk.trace
+    import opentelemetry.sdk.trace.export
+
+    span_processor = opentelemetry.sdk.trace.export.BatchSpanProcessor(trace_exporter)
+
+    trace_provider = opentelemetry.sdk.trace.TracerProvider()
+
+    trace_provider.add_span_processor(span_processor)
+
+    return trace_provider
 
-        trace_provider = opentelemetry.sdk.trace.TracerProvider()
 
-        trace_provider.add_span_processor(span_processor)
+def instrument_grpc_client() -> None:
+    import opentelemetry.instrumentation.grpc
 
-        opentelemetry.trace.set_tracer_provider(trace_provider)
+    instrumentor = opentelemetry.instrumentation.grpc.GrpcInstrumentorClient()
+    if not instrumentor.is_instrumented_by_opentelemetry:
+        instrumentor.instrument()
 
-        instrumentor = opentelemetry.instrumentation.grpc.GrpcInstrumentorClient()
-        if not instrumentor.is_instrumented_by_opentelemetry:
-            instrumentor.instrument()
+
+def initialize_telemetry(grpc_client: bool = False) -> opentelemetry.trace.Tracer:
+
+    global _OTEL_INITIALIZED, _OTEL_TRACING
+    if _OTEL_INITIALIZED is False:
+        trace_exporter = span_exporter()
+        if trace_exporter is not None:
+            opentelemetry.trace.set_tracer_provider(tracer_provider(trace_exporter))
+
+            if grpc_client:
+                instrument_grpc_client()
+
+            _OTEL_TRACING = True
 
         _OTEL_INITIALIZED = True
 
@@ -41,10 +78,16 @@ def initialize_telemetry() -> opentelemetry.trace.Tracer:
 
 def trace(func: typing.Callable):
 
+    # Switched off in the environment at import time - no wrapper at all.
+    if telemetry_disabled():
+        return func
+
     if inspect.iscoroutinefunction(func):
 
         @functools.wraps(func)
         async def asyncwrapfn(*args, **kwargs):
+            if not _OTEL_TRACING:
+                return await func(*args, **kwargs)
             tracer = opentelemetry.trace.get_tracer_provider().get_tracer(func.__module__)
             with tracer.start_as_current_span(func.__qualname__) as span:
                 try:
@@ -59,6 +102,8 @@ def trace(func: typing.Callable):
 
         @functools.wraps(func)
         def wrapfn(*args, **kwargs):
+            if not _OTEL_TRACING:
+                return func(*args, **kwargs)
             tracer = opentelemetry.trace.get_tracer_provider().get_tracer(func.__module__)
             with tracer.start_as_current_span(func.__qualname__) as span:
                 try:
@@ -0,0 +1,78 @@
+# Copyright (c) 2025 Jonathon Fletcher
+import math
+import typing
+
+
+class TimerWheel:
+
+    tick: float
+    slots: int
+    levels: int
+    current: int
+
+    def __init__(self, tick: float, /, slots: int = 256, levels: int = 4, start: float = 0.0):
+        self.tick = tick
+        self.slots = slots
+        self.levels = levels
+        self.current = int(start // tick)
+        self.wheels: list[list[set[typing.Hashable]]] = [[set() for _ in range(slots)] for _ in range(levels)]
+        # key -> (deadline tick, level, slot)
+        self.timers: dict[typing.Hashable, tuple[int, int, int]] = dict()
+
+    def __len__(self) -> int:
+        return len(self.timers)
+
+    def __contains__(self, key: typing.Hashable, /) -> bool:
+        return key in self.timers
+
+    def _place(self, key: typing.Hashable, deadline: int, /) -> None:
+        delta = max(deadline - self.current, 1)
+        level = 0
+        while level < self.levels - 1 and delta >= self.slots ** (level + 1):
+            level += 1
+        slot = (deadline // self.slots ** level) % self.slots
+        self.wheels[level][slot].add(key)
+        self.timers[key] = (deadline, level, slot)
+
+    def schedule(self, key: typing.Hashable, delay: float, /) -> None:
+        # (Re)arms the timer for key - O(1) whatever the number of timers.
+        self.cancel(key)
+        self._place(key, self.current + max(math.ceil(delay / self.tick), 1))
+
+    def cancel(self, key: typing.Hashable, /) -> bool:
+        timer = self.timers.pop(key, None)
+        if timer is None:
+            return False
+        _, level, slot = timer
+        self.wheels[level][slot].discard(key)
+        return True
+
+    def _cascade(self, level: int, /) -> None:
+        slot = (self.current // self.slots ** level) % self.slots
+        keys, self.wheels[level][slot] = self.wheels[level][slot], set()
+        for key in keys:
+            deadline, _, _ = self.timers.pop(key)
+            self._place(key, deadline)
+
+    def advance(self, ticks: int = 1, /) -> list[typing.Hashable]:
+        expired = list()
+        for _ in range(ticks):
+            self.current += 1
+            # Timers move down a level as the lower wheel wraps around.
+            for level in range(1, self.levels):
+                if self.current % self.slots ** level:
+                    break
+                self._cascade(level)
+            slot = self.current % self.slots
+            keys, self.wheels[0][slot] = self.wheels[0][slot], set()
+            for key in keys:
+                deadline, _, _ = self.timers[key]
+                if deadline <= self.current:
+                    del self.timers[key]
+                    expired.append(key)
+                else:
+                    self.wheels[0][slot].add(key)
+        return expired
+
+    def advance_to(self, now: float, /) -> list[typing.Hashable]:
+        return self.advance(max(int(now // self.tick) - self.current, 0))
@@ -0,0 +1,142 @@
+# Copyright (c) 2025 Jonathon Fletcher
+import array
+import dataclasses
+import typing
+
+
+@dataclasses.dataclass(frozen=True)
+class Resolution:
+    name: str
+    # Seconds per point, and the number of points held.
+    interval: int
+    capacity: int
+
+
+# 5 minutes by the second, 6 hours by the minute and a week by the hour.
+DEFAULT_RESOLUTIONS = (
+    Resolution("1s", 1, 300),
+    Resolution("1m", 60, 360),
+    Resolution("1h", 3600, 168),
+)
+
+
+class Level:
+
+    resolution: Resolution
+    mean: array.array
+    peak: array.array
+
+    def __init__(self, resolution: Resolution, size: int, /):
+        self.resolution = resolution
+        self.size = size
+        # Rings of capacity points for every series, allocated up front - point by point,
+        # so a bucket is written as one slice.
+        self.mean = array.array("f", bytes(4 * resolution.capacity * size))
+        self.peak = array.array("I", bytes(4 * resolution.capacity * size))
+        # The bucket being filled from the level below.
+        self.acc_sum = array.array("d")
+        self.acc_peak = array.array("I")
+        self.acc_count = 0
+        self.acc_bucket: int = None
+        self.first_bucket: int = None
+        self.last_bucket: int = None
+
+    def add(self, bucket: int, means: typing.Sequence[float], peaks: typing.Sequence[int], /) -> tuple[int, array.array, array.array] | None:
+        # Returns the bucket completed by moving on to the next one, if any.
+        completed = None
+        if self.acc_bucket is not None and bucket != self.acc_bucket:
+            completed = self.flush()
+        self.acc_bucket = bucket
+        if self.acc_count == 0:
+            # The first in a bucket (every sample, at the finest resolution) - just a copy.
+            self.acc_sum = array.array("d", means)
+            self.acc_peak = array.array("I", peaks)
+        else:
+            acc_sum, acc_peak = self.acc_sum, self.acc_peak
+            for i, (mean, peak) in enumerate(zip(means, peaks)):
+                acc_sum[i] += mean
+                if peak > acc_peak[i]:
+                    acc_peak[i] = peak
+        self.acc_count += 1
+        return completed
+
+    def flush(self, /) -> tuple[int, array.array, array.array]:
+        bucket, capacity, size = self.acc_bucket, self.resolution.capacity, self.size
+        means = array.array("f", (total / self.acc_count for total in self.acc_sum))
+        peaks = array.array("I", self.acc_peak)
+        if self.last_bucket is not None:
+            # Nothing was sampled in between (eg the service was paused) - zero, rather
+            # than leave points from capacity buckets ago.
+            for skipped in range(max(self.last_bucket + 1, bucket - capacity + 1), bucket):
+                start = (skipped % capacity) * size
+                self.mean[start:start + size] = array.array("f", bytes(4 * size))
+                self.peak[start:start + size] = array.array("I", bytes(4 * size))
+        start = (bucket % capacity) * size
+        self.mean[start:start + size] = means
+        self.peak[start:start + size] = peaks
+        if self.first_bucket is None:
+            self.first_bucket = bucket
+        self.last_bucket = bucket
+
+        self.acc_count = 0
+        self.acc_bucket = None
+        return bucket, means, peaks
+
+    def series(self, index: int, points: int, /) -> tuple[int, list[float], list[int]]:
+        # (first bucket, means, peaks) - the newest points complete buckets, oldest first.
+        if self.last_bucket is None:
+            return 0, list(), list()
+        capacity, size = self.resolution.capacity, self.size
+        count = min(capacity, self.last_bucket - self.first_bucket + 1)
+        if points:
+            count = min(count, points)
+        first = self.last_bucket - count + 1
+        slots = [(bucket % capacity) * size + index for bucket in range(first, self.last_bucket + 1)]
+        return first, [self.mean[slot] for slot in slots], [self.peak[slot] for slot in slots]
+
+
+class TimeSeries:
+
+    keys: list[int]
+    levels: list[Level]
+
+    def __init__(self, keys: typing.Sequence[int], /, resolutions: typing.Sequence[Resolution] = DEFAULT_RESOLUTIONS):
+        # One series per key, at every resolution. Memory is fixed by the number of keys
+        # and the capacities, however long it runs.
+        self.keys = list(keys)
+        self.index = {key: i for i, key in enumerate(self.keys)}
+        self.levels = [Level(resolution, len(self.keys)) for resolution in resolutions]
+        # The first sample's timestamp and bucket - later samples are placed by the whole
+        # number of intervals since then.
+        self.origin: float = None
+        self.origin_bucket: int = None
+        self.last_bucket: int = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(keys:{len(self.keys)}, resolutions:{','.join(level.resolution.name for level in self.levels)}, bytes:{self.nbytes()})"
+
+    def nbytes(self) -> int:
+        return sum(level.mean.itemsize * len(level.mean) + level.peak.itemsize * len(level.peak) for level in self.levels)
+
+    def record(self, values: typing.Sequence[int], timestamp: float, /) -> None:
+        # values in key order, sampled every interval. Each level is filled from the buckets
+        # the level below completes - means of means and peaks of peaks.
+        interval = self.levels[0].resolution.interval
+        if self.origin is None:
+            self.origin, self.origin_bucket = timestamp, int(timestamp // interval)
+        # Each sample goes in the bucket nearest a whole number of intervals after the first,
+        # and always after the one before - jitter at a bucket boundary (or the clock stepping
+        # back) must not put two samples in one bucket and leave a zero in the next.
+        bucket = self.origin_bucket + round((timestamp - self.origin) / interval)
+        if self.last_bucket is not None:
+            bucket = max(bucket, self.last_bucket + 1)
+        self.last_bucket = bucket
+        completed = self.levels[0].add(bucket, values, values)
+        for below, level in zip(self.levels, self.levels[1:]):
+            if completed is None:
+                break
+            below_bucket, means, peaks = completed
+            completed = level.add(below_bucket * below.resolution.interval // level.resolution.interval, means, peaks)
+
+    def level(self, name: str, /) -> Level | None:
+        return next((level for level in self.levels if level.resolution.name == name), None)
@@ -1,5 +1,7 @@
 # Copyright (c) 2025 Jonathon Fletcher
 import dataclasses
+import hashlib
+import json
 
 
 @dataclasses.dataclass(frozen=True)
@@ -13,3 +15,62 @@ class System:
 class Character:
     character_id: int
     name: str
+
+
+def load_universe(path: str = "universe.json", /) -> dict[int, System]:
+    universe: dict[int, System] = dict()
+    with open(path) as ifp:
+        for record in json.load(ifp):
+            system = System(**record)
+            universe[system.system_id] = system
+    return universe
+
+
+def load_characters(path: str = "characters.json", /) -> dict[int, Character]:
+    characters: dict[int, Character] = dict()
+    with open(path) as ifp:
+        for record in json.load(ifp):
+            character = Character(**record)
+            characters[character.character_id] = character
+    return characters
+
+
+def load_accounts(path: str = "accounts.json", /) -> dict[str, int]:
+    accounts: dict[str, int] = dict()
+    with open(path) as ifp:
+        for record in json.load(ifp):
+            accounts[record['username']] = record['character_id']
+    return accounts
+
+
+def region(universe: dict[int, System], system_id: int, jumps: int, /) -> set[int]:
+    # Breadth first - the systems within jumps of system_id, including itself.
+    if system_id not in universe:
+        return set()
+    seen = {system_id}
+    frontier = [system_id]
+    for _ in range(jumps):
+        next_frontier = list()
+        for current_id in frontier:
+            for neighbour_id in universe[current_id].neighbours:
+                if neighbour_id not in seen and neighbour_id in universe:
+                    seen.add(neighbour_id)
+                    next_frontier.append(neighbour_id)
+        frontier = next_frontier
+    return seen
+
+
+def universe_version(universe: dict[int, System], /) -> str:
+    hash = hashlib.sha1()
+    for system_id in sorted(universe.keys()):
+        system = universe[system_id]
+        hash.update(f"{system.system_id}:{system.name}:{sorted(system.neighbours)}\n".encode())
+    return hash.hexdigest()
+
+
+def characters_version(characters: dict[int, Character], /) -> str:
+    hash = hashlib.sha1()
+    for character_id in sorted(characters.keys()):
+        character = characters[character_id]
+        hash.update(f"{character.character_id}:{character.name}\n".encode())
+    return hash.hexdigest()
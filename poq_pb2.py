@@ -25,7 +25,7 @@ _sym_db = _symbol_database.Default()
 from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\tpoq.proto\x12\x03poq\x1a\x1fgoogle/protobuf/timestamp.proto\"U\n\x0cTopicMessage\x12\x15\n\rrequest_topic\x18\x01 \x01(\t\x12\x15\n\rpublish_topic\x18\x02 \x01(\t\x12\x17\n\x0fsubscribe_topic\x18\x03 \x01(\t\"]\n\x0cServiceStart\x12\x1e\n\x04type\x18\x01 \x01(\x0e\x32\x10.poq.ServiceType\x12-\n\ttimestamp\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"@\n\x1a\x43haracterStaticInfoMessage\x12\x14\n\x0c\x63haracter_id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\"2\n\x1a\x43haracterStaticInfoRequest\x12\x14\n\x0c\x63haracter_id\x18\x01 \x01(\x05\"i\n\x1b\x43haracterStaticInfoResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12>\n\x15\x63haracter_static_info\x18\x02 \x01(\x0b\x32\x1f.poq.CharacterStaticInfoMessage\"S\n\x18\x43haracterLiveInfoMessage\x12\x14\n\x0c\x63haracter_id\x18\x01 \x01(\x05\x12\x11\n\tsystem_id\x18\x02 \x01(\x05\x12\x0e\n\x06\x61\x63tive\x18\x03 \x01(\x08\"0\n\x18\x43haracterLiveInfoRequest\x12\x14\n\x0c\x63haracter_id\x18\x01 \x01(\x05\"y\n\x19\x43haracterLiveInfoResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x14\n\x0c\x63haracter_id\x18\x02 \x01(\x05\x12:\n\x13\x63haracter_live_info\x18\x03 \x01(\x0b\x32\x1d.poq.CharacterLiveInfoMessage\"-\n\x15\x43haracterLoginRequest\x12\x14\n\x0c\x63haracter_id\x18\x01 \x01(\x05\"v\n\x16\x43haracterLoginResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x14\n\x0c\x63haracter_id\x18\x02 \x01(\x05\x12:\n\x13\x63haracter_live_info\x18\x03 \x01(\x0b\x32\x1d.poq.CharacterLiveInfoMessage\".\n\x16\x43haracterLogoutRequest\x12\x14\n\x0c\x63haracter_id\x18\x01 \x01(\x05\";\n\x17\x43haracterLogoutResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x14\n\x0c\x63haracter_id\x18\x02 \x01(\x05\"-\n\x15\x43haracterTopicRequest\x12\x14\n\x0c\x63haracter_id\x18\x01 \x01(\x05\"g\n\x16\x43haracterTopicResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x14\n\x0c\x63haracter_id\x18\x02 \x01(\x05\x12+\n\x10\x63haracter_topics\x18\x03 \x01(\x0b\x32\x11.poq.TopicMessage\"G\n\x0e\x43hatterMessage\x12\x14\n\x0c\x63haracter_id\x18\x01 \x01(\x05\x12\x11\n\tsystem_id\x18\x02 \x01(\x05\x12\x0c\n\x04text\x18\x03 \x01(\t\"(\n\x13\x43hatterTopicRequest\x12\x11\n\tsystem_id\x18\x01 \x01(\x05\"`\n\x14\x43hatterTopicResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x11\n\tsystem_id\x18\x02 \x01(\x05\x12)\n\x0e\x63hatter_topics\x18\x03 \x01(\x0b\x32\x11.poq.TopicMessage\"N\n\x17SystemStaticInfoMessage\x12\x11\n\tsystem_id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x12\n\nneighbours\x18\x03 \x03(\x05\"\n\n\x08Universe\"\x11\n\x0fUniverseRequest\"M\n\x10UniverseResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12-\n\x07systems\x18\x02 \x03(\x0b\x32\x1c.poq.SystemStaticInfoMessage\",\n\x17SystemStaticInfoRequest\x12\x11\n\tsystem_id\x18\x01 \x01(\x05\"s\n\x18SystemStaticInfoResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x11\n\tsystem_id\x18\x02 \x01(\x05\x12\x38\n\x12system_static_info\x18\x03 \x01(\x0b\x32\x1c.poq.SystemStaticInfoMessage\"@\n\x15SystemLiveInfoMessage\x12\x11\n\tsystem_id\x18\x01 \x01(\x05\x12\x14\n\x0c\x63haracter_id\x18\x02 \x03(\x05\"*\n\x15SystemLiveInfoRequest\x12\x11\n\tsystem_id\x18\x01 \x01(\x05\"m\n\x16SystemLiveInfoResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x11\n\tsystem_id\x18\x02 \x01(\x05\x12\x34\n\x10system_live_info\x18\x03 \x01(\x0b\x32\x1a.poq.SystemLiveInfoMessage\"Y\n\x1dSystemSetLiveCharacterRequest\x12\x14\n\x0c\x63haracter_id\x18\x01 \x01(\x05\x12\x11\n\tsystem_id\x18\x02 \x01(\x05\x12\x0f\n\x07present\x18\x03 \x01(\x08\"U\n\x1eSystemSetLiveCharacterResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x14\n\x0c\x63haracter_id\x18\x02 \x01(\x05\x12\x11\n\tsystem_id\x18\x03 \x01(\x05\"\'\n\x12SystemTopicRequest\x12\x11\n\tsystem_id\x18\x01 \x01(\x05\"^\n\x13SystemTopicResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x11\n\tsystem_id\x18\x02 \x01(\x05\x12(\n\rsystem_topics\x18\x03 \x01(\x0b\x32\x11.poq.TopicMessage\"\'\n\x13SessionStartRequest\x12\x10\n\x08username\x18\x01 \x01(\t\"w\n\x14SessionStartResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x14\n\x0c\x63haracter_id\x18\x02 \x01(\x05\x12\x12\n\nsession_id\x18\x03 \x01(\t\x12)\n\x0esession_topics\x18\x04 \x01(\x0b\x32\x11.poq.TopicMessage\"(\n\x12SessionStopRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\"5\n\x13SessionStopResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x12\n\nsession_id\x18\x02 \x01(\t\"!\n\x0bSessionPing\x12\x12\n\nsession_id\x18\x01 \x01(\t\"!\n\x0bSessionPong\x12\x12\n\nsession_id\x18\x01 \x01(\t\"\x8d\x01\n\x15SessionMessageRequest\x12%\n\x04type\x18\x01 \x01(\x0e\x32\x17.poq.SessionMessageType\x12\x14\n\x0c\x63haracter_id\x18\x02 \x01(\x05\x12\x11\n\tsystem_id\x18\x03 \x01(\x05\x12$\n\x07\x63hatter\x18\x04 \x01(\x0b\x32\x13.poq.ChatterMessage\"\xdd\x02\n\x16SessionMessageResponse\x12%\n\x04type\x18\x01 \x01(\x0e\x32\x17.poq.SessionMessageType\x12\n\n\x02ok\x18\x02 \x01(\x08\x12>\n\x15\x63haracter_static_info\x18\x07 \x01(\x0b\x32\x1f.poq.CharacterStaticInfoMessage\x12:\n\x13\x63haracter_live_info\x18\x08 \x01(\x0b\x32\x1d.poq.CharacterLiveInfoMessage\x12\x38\n\x12system_static_info\x18\t \x01(\x0b\x32\x1c.poq.SystemStaticInfoMessage\x12\x34\n\x10system_live_info\x18\n \x01(\x0b\x32\x1a.poq.SystemLiveInfoMessage\x12$\n\x07\x63hatter\x18\r \x01(\x0b\x32\x13.poq.ChatterMessage*\x8c\x01\n\x0bServiceType\x12\x13\n\x0fUNKNOWN_SERVICE\x10\x00\x12\x13\n\x0fGATEWAY_SERVICE\x10\x01\x12\x13\n\x0fSESSION_SERVICE\x10\x02\x12\x15\n\x11\x43HARACTER_SERVICE\x10\x03\x12\x12\n\x0eSYSTEM_SERVICE\x10\x04\x12\x13\n\x0f\x43HATTER_SERVICE\x10\x05*\xc9\x01\n\x12SessionMessageType\x12\x18\n\x14UNKNOWN_MESSAGE_TYPE\x10\x00\x12\t\n\x05START\x10\x01\x12\x08\n\x04STOP\x10\x02\x12\t\n\x05LOGIN\x10\x05\x12\n\n\x06LOGOUT\x10\x06\x12\x19\n\x15\x43HARACTER_STATIC_INFO\x10\x07\x12\x17\n\x13\x43HARACTER_LIVE_INFO\x10\x08\x12\x16\n\x12SYSTEM_STATIC_INFO\x10\t\x12\x14\n\x10SYSTEM_LIVE_INFO\x10\n\x12\x0b\n\x07\x43HATTER\x10\r2\xd4\x01\n\x03PoQ\x12:\n\x0bGetUniverse\x12\x14.poq.UniverseRequest\x1a\x15.poq.UniverseResponse\x12\x43\n\x0cStartSession\x12\x18.poq.SessionStartRequest\x1a\x19.poq.SessionStartResponse\x12L\n\rStreamSession\x12\x1a.poq.SessionMessageRequest\x1a\x1b.poq.SessionMessageResponse(\x01\x30\x01\x42\x06Z\x04/poqb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\tpoq.proto\x12\x03poq\x1a\x1fgoogle/protobuf/timestamp.proto\"i\n\x0cTopicMessage\x12\x15\n\rrequest_topic\x18\x01 \x01(\t\x12\x15\n\rpublish_topic\x18\x02 \x01(\t\x12\x17\n\x0fsubscribe_topic\x18\x03 \x01(\t\x12\x12\n\nfeed_topic\x18\x04 \x01(\t\"\x80\x01\n\x0cServiceStart\x12\x1e\n\x04type\x18\x01 \x01(\x0e\x32\x10.poq.ServiceType\x12-\n\ttimestamp\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x13\n\x0binstance_id\x18\x03 \x01(\t\x12\x0c\n\x04load\x18\x04 \x01(\x05\";\n\x14ServiceMemoryRequest\x12\x10\n\x08heap_top\x18\x01 \x01(\x05\x12\x11\n\theap_stop\x18\x02 \x01(\x08\"<\n\x0fMemoryStructure\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\x03\x12\x0c\n\x04size\x18\x03 \x01(\x03\"e\n\rHeapStatistic\x12\x10\n\x08location\x18\x01 \x01(\t\x12\x0c\n\x04size\x18\x02 \x01(\x03\x12\x11\n\tsize_diff\x18\x03 \x01(\x03\x12\r\n\x05\x63ount\x18\x04 \x01(\x03\x12\x12\n\ncount_diff\x18\x05 \x01(\x03\"\xf5\x01\n\x15ServiceMemoryResponse\x12\x13\n\x0binstance_id\x18\x01 \x01(\t\x12\x1e\n\x04type\x18\x02 \x01(\x0e\x32\x10.poq.ServiceType\x12\x0b\n\x03rss\x18\x03 \x01(\x03\x12\x10\n\x08peak_rss\x18\x04 \x01(\x03\x12(\n\nstructures\x18\x05 \x03(\x0b\x32\x14.poq.MemoryStructure\x12\x14\n\x0cheap_tracing\x18\x06 \x01(\x08\x12\x13\n\x0bheap_traced\x18\x07 \x01(\x03\x12\x11\n\theap_peak\x18\x08 \x01(\x03\x12 \n\x04heap\x18\t \x03(\x0b\x32\x12.poq.HeapStatistic\"Q\n\x1a\x43haracterStaticInfoMessage\x12\x14\n\x0c\x63haracter_id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0f\n\x07version\x18\x03 \x01(\t\"2\n\x1a\x43haracterStaticInfoRequest\x12\x14\n\x0c\x63haracter_id\x18\x01 \x01(\x05\"i\n\x1b\x43haracterStaticInfoResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12>\n\x15\x63haracter_static_info\x18\x02 \x01(\x0b\x32\x1f.poq.CharacterStaticInfoMessage\"S\n\x18\x43haracterLiveInfoMessage\x12\x14\n\x0c\x63haracter_id\x18\x01 \x01(\x05\x12\x11\n\tsystem_id\x18\x02 \x01(\x05\x12\x0e\n\x06\x61\x63tive\x18\x03 \x01(\x08\"0\n\x18\x43haracterLiveInfoRequest\x12\x14\n\x0c\x63haracter_id\x18\x01 \x01(\x05\"y\n\x19\x43haracterLiveInfoResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x14\n\x0c\x63haracter_id\x18\x02 \x01(\x05\x12:\n\x13\x63haracter_live_info\x18\x03 \x01(\x0b\x32\x1d.poq.CharacterLiveInfoMessage\"-\n\x15\x43haracterLoginRequest\x12\x14\n\x0c\x63haracter_id\x18\x01 \x01(\x05\"v\n\x16\x43haracterLoginResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x14\n\x0c\x63haracter_id\x18\x02 \x01(\x05\x12:\n\x13\x63haracter_live_info\x18\x03 \x01(\x0b\x32\x1d.poq.CharacterLiveInfoMessage\".\n\x16\x43haracterLogoutRequest\x12\x14\n\x0c\x63haracter_id\x18\x01 \x01(\x05\";\n\x17\x43haracterLogoutResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x14\n\x0c\x63haracter_id\x18\x02 \x01(\x05\"2\n\x1a\x43haracterBulkLogoutRequest\x12\x14\n\x0c\x63haracter_id\x18\x01 \x03(\x05\"?\n\x1b\x43haracterBulkLogoutResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x14\n\x0c\x63haracter_id\x18\x02 \x03(\x05\"-\n\x15\x43haracterTopicRequest\x12\x14\n\x0c\x63haracter_id\x18\x01 \x01(\x05\"g\n\x16\x43haracterTopicResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x14\n\x0c\x63haracter_id\x18\x02 \x01(\x05\x12+\n\x10\x63haracter_topics\x18\x03 \x01(\x0b\x32\x11.poq.TopicMessage\"?\n\x14\x43haracterMoveRequest\x12\x14\n\x0c\x63haracter_id\x18\x01 \x01(\x05\x12\x11\n\tsystem_id\x18\x02 \x01(\x05\"u\n\x15\x43haracterMoveResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x14\n\x0c\x63haracter_id\x18\x02 \x01(\x05\x12:\n\x13\x63haracter_live_info\x18\x03 \x01(\x0b\x32\x1d.poq.CharacterLiveInfoMessage\"E\n\x18\x43haracterPresenceRequest\x12\x1a\n\x12\x61\x66ter_character_id\x18\x01 \x01(\x05\x12\r\n\x05limit\x18\x02 \x01(\x05\"q\n\x19\x43haracterPresenceResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12:\n\x13\x63haracter_live_info\x18\x02 \x03(\x0b\x32\x1d.poq.CharacterLiveInfoMessage\x12\x0c\n\x04more\x18\x03 \x01(\x08\"G\n\x0e\x43hatterMessage\x12\x14\n\x0c\x63haracter_id\x18\x01 \x01(\x05\x12\x11\n\tsystem_id\x18\x02 \x01(\x05\x12\x0c\n\x04text\x18\x03 \x01(\t\"(\n\x13\x43hatterTopicRequest\x12\x11\n\tsystem_id\x18\x01 \x01(\x05\"`\n\x14\x43hatterTopicResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x11\n\tsystem_id\x18\x02 \x01(\x05\x12)\n\x0e\x63hatter_topics\x18\x03 \x01(\x0b\x32\x11.poq.TopicMessage\"N\n\x17SystemStaticInfoMessage\x12\x11\n\tsystem_id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x12\n\nneighbours\x18\x03 \x03(\x05\"\n\n\x08Universe\"X\n\x0fUniverseRequest\x12\x0f\n\x07version\x18\x01 \x01(\t\x12\x11\n\tsystem_id\x18\x02 \x01(\x05\x12\r\n\x05jumps\x18\x03 \x01(\x05\x12\x12\n\nsystem_ids\x18\x04 \x03(\x05\"^\n\x10UniverseResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12-\n\x07systems\x18\x02 \x03(\x0b\x32\x1c.poq.SystemStaticInfoMessage\x12\x0f\n\x07version\x18\x03 \x01(\t\",\n\x17SystemStaticInfoRequest\x12\x11\n\tsystem_id\x18\x01 \x01(\x05\"s\n\x18SystemStaticInfoResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x11\n\tsystem_id\x18\x02 \x01(\x05\x12\x38\n\x12system_static_info\x18\x03 \x01(\x0b\x32\x1c.poq.SystemStaticInfoMessage\"@\n\x15SystemLiveInfoMessage\x12\x11\n\tsystem_id\x18\x01 \x01(\x05\x12\x14\n\x0c\x63haracter_id\x18\x02 \x03(\x05\"*\n\x15SystemLiveInfoRequest\x12\x11\n\tsystem_id\x18\x01 \x01(\x05\"\xa9\x01\n\x16SystemLiveInfoResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x11\n\tsystem_id\x18\x02 \x01(\x05\x12\x34\n\x10system_live_info\x18\x03 \x01(\x0b\x32\x1a.poq.SystemLiveInfoMessage\x12:\n\x13\x63haracter_live_info\x18\x04 \x03(\x0b\x32\x1d.poq.CharacterLiveInfoMessage\"k\n\x1aSystemCharacterFeedMessage\x12\x11\n\tsystem_id\x18\x01 \x01(\x05\x12:\n\x13\x63haracter_live_info\x18\x02 \x03(\x0b\x32\x1d.poq.CharacterLiveInfoMessage\"Y\n\x1dSystemSetLiveCharacterRequest\x12\x14\n\x0c\x63haracter_id\x18\x01 \x01(\x05\x12\x11\n\tsystem_id\x18\x02 \x01(\x05\x12\x0f\n\x07present\x18\x03 \x01(\x08\"U\n\x1eSystemSetLiveCharacterResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x14\n\x0c\x63haracter_id\x18\x02 \x01(\x05\x12\x11\n\tsystem_id\x18\x03 \x01(\x05\"Y\n!SystemBulkSetLiveCharacterRequest\x12\x34\n\x08presence\x18\x01 \x03(\x0b\x32\".poq.SystemSetLiveCharacterRequest\"W\n\x11SystemMoveRequest\x12\x14\n\x0c\x63haracter_id\x18\x01 \x01(\x05\x12\x16\n\x0e\x66rom_system_id\x18\x02 \x01(\x05\x12\x14\n\x0cto_system_id\x18\x03 \x01(\x05\"I\n\x12SystemMoveResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x14\n\x0c\x63haracter_id\x18\x02 \x01(\x05\x12\x11\n\tsystem_id\x18\x03 \x01(\x05\"@\n\x17SystemPopulationMessage\x12\x11\n\tsystem_id\x18\x01 \x01(\x05\x12\x12\n\npopulation\x18\x02 \x01(\x05\"@\n\x14SystemWhereIsRequest\x12\x14\n\x0c\x63haracter_id\x18\x01 \x03(\x05\x12\x12\n\npopulation\x18\x02 \x01(\x08\"\x91\x01\n\x15SystemWhereIsResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12:\n\x13\x63haracter_live_info\x18\x02 \x03(\x0b\x32\x1d.poq.CharacterLiveInfoMessage\x12\x30\n\npopulation\x18\x03 \x03(\x0b\x32\x1c.poq.SystemPopulationMessage\"\'\n\x12SystemTopicRequest\x12\x11\n\tsystem_id\x18\x01 \x01(\x05\"^\n\x13SystemTopicResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x11\n\tsystem_id\x18\x02 \x01(\x05\x12(\n\rsystem_topics\x18\x03 \x01(\x0b\x32\x11.poq.TopicMessage\"p\n\x14SystemHistoryRequest\x12\x11\n\tsystem_id\x18\x01 \x01(\x05\x12\r\n\x05jumps\x18\x02 \x01(\x05\x12\x12\n\nsystem_ids\x18\x03 \x03(\x05\x12\x12\n\nresolution\x18\x04 \x01(\t\x12\x0e\n\x06points\x18\x05 \x01(\x05\"E\n\x14SystemHistoryMessage\x12\x11\n\tsystem_id\x18\x01 \x01(\x05\x12\x0c\n\x04mean\x18\x02 \x03(\x02\x12\x0c\n\x04peak\x18\x03 \x03(\x05\"\x89\x01\n\x15SystemHistoryResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x12\n\nresolution\x18\x02 \x01(\t\x12\x10\n\x08interval\x18\x03 \x01(\x05\x12\x12\n\nstart_time\x18\x04 \x01(\x03\x12*\n\x07systems\x18\x05 \x03(\x0b\x32\x19.poq.SystemHistoryMessage\"K\n\x13SystemReplicaChange\x12\x11\n\tsystem_id\x18\x01 \x01(\x05\x12\x0f\n\x07\x61rrived\x18\x02 \x03(\x05\x12\x10\n\x08\x64\x65parted\x18\x03 \x03(\x05\"\x9b\x01\n\x14SystemReplicaMessage\x12\x13\n\x0binstance_id\x18\x01 \x01(\t\x12\r\n\x05\x65poch\x18\x02 \x01(\x04\x12\x10\n\x08sequence\x18\x03 \x01(\x04\x12\x10\n\x08snapshot\x18\x04 \x01(\x08\x12\x10\n\x08handover\x18\x05 \x01(\x08\x12)\n\x07\x63hanges\x18\x06 \x03(\x0b\x32\x18.poq.SystemReplicaChange\"\'\n\x13SessionStartRequest\x12\x10\n\x08username\x18\x01 \x01(\t\"w\n\x14SessionStartResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x14\n\x0c\x63haracter_id\x18\x02 \x01(\x05\x12\x12\n\nsession_id\x18\x03 \x01(\t\x12)\n\x0esession_topics\x18\x04 \x01(\x0b\x32\x11.poq.TopicMessage\"(\n\x12SessionStopRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\"5\n\x13SessionStopResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x12\n\nsession_id\x18\x02 \x01(\t\"!\n\x0bSessionPing\x12\x12\n\nsession_id\x18\x01 \x01(\t\"!\n\x0bSessionPong\x12\x12\n\nsession_id\x18\x01 \x01(\t\"K\n\x0eSessionRevoked\x12\x14\n\x0c\x63haracter_id\x18\x01 \x01(\x05\x12\x12\n\ngeneration\x18\x02 \x01(\x04\x12\x0f\n\x07\x65xpires\x18\x03 \x01(\r\"X\n\x18SessionRevocationMessage\x12\x16\n\x0emin_generation\x18\x01 \x01(\x04\x12$\n\x07revoked\x18\x02 \x03(\x0b\x32\x13.poq.SessionRevoked\"\x8d\x01\n\x15SessionMessageRequest\x12%\n\x04type\x18\x01 \x01(\x0e\x32\x17.poq.SessionMessageType\x12\x14\n\x0c\x63haracter_id\x18\x02 \x01(\x05\x12\x11\n\tsystem_id\x18\x03 \x01(\x05\x12$\n\x07\x63hatter\x18\x04 \x01(\x0b\x32\x13.poq.ChatterMessage\"\xdd\x02\n\x16SessionMessageResponse\x12%\n\x04type\x18\x01 \x01(\x0e\x32\x17.poq.SessionMessageType\x12\n\n\x02ok\x18\x02 \x01(\x08\x12>\n\x15\x63haracter_static_info\x18\x07 \x01(\x0b\x32\x1f.poq.CharacterStaticInfoMessage\x12:\n\x13\x63haracter_live_info\x18\x08 \x01(\x0b\x32\x1d.poq.CharacterLiveInfoMessage\x12\x38\n\x12system_static_info\x18\t \x01(\x0b\x32\x1c.poq.SystemStaticInfoMessage\x12\x34\n\x10system_live_info\x18\n \x01(\x0b\x32\x1a.poq.SystemLiveInfoMessage\x12$\n\x07\x63hatter\x18\r \x01(\x0b\x32\x13.poq.ChatterMessage*\x8c\x01\n\x0bServiceType\x12\x13\n\x0fUNKNOWN_SERVICE\x10\x00\x12\x13\n\x0fGATEWAY_SERVICE\x10\x01\x12\x13\n\x0fSESSION_SERVICE\x10\x02\x12\x15\n\x11\x43HARACTER_SERVICE\x10\x03\x12\x12\n\x0eSYSTEM_SERVICE\x10\x04\x12\x13\n\x0f\x43HATTER_SERVICE\x10\x05*\xee\x01\n\x12SessionMessageType\x12\x18\n\x14UNKNOWN_MESSAGE_TYPE\x10\x00\x12\t\n\x05START\x10\x01\x12\x08\n\x04STOP\x10\x02\x12\x08\n\x04PING\x10\x03\x12\x08\n\x04PONG\x10\x04\x12\t\n\x05LOGIN\x10\x05\x12\n\n\x06LOGOUT\x10\x06\x12\x19\n\x15\x43HARACTER_STATIC_INFO\x10\x07\x12\x17\n\x13\x43HARACTER_LIVE_INFO\x10\x08\x12\x16\n\x12SYSTEM_STATIC_INFO\x10\t\x12\x14\n\x10SYSTEM_LIVE_INFO\x10\n\x12\x0f\n\x0bJOIN_SYSTEM\x10\x0b\x12\x0b\n\x07\x43HATTER\x10\r2\xd4\x01\n\x03PoQ\x12:\n\x0bGetUniverse\x12\x14.poq.UniverseRequest\x1a\x15.poq.UniverseResponse\x12\x43\n\x0cStartSession\x12\x18.poq.SessionStartRequest\x1a\x19.poq.SessionStartResponse\x12L\n\rStreamSession\x12\x1a.poq.SessionMessageRequest\x1a\x1b.poq.SessionMessageResponse(\x01\x30\x01\x42\x06Z\x04/poqb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -33,86 +33,134 @@ _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'poq_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   _globals['DESCRIPTOR']._loaded_options = None
   _globals['DESCRIPTOR']._serialized_options = b'Z\004/poq'
-  _globals['_SERVICETYPE']._serialized_start=3072
-  _globals['_SERVICETYPE']._serialized_end=3212
-  _globals['_SESSIONMESSAGETYPE']._serialized_start=3215
-  _globals['_SESSIONMESSAGETYPE']._serialized_end=3416
+  _globals['_SERVICETYPE']._serialized_start=5626
+  _globals['_SERVICETYPE']._serialized_end=5766
+  _globals['_SESSIONMESSAGETYPE']._serialized_start=5769
+  _globals['_SESSIONMESSAGETYPE']._serialized_end=6007
   _globals['_TOPICMESSAGE']._serialized_start=51
-  _globals['_TOPICMESSAGE']._serialized_end=136
-  _globals['_SERVICESTART']._serialized_start=138
-  _globals['_SERVICESTART']._serialized_end=231
-  _globals['_CHARACTERSTATICINFOMESSAGE']._serialized_start=233
-  _globals['_CHARACTERSTATICINFOMESSAGE']._serialized_end=297
-  _globals['_CHARACTERSTATICINFOREQUEST']._serialized_start=299
-  _globals['_CHARACTERSTATICINFOREQUEST']._serialized_end=349
-  _globals['_CHARACTERSTATICINFORESPONSE']._serialized_start=351
-  _globals['_CHARACTERSTATICINFORESPONSE']._serialized_end=456
-  _globals['_CHARACTERLIVEINFOMESSAGE']._serialized_start=458
-  _globals['_CHARACTERLIVEINFOMESSAGE']._serialized_end=541
-  _globals['_CHARACTERLIVEINFOREQUEST']._serialized_start=543
-  _globals['_CHARACTERLIVEINFOREQUEST']._serialized_end=591
-  _globals['_CHARACTERLIVEINFORESPONSE']._serialized_start=593
-  _globals['_CHARACTERLIVEINFORESPONSE']._serialized_end=714
-  _globals['_CHARACTERLOGINREQUEST']._serialized_start=716
-  _globals['_CHARACTERLOGINREQUEST']._serialized_end=761
-  _globals['_CHARACTERLOGINRESPONSE']._serialized_start=763
-  _globals['_CHARACTERLOGINRESPONSE']._serialized_end=881
-  _globals['_CHARACTERLOGOUTREQUEST']._serialized_start=883
-  _globals['_CHARACTERLOGOUTREQUEST']._serialized_end=929
-  _globals['_CHARACTERLOGOUTRESPONSE']._serialized_start=931
-  _globals['_CHARACTERLOGOUTRESPONSE']._serialized_end=990
-  _globals['_CHARACTERTOPICREQUEST']._serialized_start=992
-  _globals['_CHARACTERTOPICREQUEST']._serialized_end=1037
-  _globals['_CHARACTERTOPICRESPONSE']._serialized_start=1039
-  _globals['_CHARACTERTOPICRESPONSE']._serialized_end=1142
-  _globals['_CHATTERMESSAGE']._serialized_start=1144
-  _globals['_CHATTERMESSAGE']._serialized_end=1215
-  _globals['_CHATTERTOPICREQUEST']._serialized_start=1217
-  _globals['_CHATTERTOPICREQUEST']._serialized_end=1257
-  _globals['_CHATTERTOPICRESPONSE']._serialized_start=1259
-  _globals['_CHATTERTOPICRESPONSE']._serialized_end=1355
-  _globals['_SYSTEMSTATICINFOMESSAGE']._serialized_start=1357
-  _globals['_SYSTEMSTATICINFOMESSAGE']._serialized_end=1435
-  _globals['_UNIVERSE']._serialized_start=1437
-  _globals['_UNIVERSE']._serialized_end=1447
-  _globals['_UNIVERSEREQUEST']._serialized_start=1449
-  _globals['_UNIVERSEREQUEST']._serialized_end=1466
-  _globals['_UNIVERSERESPONSE']._serialized_start=1468
-  _globals['_UNIVERSERESPONSE']._serialized_end=1545
-  _globals['_SYSTEMSTATICINFOREQUEST']._serialized_start=1547
-  _globals['_SYSTEMSTATICINFOREQUEST']._serialized_end=1591
-  _globals['_SYSTEMSTATICINFORESPONSE']._serialized_start=1593
-  _globals['_SYSTEMSTATICINFORESPONSE']._serialized_end=1708
-  _globals['_SYSTEMLIVEINFOMESSAGE']._serialized_start=1710
-  _globals['_SYSTEMLIVEINFOMESSAGE']._serialized_end=1774
-  _globals['_SYSTEMLIVEINFOREQUEST']._serialized_start=1776
-  _globals['_SYSTEMLIVEINFOREQUEST']._serialized_end=1818
-  _globals['_SYSTEMLIVEINFORESPONSE']._serialized_start=1820
-  _globals['_SYSTEMLIVEINFORESPONSE']._serialized_end=1929
-  _globals['_SYSTEMSETLIVECHARACTERREQUEST']._serialized_start=1931
-  _globals['_SYSTEMSETLIVECHARACTERREQUEST']._serialized_end=2020
-  _globals['_SYSTEMSETLIVECHARACTERRESPONSE']._serialized_start=2022
-  _globals['_SYSTEMSETLIVECHARACTERRESPONSE']._serialized_end=2107
-  _globals['_SYSTEMTOPICREQUEST']._serialized_start=2109
-  _globals['_SYSTEMTOPICREQUEST']._serialized_end=2148
-  _globals['_SYSTEMTOPICRESPONSE']._serialized_start=2150
-  _globals['_SYSTEMTOPICRESPONSE']._serialized_end=2244
-  _globals['_SESSIONSTARTREQUEST']._serialized_start=2246
-  _globals['_SESSIONSTARTREQUEST']._serialized_end=2285
-  _globals['_SESSIONSTARTRESPONSE']._serialized_start=2287
-  _globals['_SESSIONSTARTRESPONSE']._serialized_end=2406
-  _globals['_SESSIONSTOPREQUEST']._serialized_start=2408
-  _globals['_SESSIONSTOPREQUEST']._serialized_end=2448
-  _globals['_SESSIONSTOPRESPONSE']._serialized_start=2450
-  _globals['_SESSIONSTOPRESPONSE']._serialized_end=2503
-  _globals['_SESSIONPING']._serialized_start=2505
-  _globals['_SESSIONPING']._serialized_end=2538
-  _globals['_SESSIONPONG']._serialized_start=2540
-  _globals['_SESSIONPONG']._serialized_end=2573
-  _globals['_SESSIONMESSAGEREQUEST']._serialized_start=2576
-  _globals['_SESSIONMESSAGEREQUEST']._serialized_end=2717
-  _globals['_SESSIONMESSAGERESPONSE']._serialized_start=2720
-  _globals['_SESSIONMESSAGERESPONSE']._serialized_end=3069
-  _globals['_POQ']._serialized_start=3419
-  _globals['_POQ']._serialized_end=3631
+  _globals['_TOPICMESSAGE']._serialized_end=156
+  _globals['_SERVICESTART']._serialized_start=159
+  _globals['_SERVICESTART']._serialized_end=287
+  _globals['_SERVICEMEMORYREQUEST']._serialized_start=289
+  _globals['_SERVICEMEMORYREQUEST']._serialized_end=348
+  _globals['_MEMORYSTRUCTURE']._serialized_start=350
+  _globals['_MEMORYSTRUCTURE']._serialized_end=410
+  _globals['_HEAPSTATISTIC']._serialized_start=412
+  _globals['_HEAPSTATISTIC']._serialized_end=513
+  _globals['_SERVICEMEMORYRESPONSE']._serialized_start=516
+  _globals['_SERVICEMEMORYRESPONSE']._serialized_end=761
+  _globals['_CHARACTERSTATICINFOMESSAGE']._serialized_start=763
+  _globals['_CHARACTERSTATICINFOMESSAGE']._serialized_end=844
+  _globals['_CHARACTERSTATICINFOREQUEST']._serialized_start=846
+  _globals['_CHARACTERSTATICINFOREQUEST']._serialized_end=896
+  _globals['_CHARACTERSTATICINFORESPONSE']._serialized_start=898
+  _globals['_CHARACTERSTATICINFORESPONSE']._serialized_end=1003
+  _globals['_CHARACTERLIVEINFOMESSAGE']._serialized_start=1005
+  _globals['_CHARACTERLIVEINFOMESSAGE']._serialized_end=1088
+  _globals['_CHARACTERLIVEINFOREQUEST']._serialized_start=1090
+  _globals['_CHARACTERLIVEINFOREQUEST']._serialized_end=1138
+  _globals['_CHARACTERLIVEINFORESPONSE']._serialized_start=1140
+  _globals['_CHARACTERLIVEINFORESPONSE']._serialized_end=1261
+  _globals['_CHARACTERLOGINREQUEST']._serialized_start=1263
+  _globals['_CHARACTERLOGINREQUEST']._serialized_end=1308
+  _globals['_CHARACTERLOGINRESPONSE']._serialized_start=1310
+  _globals['_CHARACTERLOGINRESPONSE']._serialized_end=1428
+  _globals['_CHARACTERLOGOUTREQUEST']._serialized_start=1430
+  _globals['_CHARACTERLOGOUTREQUEST']._serialized_end=1476
+  _globals['_CHARACTERLOGOUTRESPONSE']._serialized_start=1478
+  _globals['_CHARACTERLOGOUTRESPONSE']._serialized_end=1537
+  _globals['_CHARACTERBULKLOGOUTREQUEST']._serialized_start=1539
+  _globals['_CHARACTERBULKLOGOUTREQUEST']._serialized_end=1589
+  _globals['_CHARACTERBULKLOGOUTRESPONSE']._serialized_start=1591
+  _globals['_CHARACTERBULKLOGOUTRESPONSE']._serialized_end=1654
+  _globals['_CHARACTERTOPICREQUEST']._serialized_start=1656
+  _globals['_CHARACTERTOPICREQUEST']._serialized_end=1701
+  _globals['_CHARACTERTOPICRESPONSE']._serialized_start=1703
+  _globals['_CHARACTERTOPICRESPONSE']._serialized_end=1806
+  _globals['_CHARACTERMOVEREQUEST']._serialized_start=1808
+  _globals['_CHARACTERMOVEREQUEST']._serialized_end=1871
+  _globals['_CHARACTERMOVERESPONSE']._serialized_start=1873
+  _globals['_CHARACTERMOVERESPONSE']._serialized_end=1990
+  _globals['_CHARACTERPRESENCEREQUEST']._serialized_start=1992
+  _globals['_CHARACTERPRESENCEREQUEST']._serialized_end=2061
+  _globals['_CHARACTERPRESENCERESPONSE']._serialized_start=2063
+  _globals['_CHARACTERPRESENCERESPONSE']._serialized_end=2176
+  _globals['_CHATTERMESSAGE']._serialized_start=2178
+  _globals['_CHATTERMESSAGE']._serialized_end=2249
+  _globals['_CHATTERTOPICREQUEST']._serialized_start=2251
+  _globals['_CHATTERTOPICREQUEST']._serialized_end=2291
+  _globals['_CHATTERTOPICRESPONSE']._serialized_start=2293
+  _globals['_CHATTERTOPICRESPONSE']._serialized_end=2389
+  _globals['_SYSTEMSTATICINFOMESSAGE']._serialized_start=2391
+  _globals['_SYSTEMSTATICINFOMESSAGE']._serialized_end=2469
+  _globals['_UNIVERSE']._serialized_start=2471
+  _globals['_UNIVERSE']._serialized_end=2481
+  _globals['_UNIVERSEREQUEST']._serialized_start=2483
+  _globals['_UNIVERSEREQUEST']._serialized_end=2571
+  _globals['_UNIVERSERESPONSE']._serialized_start=2573
+  _globals['_UNIVERSERESPONSE']._serialized_end=2667
+  _globals['_SYSTEMSTATICINFOREQUEST']._serialized_start=2669
+  _globals['_SYSTEMSTATICINFOREQUEST']._serialized_end=2713
+  _globals['_SYSTEMSTATICINFORESPONSE']._serialized_start=2715
+  _globals['_SYSTEMSTATICINFORESPONSE']._serialized_end=2830
+  _globals['_SYSTEMLIVEINFOMESSAGE']._serialized_start=2832
+  _globals['_SYSTEMLIVEINFOMESSAGE']._serialized_end=2896
+  _globals['_SYSTEMLIVEINFOREQUEST']._serialized_start=2898
+  _globals['_SYSTEMLIVEINFOREQUEST']._serialized_end=2940
+  _globals['_SYSTEMLIVEINFORESPONSE']._serialized_start=2943
+  _globals['_SYSTEMLIVEINFORESPONSE']._serialized_end=3112
+  _globals['_SYSTEMCHARACTERFEEDMESSAGE']._serialized_start=3114
+  _globals['_SYSTEMCHARACTERFEEDMESSAGE']._serialized_end=3221
+  _globals['_SYSTEMSETLIVECHARACTERREQUEST']._serialized_start=3223
+  _globals['_SYSTEMSETLIVECHARACTERREQUEST']._serialized_end=3312
+  _globals['_SYSTEMSETLIVECHARACTERRESPONSE']._serialized_start=3314
+  _globals['_SYSTEMSETLIVECHARACTERRESPONSE']._serialized_end=3399
+  _globals['_SYSTEMBULKSETLIVECHARACTERREQUEST']._serialized_start=3401
+  _globals['_SYSTEMBULKSETLIVECHARACTERREQUEST']._serialized_end=3490
+  _globals['_SYSTEMMOVEREQUEST']._serialized_start=3492
+  _globals['_SYSTEMMOVEREQUEST']._serialized_end=3579
+  _globals['_SYSTEMMOVERESPONSE']._serialized_start=3581
+  _globals['_SYSTEMMOVERESPONSE']._serialized_end=3654
+  _globals['_SYSTEMPOPULATIONMESSAGE']._serialized_start=3656
+  _globals['_SYSTEMPOPULATIONMESSAGE']._serialized_end=3720
+  _globals['_SYSTEMWHEREISREQUEST']._serialized_start=3722
+  _globals['_SYSTEMWHEREISREQUEST']._serialized_end=3786
+  _globals['_SYSTEMWHEREISRESPONSE']._serialized_start=3789
+  _globals['_SYSTEMWHEREISRESPONSE']._serialized_end=3934
+  _globals['_SYSTEMTOPICREQUEST']._serialized_start=3936
+  _globals['_SYSTEMTOPICREQUEST']._serialized_end=3975
+  _globals['_SYSTEMTOPICRESPONSE']._serialized_start=3977
+  _globals['_SYSTEMTOPICRESPONSE']._serialized_end=4071
+  _globals['_SYSTEMHISTORYREQUEST']._serialized_start=4073
+  _globals['_SYSTEMHISTORYREQUEST']._serialized_end=4185
+  _globals['_SYSTEMHISTORYMESSAGE']._serialized_start=4187
+  _globals['_SYSTEMHISTORYMESSAGE']._serialized_end=4256
+  _globals['_SYSTEMHISTORYRESPONSE']._serialized_start=4259
+  _globals['_SYSTEMHISTORYRESPONSE']._serialized_end=4396
+  _globals['_SYSTEMREPLICACHANGE']._serialized_start=4398
+  _globals['_SYSTEMREPLICACHANGE']._serialized_end=4473
+  _globals['_SYSTEMREPLICAMESSAGE']._serialized_start=4476
+  _globals['_SYSTEMREPLICAMESSAGE']._serialized_end=4631
+  _globals['_SESSIONSTARTREQUEST']._serialized_start=4633
+  _globals['_SESSIONSTARTREQUEST']._serialized_end=4672
+  _globals['_SESSIONSTARTRESPONSE']._serialized_start=4674
+  _globals['_SESSIONSTARTRESPONSE']._serialized_end=4793
+  _globals['_SESSIONSTOPREQUEST']._serialized_start=4795
+  _globals['_SESSIONSTOPREQUEST']._serialized_end=4835
+  _globals['_SESSIONSTOPRESPONSE']._serialized_start=4837
+  _globals['_SESSIONSTOPRESPONSE']._serialized_end=4890
+  _globals['_SESSIONPING']._serialized_start=4892
+  _globals['_SESSIONPING']._serialized_end=4925
+  _globals['_SESSIONPONG']._serialized_start=4927
+  _globals['_SESSIONPONG']._serialized_end=4960
+  _globals['_SESSIONREVOKED']._serialized_start=4962
+  _globals['_SESSIONREVOKED']._serialized_end=5037
+  _globals['_SESSIONREVOCATIONMESSAGE']._serialized_start=5039
+  _globals['_SESSIONREVOCATIONMESSAGE']._serialized_end=5127
+  _globals['_SESSIONMESSAGEREQUEST']._serialized_start=5130
+  _globals['_SESSIONMESSAGEREQUEST']._serialized_end=5271
+  _globals['_SESSIONMESSAGERESPONSE']._serialized_start=5274
+  _globals['_SESSIONMESSAGERESPONSE']._serialized_end=5623
+  _globals['_POQ']._serialized_start=6010
+  _globals['_POQ']._serialized_end=6222
 # @@protoc_insertion_point(module_scope)
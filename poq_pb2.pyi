@@ -21,12 +21,15 @@ class SessionMessageType(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
     UNKNOWN_MESSAGE_TYPE: _ClassVar[SessionMessageType]
     START: _ClassVar[SessionMessageType]
     STOP: _ClassVar[SessionMessageType]
+    PING: _ClassVar[SessionMessageType]
+    PONG: _ClassVar[SessionMessageType]
     LOGIN: _ClassVar[SessionMessageType]
     LOGOUT: _ClassVar[SessionMessageType]
     CHARACTER_STATIC_INFO: _ClassVar[SessionMessageType]
     CHARACTER_LIVE_INFO: _ClassVar[SessionMessageType]
     SYSTEM_STATIC_INFO: _ClassVar[SessionMessageType]
     SYSTEM_LIVE_INFO: _ClassVar[SessionMessageType]
+    JOIN_SYSTEM: _ClassVar[SessionMessageType]
     CHATTER: _ClassVar[SessionMessageType]
 UNKNOWN_SERVICE: ServiceType
 GATEWAY_SERVICE: ServiceType
@@ -37,39 +40,104 @@ CHATTER_SERVICE: ServiceType
 UNKNOWN_MESSAGE_TYPE: SessionMessageType
 START: SessionMessageType
 STOP: SessionMessageType
+PING: SessionMessageType
+PONG: SessionMessageType
 LOGIN: SessionMessageType
 LOGOUT: SessionMessageType
 CHARACTER_STATIC_INFO: SessionMessageType
 CHARACTER_LIVE_INFO: SessionMessageType
 SYSTEM_STATIC_INFO: SessionMessageType
 SYSTEM_LIVE_INFO: SessionMessageType
+JOIN_SYSTEM: SessionMessageType
 CHATTER: SessionMessageType
 
 class TopicMessage(_message.Message):
-    __slots__ = ("request_topic", "publish_topic", "subscribe_topic")
+    __slots__ = ("request_topic", "publish_topic", "subscribe_topic", "feed_topic")
     REQUEST_TOPIC_FIELD_NUMBER: _ClassVar[int]
     PUBLISH_TOPIC_FIELD_NUMBER: _ClassVar[int]
     SUBSCRIBE_TOPIC_FIELD_NUMBER: _ClassVar[int]
+    FEED_TOPIC_FIELD_NUMBER: _ClassVar[int]
     request_topic: str
     publish_topic: str
     subscribe_topic: str
-    def __init__(self, request_topic: _Optional[str] = ..., publish_topic: _Optional[str] = ..., subscribe_topic: _Optional[str] = ...) -> None: ...
+    feed_topic: str
+    def __init__(self, request_topic: _Optional[str] = ..., publish_topic: _Optional[str] = ..., subscribe_topic: _Optional[str] = ..., feed_topic: _Optional[str] = ...) -> None: ...
 
 class ServiceStart(_message.Message):
-    __slots__ = ("type", "timestamp")
+    __slots__ = ("type", "timestamp", "instance_id", "load")
     TYPE_FIELD_NUMBER: _ClassVar[int]
     TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+    INSTANCE_ID_FIELD_NUMBER: _ClassVar[int]
+    LOAD_FIELD_NUMBER: _ClassVar[int]
     type: ServiceType
     timestamp: _timestamp_pb2.Timestamp
-    def __init__(self, type: _Optional[_Union[ServiceType, str]] = ..., timestamp: _Optional[_Union[_timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
+    instance_id: str
+    load: int
+    def __init__(self, type: _Optional[_Union[ServiceType, str]] = ..., timestamp: _Optional[_Union[_timestamp_pb2.Timestamp, _Mapping]] = ..., instance_id: _Optional[str] = ..., load: _Optional[int] = ...) -> None: ...
+
+class ServiceMemoryRequest(_message.Message):
+    __slots__ = ("heap_top", "heap_stop")
+    HEAP_TOP_FIELD_NUMBER: _ClassVar[int]
+    HEAP_STOP_FIELD_NUMBER: _ClassVar[int]
+    heap_top: int
+    heap_stop: bool
+    def __init__(self, heap_top: _Optional[int] = ..., heap_stop: bool = ...) -> None: ...
+
+class MemoryStructure(_message.Message):
+    __slots__ = ("name", "count", "size")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    SIZE_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    count: int
+    size: int
+    def __init__(self, name: _Optional[str] = ..., count: _Optional[int] = ..., size: _Optional[int] = ...) -> None: ...
+
+class HeapStatistic(_message.Message):
+    __slots__ = ("location", "size", "size_diff", "count", "count_diff")
+    LOCATION_FIELD_NUMBER: _ClassVar[int]
+    SIZE_FIELD_NUMBER: _ClassVar[int]
+    SIZE_DIFF_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    COUNT_DIFF_FIELD_NUMBER: _ClassVar[int]
+    location: str
+    size: int
+    size_diff: int
+    count: int
+    count_diff: int
+    def __init__(self, location: _Optional[str] = ..., size: _Optional[int] = ..., size_diff: _Optional[int] = ..., count: _Optional[int] = ..., count_diff: _Optional[int] = ...) -> None: ...
+
+class ServiceMemoryResponse(_message.Message):
+    __slots__ = ("instance_id", "type", "rss", "peak_rss", "structures", "heap_tracing", "heap_traced", "heap_peak", "heap")
+    INSTANCE_ID_FIELD_NUMBER: _ClassVar[int]
+    TYPE_FIELD_NUMBER: _ClassVar[int]
+    RSS_FIELD_NUMBER: _ClassVar[int]
+    PEAK_RSS_FIELD_NUMBER: _ClassVar[int]
+    STRUCTURES_FIELD_NUMBER: _ClassVar[int]
+    HEAP_TRACING_FIELD_NUMBER: _ClassVar[int]
+    HEAP_TRACED_FIELD_NUMBER: _ClassVar[int]
+    HEAP_PEAK_FIELD_NUMBER: _ClassVar[int]
+    HEAP_FIELD_NUMBER: _ClassVar[int]
+    instance_id: str
+    type: ServiceType
+    rss: int
+    peak_rss: int
+    structures: _containers.RepeatedCompositeFieldContainer[MemoryStructure]
+    heap_tracing: bool
+    heap_traced: int
+    heap_peak: int
+    heap: _containers.RepeatedCompositeFieldContainer[HeapStatistic]
+    def __init__(self, instance_id: _Optional[str] = ..., type: _Optional[_Union[ServiceType, str]] = ..., rss: _Optional[int] = ..., peak_rss: _Optional[int] = ..., structures: _Optional[_Iterable[_Union[MemoryStructure, _Mapping]]] = ..., heap_tracing: bool = ..., heap_traced: _Optional[int] = ..., heap_peak: _Optional[int] = ..., heap: _Optional[_Iterable[_Union[HeapStatistic, _Mapping]]] = ...) -> None: ...
 
 class CharacterStaticInfoMessage(_message.Message):
-    __slots__ = ("character_id", "name")
+    __slots__ = ("character_id", "name", "version")
     CHARACTER_ID_FIELD_NUMBER: _ClassVar[int]
     NAME_FIELD_NUMBER: _ClassVar[int]
+    VERSION_FIELD_NUMBER: _ClassVar[int]
     character_id: int
     name: str
-    def __init__(self, character_id: _Optional[int] = ..., name: _Optional[str] = ...) -> None: ...
+    version: str
+    def __init__(self, character_id: _Optional[int] = ..., name: _Optional[str] = ..., version: _Optional[str] = ...) -> None: ...
 
 class CharacterStaticInfoRequest(_message.Message):
     __slots__ = ("character_id",)
@@ -141,6 +209,20 @@ class CharacterLogoutResponse(_message.Message):
     character_id: int
     def __init__(self, ok: bool = ..., character_id: _Optional[int] = ...) -> None: ...
 
+class CharacterBulkLogoutRequest(_message.Message):
+    __slots__ = ("character_id",)
+    CHARACTER_ID_FIELD_NUMBER: _ClassVar[int]
+    character_id: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, character_id: _Optional[_Iterable[int]] = ...) -> None: ...
+
+class CharacterBulkLogoutResponse(_message.Message):
+    __slots__ = ("ok", "character_id")
+    OK_FIELD_NUMBER: _ClassVar[int]
+    CHARACTER_ID_FIELD_NUMBER: _ClassVar[int]
+    ok: bool
+    character_id: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, ok: bool = ..., character_id: _Optional[_Iterable[int]] = ...) -> None: ...
+
 class CharacterTopicRequest(_message.Message):
     __slots__ = ("character_id",)
     CHARACTER_ID_FIELD_NUMBER: _ClassVar[int]
@@ -157,6 +239,42 @@ class CharacterTopicResponse(_message.Message):
     character_topics: TopicMessage
     def __init__(self, ok: bool = ..., character_id: _Optional[int] = ..., character_topics: _Optional[_Union[TopicMessage, _Mapping]] = ...) -> None: ...
 
+class CharacterMoveRequest(_message.Message):
+    __slots__ = ("character_id", "system_id")
+    CHARACTER_ID_FIELD_NUMBER: _ClassVar[int]
+    SYSTEM_ID_FIELD_NUMBER: _ClassVar[int]
+    character_id: int
+    system_id: int
+    def __init__(self, character_id: _Optional[int] = ..., system_id: _Optional[int] = ...) -> None: ...
+
+class CharacterMoveResponse(_message.Message):
+    __slots__ = ("ok", "character_id", "character_live_info")
+    OK_FIELD_NUMBER: _ClassVar[int]
+    CHARACTER_ID_FIELD_NUMBER: _ClassVar[int]
+    CHARACTER_LIVE_INFO_FIELD_NUMBER: _ClassVar[int]
+    ok: bool
+    character_id: int
+    character_live_info: CharacterLiveInfoMessage
+    def __init__(self, ok: bool = ..., character_id: _Optional[int] = ..., character_live_info: _Optional[_Union[CharacterLiveInfoMessage, _Mapping]] = ...) -> None: ...
+
+class CharacterPresenceRequest(_message.Message):
+    __slots__ = ("after_character_id", "limit")
+    AFTER_CHARACTER_ID_FIELD_NUMBER: _ClassVar[int]
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    after_character_id: int
+    limit: int
+    def __init__(self, after_character_id: _Optional[int] = ..., limit: _Optional[int] = ...) -> None: ...
+
+class CharacterPresenceResponse(_message.Message):
+    __slots__ = ("ok", "character_live_info", "more")
+    OK_FIELD_NUMBER: _ClassVar[int]
+    CHARACTER_LIVE_INFO_FIELD_NUMBER: _ClassVar[int]
+    MORE_FIELD_NUMBER: _ClassVar[int]
+    ok: bool
+    character_live_info: _containers.RepeatedCompositeFieldContainer[CharacterLiveInfoMessage]
+    more: bool
+    def __init__(self, ok: bool = ..., character_live_info: _Optional[_Iterable[_Union[CharacterLiveInfoMessage, _Mapping]]] = ..., more: bool = ...) -> None: ...
+
 class ChatterMessage(_message.Message):
     __slots__ = ("character_id", "system_id", "text")
     CHARACTER_ID_FIELD_NUMBER: _ClassVar[int]
@@ -198,16 +316,26 @@ class Universe(_message.Message):
     def __init__(self) -> None: ...
 
 class UniverseRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("version", "system_id", "jumps", "system_ids")
+    VERSION_FIELD_NUMBER: _ClassVar[int]
+    SYSTEM_ID_FIELD_NUMBER: _ClassVar[int]
+    JUMPS_FIELD_NUMBER: _ClassVar[int]
+    SYSTEM_IDS_FIELD_NUMBER: _ClassVar[int]
+    version: str
+    system_id: int
+    jumps: int
+    system_ids: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, version: _Optional[str] = ..., system_id: _Optional[int] = ..., jumps: _Optional[int] = ..., system_ids: _Optional[_Iterable[int]] = ...) -> None: ...
 
 class UniverseResponse(_message.Message):
-    __slots__ = ("ok", "systems")
+    __slots__ = ("ok", "systems", "version")
     OK_FIELD_NUMBER: _ClassVar[int]
     SYSTEMS_FIELD_NUMBER: _ClassVar[int]
+    VERSION_FIELD_NUMBER: _ClassVar[int]
     ok: bool
     systems: _containers.RepeatedCompositeFieldContainer[SystemStaticInfoMessage]
-    def __init__(self, ok: bool = ..., systems: _Optional[_Iterable[_Union[SystemStaticInfoMessage, _Mapping]]] = ...) -> None: ...
+    version: str
+    def __init__(self, ok: bool = ..., systems: _Optional[_Iterable[_Union[SystemStaticInfoMessage, _Mapping]]] = ..., version: _Optional[str] = ...) -> None: ...
 
 class SystemStaticInfoRequest(_message.Message):
     __slots__ = ("system_id",)
@@ -240,14 +368,24 @@ class SystemLiveInfoRequest(_message.Message):
     def __init__(self, system_id: _Optional[int] = ...) -> None: ...
 
 class SystemLiveInfoResponse(_message.Message):
-    __slots__ = ("ok", "system_id", "system_live_info")
+    __slots__ = ("ok", "system_id", "system_live_info", "character_live_info")
     OK_FIELD_NUMBER: _ClassVar[int]
     SYSTEM_ID_FIELD_NUMBER: _ClassVar[int]
     SYSTEM_LIVE_INFO_FIELD_NUMBER: _ClassVar[int]
+    CHARACTER_LIVE_INFO_FIELD_NUMBER: _ClassVar[int]
     ok: bool
     system_id: int
     system_live_info: SystemLiveInfoMessage
-    def __init__(self, ok: bool = ..., system_id: _Optional[int] = ..., system_live_info: _Optional[_Union[SystemLiveInfoMessage, _Mapping]] = ...) -> None: ...
+    character_live_info: _containers.RepeatedCompositeFieldContainer[CharacterLiveInfoMessage]
+    def __init__(self, ok: bool = ..., system_id: _Optional[int] = ..., system_live_info: _Optional[_Union[SystemLiveInfoMessage, _Mapping]] = ..., character_live_info: _Optional[_Iterable[_Union[CharacterLiveInfoMessage, _Mapping]]] = ...) -> None: ...
+
+class SystemCharacterFeedMessage(_message.Message):
+    __slots__ = ("system_id", "character_live_info")
+    SYSTEM_ID_FIELD_NUMBER: _ClassVar[int]
+    CHARACTER_LIVE_INFO_FIELD_NUMBER: _ClassVar[int]
+    system_id: int
+    character_live_info: _containers.RepeatedCompositeFieldContainer[CharacterLiveInfoMessage]
+    def __init__(self, system_id: _Optional[int] = ..., character_live_info: _Optional[_Iterable[_Union[CharacterLiveInfoMessage, _Mapping]]] = ...) -> None: ...
 
 class SystemSetLiveCharacterRequest(_message.Message):
     __slots__ = ("character_id", "system_id", "present")
@@ -269,6 +407,58 @@ class SystemSetLiveCharacterResponse(_message.Message):
     system_id: int
     def __init__(self, ok: bool = ..., character_id: _Optional[int] = ..., system_id: _Optional[int] = ...) -> None: ...
 
+class SystemBulkSetLiveCharacterRequest(_message.Message):
+    __slots__ = ("presence",)
+    PRESENCE_FIELD_NUMBER: _ClassVar[int]
+    presence: _containers.RepeatedCompositeFieldContainer[SystemSetLiveCharacterRequest]
+    def __init__(self, presence: _Optional[_Iterable[_Union[SystemSetLiveCharacterRequest, _Mapping]]] = ...) -> None: ...
+
+class SystemMoveRequest(_message.Message):
+    __slots__ = ("character_id", "from_system_id", "to_system_id")
+    CHARACTER_ID_FIELD_NUMBER: _ClassVar[int]
+    FROM_SYSTEM_ID_FIELD_NUMBER: _ClassVar[int]
+    TO_SYSTEM_ID_FIELD_NUMBER: _ClassVar[int]
+    character_id: int
+    from_system_id: int
+    to_system_id: int
+    def __init__(self, character_id: _Optional[int] = ..., from_system_id: _Optional[int] = ..., to_system_id: _Optional[int] = ...) -> None: ...
+
+class SystemMoveResponse(_message.Message):
+    __slots__ = ("ok", "character_id", "system_id")
+    OK_FIELD_NUMBER: _ClassVar[int]
+    CHARACTER_ID_FIELD_NUMBER: _ClassVar[int]
+    SYSTEM_ID_FIELD_NUMBER: _ClassVar[int]
+    ok: bool
+    character_id: int
+    system_id: int
+    def __init__(self, ok: bool = ..., character_id: _Optional[int] = ..., system_id: _Optional[int] = ...) -> None: ...
+
+class SystemPopulationMessage(_message.Message):
+    __slots__ = ("system_id", "population")
+    SYSTEM_ID_FIELD_NUMBER: _ClassVar[int]
+    POPULATION_FIELD_NUMBER: _ClassVar[int]
+    system_id: int
+    population: int
+    def __init__(self, system_id: _Optional[int] = ..., population: _Optional[int] = ...) -> None: ...
+
+class SystemWhereIsRequest(_message.Message):
+    __slots__ = ("character_id", "population")
+    CHARACTER_ID_FIELD_NUMBER: _ClassVar[int]
+    POPULATION_FIELD_NUMBER: _ClassVar[int]
+    character_id: _containers.RepeatedScalarFieldContainer[int]
+    population: bool
+    def __init__(self, character_id: _Optional[_Iterable[int]] = ..., population: bool = ...) -> None: ...
+
+class SystemWhereIsResponse(_message.Message):
+    __slots__ = ("ok", "character_live_info", "population")
+    OK_FIELD_NUMBER: _ClassVar[int]
+    CHARACTER_LIVE_INFO_FIELD_NUMBER: _ClassVar[int]
+    POPULATION_FIELD_NUMBER: _ClassVar[int]
+    ok: bool
+    character_live_info: _containers.RepeatedCompositeFieldContainer[CharacterLiveInfoMessage]
+    population: _containers.RepeatedCompositeFieldContainer[SystemPopulationMessage]
+    def __init__(self, ok: bool = ..., character_live_info: _Optional[_Iterable[_Union[CharacterLiveInfoMessage, _Mapping]]] = ..., population: _Optional[_Iterable[_Union[SystemPopulationMessage, _Mapping]]] = ...) -> None: ...
+
 class SystemTopicRequest(_message.Message):
     __slots__ = ("system_id",)
     SYSTEM_ID_FIELD_NUMBER: _ClassVar[int]
@@ -285,6 +475,70 @@ class SystemTopicResponse(_message.Message):
     system_topics: TopicMessage
     def __init__(self, ok: bool = ..., system_id: _Optional[int] = ..., system_topics: _Optional[_Union[TopicMessage, _Mapping]] = ...) -> None: ...
 
+class SystemHistoryRequest(_message.Message):
+    __slots__ = ("system_id", "jumps", "system_ids", "resolution", "points")
+    SYSTEM_ID_FIELD_NUMBER: _ClassVar[int]
+    JUMPS_FIELD_NUMBER: _ClassVar[int]
+    SYSTEM_IDS_FIELD_NUMBER: _ClassVar[int]
+    RESOLUTION_FIELD_NUMBER: _ClassVar[int]
+    POINTS_FIELD_NUMBER: _ClassVar[int]
+    system_id: int
+    jumps: int
+    system_ids: _containers.RepeatedScalarFieldContainer[int]
+    resolution: str
+    points: int
+    def __init__(self, system_id: _Optional[int] = ..., jumps: _Optional[int] = ..., system_ids: _Optional[_Iterable[int]] = ..., resolution: _Optional[str] = ..., points: _Optional[int] = ...) -> None: ...
+
+class SystemHistoryMessage(_message.Message):
+    __slots__ = ("system_id", "mean", "peak")
+    SYSTEM_ID_FIELD_NUMBER: _ClassVar[int]
+    MEAN_FIELD_NUMBER: _ClassVar[int]
+    PEAK_FIELD_NUMBER: _ClassVar[int]
+    system_id: int
+    mean: _containers.RepeatedScalarFieldContainer[float]
+    peak: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, system_id: _Optional[int] = ..., mean: _Optional[_Iterable[float]] = ..., peak: _Optional[_Iterable[int]] = ...) -> None: ...
+
+class SystemHistoryResponse(_message.Message):
+    __slots__ = ("ok", "resolution", "interval", "start_time", "systems")
+    OK_FIELD_NUMBER: _ClassVar[int]
+    RESOLUTION_FIELD_NUMBER: _ClassVar[int]
+    INTERVAL_FIELD_NUMBER: _ClassVar[int]
+    START_TIME_FIELD_NUMBER: _ClassVar[int]
+    SYSTEMS_FIELD_NUMBER: _ClassVar[int]
+    ok: bool
+    resolution: str
+    interval: int
+    start_time: int
+    systems: _containers.RepeatedCompositeFieldContainer[SystemHistoryMessage]
+    def __init__(self, ok: bool = ..., resolution: _Optional[str] = ..., interval: _Optional[int] = ..., start_time: _Optional[int] = ..., systems: _Optional[_Iterable[_Union[SystemHistoryMessage, _Mapping]]] = ...) -> None: ...
+
+class SystemReplicaChange(_message.Message):
+    __slots__ = ("system_id", "arrived", "departed")
+    SYSTEM_ID_FIELD_NUMBER: _ClassVar[int]
+    ARRIVED_FIELD_NUMBER: _ClassVar[int]
+    DEPARTED_FIELD_NUMBER: _ClassVar[int]
+    system_id: int
+    arrived: _containers.RepeatedScalarFieldContainer[int]
+    departed: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, system_id: _Optional[int] = ..., arrived: _Optional[_Iterable[int]] = ..., departed: _Optional[_Iterable[int]] = ...) -> None: ...
+
+class SystemReplicaMessage(_message.Message):
+    __slots__ = ("instance_id", "epoch", "sequence", "snapshot", "handover", "changes")
+    INSTANCE_ID_FIELD_NUMBER: _ClassVar[int]
+    EPOCH_FIELD_NUMBER: _ClassVar[int]
+    SEQUENCE_FIELD_NUMBER: _ClassVar[int]
+    SNAPSHOT_FIELD_NUMBER: _ClassVar[int]
+    HANDOVER_FIELD_NUMBER: _ClassVar[int]
+    CHANGES_FIELD_NUMBER: _ClassVar[int]
+    instance_id: str
+    epoch: int
+    sequence: int
+    snapshot: bool
+    handover: bool
+    changes: _containers.RepeatedCompositeFieldContainer[SystemReplicaChange]
+    def __init__(self, instance_id: _Optional[str] = ..., epoch: _Optional[int] = ..., sequence: _Optional[int] = ..., snapshot: bool = ..., handover: bool = ..., changes: _Optional[_Iterable[_Union[SystemReplicaChange, _Mapping]]] = ...) -> None: ...
+
 class SessionStartRequest(_message.Message):
     __slots__ = ("username",)
     USERNAME_FIELD_NUMBER: _ClassVar[int]
@@ -329,6 +583,24 @@ class SessionPong(_message.Message):
     session_id: str
     def __init__(self, session_id: _Optional[str] = ...) -> None: ...
 
+class SessionRevoked(_message.Message):
+    __slots__ = ("character_id", "generation", "expires")
+    CHARACTER_ID_FIELD_NUMBER: _ClassVar[int]
+    GENERATION_FIELD_NUMBER: _ClassVar[int]
+    EXPIRES_FIELD_NUMBER: _ClassVar[int]
+    character_id: int
+    generation: int
+    expires: int
+    def __init__(self, character_id: _Optional[int] = ..., generation: _Optional[int] = ..., expires: _Optional[int] = ...) -> None: ...
+
+class SessionRevocationMessage(_message.Message):
+    __slots__ = ("min_generation", "revoked")
+    MIN_GENERATION_FIELD_NUMBER: _ClassVar[int]
+    REVOKED_FIELD_NUMBER: _ClassVar[int]
+    min_generation: int
+    revoked: _containers.RepeatedCompositeFieldContainer[SessionRevoked]
+    def __init__(self, min_generation: _Optional[int] = ..., revoked: _Optional[_Iterable[_Union[SessionRevoked, _Mapping]]] = ...) -> None: ...
+
 class SessionMessageRequest(_message.Message):
     __slots__ = ("type", "character_id", "system_id", "chatter")
     TYPE_FIELD_NUMBER: _ClassVar[int]
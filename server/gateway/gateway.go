@@ -5,6 +5,7 @@ import (
 	"context"
 	"fmt"
 	"log"
+	"os"
 	"time"
 
 	"github.com/jonathonfletcher/poqserver/messaging"
@@ -23,13 +24,21 @@ import (
 
 type PoQServer struct {
 	poq.PoQServer
-	messaging messaging.IMessaging
-	manager   session.ISessionManager
+	messaging   messaging.IMessaging
+	manager     session.ISessionManager
+	sessionKey  []byte
+	revocations *session.SessionRevocations
 }
 
 func (server *PoQServer) sessionRouterFromMetadata(md metadata.MD) session.ISessionRouter {
 	if sessionIdList := md.Get("x-session-id"); len(sessionIdList) > 0 {
 		sessionId := sessionIdList[0]
+		// Forged, expired and revoked tokens are turned away without touching the session
+		// table. Without a key nothing can be verified, so every token is.
+		claims, ok := session.VerifySessionToken(server.sessionKey, sessionId)
+		if len(server.sessionKey) == 0 || !ok || server.revocations.Revoked(claims) {
+			return nil
+		}
 		return server.manager.GetSessionRouter(sessionId)
 	}
 	return nil
@@ -135,13 +144,20 @@ func (server *PoQServer) StreamSession(stream grpc.BidiStreamingServer[poq.Sessi
 }
 
 func newPoQServer(messaging messaging.IMessaging) *PoQServer {
-	return &PoQServer{messaging: messaging, manager: session.NewSessionManager(messaging)}
+	sessionKey := []byte(os.Getenv("POQ_SESSION_KEY"))
+	if len(sessionKey) == 0 {
+		log.Printf("%s.%s: POQ_SESSION_KEY not set - every session will be refused", telemetry.GetPackageName(), telemetry.GetFunctionName())
+	}
+	return &PoQServer{messaging: messaging, manager: session.NewSessionManager(messaging), sessionKey: sessionKey, revocations: session.NewSessionRevocations()}
 }
 
 func (server *PoQServer) poqStartup(ctx context.Context) {
 	intRequest := &poq.ServiceStart{Type: poq.ServiceType_GATEWAY_SERVICE, Timestamp: timestamppb.Now()}
 	requestData, _ := proto.Marshal(intRequest)
 	_ = server.messaging.Publish(ctx, "PUB.SERVICE.START", requestData)
+	if err := server.revocations.Start(ctx, server.messaging); err != nil {
+		log.Printf("%s.%s: err:%v", telemetry.GetPackageName(), telemetry.GetFunctionName(), err)
+	}
 }
 
 func RegisterPoQServer(ctx context.Context, s grpc.ServiceRegistrar, messaging messaging.IMessaging) error {
@@ -2,9 +2,15 @@
 package messaging
 
 import (
+	"bytes"
+	"compress/zlib"
 	"context"
+	"encoding/binary"
+	"fmt"
+	"io"
 	"log"
 	"os"
+	"strconv"
 	"sync"
 	"time"
 
@@ -15,6 +21,55 @@ import (
 	"go.opentelemetry.io/otel/propagation"
 )
 
+// BatchHeader marks a message that carries several length-prefixed payloads for the same subject.
+const BatchHeader = "Poq-Batch"
+
+// DeadlineHeader carries the absolute deadline of a request, in epoch seconds, so
+// services skip work the gateway has already given up on.
+const DeadlineHeader = "Poq-Deadline"
+
+// EncodingHeader names the codec of a compressed payload. AcceptEncodingHeader lists the
+// codecs a requester can decode - services only compress replies with one of those.
+const EncodingHeader = "Poq-Encoding"
+const AcceptEncodingHeader = "Poq-Accept-Encoding"
+
+func DecodePayload(header nats.Header, data []byte) ([]byte, error) {
+	switch encoding := header.Get(EncodingHeader); encoding {
+	case "":
+		return data, nil
+	case "zlib":
+		reader, err := zlib.NewReader(bytes.NewReader(data))
+		if err != nil {
+			return nil, err
+		}
+		defer reader.Close()
+		return io.ReadAll(reader)
+	default:
+		return nil, fmt.Errorf("unsupported encoding: %v", encoding)
+	}
+}
+
+// UnpackBatch refuses a truncated or malformed batch whole, rather than delivering part of it.
+func UnpackBatch(data []byte, count string) ([][]byte, error) {
+	payloads := make([][]byte, 0)
+	for len(data) > 0 {
+		if len(data) < 4 {
+			return nil, fmt.Errorf("batch truncated in a length prefix after %d payloads", len(payloads))
+		}
+		length := int(binary.BigEndian.Uint32(data))
+		data = data[4:]
+		if length > len(data) {
+			return nil, fmt.Errorf("batch truncated in payload %d: %d bytes, %d left", len(payloads), length, len(data))
+		}
+		payloads = append(payloads, data[:length])
+		data = data[length:]
+	}
+	if n, err := strconv.Atoi(count); err != nil || n != len(payloads) {
+		return nil, fmt.Errorf("batch of %d payloads, header says %q", len(payloads), count)
+	}
+	return payloads, nil
+}
+
 type MessagingImpl struct {
 	nc *nats.Conn
 }
@@ -33,11 +88,30 @@ func (m *MessagingImpl) Request(ctx context.Context, subj string, data []byte, t
 	header := make(nats.Header)
 	propagator := propagation.TraceContext{}
 	propagator.Inject(ctx, propagation.HeaderCarrier(header))
-	return m.nc.RequestMsg(&nats.Msg{
+
+	deadline := time.Now().Add(timeout)
+	if ctxDeadline, ok := ctx.Deadline(); ok && ctxDeadline.Before(deadline) {
+		deadline = ctxDeadline
+		timeout = time.Until(deadline)
+		if timeout <= 0 {
+			return nil, context.DeadlineExceeded
+		}
+	}
+	header.Set(DeadlineHeader, strconv.FormatFloat(float64(deadline.UnixMicro())/1e6, 'f', 6, 64))
+	header.Set(AcceptEncodingHeader, "zlib")
+	msg, err := m.nc.RequestMsg(&nats.Msg{
 		Subject: subj,
 		Header:  header,
 		Data:    data,
 	}, timeout)
+	if err != nil {
+		return nil, err
+	}
+	if msg.Data, err = DecodePayload(msg.Header, msg.Data); err != nil {
+		return nil, err
+	}
+	msg.Header.Del(EncodingHeader)
+	return msg, nil
 }
 
 func (m *MessagingImpl) Publish(ctx context.Context, subj string, data []byte) error {
@@ -81,6 +155,23 @@ func (m *MessagingImpl) Subscribe(ctx context.Context, subj string, cb func(ctx
 	sub, err := m.nc.Subscribe(subj, func(msg *nats.Msg) {
 		propagator := propagation.TraceContext{}
 		ctx := propagator.Extract(context.Background(), propagation.HeaderCarrier(msg.Header))
+		data, err := DecodePayload(msg.Header, msg.Data)
+		if err != nil {
+			log.Printf("%s.%s: subject:%v, err:%v", telemetry.GetPackageName(), telemetry.GetFunctionName(), msg.Subject, err)
+			return
+		}
+		msg.Data = data
+		if msg.Header.Get(BatchHeader) != "" {
+			payloads, err := UnpackBatch(msg.Data, msg.Header.Get(BatchHeader))
+			if err != nil {
+				log.Printf("%s.%s: subject:%v, err:%v", telemetry.GetPackageName(), telemetry.GetFunctionName(), msg.Subject, err)
+				return
+			}
+			for _, data := range payloads {
+				cb(ctx, &nats.Msg{Subject: msg.Subject, Header: msg.Header, Data: data, Sub: msg.Sub})
+			}
+			return
+		}
 		cb(ctx, msg)
 	})
 	return sub, err
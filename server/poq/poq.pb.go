@@ -82,18 +82,18 @@ func (ServiceType) EnumDescriptor() ([]byte, []int) {
 type SessionMessageType int32
 
 const (
-	SessionMessageType_UNKNOWN_MESSAGE_TYPE SessionMessageType = 0
-	SessionMessageType_START                SessionMessageType = 1
-	SessionMessageType_STOP                 SessionMessageType = 2
-	// PING = 3;
-	// PONG = 4;
+	SessionMessageType_UNKNOWN_MESSAGE_TYPE  SessionMessageType = 0
+	SessionMessageType_START                 SessionMessageType = 1
+	SessionMessageType_STOP                  SessionMessageType = 2
+	SessionMessageType_PING                  SessionMessageType = 3
+	SessionMessageType_PONG                  SessionMessageType = 4
 	SessionMessageType_LOGIN                 SessionMessageType = 5
 	SessionMessageType_LOGOUT                SessionMessageType = 6
 	SessionMessageType_CHARACTER_STATIC_INFO SessionMessageType = 7
 	SessionMessageType_CHARACTER_LIVE_INFO   SessionMessageType = 8
 	SessionMessageType_SYSTEM_STATIC_INFO    SessionMessageType = 9
 	SessionMessageType_SYSTEM_LIVE_INFO      SessionMessageType = 10
-	// JOIN_SYSTEM = 11;
+	SessionMessageType_JOIN_SYSTEM           SessionMessageType = 11
 	// LEAVE_SYSTEM = 12;
 	SessionMessageType_CHATTER SessionMessageType = 13
 )
@@ -104,24 +104,30 @@ var (
 		0:  "UNKNOWN_MESSAGE_TYPE",
 		1:  "START",
 		2:  "STOP",
+		3:  "PING",
+		4:  "PONG",
 		5:  "LOGIN",
 		6:  "LOGOUT",
 		7:  "CHARACTER_STATIC_INFO",
 		8:  "CHARACTER_LIVE_INFO",
 		9:  "SYSTEM_STATIC_INFO",
 		10: "SYSTEM_LIVE_INFO",
+		11: "JOIN_SYSTEM",
 		13: "CHATTER",
 	}
 	SessionMessageType_value = map[string]int32{
 		"UNKNOWN_MESSAGE_TYPE":  0,
 		"START":                 1,
 		"STOP":                  2,
+		"PING":                  3,
+		"PONG":                  4,
 		"LOGIN":                 5,
 		"LOGOUT":                6,
 		"CHARACTER_STATIC_INFO": 7,
 		"CHARACTER_LIVE_INFO":   8,
 		"SYSTEM_STATIC_INFO":    9,
 		"SYSTEM_LIVE_INFO":      10,
+		"JOIN_SYSTEM":           11,
 		"CHATTER":               13,
 	}
 )
@@ -161,6 +167,7 @@ type TopicMessage struct {
 	RequestTopic   string `protobuf:"bytes,1,opt,name=request_topic,json=requestTopic,proto3" json:"request_topic,omitempty"`
 	PublishTopic   string `protobuf:"bytes,2,opt,name=publish_topic,json=publishTopic,proto3" json:"publish_topic,omitempty"`
 	SubscribeTopic string `protobuf:"bytes,3,opt,name=subscribe_topic,json=subscribeTopic,proto3" json:"subscribe_topic,omitempty"`
+	FeedTopic      string `protobuf:"bytes,4,opt,name=feed_topic,json=feedTopic,proto3" json:"feed_topic,omitempty"`
 }
 
 func (x *TopicMessage) Reset() {
@@ -216,13 +223,22 @@ func (x *TopicMessage) GetSubscribeTopic() string {
 	return ""
 }
 
+func (x *TopicMessage) GetFeedTopic() string {
+	if x != nil {
+		return x.FeedTopic
+	}
+	return ""
+}
+
 type ServiceStart struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	Type      ServiceType            `protobuf:"varint,1,opt,name=type,proto3,enum=poq.ServiceType" json:"type,omitempty"`
-	Timestamp *timestamppb.Timestamp `protobuf:"bytes,2,opt,name=timestamp,proto3" json:"timestamp,omitempty"`
+	Type       ServiceType            `protobuf:"varint,1,opt,name=type,proto3,enum=poq.ServiceType" json:"type,omitempty"`
+	Timestamp  *timestamppb.Timestamp `protobuf:"bytes,2,opt,name=timestamp,proto3" json:"timestamp,omitempty"`
+	InstanceId string                 `protobuf:"bytes,3,opt,name=instance_id,json=instanceId,proto3" json:"instance_id,omitempty"`
+	Load       int32                  `protobuf:"varint,4,opt,name=load,proto3" json:"load,omitempty"`
 }
 
 func (x *ServiceStart) Reset() {
@@ -271,17 +287,34 @@ func (x *ServiceStart) GetTimestamp() *timestamppb.Timestamp {
 	return nil
 }
 
-type CharacterStaticInfoMessage struct {
+func (x *ServiceStart) GetInstanceId() string {
+	if x != nil {
+		return x.InstanceId
+	}
+	return ""
+}
+
+func (x *ServiceStart) GetLoad() int32 {
+	if x != nil {
+		return x.Load
+	}
+	return 0
+}
+
+// Memory accounting of one service instance, on REQ.SERVICE.MEMORY.{instance_id}. With
+// heap_top the tracemalloc top allocations by line since the previous such request (the
+// first one starts tracing); heap_stop stops tracing.
+type ServiceMemoryRequest struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	CharacterId int32  `protobuf:"varint,1,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
-	Name        string `protobuf:"bytes,2,opt,name=name,proto3" json:"name,omitempty"`
+	HeapTop  int32 `protobuf:"varint,1,opt,name=heap_top,json=heapTop,proto3" json:"heap_top,omitempty"`
+	HeapStop bool  `protobuf:"varint,2,opt,name=heap_stop,json=heapStop,proto3" json:"heap_stop,omitempty"`
 }
 
-func (x *CharacterStaticInfoMessage) Reset() {
-	*x = CharacterStaticInfoMessage{}
+func (x *ServiceMemoryRequest) Reset() {
+	*x = ServiceMemoryRequest{}
 	if protoimpl.UnsafeEnabled {
 		mi := &file_poq_proto_msgTypes[2]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -289,13 +322,13 @@ func (x *CharacterStaticInfoMessage) Reset() {
 	}
 }
 
-func (x *CharacterStaticInfoMessage) String() string {
+func (x *ServiceMemoryRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*CharacterStaticInfoMessage) ProtoMessage() {}
+func (*ServiceMemoryRequest) ProtoMessage() {}
 
-func (x *CharacterStaticInfoMessage) ProtoReflect() protoreflect.Message {
+func (x *ServiceMemoryRequest) ProtoReflect() protoreflect.Message {
 	mi := &file_poq_proto_msgTypes[2]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -307,35 +340,37 @@ func (x *CharacterStaticInfoMessage) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use CharacterStaticInfoMessage.ProtoReflect.Descriptor instead.
-func (*CharacterStaticInfoMessage) Descriptor() ([]byte, []int) {
+// Deprecated: Use ServiceMemoryRequest.ProtoReflect.Descriptor instead.
+func (*ServiceMemoryRequest) Descriptor() ([]byte, []int) {
 	return file_poq_proto_rawDescGZIP(), []int{2}
 }
 
-func (x *CharacterStaticInfoMessage) GetCharacterId() int32 {
+func (x *ServiceMemoryRequest) GetHeapTop() int32 {
 	if x != nil {
-		return x.CharacterId
+		return x.HeapTop
 	}
 	return 0
 }
 
-func (x *CharacterStaticInfoMessage) GetName() string {
+func (x *ServiceMemoryRequest) GetHeapStop() bool {
 	if x != nil {
-		return x.Name
+		return x.HeapStop
 	}
-	return ""
+	return false
 }
 
-type CharacterStaticInfoRequest struct {
+type MemoryStructure struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	CharacterId int32 `protobuf:"varint,1,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
+	Name  string `protobuf:"bytes,1,opt,name=name,proto3" json:"name,omitempty"`
+	Count int64  `protobuf:"varint,2,opt,name=count,proto3" json:"count,omitempty"`
+	Size  int64  `protobuf:"varint,3,opt,name=size,proto3" json:"size,omitempty"`
 }
 
-func (x *CharacterStaticInfoRequest) Reset() {
-	*x = CharacterStaticInfoRequest{}
+func (x *MemoryStructure) Reset() {
+	*x = MemoryStructure{}
 	if protoimpl.UnsafeEnabled {
 		mi := &file_poq_proto_msgTypes[3]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -343,13 +378,13 @@ func (x *CharacterStaticInfoRequest) Reset() {
 	}
 }
 
-func (x *CharacterStaticInfoRequest) String() string {
+func (x *MemoryStructure) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*CharacterStaticInfoRequest) ProtoMessage() {}
+func (*MemoryStructure) ProtoMessage() {}
 
-func (x *CharacterStaticInfoRequest) ProtoReflect() protoreflect.Message {
+func (x *MemoryStructure) ProtoReflect() protoreflect.Message {
 	mi := &file_poq_proto_msgTypes[3]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -361,29 +396,46 @@ func (x *CharacterStaticInfoRequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use CharacterStaticInfoRequest.ProtoReflect.Descriptor instead.
-func (*CharacterStaticInfoRequest) Descriptor() ([]byte, []int) {
+// Deprecated: Use MemoryStructure.ProtoReflect.Descriptor instead.
+func (*MemoryStructure) Descriptor() ([]byte, []int) {
 	return file_poq_proto_rawDescGZIP(), []int{3}
 }
 
-func (x *CharacterStaticInfoRequest) GetCharacterId() int32 {
+func (x *MemoryStructure) GetName() string {
 	if x != nil {
-		return x.CharacterId
+		return x.Name
+	}
+	return ""
+}
+
+func (x *MemoryStructure) GetCount() int64 {
+	if x != nil {
+		return x.Count
 	}
 	return 0
 }
 
-type CharacterStaticInfoResponse struct {
+func (x *MemoryStructure) GetSize() int64 {
+	if x != nil {
+		return x.Size
+	}
+	return 0
+}
+
+type HeapStatistic struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	Ok                  bool                        `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
-	CharacterStaticInfo *CharacterStaticInfoMessage `protobuf:"bytes,2,opt,name=character_static_info,json=characterStaticInfo,proto3" json:"character_static_info,omitempty"`
+	Location  string `protobuf:"bytes,1,opt,name=location,proto3" json:"location,omitempty"`
+	Size      int64  `protobuf:"varint,2,opt,name=size,proto3" json:"size,omitempty"`
+	SizeDiff  int64  `protobuf:"varint,3,opt,name=size_diff,json=sizeDiff,proto3" json:"size_diff,omitempty"`
+	Count     int64  `protobuf:"varint,4,opt,name=count,proto3" json:"count,omitempty"`
+	CountDiff int64  `protobuf:"varint,5,opt,name=count_diff,json=countDiff,proto3" json:"count_diff,omitempty"`
 }
 
-func (x *CharacterStaticInfoResponse) Reset() {
-	*x = CharacterStaticInfoResponse{}
+func (x *HeapStatistic) Reset() {
+	*x = HeapStatistic{}
 	if protoimpl.UnsafeEnabled {
 		mi := &file_poq_proto_msgTypes[4]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -391,13 +443,13 @@ func (x *CharacterStaticInfoResponse) Reset() {
 	}
 }
 
-func (x *CharacterStaticInfoResponse) String() string {
+func (x *HeapStatistic) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*CharacterStaticInfoResponse) ProtoMessage() {}
+func (*HeapStatistic) ProtoMessage() {}
 
-func (x *CharacterStaticInfoResponse) ProtoReflect() protoreflect.Message {
+func (x *HeapStatistic) ProtoReflect() protoreflect.Message {
 	mi := &file_poq_proto_msgTypes[4]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -409,37 +461,64 @@ func (x *CharacterStaticInfoResponse) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use CharacterStaticInfoResponse.ProtoReflect.Descriptor instead.
-func (*CharacterStaticInfoResponse) Descriptor() ([]byte, []int) {
+// Deprecated: Use HeapStatistic.ProtoReflect.Descriptor instead.
+func (*HeapStatistic) Descriptor() ([]byte, []int) {
 	return file_poq_proto_rawDescGZIP(), []int{4}
 }
 
-func (x *CharacterStaticInfoResponse) GetOk() bool {
+func (x *HeapStatistic) GetLocation() string {
 	if x != nil {
-		return x.Ok
+		return x.Location
 	}
-	return false
+	return ""
 }
 
-func (x *CharacterStaticInfoResponse) GetCharacterStaticInfo() *CharacterStaticInfoMessage {
+func (x *HeapStatistic) GetSize() int64 {
 	if x != nil {
-		return x.CharacterStaticInfo
+		return x.Size
 	}
-	return nil
+	return 0
 }
 
-type CharacterLiveInfoMessage struct {
+func (x *HeapStatistic) GetSizeDiff() int64 {
+	if x != nil {
+		return x.SizeDiff
+	}
+	return 0
+}
+
+func (x *HeapStatistic) GetCount() int64 {
+	if x != nil {
+		return x.Count
+	}
+	return 0
+}
+
+func (x *HeapStatistic) GetCountDiff() int64 {
+	if x != nil {
+		return x.CountDiff
+	}
+	return 0
+}
+
+type ServiceMemoryResponse struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	CharacterId int32 `protobuf:"varint,1,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
-	SystemId    int32 `protobuf:"varint,2,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
-	Active      bool  `protobuf:"varint,3,opt,name=active,proto3" json:"active,omitempty"`
+	InstanceId  string             `protobuf:"bytes,1,opt,name=instance_id,json=instanceId,proto3" json:"instance_id,omitempty"`
+	Type        ServiceType        `protobuf:"varint,2,opt,name=type,proto3,enum=poq.ServiceType" json:"type,omitempty"`
+	Rss         int64              `protobuf:"varint,3,opt,name=rss,proto3" json:"rss,omitempty"`
+	PeakRss     int64              `protobuf:"varint,4,opt,name=peak_rss,json=peakRss,proto3" json:"peak_rss,omitempty"`
+	Structures  []*MemoryStructure `protobuf:"bytes,5,rep,name=structures,proto3" json:"structures,omitempty"`
+	HeapTracing bool               `protobuf:"varint,6,opt,name=heap_tracing,json=heapTracing,proto3" json:"heap_tracing,omitempty"`
+	HeapTraced  int64              `protobuf:"varint,7,opt,name=heap_traced,json=heapTraced,proto3" json:"heap_traced,omitempty"`
+	HeapPeak    int64              `protobuf:"varint,8,opt,name=heap_peak,json=heapPeak,proto3" json:"heap_peak,omitempty"`
+	Heap        []*HeapStatistic   `protobuf:"bytes,9,rep,name=heap,proto3" json:"heap,omitempty"`
 }
 
-func (x *CharacterLiveInfoMessage) Reset() {
-	*x = CharacterLiveInfoMessage{}
+func (x *ServiceMemoryResponse) Reset() {
+	*x = ServiceMemoryResponse{}
 	if protoimpl.UnsafeEnabled {
 		mi := &file_poq_proto_msgTypes[5]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -447,13 +526,13 @@ func (x *CharacterLiveInfoMessage) Reset() {
 	}
 }
 
-func (x *CharacterLiveInfoMessage) String() string {
+func (x *ServiceMemoryResponse) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*CharacterLiveInfoMessage) ProtoMessage() {}
+func (*ServiceMemoryResponse) ProtoMessage() {}
 
-func (x *CharacterLiveInfoMessage) ProtoReflect() protoreflect.Message {
+func (x *ServiceMemoryResponse) ProtoReflect() protoreflect.Message {
 	mi := &file_poq_proto_msgTypes[5]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -465,42 +544,86 @@ func (x *CharacterLiveInfoMessage) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use CharacterLiveInfoMessage.ProtoReflect.Descriptor instead.
-func (*CharacterLiveInfoMessage) Descriptor() ([]byte, []int) {
+// Deprecated: Use ServiceMemoryResponse.ProtoReflect.Descriptor instead.
+func (*ServiceMemoryResponse) Descriptor() ([]byte, []int) {
 	return file_poq_proto_rawDescGZIP(), []int{5}
 }
 
-func (x *CharacterLiveInfoMessage) GetCharacterId() int32 {
+func (x *ServiceMemoryResponse) GetInstanceId() string {
 	if x != nil {
-		return x.CharacterId
+		return x.InstanceId
+	}
+	return ""
+}
+
+func (x *ServiceMemoryResponse) GetType() ServiceType {
+	if x != nil {
+		return x.Type
+	}
+	return ServiceType_UNKNOWN_SERVICE
+}
+
+func (x *ServiceMemoryResponse) GetRss() int64 {
+	if x != nil {
+		return x.Rss
 	}
 	return 0
 }
 
-func (x *CharacterLiveInfoMessage) GetSystemId() int32 {
+func (x *ServiceMemoryResponse) GetPeakRss() int64 {
 	if x != nil {
-		return x.SystemId
+		return x.PeakRss
 	}
 	return 0
 }
 
-func (x *CharacterLiveInfoMessage) GetActive() bool {
+func (x *ServiceMemoryResponse) GetStructures() []*MemoryStructure {
 	if x != nil {
-		return x.Active
+		return x.Structures
+	}
+	return nil
+}
+
+func (x *ServiceMemoryResponse) GetHeapTracing() bool {
+	if x != nil {
+		return x.HeapTracing
 	}
 	return false
 }
 
-type CharacterLiveInfoRequest struct {
+func (x *ServiceMemoryResponse) GetHeapTraced() int64 {
+	if x != nil {
+		return x.HeapTraced
+	}
+	return 0
+}
+
+func (x *ServiceMemoryResponse) GetHeapPeak() int64 {
+	if x != nil {
+		return x.HeapPeak
+	}
+	return 0
+}
+
+func (x *ServiceMemoryResponse) GetHeap() []*HeapStatistic {
+	if x != nil {
+		return x.Heap
+	}
+	return nil
+}
+
+type CharacterStaticInfoMessage struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	CharacterId int32 `protobuf:"varint,1,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
+	CharacterId int32  `protobuf:"varint,1,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
+	Name        string `protobuf:"bytes,2,opt,name=name,proto3" json:"name,omitempty"`
+	Version     string `protobuf:"bytes,3,opt,name=version,proto3" json:"version,omitempty"`
 }
 
-func (x *CharacterLiveInfoRequest) Reset() {
-	*x = CharacterLiveInfoRequest{}
+func (x *CharacterStaticInfoMessage) Reset() {
+	*x = CharacterStaticInfoMessage{}
 	if protoimpl.UnsafeEnabled {
 		mi := &file_poq_proto_msgTypes[6]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -508,13 +631,13 @@ func (x *CharacterLiveInfoRequest) Reset() {
 	}
 }
 
-func (x *CharacterLiveInfoRequest) String() string {
+func (x *CharacterStaticInfoMessage) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*CharacterLiveInfoRequest) ProtoMessage() {}
+func (*CharacterStaticInfoMessage) ProtoMessage() {}
 
-func (x *CharacterLiveInfoRequest) ProtoReflect() protoreflect.Message {
+func (x *CharacterStaticInfoMessage) ProtoReflect() protoreflect.Message {
 	mi := &file_poq_proto_msgTypes[6]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -526,30 +649,42 @@ func (x *CharacterLiveInfoRequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use CharacterLiveInfoRequest.ProtoReflect.Descriptor instead.
-func (*CharacterLiveInfoRequest) Descriptor() ([]byte, []int) {
+// Deprecated: Use CharacterStaticInfoMessage.ProtoReflect.Descriptor instead.
+func (*CharacterStaticInfoMessage) Descriptor() ([]byte, []int) {
 	return file_poq_proto_rawDescGZIP(), []int{6}
 }
 
-func (x *CharacterLiveInfoRequest) GetCharacterId() int32 {
+func (x *CharacterStaticInfoMessage) GetCharacterId() int32 {
 	if x != nil {
 		return x.CharacterId
 	}
 	return 0
 }
 
-type CharacterLiveInfoResponse struct {
+func (x *CharacterStaticInfoMessage) GetName() string {
+	if x != nil {
+		return x.Name
+	}
+	return ""
+}
+
+func (x *CharacterStaticInfoMessage) GetVersion() string {
+	if x != nil {
+		return x.Version
+	}
+	return ""
+}
+
+type CharacterStaticInfoRequest struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	Ok                bool                      `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
-	CharacterId       int32                     `protobuf:"varint,2,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
-	CharacterLiveInfo *CharacterLiveInfoMessage `protobuf:"bytes,3,opt,name=character_live_info,json=characterLiveInfo,proto3" json:"character_live_info,omitempty"`
+	CharacterId int32 `protobuf:"varint,1,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
 }
 
-func (x *CharacterLiveInfoResponse) Reset() {
-	*x = CharacterLiveInfoResponse{}
+func (x *CharacterStaticInfoRequest) Reset() {
+	*x = CharacterStaticInfoRequest{}
 	if protoimpl.UnsafeEnabled {
 		mi := &file_poq_proto_msgTypes[7]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -557,13 +692,13 @@ func (x *CharacterLiveInfoResponse) Reset() {
 	}
 }
 
-func (x *CharacterLiveInfoResponse) String() string {
+func (x *CharacterStaticInfoRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*CharacterLiveInfoResponse) ProtoMessage() {}
+func (*CharacterStaticInfoRequest) ProtoMessage() {}
 
-func (x *CharacterLiveInfoResponse) ProtoReflect() protoreflect.Message {
+func (x *CharacterStaticInfoRequest) ProtoReflect() protoreflect.Message {
 	mi := &file_poq_proto_msgTypes[7]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -575,42 +710,29 @@ func (x *CharacterLiveInfoResponse) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use CharacterLiveInfoResponse.ProtoReflect.Descriptor instead.
-func (*CharacterLiveInfoResponse) Descriptor() ([]byte, []int) {
+// Deprecated: Use CharacterStaticInfoRequest.ProtoReflect.Descriptor instead.
+func (*CharacterStaticInfoRequest) Descriptor() ([]byte, []int) {
 	return file_poq_proto_rawDescGZIP(), []int{7}
 }
 
-func (x *CharacterLiveInfoResponse) GetOk() bool {
-	if x != nil {
-		return x.Ok
-	}
-	return false
-}
-
-func (x *CharacterLiveInfoResponse) GetCharacterId() int32 {
+func (x *CharacterStaticInfoRequest) GetCharacterId() int32 {
 	if x != nil {
 		return x.CharacterId
 	}
 	return 0
 }
 
-func (x *CharacterLiveInfoResponse) GetCharacterLiveInfo() *CharacterLiveInfoMessage {
-	if x != nil {
-		return x.CharacterLiveInfo
-	}
-	return nil
-}
-
-type CharacterLoginRequest struct {
+type CharacterStaticInfoResponse struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	CharacterId int32 `protobuf:"varint,1,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
+	Ok                  bool                        `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
+	CharacterStaticInfo *CharacterStaticInfoMessage `protobuf:"bytes,2,opt,name=character_static_info,json=characterStaticInfo,proto3" json:"character_static_info,omitempty"`
 }
 
-func (x *CharacterLoginRequest) Reset() {
-	*x = CharacterLoginRequest{}
+func (x *CharacterStaticInfoResponse) Reset() {
+	*x = CharacterStaticInfoResponse{}
 	if protoimpl.UnsafeEnabled {
 		mi := &file_poq_proto_msgTypes[8]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -618,13 +740,13 @@ func (x *CharacterLoginRequest) Reset() {
 	}
 }
 
-func (x *CharacterLoginRequest) String() string {
+func (x *CharacterStaticInfoResponse) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*CharacterLoginRequest) ProtoMessage() {}
+func (*CharacterStaticInfoResponse) ProtoMessage() {}
 
-func (x *CharacterLoginRequest) ProtoReflect() protoreflect.Message {
+func (x *CharacterStaticInfoResponse) ProtoReflect() protoreflect.Message {
 	mi := &file_poq_proto_msgTypes[8]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -636,30 +758,37 @@ func (x *CharacterLoginRequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use CharacterLoginRequest.ProtoReflect.Descriptor instead.
-func (*CharacterLoginRequest) Descriptor() ([]byte, []int) {
+// Deprecated: Use CharacterStaticInfoResponse.ProtoReflect.Descriptor instead.
+func (*CharacterStaticInfoResponse) Descriptor() ([]byte, []int) {
 	return file_poq_proto_rawDescGZIP(), []int{8}
 }
 
-func (x *CharacterLoginRequest) GetCharacterId() int32 {
+func (x *CharacterStaticInfoResponse) GetOk() bool {
 	if x != nil {
-		return x.CharacterId
+		return x.Ok
 	}
-	return 0
+	return false
 }
 
-type CharacterLoginResponse struct {
+func (x *CharacterStaticInfoResponse) GetCharacterStaticInfo() *CharacterStaticInfoMessage {
+	if x != nil {
+		return x.CharacterStaticInfo
+	}
+	return nil
+}
+
+type CharacterLiveInfoMessage struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	Ok                bool                      `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
-	CharacterId       int32                     `protobuf:"varint,2,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
-	CharacterLiveInfo *CharacterLiveInfoMessage `protobuf:"bytes,3,opt,name=character_live_info,json=characterLiveInfo,proto3" json:"character_live_info,omitempty"`
+	CharacterId int32 `protobuf:"varint,1,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
+	SystemId    int32 `protobuf:"varint,2,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
+	Active      bool  `protobuf:"varint,3,opt,name=active,proto3" json:"active,omitempty"`
 }
 
-func (x *CharacterLoginResponse) Reset() {
-	*x = CharacterLoginResponse{}
+func (x *CharacterLiveInfoMessage) Reset() {
+	*x = CharacterLiveInfoMessage{}
 	if protoimpl.UnsafeEnabled {
 		mi := &file_poq_proto_msgTypes[9]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -667,13 +796,13 @@ func (x *CharacterLoginResponse) Reset() {
 	}
 }
 
-func (x *CharacterLoginResponse) String() string {
+func (x *CharacterLiveInfoMessage) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*CharacterLoginResponse) ProtoMessage() {}
+func (*CharacterLiveInfoMessage) ProtoMessage() {}
 
-func (x *CharacterLoginResponse) ProtoReflect() protoreflect.Message {
+func (x *CharacterLiveInfoMessage) ProtoReflect() protoreflect.Message {
 	mi := &file_poq_proto_msgTypes[9]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -685,33 +814,33 @@ func (x *CharacterLoginResponse) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use CharacterLoginResponse.ProtoReflect.Descriptor instead.
-func (*CharacterLoginResponse) Descriptor() ([]byte, []int) {
-	return file_poq_proto_rawDescGZIP(), []int{9}
+// Deprecated: Use CharacterLiveInfoMessage.ProtoReflect.Descriptor instead.
+func (*CharacterLiveInfoMessage) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{9}
 }
 
-func (x *CharacterLoginResponse) GetOk() bool {
+func (x *CharacterLiveInfoMessage) GetCharacterId() int32 {
 	if x != nil {
-		return x.Ok
+		return x.CharacterId
 	}
-	return false
+	return 0
 }
 
-func (x *CharacterLoginResponse) GetCharacterId() int32 {
+func (x *CharacterLiveInfoMessage) GetSystemId() int32 {
 	if x != nil {
-		return x.CharacterId
+		return x.SystemId
 	}
 	return 0
 }
 
-func (x *CharacterLoginResponse) GetCharacterLiveInfo() *CharacterLiveInfoMessage {
+func (x *CharacterLiveInfoMessage) GetActive() bool {
 	if x != nil {
-		return x.CharacterLiveInfo
+		return x.Active
 	}
-	return nil
+	return false
 }
 
-type CharacterLogoutRequest struct {
+type CharacterLiveInfoRequest struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
@@ -719,8 +848,8 @@ type CharacterLogoutRequest struct {
 	CharacterId int32 `protobuf:"varint,1,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
 }
 
-func (x *CharacterLogoutRequest) Reset() {
-	*x = CharacterLogoutRequest{}
+func (x *CharacterLiveInfoRequest) Reset() {
+	*x = CharacterLiveInfoRequest{}
 	if protoimpl.UnsafeEnabled {
 		mi := &file_poq_proto_msgTypes[10]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -728,13 +857,13 @@ func (x *CharacterLogoutRequest) Reset() {
 	}
 }
 
-func (x *CharacterLogoutRequest) String() string {
+func (x *CharacterLiveInfoRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*CharacterLogoutRequest) ProtoMessage() {}
+func (*CharacterLiveInfoRequest) ProtoMessage() {}
 
-func (x *CharacterLogoutRequest) ProtoReflect() protoreflect.Message {
+func (x *CharacterLiveInfoRequest) ProtoReflect() protoreflect.Message {
 	mi := &file_poq_proto_msgTypes[10]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -746,29 +875,30 @@ func (x *CharacterLogoutRequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use CharacterLogoutRequest.ProtoReflect.Descriptor instead.
-func (*CharacterLogoutRequest) Descriptor() ([]byte, []int) {
+// Deprecated: Use CharacterLiveInfoRequest.ProtoReflect.Descriptor instead.
+func (*CharacterLiveInfoRequest) Descriptor() ([]byte, []int) {
 	return file_poq_proto_rawDescGZIP(), []int{10}
 }
 
-func (x *CharacterLogoutRequest) GetCharacterId() int32 {
+func (x *CharacterLiveInfoRequest) GetCharacterId() int32 {
 	if x != nil {
 		return x.CharacterId
 	}
 	return 0
 }
 
-type CharacterLogoutResponse struct {
+type CharacterLiveInfoResponse struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	Ok          bool  `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
-	CharacterId int32 `protobuf:"varint,2,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
+	Ok                bool                      `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
+	CharacterId       int32                     `protobuf:"varint,2,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
+	CharacterLiveInfo *CharacterLiveInfoMessage `protobuf:"bytes,3,opt,name=character_live_info,json=characterLiveInfo,proto3" json:"character_live_info,omitempty"`
 }
 
-func (x *CharacterLogoutResponse) Reset() {
-	*x = CharacterLogoutResponse{}
+func (x *CharacterLiveInfoResponse) Reset() {
+	*x = CharacterLiveInfoResponse{}
 	if protoimpl.UnsafeEnabled {
 		mi := &file_poq_proto_msgTypes[11]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -776,13 +906,13 @@ func (x *CharacterLogoutResponse) Reset() {
 	}
 }
 
-func (x *CharacterLogoutResponse) String() string {
+func (x *CharacterLiveInfoResponse) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*CharacterLogoutResponse) ProtoMessage() {}
+func (*CharacterLiveInfoResponse) ProtoMessage() {}
 
-func (x *CharacterLogoutResponse) ProtoReflect() protoreflect.Message {
+func (x *CharacterLiveInfoResponse) ProtoReflect() protoreflect.Message {
 	mi := &file_poq_proto_msgTypes[11]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -794,26 +924,33 @@ func (x *CharacterLogoutResponse) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use CharacterLogoutResponse.ProtoReflect.Descriptor instead.
-func (*CharacterLogoutResponse) Descriptor() ([]byte, []int) {
+// Deprecated: Use CharacterLiveInfoResponse.ProtoReflect.Descriptor instead.
+func (*CharacterLiveInfoResponse) Descriptor() ([]byte, []int) {
 	return file_poq_proto_rawDescGZIP(), []int{11}
 }
 
-func (x *CharacterLogoutResponse) GetOk() bool {
+func (x *CharacterLiveInfoResponse) GetOk() bool {
 	if x != nil {
 		return x.Ok
 	}
 	return false
 }
 
-func (x *CharacterLogoutResponse) GetCharacterId() int32 {
+func (x *CharacterLiveInfoResponse) GetCharacterId() int32 {
 	if x != nil {
 		return x.CharacterId
 	}
 	return 0
 }
 
-type CharacterTopicRequest struct {
+func (x *CharacterLiveInfoResponse) GetCharacterLiveInfo() *CharacterLiveInfoMessage {
+	if x != nil {
+		return x.CharacterLiveInfo
+	}
+	return nil
+}
+
+type CharacterLoginRequest struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
@@ -821,8 +958,8 @@ type CharacterTopicRequest struct {
 	CharacterId int32 `protobuf:"varint,1,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
 }
 
-func (x *CharacterTopicRequest) Reset() {
-	*x = CharacterTopicRequest{}
+func (x *CharacterLoginRequest) Reset() {
+	*x = CharacterLoginRequest{}
 	if protoimpl.UnsafeEnabled {
 		mi := &file_poq_proto_msgTypes[12]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -830,13 +967,13 @@ func (x *CharacterTopicRequest) Reset() {
 	}
 }
 
-func (x *CharacterTopicRequest) String() string {
+func (x *CharacterLoginRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*CharacterTopicRequest) ProtoMessage() {}
+func (*CharacterLoginRequest) ProtoMessage() {}
 
-func (x *CharacterTopicRequest) ProtoReflect() protoreflect.Message {
+func (x *CharacterLoginRequest) ProtoReflect() protoreflect.Message {
 	mi := &file_poq_proto_msgTypes[12]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -848,30 +985,30 @@ func (x *CharacterTopicRequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use CharacterTopicRequest.ProtoReflect.Descriptor instead.
-func (*CharacterTopicRequest) Descriptor() ([]byte, []int) {
+// Deprecated: Use CharacterLoginRequest.ProtoReflect.Descriptor instead.
+func (*CharacterLoginRequest) Descriptor() ([]byte, []int) {
 	return file_poq_proto_rawDescGZIP(), []int{12}
 }
 
-func (x *CharacterTopicRequest) GetCharacterId() int32 {
+func (x *CharacterLoginRequest) GetCharacterId() int32 {
 	if x != nil {
 		return x.CharacterId
 	}
 	return 0
 }
 
-type CharacterTopicResponse struct {
+type CharacterLoginResponse struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	Ok              bool          `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
-	CharacterId     int32         `protobuf:"varint,2,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
-	CharacterTopics *TopicMessage `protobuf:"bytes,3,opt,name=character_topics,json=characterTopics,proto3" json:"character_topics,omitempty"`
+	Ok                bool                      `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
+	CharacterId       int32                     `protobuf:"varint,2,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
+	CharacterLiveInfo *CharacterLiveInfoMessage `protobuf:"bytes,3,opt,name=character_live_info,json=characterLiveInfo,proto3" json:"character_live_info,omitempty"`
 }
 
-func (x *CharacterTopicResponse) Reset() {
-	*x = CharacterTopicResponse{}
+func (x *CharacterLoginResponse) Reset() {
+	*x = CharacterLoginResponse{}
 	if protoimpl.UnsafeEnabled {
 		mi := &file_poq_proto_msgTypes[13]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -879,13 +1016,13 @@ func (x *CharacterTopicResponse) Reset() {
 	}
 }
 
-func (x *CharacterTopicResponse) String() string {
+func (x *CharacterLoginResponse) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*CharacterTopicResponse) ProtoMessage() {}
+func (*CharacterLoginResponse) ProtoMessage() {}
 
-func (x *CharacterTopicResponse) ProtoReflect() protoreflect.Message {
+func (x *CharacterLoginResponse) ProtoReflect() protoreflect.Message {
 	mi := &file_poq_proto_msgTypes[13]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -897,44 +1034,42 @@ func (x *CharacterTopicResponse) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use CharacterTopicResponse.ProtoReflect.Descriptor instead.
-func (*CharacterTopicResponse) Descriptor() ([]byte, []int) {
+// Deprecated: Use CharacterLoginResponse.ProtoReflect.Descriptor instead.
+func (*CharacterLoginResponse) Descriptor() ([]byte, []int) {
 	return file_poq_proto_rawDescGZIP(), []int{13}
 }
 
-func (x *CharacterTopicResponse) GetOk() bool {
+func (x *CharacterLoginResponse) GetOk() bool {
 	if x != nil {
 		return x.Ok
 	}
 	return false
 }
 
-func (x *CharacterTopicResponse) GetCharacterId() int32 {
+func (x *CharacterLoginResponse) GetCharacterId() int32 {
 	if x != nil {
 		return x.CharacterId
 	}
 	return 0
 }
 
-func (x *CharacterTopicResponse) GetCharacterTopics() *TopicMessage {
+func (x *CharacterLoginResponse) GetCharacterLiveInfo() *CharacterLiveInfoMessage {
 	if x != nil {
-		return x.CharacterTopics
+		return x.CharacterLiveInfo
 	}
 	return nil
 }
 
-type ChatterMessage struct {
+type CharacterLogoutRequest struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	CharacterId int32  `protobuf:"varint,1,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
-	SystemId    int32  `protobuf:"varint,2,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
-	Text        string `protobuf:"bytes,3,opt,name=text,proto3" json:"text,omitempty"`
+	CharacterId int32 `protobuf:"varint,1,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
 }
 
-func (x *ChatterMessage) Reset() {
-	*x = ChatterMessage{}
+func (x *CharacterLogoutRequest) Reset() {
+	*x = CharacterLogoutRequest{}
 	if protoimpl.UnsafeEnabled {
 		mi := &file_poq_proto_msgTypes[14]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -942,13 +1077,13 @@ func (x *ChatterMessage) Reset() {
 	}
 }
 
-func (x *ChatterMessage) String() string {
+func (x *CharacterLogoutRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*ChatterMessage) ProtoMessage() {}
+func (*CharacterLogoutRequest) ProtoMessage() {}
 
-func (x *ChatterMessage) ProtoReflect() protoreflect.Message {
+func (x *CharacterLogoutRequest) ProtoReflect() protoreflect.Message {
 	mi := &file_poq_proto_msgTypes[14]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -960,42 +1095,29 @@ func (x *ChatterMessage) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use ChatterMessage.ProtoReflect.Descriptor instead.
-func (*ChatterMessage) Descriptor() ([]byte, []int) {
+// Deprecated: Use CharacterLogoutRequest.ProtoReflect.Descriptor instead.
+func (*CharacterLogoutRequest) Descriptor() ([]byte, []int) {
 	return file_poq_proto_rawDescGZIP(), []int{14}
 }
 
-func (x *ChatterMessage) GetCharacterId() int32 {
+func (x *CharacterLogoutRequest) GetCharacterId() int32 {
 	if x != nil {
 		return x.CharacterId
 	}
 	return 0
 }
 
-func (x *ChatterMessage) GetSystemId() int32 {
-	if x != nil {
-		return x.SystemId
-	}
-	return 0
-}
-
-func (x *ChatterMessage) GetText() string {
-	if x != nil {
-		return x.Text
-	}
-	return ""
-}
-
-type ChatterTopicRequest struct {
+type CharacterLogoutResponse struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	SystemId int32 `protobuf:"varint,1,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
+	Ok          bool  `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
+	CharacterId int32 `protobuf:"varint,2,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
 }
 
-func (x *ChatterTopicRequest) Reset() {
-	*x = ChatterTopicRequest{}
+func (x *CharacterLogoutResponse) Reset() {
+	*x = CharacterLogoutResponse{}
 	if protoimpl.UnsafeEnabled {
 		mi := &file_poq_proto_msgTypes[15]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -1003,13 +1125,13 @@ func (x *ChatterTopicRequest) Reset() {
 	}
 }
 
-func (x *ChatterTopicRequest) String() string {
+func (x *CharacterLogoutResponse) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*ChatterTopicRequest) ProtoMessage() {}
+func (*CharacterLogoutResponse) ProtoMessage() {}
 
-func (x *ChatterTopicRequest) ProtoReflect() protoreflect.Message {
+func (x *CharacterLogoutResponse) ProtoReflect() protoreflect.Message {
 	mi := &file_poq_proto_msgTypes[15]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -1021,30 +1143,35 @@ func (x *ChatterTopicRequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use ChatterTopicRequest.ProtoReflect.Descriptor instead.
-func (*ChatterTopicRequest) Descriptor() ([]byte, []int) {
+// Deprecated: Use CharacterLogoutResponse.ProtoReflect.Descriptor instead.
+func (*CharacterLogoutResponse) Descriptor() ([]byte, []int) {
 	return file_poq_proto_rawDescGZIP(), []int{15}
 }
 
-func (x *ChatterTopicRequest) GetSystemId() int32 {
+func (x *CharacterLogoutResponse) GetOk() bool {
 	if x != nil {
-		return x.SystemId
+		return x.Ok
+	}
+	return false
+}
+
+func (x *CharacterLogoutResponse) GetCharacterId() int32 {
+	if x != nil {
+		return x.CharacterId
 	}
 	return 0
 }
 
-type ChatterTopicResponse struct {
+type CharacterBulkLogoutRequest struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	Ok            bool          `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
-	SystemId      int32         `protobuf:"varint,2,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
-	ChatterTopics *TopicMessage `protobuf:"bytes,3,opt,name=chatter_topics,json=chatterTopics,proto3" json:"chatter_topics,omitempty"`
+	CharacterId []int32 `protobuf:"varint,1,rep,packed,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
 }
 
-func (x *ChatterTopicResponse) Reset() {
-	*x = ChatterTopicResponse{}
+func (x *CharacterBulkLogoutRequest) Reset() {
+	*x = CharacterBulkLogoutRequest{}
 	if protoimpl.UnsafeEnabled {
 		mi := &file_poq_proto_msgTypes[16]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -1052,13 +1179,13 @@ func (x *ChatterTopicResponse) Reset() {
 	}
 }
 
-func (x *ChatterTopicResponse) String() string {
+func (x *CharacterBulkLogoutRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*ChatterTopicResponse) ProtoMessage() {}
+func (*CharacterBulkLogoutRequest) ProtoMessage() {}
 
-func (x *ChatterTopicResponse) ProtoReflect() protoreflect.Message {
+func (x *CharacterBulkLogoutRequest) ProtoReflect() protoreflect.Message {
 	mi := &file_poq_proto_msgTypes[16]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -1070,44 +1197,29 @@ func (x *ChatterTopicResponse) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use ChatterTopicResponse.ProtoReflect.Descriptor instead.
-func (*ChatterTopicResponse) Descriptor() ([]byte, []int) {
+// Deprecated: Use CharacterBulkLogoutRequest.ProtoReflect.Descriptor instead.
+func (*CharacterBulkLogoutRequest) Descriptor() ([]byte, []int) {
 	return file_poq_proto_rawDescGZIP(), []int{16}
 }
 
-func (x *ChatterTopicResponse) GetOk() bool {
-	if x != nil {
-		return x.Ok
-	}
-	return false
-}
-
-func (x *ChatterTopicResponse) GetSystemId() int32 {
-	if x != nil {
-		return x.SystemId
-	}
-	return 0
-}
-
-func (x *ChatterTopicResponse) GetChatterTopics() *TopicMessage {
+func (x *CharacterBulkLogoutRequest) GetCharacterId() []int32 {
 	if x != nil {
-		return x.ChatterTopics
+		return x.CharacterId
 	}
 	return nil
 }
 
-type SystemStaticInfoMessage struct {
+type CharacterBulkLogoutResponse struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	SystemId   int32   `protobuf:"varint,1,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
-	Name       string  `protobuf:"bytes,2,opt,name=name,proto3" json:"name,omitempty"`
-	Neighbours []int32 `protobuf:"varint,3,rep,packed,name=neighbours,proto3" json:"neighbours,omitempty"`
+	Ok          bool    `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
+	CharacterId []int32 `protobuf:"varint,2,rep,packed,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
 }
 
-func (x *SystemStaticInfoMessage) Reset() {
-	*x = SystemStaticInfoMessage{}
+func (x *CharacterBulkLogoutResponse) Reset() {
+	*x = CharacterBulkLogoutResponse{}
 	if protoimpl.UnsafeEnabled {
 		mi := &file_poq_proto_msgTypes[17]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -1115,13 +1227,13 @@ func (x *SystemStaticInfoMessage) Reset() {
 	}
 }
 
-func (x *SystemStaticInfoMessage) String() string {
+func (x *CharacterBulkLogoutResponse) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*SystemStaticInfoMessage) ProtoMessage() {}
+func (*CharacterBulkLogoutResponse) ProtoMessage() {}
 
-func (x *SystemStaticInfoMessage) ProtoReflect() protoreflect.Message {
+func (x *CharacterBulkLogoutResponse) ProtoReflect() protoreflect.Message {
 	mi := &file_poq_proto_msgTypes[17]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -1133,40 +1245,35 @@ func (x *SystemStaticInfoMessage) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use SystemStaticInfoMessage.ProtoReflect.Descriptor instead.
-func (*SystemStaticInfoMessage) Descriptor() ([]byte, []int) {
+// Deprecated: Use CharacterBulkLogoutResponse.ProtoReflect.Descriptor instead.
+func (*CharacterBulkLogoutResponse) Descriptor() ([]byte, []int) {
 	return file_poq_proto_rawDescGZIP(), []int{17}
 }
 
-func (x *SystemStaticInfoMessage) GetSystemId() int32 {
-	if x != nil {
-		return x.SystemId
-	}
-	return 0
-}
-
-func (x *SystemStaticInfoMessage) GetName() string {
+func (x *CharacterBulkLogoutResponse) GetOk() bool {
 	if x != nil {
-		return x.Name
+		return x.Ok
 	}
-	return ""
+	return false
 }
 
-func (x *SystemStaticInfoMessage) GetNeighbours() []int32 {
+func (x *CharacterBulkLogoutResponse) GetCharacterId() []int32 {
 	if x != nil {
-		return x.Neighbours
+		return x.CharacterId
 	}
 	return nil
 }
 
-type Universe struct {
+type CharacterTopicRequest struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
+
+	CharacterId int32 `protobuf:"varint,1,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
 }
 
-func (x *Universe) Reset() {
-	*x = Universe{}
+func (x *CharacterTopicRequest) Reset() {
+	*x = CharacterTopicRequest{}
 	if protoimpl.UnsafeEnabled {
 		mi := &file_poq_proto_msgTypes[18]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -1174,13 +1281,13 @@ func (x *Universe) Reset() {
 	}
 }
 
-func (x *Universe) String() string {
+func (x *CharacterTopicRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*Universe) ProtoMessage() {}
+func (*CharacterTopicRequest) ProtoMessage() {}
 
-func (x *Universe) ProtoReflect() protoreflect.Message {
+func (x *CharacterTopicRequest) ProtoReflect() protoreflect.Message {
 	mi := &file_poq_proto_msgTypes[18]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -1192,19 +1299,30 @@ func (x *Universe) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use Universe.ProtoReflect.Descriptor instead.
-func (*Universe) Descriptor() ([]byte, []int) {
+// Deprecated: Use CharacterTopicRequest.ProtoReflect.Descriptor instead.
+func (*CharacterTopicRequest) Descriptor() ([]byte, []int) {
 	return file_poq_proto_rawDescGZIP(), []int{18}
 }
 
-type UniverseRequest struct {
+func (x *CharacterTopicRequest) GetCharacterId() int32 {
+	if x != nil {
+		return x.CharacterId
+	}
+	return 0
+}
+
+type CharacterTopicResponse struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
+
+	Ok              bool          `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
+	CharacterId     int32         `protobuf:"varint,2,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
+	CharacterTopics *TopicMessage `protobuf:"bytes,3,opt,name=character_topics,json=characterTopics,proto3" json:"character_topics,omitempty"`
 }
 
-func (x *UniverseRequest) Reset() {
-	*x = UniverseRequest{}
+func (x *CharacterTopicResponse) Reset() {
+	*x = CharacterTopicResponse{}
 	if protoimpl.UnsafeEnabled {
 		mi := &file_poq_proto_msgTypes[19]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -1212,13 +1330,13 @@ func (x *UniverseRequest) Reset() {
 	}
 }
 
-func (x *UniverseRequest) String() string {
+func (x *CharacterTopicResponse) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*UniverseRequest) ProtoMessage() {}
+func (*CharacterTopicResponse) ProtoMessage() {}
 
-func (x *UniverseRequest) ProtoReflect() protoreflect.Message {
+func (x *CharacterTopicResponse) ProtoReflect() protoreflect.Message {
 	mi := &file_poq_proto_msgTypes[19]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -1230,22 +1348,43 @@ func (x *UniverseRequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use UniverseRequest.ProtoReflect.Descriptor instead.
-func (*UniverseRequest) Descriptor() ([]byte, []int) {
+// Deprecated: Use CharacterTopicResponse.ProtoReflect.Descriptor instead.
+func (*CharacterTopicResponse) Descriptor() ([]byte, []int) {
 	return file_poq_proto_rawDescGZIP(), []int{19}
 }
 
-type UniverseResponse struct {
+func (x *CharacterTopicResponse) GetOk() bool {
+	if x != nil {
+		return x.Ok
+	}
+	return false
+}
+
+func (x *CharacterTopicResponse) GetCharacterId() int32 {
+	if x != nil {
+		return x.CharacterId
+	}
+	return 0
+}
+
+func (x *CharacterTopicResponse) GetCharacterTopics() *TopicMessage {
+	if x != nil {
+		return x.CharacterTopics
+	}
+	return nil
+}
+
+type CharacterMoveRequest struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	Ok      bool                       `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
-	Systems []*SystemStaticInfoMessage `protobuf:"bytes,2,rep,name=systems,proto3" json:"systems,omitempty"`
+	CharacterId int32 `protobuf:"varint,1,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
+	SystemId    int32 `protobuf:"varint,2,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
 }
 
-func (x *UniverseResponse) Reset() {
-	*x = UniverseResponse{}
+func (x *CharacterMoveRequest) Reset() {
+	*x = CharacterMoveRequest{}
 	if protoimpl.UnsafeEnabled {
 		mi := &file_poq_proto_msgTypes[20]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -1253,13 +1392,13 @@ func (x *UniverseResponse) Reset() {
 	}
 }
 
-func (x *UniverseResponse) String() string {
+func (x *CharacterMoveRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*UniverseResponse) ProtoMessage() {}
+func (*CharacterMoveRequest) ProtoMessage() {}
 
-func (x *UniverseResponse) ProtoReflect() protoreflect.Message {
+func (x *CharacterMoveRequest) ProtoReflect() protoreflect.Message {
 	mi := &file_poq_proto_msgTypes[20]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -1271,50 +1410,1333 @@ func (x *UniverseResponse) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use UniverseResponse.ProtoReflect.Descriptor instead.
-func (*UniverseResponse) Descriptor() ([]byte, []int) {
+// Deprecated: Use CharacterMoveRequest.ProtoReflect.Descriptor instead.
+func (*CharacterMoveRequest) Descriptor() ([]byte, []int) {
 	return file_poq_proto_rawDescGZIP(), []int{20}
 }
 
-func (x *UniverseResponse) GetOk() bool {
+func (x *CharacterMoveRequest) GetCharacterId() int32 {
+	if x != nil {
+		return x.CharacterId
+	}
+	return 0
+}
+
+func (x *CharacterMoveRequest) GetSystemId() int32 {
+	if x != nil {
+		return x.SystemId
+	}
+	return 0
+}
+
+type CharacterMoveResponse struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	Ok                bool                      `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
+	CharacterId       int32                     `protobuf:"varint,2,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
+	CharacterLiveInfo *CharacterLiveInfoMessage `protobuf:"bytes,3,opt,name=character_live_info,json=characterLiveInfo,proto3" json:"character_live_info,omitempty"`
+}
+
+func (x *CharacterMoveResponse) Reset() {
+	*x = CharacterMoveResponse{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_poq_proto_msgTypes[21]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *CharacterMoveResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*CharacterMoveResponse) ProtoMessage() {}
+
+func (x *CharacterMoveResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[21]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use CharacterMoveResponse.ProtoReflect.Descriptor instead.
+func (*CharacterMoveResponse) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{21}
+}
+
+func (x *CharacterMoveResponse) GetOk() bool {
 	if x != nil {
 		return x.Ok
 	}
 	return false
 }
 
-func (x *UniverseResponse) GetSystems() []*SystemStaticInfoMessage {
+func (x *CharacterMoveResponse) GetCharacterId() int32 {
 	if x != nil {
-		return x.Systems
+		return x.CharacterId
+	}
+	return 0
+}
+
+func (x *CharacterMoveResponse) GetCharacterLiveInfo() *CharacterLiveInfoMessage {
+	if x != nil {
+		return x.CharacterLiveInfo
+	}
+	return nil
+}
+
+type CharacterPresenceRequest struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	AfterCharacterId int32 `protobuf:"varint,1,opt,name=after_character_id,json=afterCharacterId,proto3" json:"after_character_id,omitempty"`
+	Limit            int32 `protobuf:"varint,2,opt,name=limit,proto3" json:"limit,omitempty"`
+}
+
+func (x *CharacterPresenceRequest) Reset() {
+	*x = CharacterPresenceRequest{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_poq_proto_msgTypes[22]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *CharacterPresenceRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*CharacterPresenceRequest) ProtoMessage() {}
+
+func (x *CharacterPresenceRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[22]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use CharacterPresenceRequest.ProtoReflect.Descriptor instead.
+func (*CharacterPresenceRequest) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{22}
+}
+
+func (x *CharacterPresenceRequest) GetAfterCharacterId() int32 {
+	if x != nil {
+		return x.AfterCharacterId
+	}
+	return 0
+}
+
+func (x *CharacterPresenceRequest) GetLimit() int32 {
+	if x != nil {
+		return x.Limit
+	}
+	return 0
+}
+
+type CharacterPresenceResponse struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	Ok                bool                        `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
+	CharacterLiveInfo []*CharacterLiveInfoMessage `protobuf:"bytes,2,rep,name=character_live_info,json=characterLiveInfo,proto3" json:"character_live_info,omitempty"`
+	More              bool                        `protobuf:"varint,3,opt,name=more,proto3" json:"more,omitempty"`
+}
+
+func (x *CharacterPresenceResponse) Reset() {
+	*x = CharacterPresenceResponse{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_poq_proto_msgTypes[23]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *CharacterPresenceResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*CharacterPresenceResponse) ProtoMessage() {}
+
+func (x *CharacterPresenceResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[23]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use CharacterPresenceResponse.ProtoReflect.Descriptor instead.
+func (*CharacterPresenceResponse) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{23}
+}
+
+func (x *CharacterPresenceResponse) GetOk() bool {
+	if x != nil {
+		return x.Ok
+	}
+	return false
+}
+
+func (x *CharacterPresenceResponse) GetCharacterLiveInfo() []*CharacterLiveInfoMessage {
+	if x != nil {
+		return x.CharacterLiveInfo
+	}
+	return nil
+}
+
+func (x *CharacterPresenceResponse) GetMore() bool {
+	if x != nil {
+		return x.More
+	}
+	return false
+}
+
+type ChatterMessage struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	CharacterId int32  `protobuf:"varint,1,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
+	SystemId    int32  `protobuf:"varint,2,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
+	Text        string `protobuf:"bytes,3,opt,name=text,proto3" json:"text,omitempty"`
+}
+
+func (x *ChatterMessage) Reset() {
+	*x = ChatterMessage{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_poq_proto_msgTypes[24]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *ChatterMessage) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*ChatterMessage) ProtoMessage() {}
+
+func (x *ChatterMessage) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[24]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use ChatterMessage.ProtoReflect.Descriptor instead.
+func (*ChatterMessage) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{24}
+}
+
+func (x *ChatterMessage) GetCharacterId() int32 {
+	if x != nil {
+		return x.CharacterId
+	}
+	return 0
+}
+
+func (x *ChatterMessage) GetSystemId() int32 {
+	if x != nil {
+		return x.SystemId
+	}
+	return 0
+}
+
+func (x *ChatterMessage) GetText() string {
+	if x != nil {
+		return x.Text
+	}
+	return ""
+}
+
+type ChatterTopicRequest struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	SystemId int32 `protobuf:"varint,1,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
+}
+
+func (x *ChatterTopicRequest) Reset() {
+	*x = ChatterTopicRequest{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_poq_proto_msgTypes[25]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *ChatterTopicRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*ChatterTopicRequest) ProtoMessage() {}
+
+func (x *ChatterTopicRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[25]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use ChatterTopicRequest.ProtoReflect.Descriptor instead.
+func (*ChatterTopicRequest) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{25}
+}
+
+func (x *ChatterTopicRequest) GetSystemId() int32 {
+	if x != nil {
+		return x.SystemId
+	}
+	return 0
+}
+
+type ChatterTopicResponse struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	Ok            bool          `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
+	SystemId      int32         `protobuf:"varint,2,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
+	ChatterTopics *TopicMessage `protobuf:"bytes,3,opt,name=chatter_topics,json=chatterTopics,proto3" json:"chatter_topics,omitempty"`
+}
+
+func (x *ChatterTopicResponse) Reset() {
+	*x = ChatterTopicResponse{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_poq_proto_msgTypes[26]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *ChatterTopicResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*ChatterTopicResponse) ProtoMessage() {}
+
+func (x *ChatterTopicResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[26]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use ChatterTopicResponse.ProtoReflect.Descriptor instead.
+func (*ChatterTopicResponse) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{26}
+}
+
+func (x *ChatterTopicResponse) GetOk() bool {
+	if x != nil {
+		return x.Ok
+	}
+	return false
+}
+
+func (x *ChatterTopicResponse) GetSystemId() int32 {
+	if x != nil {
+		return x.SystemId
+	}
+	return 0
+}
+
+func (x *ChatterTopicResponse) GetChatterTopics() *TopicMessage {
+	if x != nil {
+		return x.ChatterTopics
+	}
+	return nil
+}
+
+type SystemStaticInfoMessage struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	SystemId   int32   `protobuf:"varint,1,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
+	Name       string  `protobuf:"bytes,2,opt,name=name,proto3" json:"name,omitempty"`
+	Neighbours []int32 `protobuf:"varint,3,rep,packed,name=neighbours,proto3" json:"neighbours,omitempty"`
+}
+
+func (x *SystemStaticInfoMessage) Reset() {
+	*x = SystemStaticInfoMessage{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_poq_proto_msgTypes[27]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *SystemStaticInfoMessage) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SystemStaticInfoMessage) ProtoMessage() {}
+
+func (x *SystemStaticInfoMessage) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[27]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SystemStaticInfoMessage.ProtoReflect.Descriptor instead.
+func (*SystemStaticInfoMessage) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{27}
+}
+
+func (x *SystemStaticInfoMessage) GetSystemId() int32 {
+	if x != nil {
+		return x.SystemId
+	}
+	return 0
+}
+
+func (x *SystemStaticInfoMessage) GetName() string {
+	if x != nil {
+		return x.Name
+	}
+	return ""
+}
+
+func (x *SystemStaticInfoMessage) GetNeighbours() []int32 {
+	if x != nil {
+		return x.Neighbours
+	}
+	return nil
+}
+
+type Universe struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+}
+
+func (x *Universe) Reset() {
+	*x = Universe{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_poq_proto_msgTypes[28]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *Universe) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*Universe) ProtoMessage() {}
+
+func (x *Universe) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[28]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use Universe.ProtoReflect.Descriptor instead.
+func (*Universe) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{28}
+}
+
+type UniverseRequest struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	Version string `protobuf:"bytes,1,opt,name=version,proto3" json:"version,omitempty"`
+	// Scoped - the systems within jumps of system_id and / or the listed system_ids.
+	SystemId  int32   `protobuf:"varint,2,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
+	Jumps     int32   `protobuf:"varint,3,opt,name=jumps,proto3" json:"jumps,omitempty"`
+	SystemIds []int32 `protobuf:"varint,4,rep,packed,name=system_ids,json=systemIds,proto3" json:"system_ids,omitempty"`
+}
+
+func (x *UniverseRequest) Reset() {
+	*x = UniverseRequest{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_poq_proto_msgTypes[29]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *UniverseRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*UniverseRequest) ProtoMessage() {}
+
+func (x *UniverseRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[29]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use UniverseRequest.ProtoReflect.Descriptor instead.
+func (*UniverseRequest) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{29}
+}
+
+func (x *UniverseRequest) GetVersion() string {
+	if x != nil {
+		return x.Version
+	}
+	return ""
+}
+
+func (x *UniverseRequest) GetSystemId() int32 {
+	if x != nil {
+		return x.SystemId
+	}
+	return 0
+}
+
+func (x *UniverseRequest) GetJumps() int32 {
+	if x != nil {
+		return x.Jumps
+	}
+	return 0
+}
+
+func (x *UniverseRequest) GetSystemIds() []int32 {
+	if x != nil {
+		return x.SystemIds
+	}
+	return nil
+}
+
+type UniverseResponse struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	Ok      bool                       `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
+	Systems []*SystemStaticInfoMessage `protobuf:"bytes,2,rep,name=systems,proto3" json:"systems,omitempty"`
+	Version string                     `protobuf:"bytes,3,opt,name=version,proto3" json:"version,omitempty"`
+}
+
+func (x *UniverseResponse) Reset() {
+	*x = UniverseResponse{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_poq_proto_msgTypes[30]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *UniverseResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*UniverseResponse) ProtoMessage() {}
+
+func (x *UniverseResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[30]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use UniverseResponse.ProtoReflect.Descriptor instead.
+func (*UniverseResponse) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{30}
+}
+
+func (x *UniverseResponse) GetOk() bool {
+	if x != nil {
+		return x.Ok
+	}
+	return false
+}
+
+func (x *UniverseResponse) GetSystems() []*SystemStaticInfoMessage {
+	if x != nil {
+		return x.Systems
+	}
+	return nil
+}
+
+func (x *UniverseResponse) GetVersion() string {
+	if x != nil {
+		return x.Version
+	}
+	return ""
+}
+
+type SystemStaticInfoRequest struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	SystemId int32 `protobuf:"varint,1,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
+}
+
+func (x *SystemStaticInfoRequest) Reset() {
+	*x = SystemStaticInfoRequest{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_poq_proto_msgTypes[31]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *SystemStaticInfoRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SystemStaticInfoRequest) ProtoMessage() {}
+
+func (x *SystemStaticInfoRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[31]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SystemStaticInfoRequest.ProtoReflect.Descriptor instead.
+func (*SystemStaticInfoRequest) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{31}
+}
+
+func (x *SystemStaticInfoRequest) GetSystemId() int32 {
+	if x != nil {
+		return x.SystemId
+	}
+	return 0
+}
+
+type SystemStaticInfoResponse struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	Ok               bool                     `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
+	SystemId         int32                    `protobuf:"varint,2,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
+	SystemStaticInfo *SystemStaticInfoMessage `protobuf:"bytes,3,opt,name=system_static_info,json=systemStaticInfo,proto3" json:"system_static_info,omitempty"`
+}
+
+func (x *SystemStaticInfoResponse) Reset() {
+	*x = SystemStaticInfoResponse{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_poq_proto_msgTypes[32]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *SystemStaticInfoResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SystemStaticInfoResponse) ProtoMessage() {}
+
+func (x *SystemStaticInfoResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[32]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SystemStaticInfoResponse.ProtoReflect.Descriptor instead.
+func (*SystemStaticInfoResponse) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{32}
+}
+
+func (x *SystemStaticInfoResponse) GetOk() bool {
+	if x != nil {
+		return x.Ok
+	}
+	return false
+}
+
+func (x *SystemStaticInfoResponse) GetSystemId() int32 {
+	if x != nil {
+		return x.SystemId
+	}
+	return 0
+}
+
+func (x *SystemStaticInfoResponse) GetSystemStaticInfo() *SystemStaticInfoMessage {
+	if x != nil {
+		return x.SystemStaticInfo
+	}
+	return nil
+}
+
+type SystemLiveInfoMessage struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	SystemId    int32   `protobuf:"varint,1,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
+	CharacterId []int32 `protobuf:"varint,2,rep,packed,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
+}
+
+func (x *SystemLiveInfoMessage) Reset() {
+	*x = SystemLiveInfoMessage{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_poq_proto_msgTypes[33]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *SystemLiveInfoMessage) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SystemLiveInfoMessage) ProtoMessage() {}
+
+func (x *SystemLiveInfoMessage) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[33]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SystemLiveInfoMessage.ProtoReflect.Descriptor instead.
+func (*SystemLiveInfoMessage) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{33}
+}
+
+func (x *SystemLiveInfoMessage) GetSystemId() int32 {
+	if x != nil {
+		return x.SystemId
+	}
+	return 0
+}
+
+func (x *SystemLiveInfoMessage) GetCharacterId() []int32 {
+	if x != nil {
+		return x.CharacterId
+	}
+	return nil
+}
+
+type SystemLiveInfoRequest struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	SystemId int32 `protobuf:"varint,1,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
+}
+
+func (x *SystemLiveInfoRequest) Reset() {
+	*x = SystemLiveInfoRequest{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_poq_proto_msgTypes[34]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *SystemLiveInfoRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SystemLiveInfoRequest) ProtoMessage() {}
+
+func (x *SystemLiveInfoRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[34]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SystemLiveInfoRequest.ProtoReflect.Descriptor instead.
+func (*SystemLiveInfoRequest) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{34}
+}
+
+func (x *SystemLiveInfoRequest) GetSystemId() int32 {
+	if x != nil {
+		return x.SystemId
+	}
+	return 0
+}
+
+type SystemLiveInfoResponse struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	Ok                bool                        `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
+	SystemId          int32                       `protobuf:"varint,2,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
+	SystemLiveInfo    *SystemLiveInfoMessage      `protobuf:"bytes,3,opt,name=system_live_info,json=systemLiveInfo,proto3" json:"system_live_info,omitempty"`
+	CharacterLiveInfo []*CharacterLiveInfoMessage `protobuf:"bytes,4,rep,name=character_live_info,json=characterLiveInfo,proto3" json:"character_live_info,omitempty"`
+}
+
+func (x *SystemLiveInfoResponse) Reset() {
+	*x = SystemLiveInfoResponse{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_poq_proto_msgTypes[35]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *SystemLiveInfoResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SystemLiveInfoResponse) ProtoMessage() {}
+
+func (x *SystemLiveInfoResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[35]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SystemLiveInfoResponse.ProtoReflect.Descriptor instead.
+func (*SystemLiveInfoResponse) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{35}
+}
+
+func (x *SystemLiveInfoResponse) GetOk() bool {
+	if x != nil {
+		return x.Ok
+	}
+	return false
+}
+
+func (x *SystemLiveInfoResponse) GetSystemId() int32 {
+	if x != nil {
+		return x.SystemId
+	}
+	return 0
+}
+
+func (x *SystemLiveInfoResponse) GetSystemLiveInfo() *SystemLiveInfoMessage {
+	if x != nil {
+		return x.SystemLiveInfo
+	}
+	return nil
+}
+
+func (x *SystemLiveInfoResponse) GetCharacterLiveInfo() []*CharacterLiveInfoMessage {
+	if x != nil {
+		return x.CharacterLiveInfo
+	}
+	return nil
+}
+
+type SystemCharacterFeedMessage struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	SystemId          int32                       `protobuf:"varint,1,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
+	CharacterLiveInfo []*CharacterLiveInfoMessage `protobuf:"bytes,2,rep,name=character_live_info,json=characterLiveInfo,proto3" json:"character_live_info,omitempty"`
+}
+
+func (x *SystemCharacterFeedMessage) Reset() {
+	*x = SystemCharacterFeedMessage{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_poq_proto_msgTypes[36]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *SystemCharacterFeedMessage) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SystemCharacterFeedMessage) ProtoMessage() {}
+
+func (x *SystemCharacterFeedMessage) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[36]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SystemCharacterFeedMessage.ProtoReflect.Descriptor instead.
+func (*SystemCharacterFeedMessage) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{36}
+}
+
+func (x *SystemCharacterFeedMessage) GetSystemId() int32 {
+	if x != nil {
+		return x.SystemId
+	}
+	return 0
+}
+
+func (x *SystemCharacterFeedMessage) GetCharacterLiveInfo() []*CharacterLiveInfoMessage {
+	if x != nil {
+		return x.CharacterLiveInfo
+	}
+	return nil
+}
+
+type SystemSetLiveCharacterRequest struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	CharacterId int32 `protobuf:"varint,1,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
+	SystemId    int32 `protobuf:"varint,2,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
+	Present     bool  `protobuf:"varint,3,opt,name=present,proto3" json:"present,omitempty"`
+}
+
+func (x *SystemSetLiveCharacterRequest) Reset() {
+	*x = SystemSetLiveCharacterRequest{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_poq_proto_msgTypes[37]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *SystemSetLiveCharacterRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SystemSetLiveCharacterRequest) ProtoMessage() {}
+
+func (x *SystemSetLiveCharacterRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[37]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SystemSetLiveCharacterRequest.ProtoReflect.Descriptor instead.
+func (*SystemSetLiveCharacterRequest) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{37}
+}
+
+func (x *SystemSetLiveCharacterRequest) GetCharacterId() int32 {
+	if x != nil {
+		return x.CharacterId
+	}
+	return 0
+}
+
+func (x *SystemSetLiveCharacterRequest) GetSystemId() int32 {
+	if x != nil {
+		return x.SystemId
+	}
+	return 0
+}
+
+func (x *SystemSetLiveCharacterRequest) GetPresent() bool {
+	if x != nil {
+		return x.Present
+	}
+	return false
+}
+
+type SystemSetLiveCharacterResponse struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	Ok          bool  `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
+	CharacterId int32 `protobuf:"varint,2,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
+	SystemId    int32 `protobuf:"varint,3,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
+}
+
+func (x *SystemSetLiveCharacterResponse) Reset() {
+	*x = SystemSetLiveCharacterResponse{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_poq_proto_msgTypes[38]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *SystemSetLiveCharacterResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SystemSetLiveCharacterResponse) ProtoMessage() {}
+
+func (x *SystemSetLiveCharacterResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[38]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SystemSetLiveCharacterResponse.ProtoReflect.Descriptor instead.
+func (*SystemSetLiveCharacterResponse) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{38}
+}
+
+func (x *SystemSetLiveCharacterResponse) GetOk() bool {
+	if x != nil {
+		return x.Ok
+	}
+	return false
+}
+
+func (x *SystemSetLiveCharacterResponse) GetCharacterId() int32 {
+	if x != nil {
+		return x.CharacterId
+	}
+	return 0
+}
+
+func (x *SystemSetLiveCharacterResponse) GetSystemId() int32 {
+	if x != nil {
+		return x.SystemId
+	}
+	return 0
+}
+
+type SystemBulkSetLiveCharacterRequest struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	Presence []*SystemSetLiveCharacterRequest `protobuf:"bytes,1,rep,name=presence,proto3" json:"presence,omitempty"`
+}
+
+func (x *SystemBulkSetLiveCharacterRequest) Reset() {
+	*x = SystemBulkSetLiveCharacterRequest{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_poq_proto_msgTypes[39]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *SystemBulkSetLiveCharacterRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SystemBulkSetLiveCharacterRequest) ProtoMessage() {}
+
+func (x *SystemBulkSetLiveCharacterRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[39]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SystemBulkSetLiveCharacterRequest.ProtoReflect.Descriptor instead.
+func (*SystemBulkSetLiveCharacterRequest) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{39}
+}
+
+func (x *SystemBulkSetLiveCharacterRequest) GetPresence() []*SystemSetLiveCharacterRequest {
+	if x != nil {
+		return x.Presence
+	}
+	return nil
+}
+
+type SystemMoveRequest struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	CharacterId  int32 `protobuf:"varint,1,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
+	FromSystemId int32 `protobuf:"varint,2,opt,name=from_system_id,json=fromSystemId,proto3" json:"from_system_id,omitempty"`
+	ToSystemId   int32 `protobuf:"varint,3,opt,name=to_system_id,json=toSystemId,proto3" json:"to_system_id,omitempty"`
+}
+
+func (x *SystemMoveRequest) Reset() {
+	*x = SystemMoveRequest{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_poq_proto_msgTypes[40]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *SystemMoveRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SystemMoveRequest) ProtoMessage() {}
+
+func (x *SystemMoveRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[40]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SystemMoveRequest.ProtoReflect.Descriptor instead.
+func (*SystemMoveRequest) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{40}
+}
+
+func (x *SystemMoveRequest) GetCharacterId() int32 {
+	if x != nil {
+		return x.CharacterId
+	}
+	return 0
+}
+
+func (x *SystemMoveRequest) GetFromSystemId() int32 {
+	if x != nil {
+		return x.FromSystemId
+	}
+	return 0
+}
+
+func (x *SystemMoveRequest) GetToSystemId() int32 {
+	if x != nil {
+		return x.ToSystemId
+	}
+	return 0
+}
+
+type SystemMoveResponse struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	Ok          bool  `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
+	CharacterId int32 `protobuf:"varint,2,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
+	SystemId    int32 `protobuf:"varint,3,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
+}
+
+func (x *SystemMoveResponse) Reset() {
+	*x = SystemMoveResponse{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_poq_proto_msgTypes[41]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *SystemMoveResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SystemMoveResponse) ProtoMessage() {}
+
+func (x *SystemMoveResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[41]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SystemMoveResponse.ProtoReflect.Descriptor instead.
+func (*SystemMoveResponse) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{41}
+}
+
+func (x *SystemMoveResponse) GetOk() bool {
+	if x != nil {
+		return x.Ok
+	}
+	return false
+}
+
+func (x *SystemMoveResponse) GetCharacterId() int32 {
+	if x != nil {
+		return x.CharacterId
+	}
+	return 0
+}
+
+func (x *SystemMoveResponse) GetSystemId() int32 {
+	if x != nil {
+		return x.SystemId
+	}
+	return 0
+}
+
+type SystemPopulationMessage struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	SystemId   int32 `protobuf:"varint,1,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
+	Population int32 `protobuf:"varint,2,opt,name=population,proto3" json:"population,omitempty"`
+}
+
+func (x *SystemPopulationMessage) Reset() {
+	*x = SystemPopulationMessage{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_poq_proto_msgTypes[42]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *SystemPopulationMessage) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SystemPopulationMessage) ProtoMessage() {}
+
+func (x *SystemPopulationMessage) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[42]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SystemPopulationMessage.ProtoReflect.Descriptor instead.
+func (*SystemPopulationMessage) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{42}
+}
+
+func (x *SystemPopulationMessage) GetSystemId() int32 {
+	if x != nil {
+		return x.SystemId
+	}
+	return 0
+}
+
+func (x *SystemPopulationMessage) GetPopulation() int32 {
+	if x != nil {
+		return x.Population
 	}
-	return nil
+	return 0
 }
 
-type SystemStaticInfoRequest struct {
+type SystemWhereIsRequest struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	SystemId int32 `protobuf:"varint,1,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
+	CharacterId []int32 `protobuf:"varint,1,rep,packed,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
+	Population  bool    `protobuf:"varint,2,opt,name=population,proto3" json:"population,omitempty"`
 }
 
-func (x *SystemStaticInfoRequest) Reset() {
-	*x = SystemStaticInfoRequest{}
+func (x *SystemWhereIsRequest) Reset() {
+	*x = SystemWhereIsRequest{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_poq_proto_msgTypes[21]
+		mi := &file_poq_proto_msgTypes[43]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
 }
 
-func (x *SystemStaticInfoRequest) String() string {
+func (x *SystemWhereIsRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*SystemStaticInfoRequest) ProtoMessage() {}
+func (*SystemWhereIsRequest) ProtoMessage() {}
 
-func (x *SystemStaticInfoRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_poq_proto_msgTypes[21]
+func (x *SystemWhereIsRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[43]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1325,45 +2747,52 @@ func (x *SystemStaticInfoRequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use SystemStaticInfoRequest.ProtoReflect.Descriptor instead.
-func (*SystemStaticInfoRequest) Descriptor() ([]byte, []int) {
-	return file_poq_proto_rawDescGZIP(), []int{21}
+// Deprecated: Use SystemWhereIsRequest.ProtoReflect.Descriptor instead.
+func (*SystemWhereIsRequest) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{43}
 }
 
-func (x *SystemStaticInfoRequest) GetSystemId() int32 {
+func (x *SystemWhereIsRequest) GetCharacterId() []int32 {
 	if x != nil {
-		return x.SystemId
+		return x.CharacterId
 	}
-	return 0
+	return nil
 }
 
-type SystemStaticInfoResponse struct {
+func (x *SystemWhereIsRequest) GetPopulation() bool {
+	if x != nil {
+		return x.Population
+	}
+	return false
+}
+
+type SystemWhereIsResponse struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	Ok               bool                     `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
-	SystemId         int32                    `protobuf:"varint,2,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
-	SystemStaticInfo *SystemStaticInfoMessage `protobuf:"bytes,3,opt,name=system_static_info,json=systemStaticInfo,proto3" json:"system_static_info,omitempty"`
+	Ok                bool                        `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
+	CharacterLiveInfo []*CharacterLiveInfoMessage `protobuf:"bytes,2,rep,name=character_live_info,json=characterLiveInfo,proto3" json:"character_live_info,omitempty"`
+	Population        []*SystemPopulationMessage  `protobuf:"bytes,3,rep,name=population,proto3" json:"population,omitempty"`
 }
 
-func (x *SystemStaticInfoResponse) Reset() {
-	*x = SystemStaticInfoResponse{}
+func (x *SystemWhereIsResponse) Reset() {
+	*x = SystemWhereIsResponse{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_poq_proto_msgTypes[22]
+		mi := &file_poq_proto_msgTypes[44]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
 }
 
-func (x *SystemStaticInfoResponse) String() string {
+func (x *SystemWhereIsResponse) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*SystemStaticInfoResponse) ProtoMessage() {}
+func (*SystemWhereIsResponse) ProtoMessage() {}
 
-func (x *SystemStaticInfoResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_poq_proto_msgTypes[22]
+func (x *SystemWhereIsResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[44]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1374,58 +2803,57 @@ func (x *SystemStaticInfoResponse) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use SystemStaticInfoResponse.ProtoReflect.Descriptor instead.
-func (*SystemStaticInfoResponse) Descriptor() ([]byte, []int) {
-	return file_poq_proto_rawDescGZIP(), []int{22}
+// Deprecated: Use SystemWhereIsResponse.ProtoReflect.Descriptor instead.
+func (*SystemWhereIsResponse) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{44}
 }
 
-func (x *SystemStaticInfoResponse) GetOk() bool {
+func (x *SystemWhereIsResponse) GetOk() bool {
 	if x != nil {
 		return x.Ok
 	}
 	return false
 }
 
-func (x *SystemStaticInfoResponse) GetSystemId() int32 {
+func (x *SystemWhereIsResponse) GetCharacterLiveInfo() []*CharacterLiveInfoMessage {
 	if x != nil {
-		return x.SystemId
+		return x.CharacterLiveInfo
 	}
-	return 0
+	return nil
 }
 
-func (x *SystemStaticInfoResponse) GetSystemStaticInfo() *SystemStaticInfoMessage {
+func (x *SystemWhereIsResponse) GetPopulation() []*SystemPopulationMessage {
 	if x != nil {
-		return x.SystemStaticInfo
+		return x.Population
 	}
 	return nil
 }
 
-type SystemLiveInfoMessage struct {
+type SystemTopicRequest struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	SystemId    int32   `protobuf:"varint,1,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
-	CharacterId []int32 `protobuf:"varint,2,rep,packed,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
+	SystemId int32 `protobuf:"varint,1,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
 }
 
-func (x *SystemLiveInfoMessage) Reset() {
-	*x = SystemLiveInfoMessage{}
+func (x *SystemTopicRequest) Reset() {
+	*x = SystemTopicRequest{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_poq_proto_msgTypes[23]
+		mi := &file_poq_proto_msgTypes[45]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
 }
 
-func (x *SystemLiveInfoMessage) String() string {
+func (x *SystemTopicRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*SystemLiveInfoMessage) ProtoMessage() {}
+func (*SystemTopicRequest) ProtoMessage() {}
 
-func (x *SystemLiveInfoMessage) ProtoReflect() protoreflect.Message {
-	mi := &file_poq_proto_msgTypes[23]
+func (x *SystemTopicRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[45]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1436,50 +2864,45 @@ func (x *SystemLiveInfoMessage) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use SystemLiveInfoMessage.ProtoReflect.Descriptor instead.
-func (*SystemLiveInfoMessage) Descriptor() ([]byte, []int) {
-	return file_poq_proto_rawDescGZIP(), []int{23}
+// Deprecated: Use SystemTopicRequest.ProtoReflect.Descriptor instead.
+func (*SystemTopicRequest) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{45}
 }
 
-func (x *SystemLiveInfoMessage) GetSystemId() int32 {
+func (x *SystemTopicRequest) GetSystemId() int32 {
 	if x != nil {
 		return x.SystemId
 	}
 	return 0
 }
 
-func (x *SystemLiveInfoMessage) GetCharacterId() []int32 {
-	if x != nil {
-		return x.CharacterId
-	}
-	return nil
-}
-
-type SystemLiveInfoRequest struct {
+type SystemTopicResponse struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	SystemId int32 `protobuf:"varint,1,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
+	Ok           bool          `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
+	SystemId     int32         `protobuf:"varint,2,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
+	SystemTopics *TopicMessage `protobuf:"bytes,3,opt,name=system_topics,json=systemTopics,proto3" json:"system_topics,omitempty"`
 }
 
-func (x *SystemLiveInfoRequest) Reset() {
-	*x = SystemLiveInfoRequest{}
+func (x *SystemTopicResponse) Reset() {
+	*x = SystemTopicResponse{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_poq_proto_msgTypes[24]
+		mi := &file_poq_proto_msgTypes[46]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
 }
 
-func (x *SystemLiveInfoRequest) String() string {
+func (x *SystemTopicResponse) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*SystemLiveInfoRequest) ProtoMessage() {}
+func (*SystemTopicResponse) ProtoMessage() {}
 
-func (x *SystemLiveInfoRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_poq_proto_msgTypes[24]
+func (x *SystemTopicResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[46]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1490,45 +2913,64 @@ func (x *SystemLiveInfoRequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use SystemLiveInfoRequest.ProtoReflect.Descriptor instead.
-func (*SystemLiveInfoRequest) Descriptor() ([]byte, []int) {
-	return file_poq_proto_rawDescGZIP(), []int{24}
+// Deprecated: Use SystemTopicResponse.ProtoReflect.Descriptor instead.
+func (*SystemTopicResponse) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{46}
 }
 
-func (x *SystemLiveInfoRequest) GetSystemId() int32 {
+func (x *SystemTopicResponse) GetOk() bool {
+	if x != nil {
+		return x.Ok
+	}
+	return false
+}
+
+func (x *SystemTopicResponse) GetSystemId() int32 {
 	if x != nil {
 		return x.SystemId
 	}
 	return 0
 }
 
-type SystemLiveInfoResponse struct {
+func (x *SystemTopicResponse) GetSystemTopics() *TopicMessage {
+	if x != nil {
+		return x.SystemTopics
+	}
+	return nil
+}
+
+// Population history of one system, a region around it (as UniverseRequest) or a list
+// of systems. points are the newest complete buckets at the resolution ("1s", "1m",
+// "1h"), oldest first and interval seconds apart from start_time (epoch seconds).
+type SystemHistoryRequest struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	Ok             bool                   `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
-	SystemId       int32                  `protobuf:"varint,2,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
-	SystemLiveInfo *SystemLiveInfoMessage `protobuf:"bytes,3,opt,name=system_live_info,json=systemLiveInfo,proto3" json:"system_live_info,omitempty"`
+	SystemId   int32   `protobuf:"varint,1,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
+	Jumps      int32   `protobuf:"varint,2,opt,name=jumps,proto3" json:"jumps,omitempty"`
+	SystemIds  []int32 `protobuf:"varint,3,rep,packed,name=system_ids,json=systemIds,proto3" json:"system_ids,omitempty"`
+	Resolution string  `protobuf:"bytes,4,opt,name=resolution,proto3" json:"resolution,omitempty"`
+	Points     int32   `protobuf:"varint,5,opt,name=points,proto3" json:"points,omitempty"`
 }
 
-func (x *SystemLiveInfoResponse) Reset() {
-	*x = SystemLiveInfoResponse{}
+func (x *SystemHistoryRequest) Reset() {
+	*x = SystemHistoryRequest{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_poq_proto_msgTypes[25]
+		mi := &file_poq_proto_msgTypes[47]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
 }
 
-func (x *SystemLiveInfoResponse) String() string {
+func (x *SystemHistoryRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*SystemLiveInfoResponse) ProtoMessage() {}
+func (*SystemHistoryRequest) ProtoMessage() {}
 
-func (x *SystemLiveInfoResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_poq_proto_msgTypes[25]
+func (x *SystemHistoryRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[47]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1539,59 +2981,73 @@ func (x *SystemLiveInfoResponse) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use SystemLiveInfoResponse.ProtoReflect.Descriptor instead.
-func (*SystemLiveInfoResponse) Descriptor() ([]byte, []int) {
-	return file_poq_proto_rawDescGZIP(), []int{25}
+// Deprecated: Use SystemHistoryRequest.ProtoReflect.Descriptor instead.
+func (*SystemHistoryRequest) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{47}
 }
 
-func (x *SystemLiveInfoResponse) GetOk() bool {
+func (x *SystemHistoryRequest) GetSystemId() int32 {
 	if x != nil {
-		return x.Ok
+		return x.SystemId
 	}
-	return false
+	return 0
 }
 
-func (x *SystemLiveInfoResponse) GetSystemId() int32 {
+func (x *SystemHistoryRequest) GetJumps() int32 {
 	if x != nil {
-		return x.SystemId
+		return x.Jumps
 	}
 	return 0
 }
 
-func (x *SystemLiveInfoResponse) GetSystemLiveInfo() *SystemLiveInfoMessage {
+func (x *SystemHistoryRequest) GetSystemIds() []int32 {
 	if x != nil {
-		return x.SystemLiveInfo
+		return x.SystemIds
 	}
 	return nil
 }
 
-type SystemSetLiveCharacterRequest struct {
+func (x *SystemHistoryRequest) GetResolution() string {
+	if x != nil {
+		return x.Resolution
+	}
+	return ""
+}
+
+func (x *SystemHistoryRequest) GetPoints() int32 {
+	if x != nil {
+		return x.Points
+	}
+	return 0
+}
+
+type SystemHistoryMessage struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	CharacterId int32 `protobuf:"varint,1,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
-	SystemId    int32 `protobuf:"varint,2,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
-	Present     bool  `protobuf:"varint,3,opt,name=present,proto3" json:"present,omitempty"`
+	SystemId int32     `protobuf:"varint,1,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
+	Mean     []float32 `protobuf:"fixed32,2,rep,packed,name=mean,proto3" json:"mean,omitempty"`
+	Peak     []int32   `protobuf:"varint,3,rep,packed,name=peak,proto3" json:"peak,omitempty"`
 }
 
-func (x *SystemSetLiveCharacterRequest) Reset() {
-	*x = SystemSetLiveCharacterRequest{}
+func (x *SystemHistoryMessage) Reset() {
+	*x = SystemHistoryMessage{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_poq_proto_msgTypes[26]
+		mi := &file_poq_proto_msgTypes[48]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
 }
 
-func (x *SystemSetLiveCharacterRequest) String() string {
+func (x *SystemHistoryMessage) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*SystemSetLiveCharacterRequest) ProtoMessage() {}
+func (*SystemHistoryMessage) ProtoMessage() {}
 
-func (x *SystemSetLiveCharacterRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_poq_proto_msgTypes[26]
+func (x *SystemHistoryMessage) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[48]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1602,59 +3058,61 @@ func (x *SystemSetLiveCharacterRequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use SystemSetLiveCharacterRequest.ProtoReflect.Descriptor instead.
-func (*SystemSetLiveCharacterRequest) Descriptor() ([]byte, []int) {
-	return file_poq_proto_rawDescGZIP(), []int{26}
+// Deprecated: Use SystemHistoryMessage.ProtoReflect.Descriptor instead.
+func (*SystemHistoryMessage) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{48}
 }
 
-func (x *SystemSetLiveCharacterRequest) GetCharacterId() int32 {
+func (x *SystemHistoryMessage) GetSystemId() int32 {
 	if x != nil {
-		return x.CharacterId
+		return x.SystemId
 	}
 	return 0
 }
 
-func (x *SystemSetLiveCharacterRequest) GetSystemId() int32 {
+func (x *SystemHistoryMessage) GetMean() []float32 {
 	if x != nil {
-		return x.SystemId
+		return x.Mean
 	}
-	return 0
+	return nil
 }
 
-func (x *SystemSetLiveCharacterRequest) GetPresent() bool {
+func (x *SystemHistoryMessage) GetPeak() []int32 {
 	if x != nil {
-		return x.Present
+		return x.Peak
 	}
-	return false
+	return nil
 }
 
-type SystemSetLiveCharacterResponse struct {
+type SystemHistoryResponse struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	Ok          bool  `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
-	CharacterId int32 `protobuf:"varint,2,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
-	SystemId    int32 `protobuf:"varint,3,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
+	Ok         bool                    `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
+	Resolution string                  `protobuf:"bytes,2,opt,name=resolution,proto3" json:"resolution,omitempty"`
+	Interval   int32                   `protobuf:"varint,3,opt,name=interval,proto3" json:"interval,omitempty"`
+	StartTime  int64                   `protobuf:"varint,4,opt,name=start_time,json=startTime,proto3" json:"start_time,omitempty"`
+	Systems    []*SystemHistoryMessage `protobuf:"bytes,5,rep,name=systems,proto3" json:"systems,omitempty"`
 }
 
-func (x *SystemSetLiveCharacterResponse) Reset() {
-	*x = SystemSetLiveCharacterResponse{}
+func (x *SystemHistoryResponse) Reset() {
+	*x = SystemHistoryResponse{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_poq_proto_msgTypes[27]
+		mi := &file_poq_proto_msgTypes[49]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
 }
 
-func (x *SystemSetLiveCharacterResponse) String() string {
+func (x *SystemHistoryResponse) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*SystemSetLiveCharacterResponse) ProtoMessage() {}
+func (*SystemHistoryResponse) ProtoMessage() {}
 
-func (x *SystemSetLiveCharacterResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_poq_proto_msgTypes[27]
+func (x *SystemHistoryResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[49]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1665,57 +3123,76 @@ func (x *SystemSetLiveCharacterResponse) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use SystemSetLiveCharacterResponse.ProtoReflect.Descriptor instead.
-func (*SystemSetLiveCharacterResponse) Descriptor() ([]byte, []int) {
-	return file_poq_proto_rawDescGZIP(), []int{27}
+// Deprecated: Use SystemHistoryResponse.ProtoReflect.Descriptor instead.
+func (*SystemHistoryResponse) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{49}
 }
 
-func (x *SystemSetLiveCharacterResponse) GetOk() bool {
+func (x *SystemHistoryResponse) GetOk() bool {
 	if x != nil {
 		return x.Ok
 	}
 	return false
 }
 
-func (x *SystemSetLiveCharacterResponse) GetCharacterId() int32 {
+func (x *SystemHistoryResponse) GetResolution() string {
 	if x != nil {
-		return x.CharacterId
+		return x.Resolution
+	}
+	return ""
+}
+
+func (x *SystemHistoryResponse) GetInterval() int32 {
+	if x != nil {
+		return x.Interval
 	}
 	return 0
 }
 
-func (x *SystemSetLiveCharacterResponse) GetSystemId() int32 {
+func (x *SystemHistoryResponse) GetStartTime() int64 {
 	if x != nil {
-		return x.SystemId
+		return x.StartTime
 	}
 	return 0
 }
 
-type SystemTopicRequest struct {
+func (x *SystemHistoryResponse) GetSystems() []*SystemHistoryMessage {
+	if x != nil {
+		return x.Systems
+	}
+	return nil
+}
+
+// Presence replication from the active SystemService to its standby. Changes are applied
+// in sequence order; a snapshot replaces the whole state (arrived is each system's full
+// presence) and an empty message is a heartbeat.
+type SystemReplicaChange struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	SystemId int32 `protobuf:"varint,1,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
+	SystemId int32   `protobuf:"varint,1,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
+	Arrived  []int32 `protobuf:"varint,2,rep,packed,name=arrived,proto3" json:"arrived,omitempty"`
+	Departed []int32 `protobuf:"varint,3,rep,packed,name=departed,proto3" json:"departed,omitempty"`
 }
 
-func (x *SystemTopicRequest) Reset() {
-	*x = SystemTopicRequest{}
+func (x *SystemReplicaChange) Reset() {
+	*x = SystemReplicaChange{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_poq_proto_msgTypes[28]
+		mi := &file_poq_proto_msgTypes[50]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
 }
 
-func (x *SystemTopicRequest) String() string {
+func (x *SystemReplicaChange) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*SystemTopicRequest) ProtoMessage() {}
+func (*SystemReplicaChange) ProtoMessage() {}
 
-func (x *SystemTopicRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_poq_proto_msgTypes[28]
+func (x *SystemReplicaChange) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[50]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1726,45 +3203,62 @@ func (x *SystemTopicRequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use SystemTopicRequest.ProtoReflect.Descriptor instead.
-func (*SystemTopicRequest) Descriptor() ([]byte, []int) {
-	return file_poq_proto_rawDescGZIP(), []int{28}
+// Deprecated: Use SystemReplicaChange.ProtoReflect.Descriptor instead.
+func (*SystemReplicaChange) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{50}
 }
 
-func (x *SystemTopicRequest) GetSystemId() int32 {
+func (x *SystemReplicaChange) GetSystemId() int32 {
 	if x != nil {
 		return x.SystemId
 	}
 	return 0
 }
 
-type SystemTopicResponse struct {
+func (x *SystemReplicaChange) GetArrived() []int32 {
+	if x != nil {
+		return x.Arrived
+	}
+	return nil
+}
+
+func (x *SystemReplicaChange) GetDeparted() []int32 {
+	if x != nil {
+		return x.Departed
+	}
+	return nil
+}
+
+type SystemReplicaMessage struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	Ok           bool          `protobuf:"varint,1,opt,name=ok,proto3" json:"ok,omitempty"`
-	SystemId     int32         `protobuf:"varint,2,opt,name=system_id,json=systemId,proto3" json:"system_id,omitempty"`
-	SystemTopics *TopicMessage `protobuf:"bytes,3,opt,name=system_topics,json=systemTopics,proto3" json:"system_topics,omitempty"`
+	InstanceId string                 `protobuf:"bytes,1,opt,name=instance_id,json=instanceId,proto3" json:"instance_id,omitempty"`
+	Epoch      uint64                 `protobuf:"varint,2,opt,name=epoch,proto3" json:"epoch,omitempty"`
+	Sequence   uint64                 `protobuf:"varint,3,opt,name=sequence,proto3" json:"sequence,omitempty"`
+	Snapshot   bool                   `protobuf:"varint,4,opt,name=snapshot,proto3" json:"snapshot,omitempty"`
+	Handover   bool                   `protobuf:"varint,5,opt,name=handover,proto3" json:"handover,omitempty"`
+	Changes    []*SystemReplicaChange `protobuf:"bytes,6,rep,name=changes,proto3" json:"changes,omitempty"`
 }
 
-func (x *SystemTopicResponse) Reset() {
-	*x = SystemTopicResponse{}
+func (x *SystemReplicaMessage) Reset() {
+	*x = SystemReplicaMessage{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_poq_proto_msgTypes[29]
+		mi := &file_poq_proto_msgTypes[51]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
 }
 
-func (x *SystemTopicResponse) String() string {
+func (x *SystemReplicaMessage) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*SystemTopicResponse) ProtoMessage() {}
+func (*SystemReplicaMessage) ProtoMessage() {}
 
-func (x *SystemTopicResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_poq_proto_msgTypes[29]
+func (x *SystemReplicaMessage) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[51]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1775,28 +3269,49 @@ func (x *SystemTopicResponse) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use SystemTopicResponse.ProtoReflect.Descriptor instead.
-func (*SystemTopicResponse) Descriptor() ([]byte, []int) {
-	return file_poq_proto_rawDescGZIP(), []int{29}
+// Deprecated: Use SystemReplicaMessage.ProtoReflect.Descriptor instead.
+func (*SystemReplicaMessage) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{51}
 }
 
-func (x *SystemTopicResponse) GetOk() bool {
+func (x *SystemReplicaMessage) GetInstanceId() string {
 	if x != nil {
-		return x.Ok
+		return x.InstanceId
+	}
+	return ""
+}
+
+func (x *SystemReplicaMessage) GetEpoch() uint64 {
+	if x != nil {
+		return x.Epoch
+	}
+	return 0
+}
+
+func (x *SystemReplicaMessage) GetSequence() uint64 {
+	if x != nil {
+		return x.Sequence
+	}
+	return 0
+}
+
+func (x *SystemReplicaMessage) GetSnapshot() bool {
+	if x != nil {
+		return x.Snapshot
 	}
 	return false
 }
 
-func (x *SystemTopicResponse) GetSystemId() int32 {
+func (x *SystemReplicaMessage) GetHandover() bool {
 	if x != nil {
-		return x.SystemId
+		return x.Handover
 	}
-	return 0
+	return false
 }
 
-func (x *SystemTopicResponse) GetSystemTopics() *TopicMessage {
+func (x *SystemReplicaMessage) GetChanges() []*SystemReplicaChange {
 	if x != nil {
-		return x.SystemTopics
+		return x.Changes
 	}
 	return nil
 }
@@ -1812,7 +3327,7 @@ type SessionStartRequest struct {
 func (x *SessionStartRequest) Reset() {
 	*x = SessionStartRequest{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_poq_proto_msgTypes[30]
+		mi := &file_poq_proto_msgTypes[52]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -1825,7 +3340,7 @@ func (x *SessionStartRequest) String() string {
 func (*SessionStartRequest) ProtoMessage() {}
 
 func (x *SessionStartRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_poq_proto_msgTypes[30]
+	mi := &file_poq_proto_msgTypes[52]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1838,7 +3353,7 @@ func (x *SessionStartRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use SessionStartRequest.ProtoReflect.Descriptor instead.
 func (*SessionStartRequest) Descriptor() ([]byte, []int) {
-	return file_poq_proto_rawDescGZIP(), []int{30}
+	return file_poq_proto_rawDescGZIP(), []int{52}
 }
 
 func (x *SessionStartRequest) GetUsername() string {
@@ -1862,7 +3377,7 @@ type SessionStartResponse struct {
 func (x *SessionStartResponse) Reset() {
 	*x = SessionStartResponse{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_poq_proto_msgTypes[31]
+		mi := &file_poq_proto_msgTypes[53]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -1875,7 +3390,7 @@ func (x *SessionStartResponse) String() string {
 func (*SessionStartResponse) ProtoMessage() {}
 
 func (x *SessionStartResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_poq_proto_msgTypes[31]
+	mi := &file_poq_proto_msgTypes[53]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1888,7 +3403,7 @@ func (x *SessionStartResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use SessionStartResponse.ProtoReflect.Descriptor instead.
 func (*SessionStartResponse) Descriptor() ([]byte, []int) {
-	return file_poq_proto_rawDescGZIP(), []int{31}
+	return file_poq_proto_rawDescGZIP(), []int{53}
 }
 
 func (x *SessionStartResponse) GetOk() bool {
@@ -1930,7 +3445,7 @@ type SessionStopRequest struct {
 func (x *SessionStopRequest) Reset() {
 	*x = SessionStopRequest{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_poq_proto_msgTypes[32]
+		mi := &file_poq_proto_msgTypes[54]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -1943,7 +3458,7 @@ func (x *SessionStopRequest) String() string {
 func (*SessionStopRequest) ProtoMessage() {}
 
 func (x *SessionStopRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_poq_proto_msgTypes[32]
+	mi := &file_poq_proto_msgTypes[54]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1956,7 +3471,7 @@ func (x *SessionStopRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use SessionStopRequest.ProtoReflect.Descriptor instead.
 func (*SessionStopRequest) Descriptor() ([]byte, []int) {
-	return file_poq_proto_rawDescGZIP(), []int{32}
+	return file_poq_proto_rawDescGZIP(), []int{54}
 }
 
 func (x *SessionStopRequest) GetSessionId() string {
@@ -1978,7 +3493,7 @@ type SessionStopResponse struct {
 func (x *SessionStopResponse) Reset() {
 	*x = SessionStopResponse{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_poq_proto_msgTypes[33]
+		mi := &file_poq_proto_msgTypes[55]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -1991,7 +3506,7 @@ func (x *SessionStopResponse) String() string {
 func (*SessionStopResponse) ProtoMessage() {}
 
 func (x *SessionStopResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_poq_proto_msgTypes[33]
+	mi := &file_poq_proto_msgTypes[55]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -2004,7 +3519,7 @@ func (x *SessionStopResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use SessionStopResponse.ProtoReflect.Descriptor instead.
 func (*SessionStopResponse) Descriptor() ([]byte, []int) {
-	return file_poq_proto_rawDescGZIP(), []int{33}
+	return file_poq_proto_rawDescGZIP(), []int{55}
 }
 
 func (x *SessionStopResponse) GetOk() bool {
@@ -2032,7 +3547,7 @@ type SessionPing struct {
 func (x *SessionPing) Reset() {
 	*x = SessionPing{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_poq_proto_msgTypes[34]
+		mi := &file_poq_proto_msgTypes[56]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -2045,7 +3560,7 @@ func (x *SessionPing) String() string {
 func (*SessionPing) ProtoMessage() {}
 
 func (x *SessionPing) ProtoReflect() protoreflect.Message {
-	mi := &file_poq_proto_msgTypes[34]
+	mi := &file_poq_proto_msgTypes[56]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -2058,7 +3573,7 @@ func (x *SessionPing) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use SessionPing.ProtoReflect.Descriptor instead.
 func (*SessionPing) Descriptor() ([]byte, []int) {
-	return file_poq_proto_rawDescGZIP(), []int{34}
+	return file_poq_proto_rawDescGZIP(), []int{56}
 }
 
 func (x *SessionPing) GetSessionId() string {
@@ -2079,7 +3594,7 @@ type SessionPong struct {
 func (x *SessionPong) Reset() {
 	*x = SessionPong{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_poq_proto_msgTypes[35]
+		mi := &file_poq_proto_msgTypes[57]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -2092,7 +3607,7 @@ func (x *SessionPong) String() string {
 func (*SessionPong) ProtoMessage() {}
 
 func (x *SessionPong) ProtoReflect() protoreflect.Message {
-	mi := &file_poq_proto_msgTypes[35]
+	mi := &file_poq_proto_msgTypes[57]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -2105,7 +3620,7 @@ func (x *SessionPong) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use SessionPong.ProtoReflect.Descriptor instead.
 func (*SessionPong) Descriptor() ([]byte, []int) {
-	return file_poq_proto_rawDescGZIP(), []int{35}
+	return file_poq_proto_rawDescGZIP(), []int{57}
 }
 
 func (x *SessionPong) GetSessionId() string {
@@ -2115,6 +3630,126 @@ func (x *SessionPong) GetSessionId() string {
 	return ""
 }
 
+// Tokens revoked before their expiry - a character's tokens up to generation, and every
+// token before min_generation.
+type SessionRevoked struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	CharacterId int32  `protobuf:"varint,1,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
+	Generation  uint64 `protobuf:"varint,2,opt,name=generation,proto3" json:"generation,omitempty"`
+	Expires     uint32 `protobuf:"varint,3,opt,name=expires,proto3" json:"expires,omitempty"`
+}
+
+func (x *SessionRevoked) Reset() {
+	*x = SessionRevoked{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_poq_proto_msgTypes[58]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *SessionRevoked) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SessionRevoked) ProtoMessage() {}
+
+func (x *SessionRevoked) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[58]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SessionRevoked.ProtoReflect.Descriptor instead.
+func (*SessionRevoked) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{58}
+}
+
+func (x *SessionRevoked) GetCharacterId() int32 {
+	if x != nil {
+		return x.CharacterId
+	}
+	return 0
+}
+
+func (x *SessionRevoked) GetGeneration() uint64 {
+	if x != nil {
+		return x.Generation
+	}
+	return 0
+}
+
+func (x *SessionRevoked) GetExpires() uint32 {
+	if x != nil {
+		return x.Expires
+	}
+	return 0
+}
+
+type SessionRevocationMessage struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	MinGeneration uint64            `protobuf:"varint,1,opt,name=min_generation,json=minGeneration,proto3" json:"min_generation,omitempty"`
+	Revoked       []*SessionRevoked `protobuf:"bytes,2,rep,name=revoked,proto3" json:"revoked,omitempty"`
+}
+
+func (x *SessionRevocationMessage) Reset() {
+	*x = SessionRevocationMessage{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_poq_proto_msgTypes[59]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *SessionRevocationMessage) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SessionRevocationMessage) ProtoMessage() {}
+
+func (x *SessionRevocationMessage) ProtoReflect() protoreflect.Message {
+	mi := &file_poq_proto_msgTypes[59]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SessionRevocationMessage.ProtoReflect.Descriptor instead.
+func (*SessionRevocationMessage) Descriptor() ([]byte, []int) {
+	return file_poq_proto_rawDescGZIP(), []int{59}
+}
+
+func (x *SessionRevocationMessage) GetMinGeneration() uint64 {
+	if x != nil {
+		return x.MinGeneration
+	}
+	return 0
+}
+
+func (x *SessionRevocationMessage) GetRevoked() []*SessionRevoked {
+	if x != nil {
+		return x.Revoked
+	}
+	return nil
+}
+
 type SessionMessageRequest struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
@@ -2129,7 +3764,7 @@ type SessionMessageRequest struct {
 func (x *SessionMessageRequest) Reset() {
 	*x = SessionMessageRequest{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_poq_proto_msgTypes[36]
+		mi := &file_poq_proto_msgTypes[60]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -2142,7 +3777,7 @@ func (x *SessionMessageRequest) String() string {
 func (*SessionMessageRequest) ProtoMessage() {}
 
 func (x *SessionMessageRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_poq_proto_msgTypes[36]
+	mi := &file_poq_proto_msgTypes[60]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -2155,7 +3790,7 @@ func (x *SessionMessageRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use SessionMessageRequest.ProtoReflect.Descriptor instead.
 func (*SessionMessageRequest) Descriptor() ([]byte, []int) {
-	return file_poq_proto_rawDescGZIP(), []int{36}
+	return file_poq_proto_rawDescGZIP(), []int{60}
 }
 
 func (x *SessionMessageRequest) GetType() SessionMessageType {
@@ -2203,7 +3838,7 @@ type SessionMessageResponse struct {
 func (x *SessionMessageResponse) Reset() {
 	*x = SessionMessageResponse{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_poq_proto_msgTypes[37]
+		mi := &file_poq_proto_msgTypes[61]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -2216,7 +3851,7 @@ func (x *SessionMessageResponse) String() string {
 func (*SessionMessageResponse) ProtoMessage() {}
 
 func (x *SessionMessageResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_poq_proto_msgTypes[37]
+	mi := &file_poq_proto_msgTypes[61]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -2229,7 +3864,7 @@ func (x *SessionMessageResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use SessionMessageResponse.ProtoReflect.Descriptor instead.
 func (*SessionMessageResponse) Descriptor() ([]byte, []int) {
-	return file_poq_proto_rawDescGZIP(), []int{37}
+	return file_poq_proto_rawDescGZIP(), []int{61}
 }
 
 func (x *SessionMessageResponse) GetType() SessionMessageType {
@@ -2287,7 +3922,7 @@ var file_poq_proto_rawDesc = []byte{
 	0x0a, 0x09, 0x70, 0x6f, 0x71, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x12, 0x03, 0x70, 0x6f, 0x71,
 	0x1a, 0x1f, 0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2f, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75,
 	0x66, 0x2f, 0x74, 0x69, 0x6d, 0x65, 0x73, 0x74, 0x61, 0x6d, 0x70, 0x2e, 0x70, 0x72, 0x6f, 0x74,
-	0x6f, 0x22, 0x81, 0x01, 0x0a, 0x0c, 0x54, 0x6f, 0x70, 0x69, 0x63, 0x4d, 0x65, 0x73, 0x73, 0x61,
+	0x6f, 0x22, 0xa0, 0x01, 0x0a, 0x0c, 0x54, 0x6f, 0x70, 0x69, 0x63, 0x4d, 0x65, 0x73, 0x73, 0x61,
 	0x67, 0x65, 0x12, 0x23, 0x0a, 0x0d, 0x72, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x5f, 0x74, 0x6f,
 	0x70, 0x69, 0x63, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0c, 0x72, 0x65, 0x71, 0x75, 0x65,
 	0x73, 0x74, 0x54, 0x6f, 0x70, 0x69, 0x63, 0x12, 0x23, 0x0a, 0x0d, 0x70, 0x75, 0x62, 0x6c, 0x69,
@@ -2295,263 +3930,479 @@ var file_poq_proto_rawDesc = []byte{
 	0x70, 0x75, 0x62, 0x6c, 0x69, 0x73, 0x68, 0x54, 0x6f, 0x70, 0x69, 0x63, 0x12, 0x27, 0x0a, 0x0f,
 	0x73, 0x75, 0x62, 0x73, 0x63, 0x72, 0x69, 0x62, 0x65, 0x5f, 0x74, 0x6f, 0x70, 0x69, 0x63, 0x18,
 	0x03, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0e, 0x73, 0x75, 0x62, 0x73, 0x63, 0x72, 0x69, 0x62, 0x65,
-	0x54, 0x6f, 0x70, 0x69, 0x63, 0x22, 0x6e, 0x0a, 0x0c, 0x53, 0x65, 0x72, 0x76, 0x69, 0x63, 0x65,
+	0x54, 0x6f, 0x70, 0x69, 0x63, 0x12, 0x1d, 0x0a, 0x0a, 0x66, 0x65, 0x65, 0x64, 0x5f, 0x74, 0x6f,
+	0x70, 0x69, 0x63, 0x18, 0x04, 0x20, 0x01, 0x28, 0x09, 0x52, 0x09, 0x66, 0x65, 0x65, 0x64, 0x54,
+	0x6f, 0x70, 0x69, 0x63, 0x22, 0xa3, 0x01, 0x0a, 0x0c, 0x53, 0x65, 0x72, 0x76, 0x69, 0x63, 0x65,
 	0x53, 0x74, 0x61, 0x72, 0x74, 0x12, 0x24, 0x0a, 0x04, 0x74, 0x79, 0x70, 0x65, 0x18, 0x01, 0x20,
 	0x01, 0x28, 0x0e, 0x32, 0x10, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x53, 0x65, 0x72, 0x76, 0x69, 0x63,
 	0x65, 0x54, 0x79, 0x70, 0x65, 0x52, 0x04, 0x74, 0x79, 0x70, 0x65, 0x12, 0x38, 0x0a, 0x09, 0x74,
 	0x69, 0x6d, 0x65, 0x73, 0x74, 0x61, 0x6d, 0x70, 0x18, 0x02, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1a,
 	0x2e, 0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66,
 	0x2e, 0x54, 0x69, 0x6d, 0x65, 0x73, 0x74, 0x61, 0x6d, 0x70, 0x52, 0x09, 0x74, 0x69, 0x6d, 0x65,
-	0x73, 0x74, 0x61, 0x6d, 0x70, 0x22, 0x53, 0x0a, 0x1a, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74,
-	0x65, 0x72, 0x53, 0x74, 0x61, 0x74, 0x69, 0x63, 0x49, 0x6e, 0x66, 0x6f, 0x4d, 0x65, 0x73, 0x73,
-	0x61, 0x67, 0x65, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72,
-	0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61,
-	0x63, 0x74, 0x65, 0x72, 0x49, 0x64, 0x12, 0x12, 0x0a, 0x04, 0x6e, 0x61, 0x6d, 0x65, 0x18, 0x02,
-	0x20, 0x01, 0x28, 0x09, 0x52, 0x04, 0x6e, 0x61, 0x6d, 0x65, 0x22, 0x3f, 0x0a, 0x1a, 0x43, 0x68,
-	0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x53, 0x74, 0x61, 0x74, 0x69, 0x63, 0x49, 0x6e, 0x66,
-	0x6f, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68, 0x61, 0x72,
-	0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0b,
-	0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x49, 0x64, 0x22, 0x82, 0x01, 0x0a, 0x1b,
+	0x73, 0x74, 0x61, 0x6d, 0x70, 0x12, 0x1f, 0x0a, 0x0b, 0x69, 0x6e, 0x73, 0x74, 0x61, 0x6e, 0x63,
+	0x65, 0x5f, 0x69, 0x64, 0x18, 0x03, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0a, 0x69, 0x6e, 0x73, 0x74,
+	0x61, 0x6e, 0x63, 0x65, 0x49, 0x64, 0x12, 0x12, 0x0a, 0x04, 0x6c, 0x6f, 0x61, 0x64, 0x18, 0x04,
+	0x20, 0x01, 0x28, 0x05, 0x52, 0x04, 0x6c, 0x6f, 0x61, 0x64, 0x22, 0x4e, 0x0a, 0x14, 0x53, 0x65,
+	0x72, 0x76, 0x69, 0x63, 0x65, 0x4d, 0x65, 0x6d, 0x6f, 0x72, 0x79, 0x52, 0x65, 0x71, 0x75, 0x65,
+	0x73, 0x74, 0x12, 0x19, 0x0a, 0x08, 0x68, 0x65, 0x61, 0x70, 0x5f, 0x74, 0x6f, 0x70, 0x18, 0x01,
+	0x20, 0x01, 0x28, 0x05, 0x52, 0x07, 0x68, 0x65, 0x61, 0x70, 0x54, 0x6f, 0x70, 0x12, 0x1b, 0x0a,
+	0x09, 0x68, 0x65, 0x61, 0x70, 0x5f, 0x73, 0x74, 0x6f, 0x70, 0x18, 0x02, 0x20, 0x01, 0x28, 0x08,
+	0x52, 0x08, 0x68, 0x65, 0x61, 0x70, 0x53, 0x74, 0x6f, 0x70, 0x22, 0x4f, 0x0a, 0x0f, 0x4d, 0x65,
+	0x6d, 0x6f, 0x72, 0x79, 0x53, 0x74, 0x72, 0x75, 0x63, 0x74, 0x75, 0x72, 0x65, 0x12, 0x12, 0x0a,
+	0x04, 0x6e, 0x61, 0x6d, 0x65, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x04, 0x6e, 0x61, 0x6d,
+	0x65, 0x12, 0x14, 0x0a, 0x05, 0x63, 0x6f, 0x75, 0x6e, 0x74, 0x18, 0x02, 0x20, 0x01, 0x28, 0x03,
+	0x52, 0x05, 0x63, 0x6f, 0x75, 0x6e, 0x74, 0x12, 0x12, 0x0a, 0x04, 0x73, 0x69, 0x7a, 0x65, 0x18,
+	0x03, 0x20, 0x01, 0x28, 0x03, 0x52, 0x04, 0x73, 0x69, 0x7a, 0x65, 0x22, 0x91, 0x01, 0x0a, 0x0d,
+	0x48, 0x65, 0x61, 0x70, 0x53, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x12, 0x1a, 0x0a,
+	0x08, 0x6c, 0x6f, 0x63, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52,
+	0x08, 0x6c, 0x6f, 0x63, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x12, 0x12, 0x0a, 0x04, 0x73, 0x69, 0x7a,
+	0x65, 0x18, 0x02, 0x20, 0x01, 0x28, 0x03, 0x52, 0x04, 0x73, 0x69, 0x7a, 0x65, 0x12, 0x1b, 0x0a,
+	0x09, 0x73, 0x69, 0x7a, 0x65, 0x5f, 0x64, 0x69, 0x66, 0x66, 0x18, 0x03, 0x20, 0x01, 0x28, 0x03,
+	0x52, 0x08, 0x73, 0x69, 0x7a, 0x65, 0x44, 0x69, 0x66, 0x66, 0x12, 0x14, 0x0a, 0x05, 0x63, 0x6f,
+	0x75, 0x6e, 0x74, 0x18, 0x04, 0x20, 0x01, 0x28, 0x03, 0x52, 0x05, 0x63, 0x6f, 0x75, 0x6e, 0x74,
+	0x12, 0x1d, 0x0a, 0x0a, 0x63, 0x6f, 0x75, 0x6e, 0x74, 0x5f, 0x64, 0x69, 0x66, 0x66, 0x18, 0x05,
+	0x20, 0x01, 0x28, 0x03, 0x52, 0x09, 0x63, 0x6f, 0x75, 0x6e, 0x74, 0x44, 0x69, 0x66, 0x66, 0x22,
+	0xca, 0x02, 0x0a, 0x15, 0x53, 0x65, 0x72, 0x76, 0x69, 0x63, 0x65, 0x4d, 0x65, 0x6d, 0x6f, 0x72,
+	0x79, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x1f, 0x0a, 0x0b, 0x69, 0x6e, 0x73,
+	0x74, 0x61, 0x6e, 0x63, 0x65, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0a,
+	0x69, 0x6e, 0x73, 0x74, 0x61, 0x6e, 0x63, 0x65, 0x49, 0x64, 0x12, 0x24, 0x0a, 0x04, 0x74, 0x79,
+	0x70, 0x65, 0x18, 0x02, 0x20, 0x01, 0x28, 0x0e, 0x32, 0x10, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x53,
+	0x65, 0x72, 0x76, 0x69, 0x63, 0x65, 0x54, 0x79, 0x70, 0x65, 0x52, 0x04, 0x74, 0x79, 0x70, 0x65,
+	0x12, 0x10, 0x0a, 0x03, 0x72, 0x73, 0x73, 0x18, 0x03, 0x20, 0x01, 0x28, 0x03, 0x52, 0x03, 0x72,
+	0x73, 0x73, 0x12, 0x19, 0x0a, 0x08, 0x70, 0x65, 0x61, 0x6b, 0x5f, 0x72, 0x73, 0x73, 0x18, 0x04,
+	0x20, 0x01, 0x28, 0x03, 0x52, 0x07, 0x70, 0x65, 0x61, 0x6b, 0x52, 0x73, 0x73, 0x12, 0x34, 0x0a,
+	0x0a, 0x73, 0x74, 0x72, 0x75, 0x63, 0x74, 0x75, 0x72, 0x65, 0x73, 0x18, 0x05, 0x20, 0x03, 0x28,
+	0x0b, 0x32, 0x14, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x4d, 0x65, 0x6d, 0x6f, 0x72, 0x79, 0x53, 0x74,
+	0x72, 0x75, 0x63, 0x74, 0x75, 0x72, 0x65, 0x52, 0x0a, 0x73, 0x74, 0x72, 0x75, 0x63, 0x74, 0x75,
+	0x72, 0x65, 0x73, 0x12, 0x21, 0x0a, 0x0c, 0x68, 0x65, 0x61, 0x70, 0x5f, 0x74, 0x72, 0x61, 0x63,
+	0x69, 0x6e, 0x67, 0x18, 0x06, 0x20, 0x01, 0x28, 0x08, 0x52, 0x0b, 0x68, 0x65, 0x61, 0x70, 0x54,
+	0x72, 0x61, 0x63, 0x69, 0x6e, 0x67, 0x12, 0x1f, 0x0a, 0x0b, 0x68, 0x65, 0x61, 0x70, 0x5f, 0x74,
+	0x72, 0x61, 0x63, 0x65, 0x64, 0x18, 0x07, 0x20, 0x01, 0x28, 0x03, 0x52, 0x0a, 0x68, 0x65, 0x61,
+	0x70, 0x54, 0x72, 0x61, 0x63, 0x65, 0x64, 0x12, 0x1b, 0x0a, 0x09, 0x68, 0x65, 0x61, 0x70, 0x5f,
+	0x70, 0x65, 0x61, 0x6b, 0x18, 0x08, 0x20, 0x01, 0x28, 0x03, 0x52, 0x08, 0x68, 0x65, 0x61, 0x70,
+	0x50, 0x65, 0x61, 0x6b, 0x12, 0x26, 0x0a, 0x04, 0x68, 0x65, 0x61, 0x70, 0x18, 0x09, 0x20, 0x03,
+	0x28, 0x0b, 0x32, 0x12, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x48, 0x65, 0x61, 0x70, 0x53, 0x74, 0x61,
+	0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x52, 0x04, 0x68, 0x65, 0x61, 0x70, 0x22, 0x6d, 0x0a, 0x1a,
 	0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x53, 0x74, 0x61, 0x74, 0x69, 0x63, 0x49,
-	0x6e, 0x66, 0x6f, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x0e, 0x0a, 0x02, 0x6f,
-	0x6b, 0x18, 0x01, 0x20, 0x01, 0x28, 0x08, 0x52, 0x02, 0x6f, 0x6b, 0x12, 0x53, 0x0a, 0x15, 0x63,
-	0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x73, 0x74, 0x61, 0x74, 0x69, 0x63, 0x5f,
-	0x69, 0x6e, 0x66, 0x6f, 0x18, 0x02, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1f, 0x2e, 0x70, 0x6f, 0x71,
-	0x2e, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x53, 0x74, 0x61, 0x74, 0x69, 0x63,
-	0x49, 0x6e, 0x66, 0x6f, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x13, 0x63, 0x68, 0x61,
-	0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x53, 0x74, 0x61, 0x74, 0x69, 0x63, 0x49, 0x6e, 0x66, 0x6f,
-	0x22, 0x72, 0x0a, 0x18, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x4c, 0x69, 0x76,
-	0x65, 0x49, 0x6e, 0x66, 0x6f, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x12, 0x21, 0x0a, 0x0c,
-	0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01,
-	0x28, 0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x49, 0x64, 0x12,
-	0x1b, 0x0a, 0x09, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x69, 0x64, 0x18, 0x02, 0x20, 0x01,
-	0x28, 0x05, 0x52, 0x08, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x49, 0x64, 0x12, 0x16, 0x0a, 0x06,
-	0x61, 0x63, 0x74, 0x69, 0x76, 0x65, 0x18, 0x03, 0x20, 0x01, 0x28, 0x08, 0x52, 0x06, 0x61, 0x63,
-	0x74, 0x69, 0x76, 0x65, 0x22, 0x3d, 0x0a, 0x18, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65,
-	0x72, 0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74,
-	0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x69, 0x64,
-	0x18, 0x01, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65,
-	0x72, 0x49, 0x64, 0x22, 0x9d, 0x01, 0x0a, 0x19, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65,
-	0x72, 0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73,
-	0x65, 0x12, 0x0e, 0x0a, 0x02, 0x6f, 0x6b, 0x18, 0x01, 0x20, 0x01, 0x28, 0x08, 0x52, 0x02, 0x6f,
-	0x6b, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x69,
-	0x64, 0x18, 0x02, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74,
-	0x65, 0x72, 0x49, 0x64, 0x12, 0x4d, 0x0a, 0x13, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65,
-	0x72, 0x5f, 0x6c, 0x69, 0x76, 0x65, 0x5f, 0x69, 0x6e, 0x66, 0x6f, 0x18, 0x03, 0x20, 0x01, 0x28,
+	0x6e, 0x66, 0x6f, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68,
+	0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05,
+	0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x49, 0x64, 0x12, 0x12, 0x0a,
+	0x04, 0x6e, 0x61, 0x6d, 0x65, 0x18, 0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x04, 0x6e, 0x61, 0x6d,
+	0x65, 0x12, 0x18, 0x0a, 0x07, 0x76, 0x65, 0x72, 0x73, 0x69, 0x6f, 0x6e, 0x18, 0x03, 0x20, 0x01,
+	0x28, 0x09, 0x52, 0x07, 0x76, 0x65, 0x72, 0x73, 0x69, 0x6f, 0x6e, 0x22, 0x3f, 0x0a, 0x1a, 0x43,
+	0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x53, 0x74, 0x61, 0x74, 0x69, 0x63, 0x49, 0x6e,
+	0x66, 0x6f, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68, 0x61,
+	0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05, 0x52,
+	0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x49, 0x64, 0x22, 0x82, 0x01, 0x0a,
+	0x1b, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x53, 0x74, 0x61, 0x74, 0x69, 0x63,
+	0x49, 0x6e, 0x66, 0x6f, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x0e, 0x0a, 0x02,
+	0x6f, 0x6b, 0x18, 0x01, 0x20, 0x01, 0x28, 0x08, 0x52, 0x02, 0x6f, 0x6b, 0x12, 0x53, 0x0a, 0x15,
+	0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x73, 0x74, 0x61, 0x74, 0x69, 0x63,
+	0x5f, 0x69, 0x6e, 0x66, 0x6f, 0x18, 0x02, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1f, 0x2e, 0x70, 0x6f,
+	0x71, 0x2e, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x53, 0x74, 0x61, 0x74, 0x69,
+	0x63, 0x49, 0x6e, 0x66, 0x6f, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x13, 0x63, 0x68,
+	0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x53, 0x74, 0x61, 0x74, 0x69, 0x63, 0x49, 0x6e, 0x66,
+	0x6f, 0x22, 0x72, 0x0a, 0x18, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x4c, 0x69,
+	0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x12, 0x21, 0x0a,
+	0x0c, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20,
+	0x01, 0x28, 0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x49, 0x64,
+	0x12, 0x1b, 0x0a, 0x09, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x69, 0x64, 0x18, 0x02, 0x20,
+	0x01, 0x28, 0x05, 0x52, 0x08, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x49, 0x64, 0x12, 0x16, 0x0a,
+	0x06, 0x61, 0x63, 0x74, 0x69, 0x76, 0x65, 0x18, 0x03, 0x20, 0x01, 0x28, 0x08, 0x52, 0x06, 0x61,
+	0x63, 0x74, 0x69, 0x76, 0x65, 0x22, 0x3d, 0x0a, 0x18, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74,
+	0x65, 0x72, 0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73,
+	0x74, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x69,
+	0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74,
+	0x65, 0x72, 0x49, 0x64, 0x22, 0x9d, 0x01, 0x0a, 0x19, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74,
+	0x65, 0x72, 0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e,
+	0x73, 0x65, 0x12, 0x0e, 0x0a, 0x02, 0x6f, 0x6b, 0x18, 0x01, 0x20, 0x01, 0x28, 0x08, 0x52, 0x02,
+	0x6f, 0x6b, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f,
+	0x69, 0x64, 0x18, 0x02, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63,
+	0x74, 0x65, 0x72, 0x49, 0x64, 0x12, 0x4d, 0x0a, 0x13, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74,
+	0x65, 0x72, 0x5f, 0x6c, 0x69, 0x76, 0x65, 0x5f, 0x69, 0x6e, 0x66, 0x6f, 0x18, 0x03, 0x20, 0x01,
+	0x28, 0x0b, 0x32, 0x1d, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74,
+	0x65, 0x72, 0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67,
+	0x65, 0x52, 0x11, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x4c, 0x69, 0x76, 0x65,
+	0x49, 0x6e, 0x66, 0x6f, 0x22, 0x3a, 0x0a, 0x15, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65,
+	0x72, 0x4c, 0x6f, 0x67, 0x69, 0x6e, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x21, 0x0a,
+	0x0c, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20,
+	0x01, 0x28, 0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x49, 0x64,
+	0x22, 0x9a, 0x01, 0x0a, 0x16, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x4c, 0x6f,
+	0x67, 0x69, 0x6e, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x0e, 0x0a, 0x02, 0x6f,
+	0x6b, 0x18, 0x01, 0x20, 0x01, 0x28, 0x08, 0x52, 0x02, 0x6f, 0x6b, 0x12, 0x21, 0x0a, 0x0c, 0x63,
+	0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x69, 0x64, 0x18, 0x02, 0x20, 0x01, 0x28,
+	0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x49, 0x64, 0x12, 0x4d,
+	0x0a, 0x13, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x6c, 0x69, 0x76, 0x65,
+	0x5f, 0x69, 0x6e, 0x66, 0x6f, 0x18, 0x03, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1d, 0x2e, 0x70, 0x6f,
+	0x71, 0x2e, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x4c, 0x69, 0x76, 0x65, 0x49,
+	0x6e, 0x66, 0x6f, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x11, 0x63, 0x68, 0x61, 0x72,
+	0x61, 0x63, 0x74, 0x65, 0x72, 0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x22, 0x3b, 0x0a,
+	0x16, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x4c, 0x6f, 0x67, 0x6f, 0x75, 0x74,
+	0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68, 0x61, 0x72, 0x61,
+	0x63, 0x74, 0x65, 0x72, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0b, 0x63,
+	0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x49, 0x64, 0x22, 0x4c, 0x0a, 0x17, 0x43, 0x68,
+	0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x4c, 0x6f, 0x67, 0x6f, 0x75, 0x74, 0x52, 0x65, 0x73,
+	0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x0e, 0x0a, 0x02, 0x6f, 0x6b, 0x18, 0x01, 0x20, 0x01, 0x28,
+	0x08, 0x52, 0x02, 0x6f, 0x6b, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74,
+	0x65, 0x72, 0x5f, 0x69, 0x64, 0x18, 0x02, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0b, 0x63, 0x68, 0x61,
+	0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x49, 0x64, 0x22, 0x3f, 0x0a, 0x1a, 0x43, 0x68, 0x61, 0x72,
+	0x61, 0x63, 0x74, 0x65, 0x72, 0x42, 0x75, 0x6c, 0x6b, 0x4c, 0x6f, 0x67, 0x6f, 0x75, 0x74, 0x52,
+	0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63,
+	0x74, 0x65, 0x72, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x03, 0x28, 0x05, 0x52, 0x0b, 0x63, 0x68,
+	0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x49, 0x64, 0x22, 0x50, 0x0a, 0x1b, 0x43, 0x68, 0x61,
+	0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x42, 0x75, 0x6c, 0x6b, 0x4c, 0x6f, 0x67, 0x6f, 0x75, 0x74,
+	0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x0e, 0x0a, 0x02, 0x6f, 0x6b, 0x18, 0x01,
+	0x20, 0x01, 0x28, 0x08, 0x52, 0x02, 0x6f, 0x6b, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68, 0x61, 0x72,
+	0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x69, 0x64, 0x18, 0x02, 0x20, 0x03, 0x28, 0x05, 0x52, 0x0b,
+	0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x49, 0x64, 0x22, 0x3a, 0x0a, 0x15, 0x43,
+	0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x54, 0x6f, 0x70, 0x69, 0x63, 0x52, 0x65, 0x71,
+	0x75, 0x65, 0x73, 0x74, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65,
+	0x72, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72,
+	0x61, 0x63, 0x74, 0x65, 0x72, 0x49, 0x64, 0x22, 0x89, 0x01, 0x0a, 0x16, 0x43, 0x68, 0x61, 0x72,
+	0x61, 0x63, 0x74, 0x65, 0x72, 0x54, 0x6f, 0x70, 0x69, 0x63, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e,
+	0x73, 0x65, 0x12, 0x0e, 0x0a, 0x02, 0x6f, 0x6b, 0x18, 0x01, 0x20, 0x01, 0x28, 0x08, 0x52, 0x02,
+	0x6f, 0x6b, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f,
+	0x69, 0x64, 0x18, 0x02, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63,
+	0x74, 0x65, 0x72, 0x49, 0x64, 0x12, 0x3c, 0x0a, 0x10, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74,
+	0x65, 0x72, 0x5f, 0x74, 0x6f, 0x70, 0x69, 0x63, 0x73, 0x18, 0x03, 0x20, 0x01, 0x28, 0x0b, 0x32,
+	0x11, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x54, 0x6f, 0x70, 0x69, 0x63, 0x4d, 0x65, 0x73, 0x73, 0x61,
+	0x67, 0x65, 0x52, 0x0f, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x54, 0x6f, 0x70,
+	0x69, 0x63, 0x73, 0x22, 0x56, 0x0a, 0x14, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72,
+	0x4d, 0x6f, 0x76, 0x65, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x21, 0x0a, 0x0c, 0x63,
+	0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28,
+	0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x49, 0x64, 0x12, 0x1b,
+	0x0a, 0x09, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x69, 0x64, 0x18, 0x02, 0x20, 0x01, 0x28,
+	0x05, 0x52, 0x08, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x49, 0x64, 0x22, 0x99, 0x01, 0x0a, 0x15,
+	0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x4d, 0x6f, 0x76, 0x65, 0x52, 0x65, 0x73,
+	0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x0e, 0x0a, 0x02, 0x6f, 0x6b, 0x18, 0x01, 0x20, 0x01, 0x28,
+	0x08, 0x52, 0x02, 0x6f, 0x6b, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74,
+	0x65, 0x72, 0x5f, 0x69, 0x64, 0x18, 0x02, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0b, 0x63, 0x68, 0x61,
+	0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x49, 0x64, 0x12, 0x4d, 0x0a, 0x13, 0x63, 0x68, 0x61, 0x72,
+	0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x6c, 0x69, 0x76, 0x65, 0x5f, 0x69, 0x6e, 0x66, 0x6f, 0x18,
+	0x03, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1d, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x43, 0x68, 0x61, 0x72,
+	0x61, 0x63, 0x74, 0x65, 0x72, 0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x4d, 0x65, 0x73,
+	0x73, 0x61, 0x67, 0x65, 0x52, 0x11, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x4c,
+	0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x22, 0x5e, 0x0a, 0x18, 0x43, 0x68, 0x61, 0x72, 0x61,
+	0x63, 0x74, 0x65, 0x72, 0x50, 0x72, 0x65, 0x73, 0x65, 0x6e, 0x63, 0x65, 0x52, 0x65, 0x71, 0x75,
+	0x65, 0x73, 0x74, 0x12, 0x2c, 0x0a, 0x12, 0x61, 0x66, 0x74, 0x65, 0x72, 0x5f, 0x63, 0x68, 0x61,
+	0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05, 0x52,
+	0x10, 0x61, 0x66, 0x74, 0x65, 0x72, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x49,
+	0x64, 0x12, 0x14, 0x0a, 0x05, 0x6c, 0x69, 0x6d, 0x69, 0x74, 0x18, 0x02, 0x20, 0x01, 0x28, 0x05,
+	0x52, 0x05, 0x6c, 0x69, 0x6d, 0x69, 0x74, 0x22, 0x8e, 0x01, 0x0a, 0x19, 0x43, 0x68, 0x61, 0x72,
+	0x61, 0x63, 0x74, 0x65, 0x72, 0x50, 0x72, 0x65, 0x73, 0x65, 0x6e, 0x63, 0x65, 0x52, 0x65, 0x73,
+	0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x0e, 0x0a, 0x02, 0x6f, 0x6b, 0x18, 0x01, 0x20, 0x01, 0x28,
+	0x08, 0x52, 0x02, 0x6f, 0x6b, 0x12, 0x4d, 0x0a, 0x13, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74,
+	0x65, 0x72, 0x5f, 0x6c, 0x69, 0x76, 0x65, 0x5f, 0x69, 0x6e, 0x66, 0x6f, 0x18, 0x02, 0x20, 0x03,
+	0x28, 0x0b, 0x32, 0x1d, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74,
+	0x65, 0x72, 0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67,
+	0x65, 0x52, 0x11, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x4c, 0x69, 0x76, 0x65,
+	0x49, 0x6e, 0x66, 0x6f, 0x12, 0x12, 0x0a, 0x04, 0x6d, 0x6f, 0x72, 0x65, 0x18, 0x03, 0x20, 0x01,
+	0x28, 0x08, 0x52, 0x04, 0x6d, 0x6f, 0x72, 0x65, 0x22, 0x64, 0x0a, 0x0e, 0x43, 0x68, 0x61, 0x74,
+	0x74, 0x65, 0x72, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68,
+	0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05,
+	0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x49, 0x64, 0x12, 0x1b, 0x0a,
+	0x09, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x69, 0x64, 0x18, 0x02, 0x20, 0x01, 0x28, 0x05,
+	0x52, 0x08, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x49, 0x64, 0x12, 0x12, 0x0a, 0x04, 0x74, 0x65,
+	0x78, 0x74, 0x18, 0x03, 0x20, 0x01, 0x28, 0x09, 0x52, 0x04, 0x74, 0x65, 0x78, 0x74, 0x22, 0x32,
+	0x0a, 0x13, 0x43, 0x68, 0x61, 0x74, 0x74, 0x65, 0x72, 0x54, 0x6f, 0x70, 0x69, 0x63, 0x52, 0x65,
+	0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x1b, 0x0a, 0x09, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f,
+	0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05, 0x52, 0x08, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d,
+	0x49, 0x64, 0x22, 0x7d, 0x0a, 0x14, 0x43, 0x68, 0x61, 0x74, 0x74, 0x65, 0x72, 0x54, 0x6f, 0x70,
+	0x69, 0x63, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x0e, 0x0a, 0x02, 0x6f, 0x6b,
+	0x18, 0x01, 0x20, 0x01, 0x28, 0x08, 0x52, 0x02, 0x6f, 0x6b, 0x12, 0x1b, 0x0a, 0x09, 0x73, 0x79,
+	0x73, 0x74, 0x65, 0x6d, 0x5f, 0x69, 0x64, 0x18, 0x02, 0x20, 0x01, 0x28, 0x05, 0x52, 0x08, 0x73,
+	0x79, 0x73, 0x74, 0x65, 0x6d, 0x49, 0x64, 0x12, 0x38, 0x0a, 0x0e, 0x63, 0x68, 0x61, 0x74, 0x74,
+	0x65, 0x72, 0x5f, 0x74, 0x6f, 0x70, 0x69, 0x63, 0x73, 0x18, 0x03, 0x20, 0x01, 0x28, 0x0b, 0x32,
+	0x11, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x54, 0x6f, 0x70, 0x69, 0x63, 0x4d, 0x65, 0x73, 0x73, 0x61,
+	0x67, 0x65, 0x52, 0x0d, 0x63, 0x68, 0x61, 0x74, 0x74, 0x65, 0x72, 0x54, 0x6f, 0x70, 0x69, 0x63,
+	0x73, 0x22, 0x6a, 0x0a, 0x17, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x53, 0x74, 0x61, 0x74, 0x69,
+	0x63, 0x49, 0x6e, 0x66, 0x6f, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x12, 0x1b, 0x0a, 0x09,
+	0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05, 0x52,
+	0x08, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x49, 0x64, 0x12, 0x12, 0x0a, 0x04, 0x6e, 0x61, 0x6d,
+	0x65, 0x18, 0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x04, 0x6e, 0x61, 0x6d, 0x65, 0x12, 0x1e, 0x0a,
+	0x0a, 0x6e, 0x65, 0x69, 0x67, 0x68, 0x62, 0x6f, 0x75, 0x72, 0x73, 0x18, 0x03, 0x20, 0x03, 0x28,
+	0x05, 0x52, 0x0a, 0x6e, 0x65, 0x69, 0x67, 0x68, 0x62, 0x6f, 0x75, 0x72, 0x73, 0x22, 0x0a, 0x0a,
+	0x08, 0x55, 0x6e, 0x69, 0x76, 0x65, 0x72, 0x73, 0x65, 0x22, 0x7d, 0x0a, 0x0f, 0x55, 0x6e, 0x69,
+	0x76, 0x65, 0x72, 0x73, 0x65, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x18, 0x0a, 0x07,
+	0x76, 0x65, 0x72, 0x73, 0x69, 0x6f, 0x6e, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x07, 0x76,
+	0x65, 0x72, 0x73, 0x69, 0x6f, 0x6e, 0x12, 0x1b, 0x0a, 0x09, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d,
+	0x5f, 0x69, 0x64, 0x18, 0x02, 0x20, 0x01, 0x28, 0x05, 0x52, 0x08, 0x73, 0x79, 0x73, 0x74, 0x65,
+	0x6d, 0x49, 0x64, 0x12, 0x14, 0x0a, 0x05, 0x6a, 0x75, 0x6d, 0x70, 0x73, 0x18, 0x03, 0x20, 0x01,
+	0x28, 0x05, 0x52, 0x05, 0x6a, 0x75, 0x6d, 0x70, 0x73, 0x12, 0x1d, 0x0a, 0x0a, 0x73, 0x79, 0x73,
+	0x74, 0x65, 0x6d, 0x5f, 0x69, 0x64, 0x73, 0x18, 0x04, 0x20, 0x03, 0x28, 0x05, 0x52, 0x09, 0x73,
+	0x79, 0x73, 0x74, 0x65, 0x6d, 0x49, 0x64, 0x73, 0x22, 0x74, 0x0a, 0x10, 0x55, 0x6e, 0x69, 0x76,
+	0x65, 0x72, 0x73, 0x65, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x0e, 0x0a, 0x02,
+	0x6f, 0x6b, 0x18, 0x01, 0x20, 0x01, 0x28, 0x08, 0x52, 0x02, 0x6f, 0x6b, 0x12, 0x36, 0x0a, 0x07,
+	0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x73, 0x18, 0x02, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x1c, 0x2e,
+	0x70, 0x6f, 0x71, 0x2e, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x53, 0x74, 0x61, 0x74, 0x69, 0x63,
+	0x49, 0x6e, 0x66, 0x6f, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x07, 0x73, 0x79, 0x73,
+	0x74, 0x65, 0x6d, 0x73, 0x12, 0x18, 0x0a, 0x07, 0x76, 0x65, 0x72, 0x73, 0x69, 0x6f, 0x6e, 0x18,
+	0x03, 0x20, 0x01, 0x28, 0x09, 0x52, 0x07, 0x76, 0x65, 0x72, 0x73, 0x69, 0x6f, 0x6e, 0x22, 0x36,
+	0x0a, 0x17, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x53, 0x74, 0x61, 0x74, 0x69, 0x63, 0x49, 0x6e,
+	0x66, 0x6f, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x1b, 0x0a, 0x09, 0x73, 0x79, 0x73,
+	0x74, 0x65, 0x6d, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05, 0x52, 0x08, 0x73, 0x79,
+	0x73, 0x74, 0x65, 0x6d, 0x49, 0x64, 0x22, 0x93, 0x01, 0x0a, 0x18, 0x53, 0x79, 0x73, 0x74, 0x65,
+	0x6d, 0x53, 0x74, 0x61, 0x74, 0x69, 0x63, 0x49, 0x6e, 0x66, 0x6f, 0x52, 0x65, 0x73, 0x70, 0x6f,
+	0x6e, 0x73, 0x65, 0x12, 0x0e, 0x0a, 0x02, 0x6f, 0x6b, 0x18, 0x01, 0x20, 0x01, 0x28, 0x08, 0x52,
+	0x02, 0x6f, 0x6b, 0x12, 0x1b, 0x0a, 0x09, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x69, 0x64,
+	0x18, 0x02, 0x20, 0x01, 0x28, 0x05, 0x52, 0x08, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x49, 0x64,
+	0x12, 0x4a, 0x0a, 0x12, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x73, 0x74, 0x61, 0x74, 0x69,
+	0x63, 0x5f, 0x69, 0x6e, 0x66, 0x6f, 0x18, 0x03, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1c, 0x2e, 0x70,
+	0x6f, 0x71, 0x2e, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x53, 0x74, 0x61, 0x74, 0x69, 0x63, 0x49,
+	0x6e, 0x66, 0x6f, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x10, 0x73, 0x79, 0x73, 0x74,
+	0x65, 0x6d, 0x53, 0x74, 0x61, 0x74, 0x69, 0x63, 0x49, 0x6e, 0x66, 0x6f, 0x22, 0x57, 0x0a, 0x15,
+	0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x4d, 0x65,
+	0x73, 0x73, 0x61, 0x67, 0x65, 0x12, 0x1b, 0x0a, 0x09, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f,
+	0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05, 0x52, 0x08, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d,
+	0x49, 0x64, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f,
+	0x69, 0x64, 0x18, 0x02, 0x20, 0x03, 0x28, 0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63,
+	0x74, 0x65, 0x72, 0x49, 0x64, 0x22, 0x34, 0x0a, 0x15, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x4c,
+	0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x1b,
+	0x0a, 0x09, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28,
+	0x05, 0x52, 0x08, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x49, 0x64, 0x22, 0xda, 0x01, 0x0a, 0x16,
+	0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x52, 0x65,
+	0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x0e, 0x0a, 0x02, 0x6f, 0x6b, 0x18, 0x01, 0x20, 0x01,
+	0x28, 0x08, 0x52, 0x02, 0x6f, 0x6b, 0x12, 0x1b, 0x0a, 0x09, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d,
+	0x5f, 0x69, 0x64, 0x18, 0x02, 0x20, 0x01, 0x28, 0x05, 0x52, 0x08, 0x73, 0x79, 0x73, 0x74, 0x65,
+	0x6d, 0x49, 0x64, 0x12, 0x44, 0x0a, 0x10, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x6c, 0x69,
+	0x76, 0x65, 0x5f, 0x69, 0x6e, 0x66, 0x6f, 0x18, 0x03, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1a, 0x2e,
+	0x70, 0x6f, 0x71, 0x2e, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e,
+	0x66, 0x6f, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x0e, 0x73, 0x79, 0x73, 0x74, 0x65,
+	0x6d, 0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x12, 0x4d, 0x0a, 0x13, 0x63, 0x68, 0x61,
+	0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x6c, 0x69, 0x76, 0x65, 0x5f, 0x69, 0x6e, 0x66, 0x6f,
+	0x18, 0x04, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x1d, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x43, 0x68, 0x61,
+	0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x4d, 0x65,
+	0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x11, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72,
+	0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x22, 0x88, 0x01, 0x0a, 0x1a, 0x53, 0x79, 0x73,
+	0x74, 0x65, 0x6d, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x46, 0x65, 0x65, 0x64,
+	0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x12, 0x1b, 0x0a, 0x09, 0x73, 0x79, 0x73, 0x74, 0x65,
+	0x6d, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05, 0x52, 0x08, 0x73, 0x79, 0x73, 0x74,
+	0x65, 0x6d, 0x49, 0x64, 0x12, 0x4d, 0x0a, 0x13, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65,
+	0x72, 0x5f, 0x6c, 0x69, 0x76, 0x65, 0x5f, 0x69, 0x6e, 0x66, 0x6f, 0x18, 0x02, 0x20, 0x03, 0x28,
 	0x0b, 0x32, 0x1d, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65,
 	0x72, 0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65,
 	0x52, 0x11, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x4c, 0x69, 0x76, 0x65, 0x49,
-	0x6e, 0x66, 0x6f, 0x22, 0x3a, 0x0a, 0x15, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72,
-	0x4c, 0x6f, 0x67, 0x69, 0x6e, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x21, 0x0a, 0x0c,
-	0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01,
-	0x28, 0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x49, 0x64, 0x22,
-	0x9a, 0x01, 0x0a, 0x16, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x4c, 0x6f, 0x67,
-	0x69, 0x6e, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x0e, 0x0a, 0x02, 0x6f, 0x6b,
-	0x18, 0x01, 0x20, 0x01, 0x28, 0x08, 0x52, 0x02, 0x6f, 0x6b, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68,
-	0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x69, 0x64, 0x18, 0x02, 0x20, 0x01, 0x28, 0x05,
-	0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x49, 0x64, 0x12, 0x4d, 0x0a,
-	0x13, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x6c, 0x69, 0x76, 0x65, 0x5f,
-	0x69, 0x6e, 0x66, 0x6f, 0x18, 0x03, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1d, 0x2e, 0x70, 0x6f, 0x71,
-	0x2e, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e,
-	0x66, 0x6f, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x11, 0x63, 0x68, 0x61, 0x72, 0x61,
-	0x63, 0x74, 0x65, 0x72, 0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x22, 0x3b, 0x0a, 0x16,
-	0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x4c, 0x6f, 0x67, 0x6f, 0x75, 0x74, 0x52,
-	0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63,
-	0x74, 0x65, 0x72, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0b, 0x63, 0x68,
-	0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x49, 0x64, 0x22, 0x4c, 0x0a, 0x17, 0x43, 0x68, 0x61,
-	0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x4c, 0x6f, 0x67, 0x6f, 0x75, 0x74, 0x52, 0x65, 0x73, 0x70,
-	0x6f, 0x6e, 0x73, 0x65, 0x12, 0x0e, 0x0a, 0x02, 0x6f, 0x6b, 0x18, 0x01, 0x20, 0x01, 0x28, 0x08,
-	0x52, 0x02, 0x6f, 0x6b, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65,
-	0x72, 0x5f, 0x69, 0x64, 0x18, 0x02, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72,
-	0x61, 0x63, 0x74, 0x65, 0x72, 0x49, 0x64, 0x22, 0x3a, 0x0a, 0x15, 0x43, 0x68, 0x61, 0x72, 0x61,
-	0x63, 0x74, 0x65, 0x72, 0x54, 0x6f, 0x70, 0x69, 0x63, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74,
+	0x6e, 0x66, 0x6f, 0x22, 0x79, 0x0a, 0x1d, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x53, 0x65, 0x74,
+	0x4c, 0x69, 0x76, 0x65, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x52, 0x65, 0x71,
+	0x75, 0x65, 0x73, 0x74, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65,
+	0x72, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72,
+	0x61, 0x63, 0x74, 0x65, 0x72, 0x49, 0x64, 0x12, 0x1b, 0x0a, 0x09, 0x73, 0x79, 0x73, 0x74, 0x65,
+	0x6d, 0x5f, 0x69, 0x64, 0x18, 0x02, 0x20, 0x01, 0x28, 0x05, 0x52, 0x08, 0x73, 0x79, 0x73, 0x74,
+	0x65, 0x6d, 0x49, 0x64, 0x12, 0x18, 0x0a, 0x07, 0x70, 0x72, 0x65, 0x73, 0x65, 0x6e, 0x74, 0x18,
+	0x03, 0x20, 0x01, 0x28, 0x08, 0x52, 0x07, 0x70, 0x72, 0x65, 0x73, 0x65, 0x6e, 0x74, 0x22, 0x70,
+	0x0a, 0x1e, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x53, 0x65, 0x74, 0x4c, 0x69, 0x76, 0x65, 0x43,
+	0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65,
+	0x12, 0x0e, 0x0a, 0x02, 0x6f, 0x6b, 0x18, 0x01, 0x20, 0x01, 0x28, 0x08, 0x52, 0x02, 0x6f, 0x6b,
 	0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x69, 0x64,
-	0x18, 0x01, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65,
-	0x72, 0x49, 0x64, 0x22, 0x89, 0x01, 0x0a, 0x16, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65,
-	0x72, 0x54, 0x6f, 0x70, 0x69, 0x63, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x0e,
-	0x0a, 0x02, 0x6f, 0x6b, 0x18, 0x01, 0x20, 0x01, 0x28, 0x08, 0x52, 0x02, 0x6f, 0x6b, 0x12, 0x21,
-	0x0a, 0x0c, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x69, 0x64, 0x18, 0x02,
-	0x20, 0x01, 0x28, 0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x49,
-	0x64, 0x12, 0x3c, 0x0a, 0x10, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x74,
-	0x6f, 0x70, 0x69, 0x63, 0x73, 0x18, 0x03, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x11, 0x2e, 0x70, 0x6f,
-	0x71, 0x2e, 0x54, 0x6f, 0x70, 0x69, 0x63, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x0f,
-	0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x54, 0x6f, 0x70, 0x69, 0x63, 0x73, 0x22,
-	0x64, 0x0a, 0x0e, 0x43, 0x68, 0x61, 0x74, 0x74, 0x65, 0x72, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67,
-	0x65, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x69,
-	0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74,
-	0x65, 0x72, 0x49, 0x64, 0x12, 0x1b, 0x0a, 0x09, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x69,
-	0x64, 0x18, 0x02, 0x20, 0x01, 0x28, 0x05, 0x52, 0x08, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x49,
-	0x64, 0x12, 0x12, 0x0a, 0x04, 0x74, 0x65, 0x78, 0x74, 0x18, 0x03, 0x20, 0x01, 0x28, 0x09, 0x52,
-	0x04, 0x74, 0x65, 0x78, 0x74, 0x22, 0x32, 0x0a, 0x13, 0x43, 0x68, 0x61, 0x74, 0x74, 0x65, 0x72,
-	0x54, 0x6f, 0x70, 0x69, 0x63, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x1b, 0x0a, 0x09,
-	0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05, 0x52,
-	0x08, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x49, 0x64, 0x22, 0x7d, 0x0a, 0x14, 0x43, 0x68, 0x61,
-	0x74, 0x74, 0x65, 0x72, 0x54, 0x6f, 0x70, 0x69, 0x63, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73,
-	0x65, 0x12, 0x0e, 0x0a, 0x02, 0x6f, 0x6b, 0x18, 0x01, 0x20, 0x01, 0x28, 0x08, 0x52, 0x02, 0x6f,
-	0x6b, 0x12, 0x1b, 0x0a, 0x09, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x69, 0x64, 0x18, 0x02,
-	0x20, 0x01, 0x28, 0x05, 0x52, 0x08, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x49, 0x64, 0x12, 0x38,
-	0x0a, 0x0e, 0x63, 0x68, 0x61, 0x74, 0x74, 0x65, 0x72, 0x5f, 0x74, 0x6f, 0x70, 0x69, 0x63, 0x73,
-	0x18, 0x03, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x11, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x54, 0x6f, 0x70,
-	0x69, 0x63, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x0d, 0x63, 0x68, 0x61, 0x74, 0x74,
-	0x65, 0x72, 0x54, 0x6f, 0x70, 0x69, 0x63, 0x73, 0x22, 0x6a, 0x0a, 0x17, 0x53, 0x79, 0x73, 0x74,
-	0x65, 0x6d, 0x53, 0x74, 0x61, 0x74, 0x69, 0x63, 0x49, 0x6e, 0x66, 0x6f, 0x4d, 0x65, 0x73, 0x73,
-	0x61, 0x67, 0x65, 0x12, 0x1b, 0x0a, 0x09, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x69, 0x64,
-	0x18, 0x01, 0x20, 0x01, 0x28, 0x05, 0x52, 0x08, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x49, 0x64,
-	0x12, 0x12, 0x0a, 0x04, 0x6e, 0x61, 0x6d, 0x65, 0x18, 0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x04,
-	0x6e, 0x61, 0x6d, 0x65, 0x12, 0x1e, 0x0a, 0x0a, 0x6e, 0x65, 0x69, 0x67, 0x68, 0x62, 0x6f, 0x75,
-	0x72, 0x73, 0x18, 0x03, 0x20, 0x03, 0x28, 0x05, 0x52, 0x0a, 0x6e, 0x65, 0x69, 0x67, 0x68, 0x62,
-	0x6f, 0x75, 0x72, 0x73, 0x22, 0x0a, 0x0a, 0x08, 0x55, 0x6e, 0x69, 0x76, 0x65, 0x72, 0x73, 0x65,
-	0x22, 0x11, 0x0a, 0x0f, 0x55, 0x6e, 0x69, 0x76, 0x65, 0x72, 0x73, 0x65, 0x52, 0x65, 0x71, 0x75,
-	0x65, 0x73, 0x74, 0x22, 0x5a, 0x0a, 0x10, 0x55, 0x6e, 0x69, 0x76, 0x65, 0x72, 0x73, 0x65, 0x52,
-	0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x0e, 0x0a, 0x02, 0x6f, 0x6b, 0x18, 0x01, 0x20,
-	0x01, 0x28, 0x08, 0x52, 0x02, 0x6f, 0x6b, 0x12, 0x36, 0x0a, 0x07, 0x73, 0x79, 0x73, 0x74, 0x65,
-	0x6d, 0x73, 0x18, 0x02, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x1c, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x53,
-	0x79, 0x73, 0x74, 0x65, 0x6d, 0x53, 0x74, 0x61, 0x74, 0x69, 0x63, 0x49, 0x6e, 0x66, 0x6f, 0x4d,
-	0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x07, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x73, 0x22,
-	0x36, 0x0a, 0x17, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x53, 0x74, 0x61, 0x74, 0x69, 0x63, 0x49,
-	0x6e, 0x66, 0x6f, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x1b, 0x0a, 0x09, 0x73, 0x79,
-	0x73, 0x74, 0x65, 0x6d, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05, 0x52, 0x08, 0x73,
-	0x79, 0x73, 0x74, 0x65, 0x6d, 0x49, 0x64, 0x22, 0x93, 0x01, 0x0a, 0x18, 0x53, 0x79, 0x73, 0x74,
-	0x65, 0x6d, 0x53, 0x74, 0x61, 0x74, 0x69, 0x63, 0x49, 0x6e, 0x66, 0x6f, 0x52, 0x65, 0x73, 0x70,
-	0x6f, 0x6e, 0x73, 0x65, 0x12, 0x0e, 0x0a, 0x02, 0x6f, 0x6b, 0x18, 0x01, 0x20, 0x01, 0x28, 0x08,
-	0x52, 0x02, 0x6f, 0x6b, 0x12, 0x1b, 0x0a, 0x09, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x69,
-	0x64, 0x18, 0x02, 0x20, 0x01, 0x28, 0x05, 0x52, 0x08, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x49,
-	0x64, 0x12, 0x4a, 0x0a, 0x12, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x73, 0x74, 0x61, 0x74,
-	0x69, 0x63, 0x5f, 0x69, 0x6e, 0x66, 0x6f, 0x18, 0x03, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1c, 0x2e,
-	0x70, 0x6f, 0x71, 0x2e, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x53, 0x74, 0x61, 0x74, 0x69, 0x63,
-	0x49, 0x6e, 0x66, 0x6f, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x10, 0x73, 0x79, 0x73,
-	0x74, 0x65, 0x6d, 0x53, 0x74, 0x61, 0x74, 0x69, 0x63, 0x49, 0x6e, 0x66, 0x6f, 0x22, 0x57, 0x0a,
-	0x15, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x4d,
+	0x18, 0x02, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65,
+	0x72, 0x49, 0x64, 0x12, 0x1b, 0x0a, 0x09, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x69, 0x64,
+	0x18, 0x03, 0x20, 0x01, 0x28, 0x05, 0x52, 0x08, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x49, 0x64,
+	0x22, 0x63, 0x0a, 0x21, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x42, 0x75, 0x6c, 0x6b, 0x53, 0x65,
+	0x74, 0x4c, 0x69, 0x76, 0x65, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x52, 0x65,
+	0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x3e, 0x0a, 0x08, 0x70, 0x72, 0x65, 0x73, 0x65, 0x6e, 0x63,
+	0x65, 0x18, 0x01, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x22, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x53, 0x79,
+	0x73, 0x74, 0x65, 0x6d, 0x53, 0x65, 0x74, 0x4c, 0x69, 0x76, 0x65, 0x43, 0x68, 0x61, 0x72, 0x61,
+	0x63, 0x74, 0x65, 0x72, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x52, 0x08, 0x70, 0x72, 0x65,
+	0x73, 0x65, 0x6e, 0x63, 0x65, 0x22, 0x7e, 0x0a, 0x11, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x4d,
+	0x6f, 0x76, 0x65, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68,
+	0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05,
+	0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x49, 0x64, 0x12, 0x24, 0x0a,
+	0x0e, 0x66, 0x72, 0x6f, 0x6d, 0x5f, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x69, 0x64, 0x18,
+	0x02, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0c, 0x66, 0x72, 0x6f, 0x6d, 0x53, 0x79, 0x73, 0x74, 0x65,
+	0x6d, 0x49, 0x64, 0x12, 0x20, 0x0a, 0x0c, 0x74, 0x6f, 0x5f, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d,
+	0x5f, 0x69, 0x64, 0x18, 0x03, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0a, 0x74, 0x6f, 0x53, 0x79, 0x73,
+	0x74, 0x65, 0x6d, 0x49, 0x64, 0x22, 0x64, 0x0a, 0x12, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x4d,
+	0x6f, 0x76, 0x65, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x0e, 0x0a, 0x02, 0x6f,
+	0x6b, 0x18, 0x01, 0x20, 0x01, 0x28, 0x08, 0x52, 0x02, 0x6f, 0x6b, 0x12, 0x21, 0x0a, 0x0c, 0x63,
+	0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x69, 0x64, 0x18, 0x02, 0x20, 0x01, 0x28,
+	0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x49, 0x64, 0x12, 0x1b,
+	0x0a, 0x09, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x69, 0x64, 0x18, 0x03, 0x20, 0x01, 0x28,
+	0x05, 0x52, 0x08, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x49, 0x64, 0x22, 0x56, 0x0a, 0x17, 0x53,
+	0x79, 0x73, 0x74, 0x65, 0x6d, 0x50, 0x6f, 0x70, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x4d,
 	0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x12, 0x1b, 0x0a, 0x09, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d,
 	0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05, 0x52, 0x08, 0x73, 0x79, 0x73, 0x74, 0x65,
-	0x6d, 0x49, 0x64, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72,
-	0x5f, 0x69, 0x64, 0x18, 0x02, 0x20, 0x03, 0x28, 0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61,
-	0x63, 0x74, 0x65, 0x72, 0x49, 0x64, 0x22, 0x34, 0x0a, 0x15, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d,
-	0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12,
+	0x6d, 0x49, 0x64, 0x12, 0x1e, 0x0a, 0x0a, 0x70, 0x6f, 0x70, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f,
+	0x6e, 0x18, 0x02, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0a, 0x70, 0x6f, 0x70, 0x75, 0x6c, 0x61, 0x74,
+	0x69, 0x6f, 0x6e, 0x22, 0x59, 0x0a, 0x14, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x57, 0x68, 0x65,
+	0x72, 0x65, 0x49, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x21, 0x0a, 0x0c, 0x63,
+	0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x03, 0x28,
+	0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x49, 0x64, 0x12, 0x1e,
+	0x0a, 0x0a, 0x70, 0x6f, 0x70, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x18, 0x02, 0x20, 0x01,
+	0x28, 0x08, 0x52, 0x0a, 0x70, 0x6f, 0x70, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x22, 0xb4,
+	0x01, 0x0a, 0x15, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x57, 0x68, 0x65, 0x72, 0x65, 0x49, 0x73,
+	0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x0e, 0x0a, 0x02, 0x6f, 0x6b, 0x18, 0x01,
+	0x20, 0x01, 0x28, 0x08, 0x52, 0x02, 0x6f, 0x6b, 0x12, 0x4d, 0x0a, 0x13, 0x63, 0x68, 0x61, 0x72,
+	0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x6c, 0x69, 0x76, 0x65, 0x5f, 0x69, 0x6e, 0x66, 0x6f, 0x18,
+	0x02, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x1d, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x43, 0x68, 0x61, 0x72,
+	0x61, 0x63, 0x74, 0x65, 0x72, 0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x4d, 0x65, 0x73,
+	0x73, 0x61, 0x67, 0x65, 0x52, 0x11, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x4c,
+	0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x12, 0x3c, 0x0a, 0x0a, 0x70, 0x6f, 0x70, 0x75, 0x6c,
+	0x61, 0x74, 0x69, 0x6f, 0x6e, 0x18, 0x03, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x1c, 0x2e, 0x70, 0x6f,
+	0x71, 0x2e, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x50, 0x6f, 0x70, 0x75, 0x6c, 0x61, 0x74, 0x69,
+	0x6f, 0x6e, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x0a, 0x70, 0x6f, 0x70, 0x75, 0x6c,
+	0x61, 0x74, 0x69, 0x6f, 0x6e, 0x22, 0x31, 0x0a, 0x12, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x54,
+	0x6f, 0x70, 0x69, 0x63, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x1b, 0x0a, 0x09, 0x73,
+	0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05, 0x52, 0x08,
+	0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x49, 0x64, 0x22, 0x7a, 0x0a, 0x13, 0x53, 0x79, 0x73, 0x74,
+	0x65, 0x6d, 0x54, 0x6f, 0x70, 0x69, 0x63, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12,
+	0x0e, 0x0a, 0x02, 0x6f, 0x6b, 0x18, 0x01, 0x20, 0x01, 0x28, 0x08, 0x52, 0x02, 0x6f, 0x6b, 0x12,
+	0x1b, 0x0a, 0x09, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x69, 0x64, 0x18, 0x02, 0x20, 0x01,
+	0x28, 0x05, 0x52, 0x08, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x49, 0x64, 0x12, 0x36, 0x0a, 0x0d,
+	0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x74, 0x6f, 0x70, 0x69, 0x63, 0x73, 0x18, 0x03, 0x20,
+	0x01, 0x28, 0x0b, 0x32, 0x11, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x54, 0x6f, 0x70, 0x69, 0x63, 0x4d,
+	0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x0c, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x54, 0x6f,
+	0x70, 0x69, 0x63, 0x73, 0x22, 0xa0, 0x01, 0x0a, 0x14, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x48,
+	0x69, 0x73, 0x74, 0x6f, 0x72, 0x79, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x1b, 0x0a,
+	0x09, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05,
+	0x52, 0x08, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x49, 0x64, 0x12, 0x14, 0x0a, 0x05, 0x6a, 0x75,
+	0x6d, 0x70, 0x73, 0x18, 0x02, 0x20, 0x01, 0x28, 0x05, 0x52, 0x05, 0x6a, 0x75, 0x6d, 0x70, 0x73,
+	0x12, 0x1d, 0x0a, 0x0a, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x69, 0x64, 0x73, 0x18, 0x03,
+	0x20, 0x03, 0x28, 0x05, 0x52, 0x09, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x49, 0x64, 0x73, 0x12,
+	0x1e, 0x0a, 0x0a, 0x72, 0x65, 0x73, 0x6f, 0x6c, 0x75, 0x74, 0x69, 0x6f, 0x6e, 0x18, 0x04, 0x20,
+	0x01, 0x28, 0x09, 0x52, 0x0a, 0x72, 0x65, 0x73, 0x6f, 0x6c, 0x75, 0x74, 0x69, 0x6f, 0x6e, 0x12,
+	0x16, 0x0a, 0x06, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x73, 0x18, 0x05, 0x20, 0x01, 0x28, 0x05, 0x52,
+	0x06, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x73, 0x22, 0x5b, 0x0a, 0x14, 0x53, 0x79, 0x73, 0x74, 0x65,
+	0x6d, 0x48, 0x69, 0x73, 0x74, 0x6f, 0x72, 0x79, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x12,
 	0x1b, 0x0a, 0x09, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01,
-	0x28, 0x05, 0x52, 0x08, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x49, 0x64, 0x22, 0x8b, 0x01, 0x0a,
-	0x16, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x52,
-	0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x0e, 0x0a, 0x02, 0x6f, 0x6b, 0x18, 0x01, 0x20,
-	0x01, 0x28, 0x08, 0x52, 0x02, 0x6f, 0x6b, 0x12, 0x1b, 0x0a, 0x09, 0x73, 0x79, 0x73, 0x74, 0x65,
-	0x6d, 0x5f, 0x69, 0x64, 0x18, 0x02, 0x20, 0x01, 0x28, 0x05, 0x52, 0x08, 0x73, 0x79, 0x73, 0x74,
-	0x65, 0x6d, 0x49, 0x64, 0x12, 0x44, 0x0a, 0x10, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x6c,
-	0x69, 0x76, 0x65, 0x5f, 0x69, 0x6e, 0x66, 0x6f, 0x18, 0x03, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1a,
-	0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x4c, 0x69, 0x76, 0x65, 0x49,
-	0x6e, 0x66, 0x6f, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x0e, 0x73, 0x79, 0x73, 0x74,
-	0x65, 0x6d, 0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x22, 0x79, 0x0a, 0x1d, 0x53, 0x79,
-	0x73, 0x74, 0x65, 0x6d, 0x53, 0x65, 0x74, 0x4c, 0x69, 0x76, 0x65, 0x43, 0x68, 0x61, 0x72, 0x61,
-	0x63, 0x74, 0x65, 0x72, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x21, 0x0a, 0x0c, 0x63,
-	0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28,
-	0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x49, 0x64, 0x12, 0x1b,
-	0x0a, 0x09, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x69, 0x64, 0x18, 0x02, 0x20, 0x01, 0x28,
-	0x05, 0x52, 0x08, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x49, 0x64, 0x12, 0x18, 0x0a, 0x07, 0x70,
-	0x72, 0x65, 0x73, 0x65, 0x6e, 0x74, 0x18, 0x03, 0x20, 0x01, 0x28, 0x08, 0x52, 0x07, 0x70, 0x72,
-	0x65, 0x73, 0x65, 0x6e, 0x74, 0x22, 0x70, 0x0a, 0x1e, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x53,
-	0x65, 0x74, 0x4c, 0x69, 0x76, 0x65, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x52,
-	0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x0e, 0x0a, 0x02, 0x6f, 0x6b, 0x18, 0x01, 0x20,
-	0x01, 0x28, 0x08, 0x52, 0x02, 0x6f, 0x6b, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68, 0x61, 0x72, 0x61,
+	0x28, 0x05, 0x52, 0x08, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x49, 0x64, 0x12, 0x12, 0x0a, 0x04,
+	0x6d, 0x65, 0x61, 0x6e, 0x18, 0x02, 0x20, 0x03, 0x28, 0x02, 0x52, 0x04, 0x6d, 0x65, 0x61, 0x6e,
+	0x12, 0x12, 0x0a, 0x04, 0x70, 0x65, 0x61, 0x6b, 0x18, 0x03, 0x20, 0x03, 0x28, 0x05, 0x52, 0x04,
+	0x70, 0x65, 0x61, 0x6b, 0x22, 0xb7, 0x01, 0x0a, 0x15, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x48,
+	0x69, 0x73, 0x74, 0x6f, 0x72, 0x79, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x0e,
+	0x0a, 0x02, 0x6f, 0x6b, 0x18, 0x01, 0x20, 0x01, 0x28, 0x08, 0x52, 0x02, 0x6f, 0x6b, 0x12, 0x1e,
+	0x0a, 0x0a, 0x72, 0x65, 0x73, 0x6f, 0x6c, 0x75, 0x74, 0x69, 0x6f, 0x6e, 0x18, 0x02, 0x20, 0x01,
+	0x28, 0x09, 0x52, 0x0a, 0x72, 0x65, 0x73, 0x6f, 0x6c, 0x75, 0x74, 0x69, 0x6f, 0x6e, 0x12, 0x1a,
+	0x0a, 0x08, 0x69, 0x6e, 0x74, 0x65, 0x72, 0x76, 0x61, 0x6c, 0x18, 0x03, 0x20, 0x01, 0x28, 0x05,
+	0x52, 0x08, 0x69, 0x6e, 0x74, 0x65, 0x72, 0x76, 0x61, 0x6c, 0x12, 0x1d, 0x0a, 0x0a, 0x73, 0x74,
+	0x61, 0x72, 0x74, 0x5f, 0x74, 0x69, 0x6d, 0x65, 0x18, 0x04, 0x20, 0x01, 0x28, 0x03, 0x52, 0x09,
+	0x73, 0x74, 0x61, 0x72, 0x74, 0x54, 0x69, 0x6d, 0x65, 0x12, 0x33, 0x0a, 0x07, 0x73, 0x79, 0x73,
+	0x74, 0x65, 0x6d, 0x73, 0x18, 0x05, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x19, 0x2e, 0x70, 0x6f, 0x71,
+	0x2e, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x48, 0x69, 0x73, 0x74, 0x6f, 0x72, 0x79, 0x4d, 0x65,
+	0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x07, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x73, 0x22, 0x68,
+	0x0a, 0x13, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x52, 0x65, 0x70, 0x6c, 0x69, 0x63, 0x61, 0x43,
+	0x68, 0x61, 0x6e, 0x67, 0x65, 0x12, 0x1b, 0x0a, 0x09, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f,
+	0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05, 0x52, 0x08, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d,
+	0x49, 0x64, 0x12, 0x18, 0x0a, 0x07, 0x61, 0x72, 0x72, 0x69, 0x76, 0x65, 0x64, 0x18, 0x02, 0x20,
+	0x03, 0x28, 0x05, 0x52, 0x07, 0x61, 0x72, 0x72, 0x69, 0x76, 0x65, 0x64, 0x12, 0x1a, 0x0a, 0x08,
+	0x64, 0x65, 0x70, 0x61, 0x72, 0x74, 0x65, 0x64, 0x18, 0x03, 0x20, 0x03, 0x28, 0x05, 0x52, 0x08,
+	0x64, 0x65, 0x70, 0x61, 0x72, 0x74, 0x65, 0x64, 0x22, 0xd5, 0x01, 0x0a, 0x14, 0x53, 0x79, 0x73,
+	0x74, 0x65, 0x6d, 0x52, 0x65, 0x70, 0x6c, 0x69, 0x63, 0x61, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67,
+	0x65, 0x12, 0x1f, 0x0a, 0x0b, 0x69, 0x6e, 0x73, 0x74, 0x61, 0x6e, 0x63, 0x65, 0x5f, 0x69, 0x64,
+	0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0a, 0x69, 0x6e, 0x73, 0x74, 0x61, 0x6e, 0x63, 0x65,
+	0x49, 0x64, 0x12, 0x14, 0x0a, 0x05, 0x65, 0x70, 0x6f, 0x63, 0x68, 0x18, 0x02, 0x20, 0x01, 0x28,
+	0x04, 0x52, 0x05, 0x65, 0x70, 0x6f, 0x63, 0x68, 0x12, 0x1a, 0x0a, 0x08, 0x73, 0x65, 0x71, 0x75,
+	0x65, 0x6e, 0x63, 0x65, 0x18, 0x03, 0x20, 0x01, 0x28, 0x04, 0x52, 0x08, 0x73, 0x65, 0x71, 0x75,
+	0x65, 0x6e, 0x63, 0x65, 0x12, 0x1a, 0x0a, 0x08, 0x73, 0x6e, 0x61, 0x70, 0x73, 0x68, 0x6f, 0x74,
+	0x18, 0x04, 0x20, 0x01, 0x28, 0x08, 0x52, 0x08, 0x73, 0x6e, 0x61, 0x70, 0x73, 0x68, 0x6f, 0x74,
+	0x12, 0x1a, 0x0a, 0x08, 0x68, 0x61, 0x6e, 0x64, 0x6f, 0x76, 0x65, 0x72, 0x18, 0x05, 0x20, 0x01,
+	0x28, 0x08, 0x52, 0x08, 0x68, 0x61, 0x6e, 0x64, 0x6f, 0x76, 0x65, 0x72, 0x12, 0x32, 0x0a, 0x07,
+	0x63, 0x68, 0x61, 0x6e, 0x67, 0x65, 0x73, 0x18, 0x06, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x18, 0x2e,
+	0x70, 0x6f, 0x71, 0x2e, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x52, 0x65, 0x70, 0x6c, 0x69, 0x63,
+	0x61, 0x43, 0x68, 0x61, 0x6e, 0x67, 0x65, 0x52, 0x07, 0x63, 0x68, 0x61, 0x6e, 0x67, 0x65, 0x73,
+	0x22, 0x31, 0x0a, 0x13, 0x53, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x53, 0x74, 0x61, 0x72, 0x74,
+	0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x1a, 0x0a, 0x08, 0x75, 0x73, 0x65, 0x72, 0x6e,
+	0x61, 0x6d, 0x65, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x08, 0x75, 0x73, 0x65, 0x72, 0x6e,
+	0x61, 0x6d, 0x65, 0x22, 0xa2, 0x01, 0x0a, 0x14, 0x53, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x53,
+	0x74, 0x61, 0x72, 0x74, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x0e, 0x0a, 0x02,
+	0x6f, 0x6b, 0x18, 0x01, 0x20, 0x01, 0x28, 0x08, 0x52, 0x02, 0x6f, 0x6b, 0x12, 0x21, 0x0a, 0x0c,
+	0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x69, 0x64, 0x18, 0x02, 0x20, 0x01,
+	0x28, 0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x49, 0x64, 0x12,
+	0x1d, 0x0a, 0x0a, 0x73, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x5f, 0x69, 0x64, 0x18, 0x03, 0x20,
+	0x01, 0x28, 0x09, 0x52, 0x09, 0x73, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x49, 0x64, 0x12, 0x38,
+	0x0a, 0x0e, 0x73, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x5f, 0x74, 0x6f, 0x70, 0x69, 0x63, 0x73,
+	0x18, 0x04, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x11, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x54, 0x6f, 0x70,
+	0x69, 0x63, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x0d, 0x73, 0x65, 0x73, 0x73, 0x69,
+	0x6f, 0x6e, 0x54, 0x6f, 0x70, 0x69, 0x63, 0x73, 0x22, 0x33, 0x0a, 0x12, 0x53, 0x65, 0x73, 0x73,
+	0x69, 0x6f, 0x6e, 0x53, 0x74, 0x6f, 0x70, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x1d,
+	0x0a, 0x0a, 0x73, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01,
+	0x28, 0x09, 0x52, 0x09, 0x73, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x49, 0x64, 0x22, 0x44, 0x0a,
+	0x13, 0x53, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x53, 0x74, 0x6f, 0x70, 0x52, 0x65, 0x73, 0x70,
+	0x6f, 0x6e, 0x73, 0x65, 0x12, 0x0e, 0x0a, 0x02, 0x6f, 0x6b, 0x18, 0x01, 0x20, 0x01, 0x28, 0x08,
+	0x52, 0x02, 0x6f, 0x6b, 0x12, 0x1d, 0x0a, 0x0a, 0x73, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x5f,
+	0x69, 0x64, 0x18, 0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x09, 0x73, 0x65, 0x73, 0x73, 0x69, 0x6f,
+	0x6e, 0x49, 0x64, 0x22, 0x2c, 0x0a, 0x0b, 0x53, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x50, 0x69,
+	0x6e, 0x67, 0x12, 0x1d, 0x0a, 0x0a, 0x73, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x5f, 0x69, 0x64,
+	0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x09, 0x73, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x49,
+	0x64, 0x22, 0x2c, 0x0a, 0x0b, 0x53, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x50, 0x6f, 0x6e, 0x67,
+	0x12, 0x1d, 0x0a, 0x0a, 0x73, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x5f, 0x69, 0x64, 0x18, 0x01,
+	0x20, 0x01, 0x28, 0x09, 0x52, 0x09, 0x73, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x49, 0x64, 0x22,
+	0x6d, 0x0a, 0x0e, 0x53, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x76, 0x6f, 0x6b, 0x65,
+	0x64, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x69,
+	0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74,
+	0x65, 0x72, 0x49, 0x64, 0x12, 0x1e, 0x0a, 0x0a, 0x67, 0x65, 0x6e, 0x65, 0x72, 0x61, 0x74, 0x69,
+	0x6f, 0x6e, 0x18, 0x02, 0x20, 0x01, 0x28, 0x04, 0x52, 0x0a, 0x67, 0x65, 0x6e, 0x65, 0x72, 0x61,
+	0x74, 0x69, 0x6f, 0x6e, 0x12, 0x18, 0x0a, 0x07, 0x65, 0x78, 0x70, 0x69, 0x72, 0x65, 0x73, 0x18,
+	0x03, 0x20, 0x01, 0x28, 0x0d, 0x52, 0x07, 0x65, 0x78, 0x70, 0x69, 0x72, 0x65, 0x73, 0x22, 0x70,
+	0x0a, 0x18, 0x53, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x76, 0x6f, 0x63, 0x61, 0x74,
+	0x69, 0x6f, 0x6e, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x12, 0x25, 0x0a, 0x0e, 0x6d, 0x69,
+	0x6e, 0x5f, 0x67, 0x65, 0x6e, 0x65, 0x72, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x18, 0x01, 0x20, 0x01,
+	0x28, 0x04, 0x52, 0x0d, 0x6d, 0x69, 0x6e, 0x47, 0x65, 0x6e, 0x65, 0x72, 0x61, 0x74, 0x69, 0x6f,
+	0x6e, 0x12, 0x2d, 0x0a, 0x07, 0x72, 0x65, 0x76, 0x6f, 0x6b, 0x65, 0x64, 0x18, 0x02, 0x20, 0x03,
+	0x28, 0x0b, 0x32, 0x13, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x53, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e,
+	0x52, 0x65, 0x76, 0x6f, 0x6b, 0x65, 0x64, 0x52, 0x07, 0x72, 0x65, 0x76, 0x6f, 0x6b, 0x65, 0x64,
+	0x22, 0xb3, 0x01, 0x0a, 0x15, 0x53, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x4d, 0x65, 0x73, 0x73,
+	0x61, 0x67, 0x65, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x2b, 0x0a, 0x04, 0x74, 0x79,
+	0x70, 0x65, 0x18, 0x01, 0x20, 0x01, 0x28, 0x0e, 0x32, 0x17, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x53,
+	0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x54, 0x79, 0x70,
+	0x65, 0x52, 0x04, 0x74, 0x79, 0x70, 0x65, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68, 0x61, 0x72, 0x61,
 	0x63, 0x74, 0x65, 0x72, 0x5f, 0x69, 0x64, 0x18, 0x02, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0b, 0x63,
 	0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x49, 0x64, 0x12, 0x1b, 0x0a, 0x09, 0x73, 0x79,
 	0x73, 0x74, 0x65, 0x6d, 0x5f, 0x69, 0x64, 0x18, 0x03, 0x20, 0x01, 0x28, 0x05, 0x52, 0x08, 0x73,
-	0x79, 0x73, 0x74, 0x65, 0x6d, 0x49, 0x64, 0x22, 0x31, 0x0a, 0x12, 0x53, 0x79, 0x73, 0x74, 0x65,
-	0x6d, 0x54, 0x6f, 0x70, 0x69, 0x63, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x1b, 0x0a,
-	0x09, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05,
-	0x52, 0x08, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x49, 0x64, 0x22, 0x7a, 0x0a, 0x13, 0x53, 0x79,
-	0x73, 0x74, 0x65, 0x6d, 0x54, 0x6f, 0x70, 0x69, 0x63, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73,
-	0x65, 0x12, 0x0e, 0x0a, 0x02, 0x6f, 0x6b, 0x18, 0x01, 0x20, 0x01, 0x28, 0x08, 0x52, 0x02, 0x6f,
-	0x6b, 0x12, 0x1b, 0x0a, 0x09, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x69, 0x64, 0x18, 0x02,
-	0x20, 0x01, 0x28, 0x05, 0x52, 0x08, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x49, 0x64, 0x12, 0x36,
-	0x0a, 0x0d, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x74, 0x6f, 0x70, 0x69, 0x63, 0x73, 0x18,
-	0x03, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x11, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x54, 0x6f, 0x70, 0x69,
-	0x63, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x0c, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d,
-	0x54, 0x6f, 0x70, 0x69, 0x63, 0x73, 0x22, 0x31, 0x0a, 0x13, 0x53, 0x65, 0x73, 0x73, 0x69, 0x6f,
-	0x6e, 0x53, 0x74, 0x61, 0x72, 0x74, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x1a, 0x0a,
-	0x08, 0x75, 0x73, 0x65, 0x72, 0x6e, 0x61, 0x6d, 0x65, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52,
-	0x08, 0x75, 0x73, 0x65, 0x72, 0x6e, 0x61, 0x6d, 0x65, 0x22, 0xa2, 0x01, 0x0a, 0x14, 0x53, 0x65,
-	0x73, 0x73, 0x69, 0x6f, 0x6e, 0x53, 0x74, 0x61, 0x72, 0x74, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e,
-	0x73, 0x65, 0x12, 0x0e, 0x0a, 0x02, 0x6f, 0x6b, 0x18, 0x01, 0x20, 0x01, 0x28, 0x08, 0x52, 0x02,
-	0x6f, 0x6b, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f,
-	0x69, 0x64, 0x18, 0x02, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63,
-	0x74, 0x65, 0x72, 0x49, 0x64, 0x12, 0x1d, 0x0a, 0x0a, 0x73, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e,
-	0x5f, 0x69, 0x64, 0x18, 0x03, 0x20, 0x01, 0x28, 0x09, 0x52, 0x09, 0x73, 0x65, 0x73, 0x73, 0x69,
-	0x6f, 0x6e, 0x49, 0x64, 0x12, 0x38, 0x0a, 0x0e, 0x73, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x5f,
-	0x74, 0x6f, 0x70, 0x69, 0x63, 0x73, 0x18, 0x04, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x11, 0x2e, 0x70,
-	0x6f, 0x71, 0x2e, 0x54, 0x6f, 0x70, 0x69, 0x63, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52,
-	0x0d, 0x73, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x54, 0x6f, 0x70, 0x69, 0x63, 0x73, 0x22, 0x33,
-	0x0a, 0x12, 0x53, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x53, 0x74, 0x6f, 0x70, 0x52, 0x65, 0x71,
-	0x75, 0x65, 0x73, 0x74, 0x12, 0x1d, 0x0a, 0x0a, 0x73, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x5f,
-	0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x09, 0x73, 0x65, 0x73, 0x73, 0x69, 0x6f,
-	0x6e, 0x49, 0x64, 0x22, 0x44, 0x0a, 0x13, 0x53, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x53, 0x74,
-	0x6f, 0x70, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x0e, 0x0a, 0x02, 0x6f, 0x6b,
-	0x18, 0x01, 0x20, 0x01, 0x28, 0x08, 0x52, 0x02, 0x6f, 0x6b, 0x12, 0x1d, 0x0a, 0x0a, 0x73, 0x65,
-	0x73, 0x73, 0x69, 0x6f, 0x6e, 0x5f, 0x69, 0x64, 0x18, 0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x09,
-	0x73, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x49, 0x64, 0x22, 0x2c, 0x0a, 0x0b, 0x53, 0x65, 0x73,
-	0x73, 0x69, 0x6f, 0x6e, 0x50, 0x69, 0x6e, 0x67, 0x12, 0x1d, 0x0a, 0x0a, 0x73, 0x65, 0x73, 0x73,
-	0x69, 0x6f, 0x6e, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x09, 0x73, 0x65,
-	0x73, 0x73, 0x69, 0x6f, 0x6e, 0x49, 0x64, 0x22, 0x2c, 0x0a, 0x0b, 0x53, 0x65, 0x73, 0x73, 0x69,
-	0x6f, 0x6e, 0x50, 0x6f, 0x6e, 0x67, 0x12, 0x1d, 0x0a, 0x0a, 0x73, 0x65, 0x73, 0x73, 0x69, 0x6f,
-	0x6e, 0x5f, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x09, 0x73, 0x65, 0x73, 0x73,
-	0x69, 0x6f, 0x6e, 0x49, 0x64, 0x22, 0xb3, 0x01, 0x0a, 0x15, 0x53, 0x65, 0x73, 0x73, 0x69, 0x6f,
-	0x6e, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12,
-	0x2b, 0x0a, 0x04, 0x74, 0x79, 0x70, 0x65, 0x18, 0x01, 0x20, 0x01, 0x28, 0x0e, 0x32, 0x17, 0x2e,
-	0x70, 0x6f, 0x71, 0x2e, 0x53, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x4d, 0x65, 0x73, 0x73, 0x61,
-	0x67, 0x65, 0x54, 0x79, 0x70, 0x65, 0x52, 0x04, 0x74, 0x79, 0x70, 0x65, 0x12, 0x21, 0x0a, 0x0c,
-	0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x69, 0x64, 0x18, 0x02, 0x20, 0x01,
-	0x28, 0x05, 0x52, 0x0b, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x49, 0x64, 0x12,
-	0x1b, 0x0a, 0x09, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x69, 0x64, 0x18, 0x03, 0x20, 0x01,
-	0x28, 0x05, 0x52, 0x08, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x49, 0x64, 0x12, 0x2d, 0x0a, 0x07,
-	0x63, 0x68, 0x61, 0x74, 0x74, 0x65, 0x72, 0x18, 0x04, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x13, 0x2e,
-	0x70, 0x6f, 0x71, 0x2e, 0x43, 0x68, 0x61, 0x74, 0x74, 0x65, 0x72, 0x4d, 0x65, 0x73, 0x73, 0x61,
-	0x67, 0x65, 0x52, 0x07, 0x63, 0x68, 0x61, 0x74, 0x74, 0x65, 0x72, 0x22, 0xba, 0x03, 0x0a, 0x16,
-	0x53, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x65,
-	0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x2b, 0x0a, 0x04, 0x74, 0x79, 0x70, 0x65, 0x18, 0x01,
-	0x20, 0x01, 0x28, 0x0e, 0x32, 0x17, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x53, 0x65, 0x73, 0x73, 0x69,
-	0x6f, 0x6e, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x54, 0x79, 0x70, 0x65, 0x52, 0x04, 0x74,
-	0x79, 0x70, 0x65, 0x12, 0x0e, 0x0a, 0x02, 0x6f, 0x6b, 0x18, 0x02, 0x20, 0x01, 0x28, 0x08, 0x52,
-	0x02, 0x6f, 0x6b, 0x12, 0x53, 0x0a, 0x15, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72,
-	0x5f, 0x73, 0x74, 0x61, 0x74, 0x69, 0x63, 0x5f, 0x69, 0x6e, 0x66, 0x6f, 0x18, 0x07, 0x20, 0x01,
-	0x28, 0x0b, 0x32, 0x1f, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74,
-	0x65, 0x72, 0x53, 0x74, 0x61, 0x74, 0x69, 0x63, 0x49, 0x6e, 0x66, 0x6f, 0x4d, 0x65, 0x73, 0x73,
-	0x61, 0x67, 0x65, 0x52, 0x13, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x53, 0x74,
-	0x61, 0x74, 0x69, 0x63, 0x49, 0x6e, 0x66, 0x6f, 0x12, 0x4d, 0x0a, 0x13, 0x63, 0x68, 0x61, 0x72,
-	0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x6c, 0x69, 0x76, 0x65, 0x5f, 0x69, 0x6e, 0x66, 0x6f, 0x18,
-	0x08, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1d, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x43, 0x68, 0x61, 0x72,
-	0x61, 0x63, 0x74, 0x65, 0x72, 0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x4d, 0x65, 0x73,
-	0x73, 0x61, 0x67, 0x65, 0x52, 0x11, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x4c,
-	0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x12, 0x4a, 0x0a, 0x12, 0x73, 0x79, 0x73, 0x74, 0x65,
-	0x6d, 0x5f, 0x73, 0x74, 0x61, 0x74, 0x69, 0x63, 0x5f, 0x69, 0x6e, 0x66, 0x6f, 0x18, 0x09, 0x20,
-	0x01, 0x28, 0x0b, 0x32, 0x1c, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d,
-	0x53, 0x74, 0x61, 0x74, 0x69, 0x63, 0x49, 0x6e, 0x66, 0x6f, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67,
-	0x65, 0x52, 0x10, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x53, 0x74, 0x61, 0x74, 0x69, 0x63, 0x49,
-	0x6e, 0x66, 0x6f, 0x12, 0x44, 0x0a, 0x10, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x6c, 0x69,
-	0x76, 0x65, 0x5f, 0x69, 0x6e, 0x66, 0x6f, 0x18, 0x0a, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1a, 0x2e,
-	0x70, 0x6f, 0x71, 0x2e, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e,
-	0x66, 0x6f, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x0e, 0x73, 0x79, 0x73, 0x74, 0x65,
-	0x6d, 0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x12, 0x2d, 0x0a, 0x07, 0x63, 0x68, 0x61,
-	0x74, 0x74, 0x65, 0x72, 0x18, 0x0d, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x13, 0x2e, 0x70, 0x6f, 0x71,
-	0x2e, 0x43, 0x68, 0x61, 0x74, 0x74, 0x65, 0x72, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52,
-	0x07, 0x63, 0x68, 0x61, 0x74, 0x74, 0x65, 0x72, 0x2a, 0x8c, 0x01, 0x0a, 0x0b, 0x53, 0x65, 0x72,
-	0x76, 0x69, 0x63, 0x65, 0x54, 0x79, 0x70, 0x65, 0x12, 0x13, 0x0a, 0x0f, 0x55, 0x4e, 0x4b, 0x4e,
-	0x4f, 0x57, 0x4e, 0x5f, 0x53, 0x45, 0x52, 0x56, 0x49, 0x43, 0x45, 0x10, 0x00, 0x12, 0x13, 0x0a,
-	0x0f, 0x47, 0x41, 0x54, 0x45, 0x57, 0x41, 0x59, 0x5f, 0x53, 0x45, 0x52, 0x56, 0x49, 0x43, 0x45,
-	0x10, 0x01, 0x12, 0x13, 0x0a, 0x0f, 0x53, 0x45, 0x53, 0x53, 0x49, 0x4f, 0x4e, 0x5f, 0x53, 0x45,
-	0x52, 0x56, 0x49, 0x43, 0x45, 0x10, 0x02, 0x12, 0x15, 0x0a, 0x11, 0x43, 0x48, 0x41, 0x52, 0x41,
-	0x43, 0x54, 0x45, 0x52, 0x5f, 0x53, 0x45, 0x52, 0x56, 0x49, 0x43, 0x45, 0x10, 0x03, 0x12, 0x12,
-	0x0a, 0x0e, 0x53, 0x59, 0x53, 0x54, 0x45, 0x4d, 0x5f, 0x53, 0x45, 0x52, 0x56, 0x49, 0x43, 0x45,
-	0x10, 0x04, 0x12, 0x13, 0x0a, 0x0f, 0x43, 0x48, 0x41, 0x54, 0x54, 0x45, 0x52, 0x5f, 0x53, 0x45,
-	0x52, 0x56, 0x49, 0x43, 0x45, 0x10, 0x05, 0x2a, 0xc9, 0x01, 0x0a, 0x12, 0x53, 0x65, 0x73, 0x73,
-	0x69, 0x6f, 0x6e, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x54, 0x79, 0x70, 0x65, 0x12, 0x18,
-	0x0a, 0x14, 0x55, 0x4e, 0x4b, 0x4e, 0x4f, 0x57, 0x4e, 0x5f, 0x4d, 0x45, 0x53, 0x53, 0x41, 0x47,
-	0x45, 0x5f, 0x54, 0x59, 0x50, 0x45, 0x10, 0x00, 0x12, 0x09, 0x0a, 0x05, 0x53, 0x54, 0x41, 0x52,
-	0x54, 0x10, 0x01, 0x12, 0x08, 0x0a, 0x04, 0x53, 0x54, 0x4f, 0x50, 0x10, 0x02, 0x12, 0x09, 0x0a,
-	0x05, 0x4c, 0x4f, 0x47, 0x49, 0x4e, 0x10, 0x05, 0x12, 0x0a, 0x0a, 0x06, 0x4c, 0x4f, 0x47, 0x4f,
-	0x55, 0x54, 0x10, 0x06, 0x12, 0x19, 0x0a, 0x15, 0x43, 0x48, 0x41, 0x52, 0x41, 0x43, 0x54, 0x45,
-	0x52, 0x5f, 0x53, 0x54, 0x41, 0x54, 0x49, 0x43, 0x5f, 0x49, 0x4e, 0x46, 0x4f, 0x10, 0x07, 0x12,
-	0x17, 0x0a, 0x13, 0x43, 0x48, 0x41, 0x52, 0x41, 0x43, 0x54, 0x45, 0x52, 0x5f, 0x4c, 0x49, 0x56,
-	0x45, 0x5f, 0x49, 0x4e, 0x46, 0x4f, 0x10, 0x08, 0x12, 0x16, 0x0a, 0x12, 0x53, 0x59, 0x53, 0x54,
-	0x45, 0x4d, 0x5f, 0x53, 0x54, 0x41, 0x54, 0x49, 0x43, 0x5f, 0x49, 0x4e, 0x46, 0x4f, 0x10, 0x09,
-	0x12, 0x14, 0x0a, 0x10, 0x53, 0x59, 0x53, 0x54, 0x45, 0x4d, 0x5f, 0x4c, 0x49, 0x56, 0x45, 0x5f,
-	0x49, 0x4e, 0x46, 0x4f, 0x10, 0x0a, 0x12, 0x0b, 0x0a, 0x07, 0x43, 0x48, 0x41, 0x54, 0x54, 0x45,
+	0x79, 0x73, 0x74, 0x65, 0x6d, 0x49, 0x64, 0x12, 0x2d, 0x0a, 0x07, 0x63, 0x68, 0x61, 0x74, 0x74,
+	0x65, 0x72, 0x18, 0x04, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x13, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x43,
+	0x68, 0x61, 0x74, 0x74, 0x65, 0x72, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x07, 0x63,
+	0x68, 0x61, 0x74, 0x74, 0x65, 0x72, 0x22, 0xba, 0x03, 0x0a, 0x16, 0x53, 0x65, 0x73, 0x73, 0x69,
+	0x6f, 0x6e, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73,
+	0x65, 0x12, 0x2b, 0x0a, 0x04, 0x74, 0x79, 0x70, 0x65, 0x18, 0x01, 0x20, 0x01, 0x28, 0x0e, 0x32,
+	0x17, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x53, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x4d, 0x65, 0x73,
+	0x73, 0x61, 0x67, 0x65, 0x54, 0x79, 0x70, 0x65, 0x52, 0x04, 0x74, 0x79, 0x70, 0x65, 0x12, 0x0e,
+	0x0a, 0x02, 0x6f, 0x6b, 0x18, 0x02, 0x20, 0x01, 0x28, 0x08, 0x52, 0x02, 0x6f, 0x6b, 0x12, 0x53,
+	0x0a, 0x15, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x5f, 0x73, 0x74, 0x61, 0x74,
+	0x69, 0x63, 0x5f, 0x69, 0x6e, 0x66, 0x6f, 0x18, 0x07, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1f, 0x2e,
+	0x70, 0x6f, 0x71, 0x2e, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x53, 0x74, 0x61,
+	0x74, 0x69, 0x63, 0x49, 0x6e, 0x66, 0x6f, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x13,
+	0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x53, 0x74, 0x61, 0x74, 0x69, 0x63, 0x49,
+	0x6e, 0x66, 0x6f, 0x12, 0x4d, 0x0a, 0x13, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72,
+	0x5f, 0x6c, 0x69, 0x76, 0x65, 0x5f, 0x69, 0x6e, 0x66, 0x6f, 0x18, 0x08, 0x20, 0x01, 0x28, 0x0b,
+	0x32, 0x1d, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x43, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72,
+	0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52,
+	0x11, 0x63, 0x68, 0x61, 0x72, 0x61, 0x63, 0x74, 0x65, 0x72, 0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e,
+	0x66, 0x6f, 0x12, 0x4a, 0x0a, 0x12, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x73, 0x74, 0x61,
+	0x74, 0x69, 0x63, 0x5f, 0x69, 0x6e, 0x66, 0x6f, 0x18, 0x09, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1c,
+	0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x53, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x53, 0x74, 0x61, 0x74, 0x69,
+	0x63, 0x49, 0x6e, 0x66, 0x6f, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x10, 0x73, 0x79,
+	0x73, 0x74, 0x65, 0x6d, 0x53, 0x74, 0x61, 0x74, 0x69, 0x63, 0x49, 0x6e, 0x66, 0x6f, 0x12, 0x44,
+	0x0a, 0x10, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x5f, 0x6c, 0x69, 0x76, 0x65, 0x5f, 0x69, 0x6e,
+	0x66, 0x6f, 0x18, 0x0a, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1a, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x53,
+	0x79, 0x73, 0x74, 0x65, 0x6d, 0x4c, 0x69, 0x76, 0x65, 0x49, 0x6e, 0x66, 0x6f, 0x4d, 0x65, 0x73,
+	0x73, 0x61, 0x67, 0x65, 0x52, 0x0e, 0x73, 0x79, 0x73, 0x74, 0x65, 0x6d, 0x4c, 0x69, 0x76, 0x65,
+	0x49, 0x6e, 0x66, 0x6f, 0x12, 0x2d, 0x0a, 0x07, 0x63, 0x68, 0x61, 0x74, 0x74, 0x65, 0x72, 0x18,
+	0x0d, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x13, 0x2e, 0x70, 0x6f, 0x71, 0x2e, 0x43, 0x68, 0x61, 0x74,
+	0x74, 0x65, 0x72, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x07, 0x63, 0x68, 0x61, 0x74,
+	0x74, 0x65, 0x72, 0x2a, 0x8c, 0x01, 0x0a, 0x0b, 0x53, 0x65, 0x72, 0x76, 0x69, 0x63, 0x65, 0x54,
+	0x79, 0x70, 0x65, 0x12, 0x13, 0x0a, 0x0f, 0x55, 0x4e, 0x4b, 0x4e, 0x4f, 0x57, 0x4e, 0x5f, 0x53,
+	0x45, 0x52, 0x56, 0x49, 0x43, 0x45, 0x10, 0x00, 0x12, 0x13, 0x0a, 0x0f, 0x47, 0x41, 0x54, 0x45,
+	0x57, 0x41, 0x59, 0x5f, 0x53, 0x45, 0x52, 0x56, 0x49, 0x43, 0x45, 0x10, 0x01, 0x12, 0x13, 0x0a,
+	0x0f, 0x53, 0x45, 0x53, 0x53, 0x49, 0x4f, 0x4e, 0x5f, 0x53, 0x45, 0x52, 0x56, 0x49, 0x43, 0x45,
+	0x10, 0x02, 0x12, 0x15, 0x0a, 0x11, 0x43, 0x48, 0x41, 0x52, 0x41, 0x43, 0x54, 0x45, 0x52, 0x5f,
+	0x53, 0x45, 0x52, 0x56, 0x49, 0x43, 0x45, 0x10, 0x03, 0x12, 0x12, 0x0a, 0x0e, 0x53, 0x59, 0x53,
+	0x54, 0x45, 0x4d, 0x5f, 0x53, 0x45, 0x52, 0x56, 0x49, 0x43, 0x45, 0x10, 0x04, 0x12, 0x13, 0x0a,
+	0x0f, 0x43, 0x48, 0x41, 0x54, 0x54, 0x45, 0x52, 0x5f, 0x53, 0x45, 0x52, 0x56, 0x49, 0x43, 0x45,
+	0x10, 0x05, 0x2a, 0xee, 0x01, 0x0a, 0x12, 0x53, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x4d, 0x65,
+	0x73, 0x73, 0x61, 0x67, 0x65, 0x54, 0x79, 0x70, 0x65, 0x12, 0x18, 0x0a, 0x14, 0x55, 0x4e, 0x4b,
+	0x4e, 0x4f, 0x57, 0x4e, 0x5f, 0x4d, 0x45, 0x53, 0x53, 0x41, 0x47, 0x45, 0x5f, 0x54, 0x59, 0x50,
+	0x45, 0x10, 0x00, 0x12, 0x09, 0x0a, 0x05, 0x53, 0x54, 0x41, 0x52, 0x54, 0x10, 0x01, 0x12, 0x08,
+	0x0a, 0x04, 0x53, 0x54, 0x4f, 0x50, 0x10, 0x02, 0x12, 0x08, 0x0a, 0x04, 0x50, 0x49, 0x4e, 0x47,
+	0x10, 0x03, 0x12, 0x08, 0x0a, 0x04, 0x50, 0x4f, 0x4e, 0x47, 0x10, 0x04, 0x12, 0x09, 0x0a, 0x05,
+	0x4c, 0x4f, 0x47, 0x49, 0x4e, 0x10, 0x05, 0x12, 0x0a, 0x0a, 0x06, 0x4c, 0x4f, 0x47, 0x4f, 0x55,
+	0x54, 0x10, 0x06, 0x12, 0x19, 0x0a, 0x15, 0x43, 0x48, 0x41, 0x52, 0x41, 0x43, 0x54, 0x45, 0x52,
+	0x5f, 0x53, 0x54, 0x41, 0x54, 0x49, 0x43, 0x5f, 0x49, 0x4e, 0x46, 0x4f, 0x10, 0x07, 0x12, 0x17,
+	0x0a, 0x13, 0x43, 0x48, 0x41, 0x52, 0x41, 0x43, 0x54, 0x45, 0x52, 0x5f, 0x4c, 0x49, 0x56, 0x45,
+	0x5f, 0x49, 0x4e, 0x46, 0x4f, 0x10, 0x08, 0x12, 0x16, 0x0a, 0x12, 0x53, 0x59, 0x53, 0x54, 0x45,
+	0x4d, 0x5f, 0x53, 0x54, 0x41, 0x54, 0x49, 0x43, 0x5f, 0x49, 0x4e, 0x46, 0x4f, 0x10, 0x09, 0x12,
+	0x14, 0x0a, 0x10, 0x53, 0x59, 0x53, 0x54, 0x45, 0x4d, 0x5f, 0x4c, 0x49, 0x56, 0x45, 0x5f, 0x49,
+	0x4e, 0x46, 0x4f, 0x10, 0x0a, 0x12, 0x0f, 0x0a, 0x0b, 0x4a, 0x4f, 0x49, 0x4e, 0x5f, 0x53, 0x59,
+	0x53, 0x54, 0x45, 0x4d, 0x10, 0x0b, 0x12, 0x0b, 0x0a, 0x07, 0x43, 0x48, 0x41, 0x54, 0x54, 0x45,
 	0x52, 0x10, 0x0d, 0x32, 0xd4, 0x01, 0x0a, 0x03, 0x50, 0x6f, 0x51, 0x12, 0x3a, 0x0a, 0x0b, 0x47,
 	0x65, 0x74, 0x55, 0x6e, 0x69, 0x76, 0x65, 0x72, 0x73, 0x65, 0x12, 0x14, 0x2e, 0x70, 0x6f, 0x71,
 	0x2e, 0x55, 0x6e, 0x69, 0x76, 0x65, 0x72, 0x73, 0x65, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74,
@@ -2582,82 +4433,119 @@ func file_poq_proto_rawDescGZIP() []byte {
 }
 
 var file_poq_proto_enumTypes = make([]protoimpl.EnumInfo, 2)
-var file_poq_proto_msgTypes = make([]protoimpl.MessageInfo, 38)
+var file_poq_proto_msgTypes = make([]protoimpl.MessageInfo, 62)
 var file_poq_proto_goTypes = []interface{}{
-	(ServiceType)(0),                       // 0: poq.ServiceType
-	(SessionMessageType)(0),                // 1: poq.SessionMessageType
-	(*TopicMessage)(nil),                   // 2: poq.TopicMessage
-	(*ServiceStart)(nil),                   // 3: poq.ServiceStart
-	(*CharacterStaticInfoMessage)(nil),     // 4: poq.CharacterStaticInfoMessage
-	(*CharacterStaticInfoRequest)(nil),     // 5: poq.CharacterStaticInfoRequest
-	(*CharacterStaticInfoResponse)(nil),    // 6: poq.CharacterStaticInfoResponse
-	(*CharacterLiveInfoMessage)(nil),       // 7: poq.CharacterLiveInfoMessage
-	(*CharacterLiveInfoRequest)(nil),       // 8: poq.CharacterLiveInfoRequest
-	(*CharacterLiveInfoResponse)(nil),      // 9: poq.CharacterLiveInfoResponse
-	(*CharacterLoginRequest)(nil),          // 10: poq.CharacterLoginRequest
-	(*CharacterLoginResponse)(nil),         // 11: poq.CharacterLoginResponse
-	(*CharacterLogoutRequest)(nil),         // 12: poq.CharacterLogoutRequest
-	(*CharacterLogoutResponse)(nil),        // 13: poq.CharacterLogoutResponse
-	(*CharacterTopicRequest)(nil),          // 14: poq.CharacterTopicRequest
-	(*CharacterTopicResponse)(nil),         // 15: poq.CharacterTopicResponse
-	(*ChatterMessage)(nil),                 // 16: poq.ChatterMessage
-	(*ChatterTopicRequest)(nil),            // 17: poq.ChatterTopicRequest
-	(*ChatterTopicResponse)(nil),           // 18: poq.ChatterTopicResponse
-	(*SystemStaticInfoMessage)(nil),        // 19: poq.SystemStaticInfoMessage
-	(*Universe)(nil),                       // 20: poq.Universe
-	(*UniverseRequest)(nil),                // 21: poq.UniverseRequest
-	(*UniverseResponse)(nil),               // 22: poq.UniverseResponse
-	(*SystemStaticInfoRequest)(nil),        // 23: poq.SystemStaticInfoRequest
-	(*SystemStaticInfoResponse)(nil),       // 24: poq.SystemStaticInfoResponse
-	(*SystemLiveInfoMessage)(nil),          // 25: poq.SystemLiveInfoMessage
-	(*SystemLiveInfoRequest)(nil),          // 26: poq.SystemLiveInfoRequest
-	(*SystemLiveInfoResponse)(nil),         // 27: poq.SystemLiveInfoResponse
-	(*SystemSetLiveCharacterRequest)(nil),  // 28: poq.SystemSetLiveCharacterRequest
-	(*SystemSetLiveCharacterResponse)(nil), // 29: poq.SystemSetLiveCharacterResponse
-	(*SystemTopicRequest)(nil),             // 30: poq.SystemTopicRequest
-	(*SystemTopicResponse)(nil),            // 31: poq.SystemTopicResponse
-	(*SessionStartRequest)(nil),            // 32: poq.SessionStartRequest
-	(*SessionStartResponse)(nil),           // 33: poq.SessionStartResponse
-	(*SessionStopRequest)(nil),             // 34: poq.SessionStopRequest
-	(*SessionStopResponse)(nil),            // 35: poq.SessionStopResponse
-	(*SessionPing)(nil),                    // 36: poq.SessionPing
-	(*SessionPong)(nil),                    // 37: poq.SessionPong
-	(*SessionMessageRequest)(nil),          // 38: poq.SessionMessageRequest
-	(*SessionMessageResponse)(nil),         // 39: poq.SessionMessageResponse
-	(*timestamppb.Timestamp)(nil),          // 40: google.protobuf.Timestamp
+	(ServiceType)(0),                          // 0: poq.ServiceType
+	(SessionMessageType)(0),                   // 1: poq.SessionMessageType
+	(*TopicMessage)(nil),                      // 2: poq.TopicMessage
+	(*ServiceStart)(nil),                      // 3: poq.ServiceStart
+	(*ServiceMemoryRequest)(nil),              // 4: poq.ServiceMemoryRequest
+	(*MemoryStructure)(nil),                   // 5: poq.MemoryStructure
+	(*HeapStatistic)(nil),                     // 6: poq.HeapStatistic
+	(*ServiceMemoryResponse)(nil),             // 7: poq.ServiceMemoryResponse
+	(*CharacterStaticInfoMessage)(nil),        // 8: poq.CharacterStaticInfoMessage
+	(*CharacterStaticInfoRequest)(nil),        // 9: poq.CharacterStaticInfoRequest
+	(*CharacterStaticInfoResponse)(nil),       // 10: poq.CharacterStaticInfoResponse
+	(*CharacterLiveInfoMessage)(nil),          // 11: poq.CharacterLiveInfoMessage
+	(*CharacterLiveInfoRequest)(nil),          // 12: poq.CharacterLiveInfoRequest
+	(*CharacterLiveInfoResponse)(nil),         // 13: poq.CharacterLiveInfoResponse
+	(*CharacterLoginRequest)(nil),             // 14: poq.CharacterLoginRequest
+	(*CharacterLoginResponse)(nil),            // 15: poq.CharacterLoginResponse
+	(*CharacterLogoutRequest)(nil),            // 16: poq.CharacterLogoutRequest
+	(*CharacterLogoutResponse)(nil),           // 17: poq.CharacterLogoutResponse
+	(*CharacterBulkLogoutRequest)(nil),        // 18: poq.CharacterBulkLogoutRequest
+	(*CharacterBulkLogoutResponse)(nil),       // 19: poq.CharacterBulkLogoutResponse
+	(*CharacterTopicRequest)(nil),             // 20: poq.CharacterTopicRequest
+	(*CharacterTopicResponse)(nil),            // 21: poq.CharacterTopicResponse
+	(*CharacterMoveRequest)(nil),              // 22: poq.CharacterMoveRequest
+	(*CharacterMoveResponse)(nil),             // 23: poq.CharacterMoveResponse
+	(*CharacterPresenceRequest)(nil),          // 24: poq.CharacterPresenceRequest
+	(*CharacterPresenceResponse)(nil),         // 25: poq.CharacterPresenceResponse
+	(*ChatterMessage)(nil),                    // 26: poq.ChatterMessage
+	(*ChatterTopicRequest)(nil),               // 27: poq.ChatterTopicRequest
+	(*ChatterTopicResponse)(nil),              // 28: poq.ChatterTopicResponse
+	(*SystemStaticInfoMessage)(nil),           // 29: poq.SystemStaticInfoMessage
+	(*Universe)(nil),                          // 30: poq.Universe
+	(*UniverseRequest)(nil),                   // 31: poq.UniverseRequest
+	(*UniverseResponse)(nil),                  // 32: poq.UniverseResponse
+	(*SystemStaticInfoRequest)(nil),           // 33: poq.SystemStaticInfoRequest
+	(*SystemStaticInfoResponse)(nil),          // 34: poq.SystemStaticInfoResponse
+	(*SystemLiveInfoMessage)(nil),             // 35: poq.SystemLiveInfoMessage
+	(*SystemLiveInfoRequest)(nil),             // 36: poq.SystemLiveInfoRequest
+	(*SystemLiveInfoResponse)(nil),            // 37: poq.SystemLiveInfoResponse
+	(*SystemCharacterFeedMessage)(nil),        // 38: poq.SystemCharacterFeedMessage
+	(*SystemSetLiveCharacterRequest)(nil),     // 39: poq.SystemSetLiveCharacterRequest
+	(*SystemSetLiveCharacterResponse)(nil),    // 40: poq.SystemSetLiveCharacterResponse
+	(*SystemBulkSetLiveCharacterRequest)(nil), // 41: poq.SystemBulkSetLiveCharacterRequest
+	(*SystemMoveRequest)(nil),                 // 42: poq.SystemMoveRequest
+	(*SystemMoveResponse)(nil),                // 43: poq.SystemMoveResponse
+	(*SystemPopulationMessage)(nil),           // 44: poq.SystemPopulationMessage
+	(*SystemWhereIsRequest)(nil),              // 45: poq.SystemWhereIsRequest
+	(*SystemWhereIsResponse)(nil),             // 46: poq.SystemWhereIsResponse
+	(*SystemTopicRequest)(nil),                // 47: poq.SystemTopicRequest
+	(*SystemTopicResponse)(nil),               // 48: poq.SystemTopicResponse
+	(*SystemHistoryRequest)(nil),              // 49: poq.SystemHistoryRequest
+	(*SystemHistoryMessage)(nil),              // 50: poq.SystemHistoryMessage
+	(*SystemHistoryResponse)(nil),             // 51: poq.SystemHistoryResponse
+	(*SystemReplicaChange)(nil),               // 52: poq.SystemReplicaChange
+	(*SystemReplicaMessage)(nil),              // 53: poq.SystemReplicaMessage
+	(*SessionStartRequest)(nil),               // 54: poq.SessionStartRequest
+	(*SessionStartResponse)(nil),              // 55: poq.SessionStartResponse
+	(*SessionStopRequest)(nil),                // 56: poq.SessionStopRequest
+	(*SessionStopResponse)(nil),               // 57: poq.SessionStopResponse
+	(*SessionPing)(nil),                       // 58: poq.SessionPing
+	(*SessionPong)(nil),                       // 59: poq.SessionPong
+	(*SessionRevoked)(nil),                    // 60: poq.SessionRevoked
+	(*SessionRevocationMessage)(nil),          // 61: poq.SessionRevocationMessage
+	(*SessionMessageRequest)(nil),             // 62: poq.SessionMessageRequest
+	(*SessionMessageResponse)(nil),            // 63: poq.SessionMessageResponse
+	(*timestamppb.Timestamp)(nil),             // 64: google.protobuf.Timestamp
 }
 var file_poq_proto_depIdxs = []int32{
 	0,  // 0: poq.ServiceStart.type:type_name -> poq.ServiceType
-	40, // 1: poq.ServiceStart.timestamp:type_name -> google.protobuf.Timestamp
-	4,  // 2: poq.CharacterStaticInfoResponse.character_static_info:type_name -> poq.CharacterStaticInfoMessage
-	7,  // 3: poq.CharacterLiveInfoResponse.character_live_info:type_name -> poq.CharacterLiveInfoMessage
-	7,  // 4: poq.CharacterLoginResponse.character_live_info:type_name -> poq.CharacterLiveInfoMessage
-	2,  // 5: poq.CharacterTopicResponse.character_topics:type_name -> poq.TopicMessage
-	2,  // 6: poq.ChatterTopicResponse.chatter_topics:type_name -> poq.TopicMessage
-	19, // 7: poq.UniverseResponse.systems:type_name -> poq.SystemStaticInfoMessage
-	19, // 8: poq.SystemStaticInfoResponse.system_static_info:type_name -> poq.SystemStaticInfoMessage
-	25, // 9: poq.SystemLiveInfoResponse.system_live_info:type_name -> poq.SystemLiveInfoMessage
-	2,  // 10: poq.SystemTopicResponse.system_topics:type_name -> poq.TopicMessage
-	2,  // 11: poq.SessionStartResponse.session_topics:type_name -> poq.TopicMessage
-	1,  // 12: poq.SessionMessageRequest.type:type_name -> poq.SessionMessageType
-	16, // 13: poq.SessionMessageRequest.chatter:type_name -> poq.ChatterMessage
-	1,  // 14: poq.SessionMessageResponse.type:type_name -> poq.SessionMessageType
-	4,  // 15: poq.SessionMessageResponse.character_static_info:type_name -> poq.CharacterStaticInfoMessage
-	7,  // 16: poq.SessionMessageResponse.character_live_info:type_name -> poq.CharacterLiveInfoMessage
-	19, // 17: poq.SessionMessageResponse.system_static_info:type_name -> poq.SystemStaticInfoMessage
-	25, // 18: poq.SessionMessageResponse.system_live_info:type_name -> poq.SystemLiveInfoMessage
-	16, // 19: poq.SessionMessageResponse.chatter:type_name -> poq.ChatterMessage
-	21, // 20: poq.PoQ.GetUniverse:input_type -> poq.UniverseRequest
-	32, // 21: poq.PoQ.StartSession:input_type -> poq.SessionStartRequest
-	38, // 22: poq.PoQ.StreamSession:input_type -> poq.SessionMessageRequest
-	22, // 23: poq.PoQ.GetUniverse:output_type -> poq.UniverseResponse
-	33, // 24: poq.PoQ.StartSession:output_type -> poq.SessionStartResponse
-	39, // 25: poq.PoQ.StreamSession:output_type -> poq.SessionMessageResponse
-	23, // [23:26] is the sub-list for method output_type
-	20, // [20:23] is the sub-list for method input_type
-	20, // [20:20] is the sub-list for extension type_name
-	20, // [20:20] is the sub-list for extension extendee
-	0,  // [0:20] is the sub-list for field type_name
+	64, // 1: poq.ServiceStart.timestamp:type_name -> google.protobuf.Timestamp
+	0,  // 2: poq.ServiceMemoryResponse.type:type_name -> poq.ServiceType
+	5,  // 3: poq.ServiceMemoryResponse.structures:type_name -> poq.MemoryStructure
+	6,  // 4: poq.ServiceMemoryResponse.heap:type_name -> poq.HeapStatistic
+	8,  // 5: poq.CharacterStaticInfoResponse.character_static_info:type_name -> poq.CharacterStaticInfoMessage
+	11, // 6: poq.CharacterLiveInfoResponse.character_live_info:type_name -> poq.CharacterLiveInfoMessage
+	11, // 7: poq.CharacterLoginResponse.character_live_info:type_name -> poq.CharacterLiveInfoMessage
+	2,  // 8: poq.CharacterTopicResponse.character_topics:type_name -> poq.TopicMessage
+	11, // 9: poq.CharacterMoveResponse.character_live_info:type_name -> poq.CharacterLiveInfoMessage
+	11, // 10: poq.CharacterPresenceResponse.character_live_info:type_name -> poq.CharacterLiveInfoMessage
+	2,  // 11: poq.ChatterTopicResponse.chatter_topics:type_name -> poq.TopicMessage
+	29, // 12: poq.UniverseResponse.systems:type_name -> poq.SystemStaticInfoMessage
+	29, // 13: poq.SystemStaticInfoResponse.system_static_info:type_name -> poq.SystemStaticInfoMessage
+	35, // 14: poq.SystemLiveInfoResponse.system_live_info:type_name -> poq.SystemLiveInfoMessage
+	11, // 15: poq.SystemLiveInfoResponse.character_live_info:type_name -> poq.CharacterLiveInfoMessage
+	11, // 16: poq.SystemCharacterFeedMessage.character_live_info:type_name -> poq.CharacterLiveInfoMessage
+	39, // 17: poq.SystemBulkSetLiveCharacterRequest.presence:type_name -> poq.SystemSetLiveCharacterRequest
+	11, // 18: poq.SystemWhereIsResponse.character_live_info:type_name -> poq.CharacterLiveInfoMessage
+	44, // 19: poq.SystemWhereIsResponse.population:type_name -> poq.SystemPopulationMessage
+	2,  // 20: poq.SystemTopicResponse.system_topics:type_name -> poq.TopicMessage
+	50, // 21: poq.SystemHistoryResponse.systems:type_name -> poq.SystemHistoryMessage
+	52, // 22: poq.SystemReplicaMessage.changes:type_name -> poq.SystemReplicaChange
+	2,  // 23: poq.SessionStartResponse.session_topics:type_name -> poq.TopicMessage
+	60, // 24: poq.SessionRevocationMessage.revoked:type_name -> poq.SessionRevoked
+	1,  // 25: poq.SessionMessageRequest.type:type_name -> poq.SessionMessageType
+	26, // 26: poq.SessionMessageRequest.chatter:type_name -> poq.ChatterMessage
+	1,  // 27: poq.SessionMessageResponse.type:type_name -> poq.SessionMessageType
+	8,  // 28: poq.SessionMessageResponse.character_static_info:type_name -> poq.CharacterStaticInfoMessage
+	11, // 29: poq.SessionMessageResponse.character_live_info:type_name -> poq.CharacterLiveInfoMessage
+	29, // 30: poq.SessionMessageResponse.system_static_info:type_name -> poq.SystemStaticInfoMessage
+	35, // 31: poq.SessionMessageResponse.system_live_info:type_name -> poq.SystemLiveInfoMessage
+	26, // 32: poq.SessionMessageResponse.chatter:type_name -> poq.ChatterMessage
+	31, // 33: poq.PoQ.GetUniverse:input_type -> poq.UniverseRequest
+	54, // 34: poq.PoQ.StartSession:input_type -> poq.SessionStartRequest
+	62, // 35: poq.PoQ.StreamSession:input_type -> poq.SessionMessageRequest
+	32, // 36: poq.PoQ.GetUniverse:output_type -> poq.UniverseResponse
+	55, // 37: poq.PoQ.StartSession:output_type -> poq.SessionStartResponse
+	63, // 38: poq.PoQ.StreamSession:output_type -> poq.SessionMessageResponse
+	36, // [36:39] is the sub-list for method output_type
+	33, // [33:36] is the sub-list for method input_type
+	33, // [33:33] is the sub-list for extension type_name
+	33, // [33:33] is the sub-list for extension extendee
+	0,  // [0:33] is the sub-list for field type_name
 }
 
 func init() { file_poq_proto_init() }
@@ -2678,8 +4566,104 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[1].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*ServiceStart); i {
+		file_poq_proto_msgTypes[1].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*ServiceStart); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_poq_proto_msgTypes[2].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*ServiceMemoryRequest); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_poq_proto_msgTypes[3].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*MemoryStructure); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_poq_proto_msgTypes[4].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*HeapStatistic); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_poq_proto_msgTypes[5].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*ServiceMemoryResponse); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_poq_proto_msgTypes[6].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*CharacterStaticInfoMessage); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_poq_proto_msgTypes[7].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*CharacterStaticInfoRequest); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_poq_proto_msgTypes[8].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*CharacterStaticInfoResponse); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_poq_proto_msgTypes[9].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*CharacterLiveInfoMessage); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2690,8 +4674,8 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[2].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*CharacterStaticInfoMessage); i {
+		file_poq_proto_msgTypes[10].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*CharacterLiveInfoRequest); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2702,8 +4686,8 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[3].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*CharacterStaticInfoRequest); i {
+		file_poq_proto_msgTypes[11].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*CharacterLiveInfoResponse); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2714,8 +4698,8 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[4].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*CharacterStaticInfoResponse); i {
+		file_poq_proto_msgTypes[12].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*CharacterLoginRequest); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2726,8 +4710,8 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[5].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*CharacterLiveInfoMessage); i {
+		file_poq_proto_msgTypes[13].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*CharacterLoginResponse); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2738,8 +4722,8 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[6].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*CharacterLiveInfoRequest); i {
+		file_poq_proto_msgTypes[14].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*CharacterLogoutRequest); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2750,8 +4734,8 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[7].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*CharacterLiveInfoResponse); i {
+		file_poq_proto_msgTypes[15].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*CharacterLogoutResponse); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2762,8 +4746,8 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[8].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*CharacterLoginRequest); i {
+		file_poq_proto_msgTypes[16].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*CharacterBulkLogoutRequest); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2774,8 +4758,8 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[9].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*CharacterLoginResponse); i {
+		file_poq_proto_msgTypes[17].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*CharacterBulkLogoutResponse); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2786,8 +4770,8 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[10].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*CharacterLogoutRequest); i {
+		file_poq_proto_msgTypes[18].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*CharacterTopicRequest); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2798,8 +4782,8 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[11].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*CharacterLogoutResponse); i {
+		file_poq_proto_msgTypes[19].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*CharacterTopicResponse); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2810,8 +4794,8 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[12].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*CharacterTopicRequest); i {
+		file_poq_proto_msgTypes[20].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*CharacterMoveRequest); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2822,8 +4806,8 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[13].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*CharacterTopicResponse); i {
+		file_poq_proto_msgTypes[21].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*CharacterMoveResponse); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2834,7 +4818,31 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[14].Exporter = func(v interface{}, i int) interface{} {
+		file_poq_proto_msgTypes[22].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*CharacterPresenceRequest); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_poq_proto_msgTypes[23].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*CharacterPresenceResponse); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_poq_proto_msgTypes[24].Exporter = func(v interface{}, i int) interface{} {
 			switch v := v.(*ChatterMessage); i {
 			case 0:
 				return &v.state
@@ -2846,7 +4854,7 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[15].Exporter = func(v interface{}, i int) interface{} {
+		file_poq_proto_msgTypes[25].Exporter = func(v interface{}, i int) interface{} {
 			switch v := v.(*ChatterTopicRequest); i {
 			case 0:
 				return &v.state
@@ -2858,7 +4866,7 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[16].Exporter = func(v interface{}, i int) interface{} {
+		file_poq_proto_msgTypes[26].Exporter = func(v interface{}, i int) interface{} {
 			switch v := v.(*ChatterTopicResponse); i {
 			case 0:
 				return &v.state
@@ -2870,7 +4878,7 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[17].Exporter = func(v interface{}, i int) interface{} {
+		file_poq_proto_msgTypes[27].Exporter = func(v interface{}, i int) interface{} {
 			switch v := v.(*SystemStaticInfoMessage); i {
 			case 0:
 				return &v.state
@@ -2882,7 +4890,7 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[18].Exporter = func(v interface{}, i int) interface{} {
+		file_poq_proto_msgTypes[28].Exporter = func(v interface{}, i int) interface{} {
 			switch v := v.(*Universe); i {
 			case 0:
 				return &v.state
@@ -2894,7 +4902,7 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[19].Exporter = func(v interface{}, i int) interface{} {
+		file_poq_proto_msgTypes[29].Exporter = func(v interface{}, i int) interface{} {
 			switch v := v.(*UniverseRequest); i {
 			case 0:
 				return &v.state
@@ -2906,7 +4914,7 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[20].Exporter = func(v interface{}, i int) interface{} {
+		file_poq_proto_msgTypes[30].Exporter = func(v interface{}, i int) interface{} {
 			switch v := v.(*UniverseResponse); i {
 			case 0:
 				return &v.state
@@ -2918,7 +4926,7 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[21].Exporter = func(v interface{}, i int) interface{} {
+		file_poq_proto_msgTypes[31].Exporter = func(v interface{}, i int) interface{} {
 			switch v := v.(*SystemStaticInfoRequest); i {
 			case 0:
 				return &v.state
@@ -2930,7 +4938,7 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[22].Exporter = func(v interface{}, i int) interface{} {
+		file_poq_proto_msgTypes[32].Exporter = func(v interface{}, i int) interface{} {
 			switch v := v.(*SystemStaticInfoResponse); i {
 			case 0:
 				return &v.state
@@ -2942,7 +4950,7 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[23].Exporter = func(v interface{}, i int) interface{} {
+		file_poq_proto_msgTypes[33].Exporter = func(v interface{}, i int) interface{} {
 			switch v := v.(*SystemLiveInfoMessage); i {
 			case 0:
 				return &v.state
@@ -2954,7 +4962,7 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[24].Exporter = func(v interface{}, i int) interface{} {
+		file_poq_proto_msgTypes[34].Exporter = func(v interface{}, i int) interface{} {
 			switch v := v.(*SystemLiveInfoRequest); i {
 			case 0:
 				return &v.state
@@ -2966,7 +4974,7 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[25].Exporter = func(v interface{}, i int) interface{} {
+		file_poq_proto_msgTypes[35].Exporter = func(v interface{}, i int) interface{} {
 			switch v := v.(*SystemLiveInfoResponse); i {
 			case 0:
 				return &v.state
@@ -2978,7 +4986,19 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[26].Exporter = func(v interface{}, i int) interface{} {
+		file_poq_proto_msgTypes[36].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*SystemCharacterFeedMessage); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_poq_proto_msgTypes[37].Exporter = func(v interface{}, i int) interface{} {
 			switch v := v.(*SystemSetLiveCharacterRequest); i {
 			case 0:
 				return &v.state
@@ -2990,7 +5010,7 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[27].Exporter = func(v interface{}, i int) interface{} {
+		file_poq_proto_msgTypes[38].Exporter = func(v interface{}, i int) interface{} {
 			switch v := v.(*SystemSetLiveCharacterResponse); i {
 			case 0:
 				return &v.state
@@ -3002,7 +5022,79 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[28].Exporter = func(v interface{}, i int) interface{} {
+		file_poq_proto_msgTypes[39].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*SystemBulkSetLiveCharacterRequest); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_poq_proto_msgTypes[40].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*SystemMoveRequest); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_poq_proto_msgTypes[41].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*SystemMoveResponse); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_poq_proto_msgTypes[42].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*SystemPopulationMessage); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_poq_proto_msgTypes[43].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*SystemWhereIsRequest); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_poq_proto_msgTypes[44].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*SystemWhereIsResponse); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_poq_proto_msgTypes[45].Exporter = func(v interface{}, i int) interface{} {
 			switch v := v.(*SystemTopicRequest); i {
 			case 0:
 				return &v.state
@@ -3014,7 +5106,7 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[29].Exporter = func(v interface{}, i int) interface{} {
+		file_poq_proto_msgTypes[46].Exporter = func(v interface{}, i int) interface{} {
 			switch v := v.(*SystemTopicResponse); i {
 			case 0:
 				return &v.state
@@ -3026,7 +5118,67 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[30].Exporter = func(v interface{}, i int) interface{} {
+		file_poq_proto_msgTypes[47].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*SystemHistoryRequest); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_poq_proto_msgTypes[48].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*SystemHistoryMessage); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_poq_proto_msgTypes[49].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*SystemHistoryResponse); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_poq_proto_msgTypes[50].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*SystemReplicaChange); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_poq_proto_msgTypes[51].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*SystemReplicaMessage); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_poq_proto_msgTypes[52].Exporter = func(v interface{}, i int) interface{} {
 			switch v := v.(*SessionStartRequest); i {
 			case 0:
 				return &v.state
@@ -3038,7 +5190,7 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[31].Exporter = func(v interface{}, i int) interface{} {
+		file_poq_proto_msgTypes[53].Exporter = func(v interface{}, i int) interface{} {
 			switch v := v.(*SessionStartResponse); i {
 			case 0:
 				return &v.state
@@ -3050,7 +5202,7 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[32].Exporter = func(v interface{}, i int) interface{} {
+		file_poq_proto_msgTypes[54].Exporter = func(v interface{}, i int) interface{} {
 			switch v := v.(*SessionStopRequest); i {
 			case 0:
 				return &v.state
@@ -3062,7 +5214,7 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[33].Exporter = func(v interface{}, i int) interface{} {
+		file_poq_proto_msgTypes[55].Exporter = func(v interface{}, i int) interface{} {
 			switch v := v.(*SessionStopResponse); i {
 			case 0:
 				return &v.state
@@ -3074,7 +5226,7 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[34].Exporter = func(v interface{}, i int) interface{} {
+		file_poq_proto_msgTypes[56].Exporter = func(v interface{}, i int) interface{} {
 			switch v := v.(*SessionPing); i {
 			case 0:
 				return &v.state
@@ -3086,7 +5238,7 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[35].Exporter = func(v interface{}, i int) interface{} {
+		file_poq_proto_msgTypes[57].Exporter = func(v interface{}, i int) interface{} {
 			switch v := v.(*SessionPong); i {
 			case 0:
 				return &v.state
@@ -3098,7 +5250,31 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[36].Exporter = func(v interface{}, i int) interface{} {
+		file_poq_proto_msgTypes[58].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*SessionRevoked); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_poq_proto_msgTypes[59].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*SessionRevocationMessage); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_poq_proto_msgTypes[60].Exporter = func(v interface{}, i int) interface{} {
 			switch v := v.(*SessionMessageRequest); i {
 			case 0:
 				return &v.state
@@ -3110,7 +5286,7 @@ func file_poq_proto_init() {
 				return nil
 			}
 		}
-		file_poq_proto_msgTypes[37].Exporter = func(v interface{}, i int) interface{} {
+		file_poq_proto_msgTypes[61].Exporter = func(v interface{}, i int) interface{} {
 			switch v := v.(*SessionMessageResponse); i {
 			case 0:
 				return &v.state
@@ -3129,7 +5305,7 @@ func file_poq_proto_init() {
 			GoPackagePath: reflect.TypeOf(x{}).PkgPath(),
 			RawDescriptor: file_poq_proto_rawDesc,
 			NumEnums:      2,
-			NumMessages:   38,
+			NumMessages:   62,
 			NumExtensions: 0,
 			NumServices:   1,
 		},
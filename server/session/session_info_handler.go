@@ -3,6 +3,7 @@ package session
 
 import (
 	"context"
+	"log"
 	"time"
 
 	"github.com/jonathonfletcher/poqserver/messaging"
@@ -83,10 +84,41 @@ func (h *InfoHandler) handleSystemStaticInfo(ctx context.Context, msg *poq.Sessi
 	return nil
 }
 
+func (h *InfoHandler) handlePing(ctx context.Context, msg *poq.SessionMessageRequest) error {
+
+	tracer := otel.GetTracerProvider().Tracer(telemetry.GetPackageName())
+	ctx, span := tracer.Start(ctx, telemetry.GetFunctionName())
+	defer span.End()
+
+	requestMsg := &poq.SessionPing{SessionId: h.state.GetSessionId()}
+	requestData, _ := proto.Marshal(requestMsg)
+	requestTopic := "REQ.SESSION.PING"
+	responseData, err := h.messaging.Request(ctx, requestTopic, requestData, time.Duration(10*float64(time.Second)))
+	if err != nil {
+		// No answer (eg a timeout, or the SessionService restarting) says nothing about the
+		// session - no pong, and the client carries on until a ping is answered.
+		span.RecordError(err)
+		log.Printf("%s.%s: err:%v", telemetry.GetPackageName(), telemetry.GetFunctionName(), err)
+		return nil
+	}
+	responseMsg := &poq.SessionPong{}
+	if err := proto.Unmarshal(responseData.Data, responseMsg); err != nil {
+		span.RecordError(err)
+		log.Printf("%s.%s: err:%v", telemetry.GetPackageName(), telemetry.GetFunctionName(), err)
+		return nil
+	}
+
+	// The SessionService answers without a session_id once the session has expired.
+	sessionResponseMsg := &poq.SessionMessageResponse{Type: poq.SessionMessageType_PONG, Ok: responseMsg.SessionId == h.state.GetSessionId()}
+	_ = h.grpcFunc(ctx, sessionResponseMsg)
+	return nil
+}
+
 func (h *InfoHandler) Shutdown(ctx context.Context) {
 	if h.dispatcher != nil {
 		h.dispatcher.ClearDispatchHandler(poq.SessionMessageType_CHARACTER_STATIC_INFO)
 		h.dispatcher.ClearDispatchHandler(poq.SessionMessageType_SYSTEM_STATIC_INFO)
+		h.dispatcher.ClearDispatchHandler(poq.SessionMessageType_PING)
 		h.dispatcher = nil
 	}
 }
@@ -100,5 +132,6 @@ func NewInfoHandler(messaging messaging.IMessaging, state ISessionState, dispatc
 	}
 	dispatcher.SetDispatchHandler(poq.SessionMessageType_CHARACTER_STATIC_INFO, handler.handleCharacterStaticInfo)
 	dispatcher.SetDispatchHandler(poq.SessionMessageType_SYSTEM_STATIC_INFO, handler.handleSystemStaticInfo)
+	dispatcher.SetDispatchHandler(poq.SessionMessageType_PING, handler.handlePing)
 	return handler
 }
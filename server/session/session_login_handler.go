@@ -4,8 +4,6 @@ package session
 import (
 	"context"
 	"fmt"
-	"log"
-	"slices"
 	"time"
 
 	"github.com/jonathonfletcher/poqserver/messaging"
@@ -23,7 +21,6 @@ type LoginHandler struct {
 	characterListener     ISessionLiveListener
 	systemListener        ISessionLiveListener
 	systemChatterListener ISessionLiveListener
-	localCharacters       map[int]ISessionLiveListener
 }
 
 func (h *LoginHandler) grpcSendFuncPlayerCharacterRelay(ctx context.Context, msg *poq.SessionMessageResponse) error {
@@ -46,7 +43,7 @@ func (h *LoginHandler) grpcSendFuncPlayerCharacterRelay(ctx context.Context, msg
 
 		h.systemListener = doDropDifferentIdFn(ctx, h.systemListener, int(msg.CharacterLiveInfo.SystemId))
 		if h.systemListener == nil {
-			h.systemListener = h.MakeSystemLiveInfoListener(ctx, int(msg.CharacterLiveInfo.SystemId), int(msg.CharacterLiveInfo.CharacterId), h.grpcSendFuncSystemRelay)
+			h.systemListener = h.MakeSystemLiveInfoListener(ctx, int(msg.CharacterLiveInfo.SystemId), int(msg.CharacterLiveInfo.CharacterId), h.grpcSendFn)
 		}
 
 		h.systemChatterListener = doDropDifferentIdFn(ctx, h.systemChatterListener, int(msg.CharacterLiveInfo.SystemId))
@@ -58,46 +55,6 @@ func (h *LoginHandler) grpcSendFuncPlayerCharacterRelay(ctx context.Context, msg
 	return h.grpcSendFn(ctx, msg)
 }
 
-func (h *LoginHandler) grpcSendFuncSystemRelay(ctx context.Context, msg *poq.SessionMessageResponse) error {
-	if h.characterListener != nil && msg.Type == poq.SessionMessageType_SYSTEM_LIVE_INFO {
-
-		removeList := make([]int, 0)
-		localCharacterList := make([]int, 0)
-		for characterId := range h.localCharacters {
-			localCharacterList = append(localCharacterList, characterId)
-			if !slices.Contains(msg.SystemLiveInfo.CharacterId, int32(characterId)) {
-				removeList = append(removeList, characterId)
-			}
-		}
-
-		myCharacterId := h.characterListener.Id(ctx)
-		addList := make([]int, 0)
-		for _, characterId := range msg.SystemLiveInfo.CharacterId {
-			if int(characterId) != myCharacterId && !slices.Contains(localCharacterList, int(characterId)) {
-				addList = append(addList, int(characterId))
-			}
-		}
-
-		for _, characterId := range removeList {
-			listener := h.localCharacters[characterId]
-			if listener != nil {
-				listener.Shutdown(ctx)
-			}
-			log.Printf("%s.%s: removing character listener for characterId:%d", telemetry.GetPackageName(), telemetry.GetFunctionName(), characterId)
-			delete(h.localCharacters, characterId)
-		}
-
-		for _, characterId := range addList {
-			listener := h.localCharacters[characterId]
-			if listener == nil {
-				log.Printf("%s.%s: making new character listener for characterId:%d", telemetry.GetPackageName(), telemetry.GetFunctionName(), characterId)
-				h.localCharacters[characterId] = h.MakeCharacterLiveInfoListener(ctx, characterId, h.grpcSendFn)
-			}
-		}
-	}
-	return h.grpcSendFn(ctx, msg)
-}
-
 func (h *LoginHandler) grpcSendFuncChatterRelay(ctx context.Context, msg *poq.SessionMessageResponse) error {
 	return h.grpcSendFn(ctx, msg)
 }
@@ -128,7 +85,7 @@ func (h *LoginHandler) handleLogin(ctx context.Context, msg *poq.SessionMessageR
 		span.RecordError(err)
 	}
 
-	_ = h.grpcSendFuncSystemRelay(ctx, sessionResponseMsg)
+	_ = h.grpcSendFn(ctx, sessionResponseMsg)
 
 	return nil
 }
@@ -157,7 +114,38 @@ func (h *LoginHandler) handleLogoff(ctx context.Context, msg *poq.SessionMessage
 		}
 	}
 
-	_ = h.grpcSendFuncSystemRelay(ctx, sessionResponseMsg)
+	_ = h.grpcSendFn(ctx, sessionResponseMsg)
+	return nil
+}
+
+func (h *LoginHandler) handleJoinSystem(ctx context.Context, msg *poq.SessionMessageRequest) error {
+
+	tracer := otel.GetTracerProvider().Tracer(telemetry.GetPackageName())
+	ctx, span := tracer.Start(ctx, telemetry.GetFunctionName())
+	defer span.End()
+
+	sessionResponseMsg := &poq.SessionMessageResponse{Type: poq.SessionMessageType_JOIN_SYSTEM, Ok: false}
+
+	reqMsg := &poq.CharacterMoveRequest{CharacterId: int32(h.state.GetCharacterId()), SystemId: msg.SystemId}
+	reqData, _ := proto.Marshal(reqMsg)
+	reqTopic := "REQ.CHARACTER.MOVE"
+	resData, err := h.messaging.Request(ctx, reqTopic, reqData, time.Duration(10*float64(time.Second)))
+	if err == nil {
+		resMsg := &poq.CharacterMoveResponse{}
+		if err := proto.Unmarshal(resData.Data, resMsg); err == nil {
+			sessionResponseMsg = &poq.SessionMessageResponse{
+				Type:              sessionResponseMsg.Type,
+				CharacterLiveInfo: resMsg.CharacterLiveInfo,
+				Ok:                resMsg.Ok,
+			}
+		}
+	} else {
+		span.RecordError(err)
+	}
+
+	// The system / chatter listeners follow the character live info published
+	// by the CharacterService, so the reply only goes to the client.
+	_ = h.grpcSendFn(ctx, sessionResponseMsg)
 	return nil
 }
 
@@ -173,14 +161,11 @@ func (h *LoginHandler) Shutdown(ctx context.Context) {
 	h.systemListener = doShutdownFn(ctx, h.systemListener)
 	h.systemChatterListener = doShutdownFn(ctx, h.systemChatterListener)
 	h.characterListener = doShutdownFn(ctx, h.characterListener)
-	for _, v := range h.localCharacters {
-		doShutdownFn(ctx, v)
-	}
-	clear(h.localCharacters)
 
 	if h.dispatcher != nil {
 		h.dispatcher.ClearDispatchHandler(poq.SessionMessageType_LOGIN)
 		h.dispatcher.ClearDispatchHandler(poq.SessionMessageType_LOGOUT)
+		h.dispatcher.ClearDispatchHandler(poq.SessionMessageType_JOIN_SYSTEM)
 		h.dispatcher = nil
 	}
 }
@@ -194,9 +179,9 @@ func NewLoginHandler(messaging messaging.IMessaging, state ISessionState, dispat
 		characterListener:     nil,
 		systemListener:        nil,
 		systemChatterListener: nil,
-		localCharacters:       make(map[int]ISessionLiveListener, 0),
 	}
 	dispatcher.SetDispatchHandler(poq.SessionMessageType_LOGIN, handler.handleLogin)
 	dispatcher.SetDispatchHandler(poq.SessionMessageType_LOGOUT, handler.handleLogoff)
+	dispatcher.SetDispatchHandler(poq.SessionMessageType_JOIN_SYSTEM, handler.handleJoinSystem)
 	return handler
 }
@@ -0,0 +1,90 @@
+// Copyright (c) 2025 Jonathon Fletcher
+package session
+
+import (
+	"context"
+	"log"
+	"sync"
+	"time"
+
+	"github.com/jonathonfletcher/poqserver/messaging"
+	"github.com/jonathonfletcher/poqserver/poq"
+	"github.com/jonathonfletcher/poqserver/telemetry"
+	"github.com/nats-io/nats.go"
+	"google.golang.org/protobuf/proto"
+)
+
+// Follows the SessionService revocations (common/sessions.py) - a character's tokens up to
+// a generation, and every token before min_generation.
+type sessionRevoked struct {
+	generation uint64
+	expires    time.Time
+}
+
+type SessionRevocations struct {
+	mu            sync.RWMutex
+	minGeneration uint64
+	revoked       map[int32]sessionRevoked
+}
+
+func NewSessionRevocations() *SessionRevocations {
+	return &SessionRevocations{revoked: make(map[int32]sessionRevoked)}
+}
+
+func (r *SessionRevocations) Apply(msg *poq.SessionRevocationMessage) {
+	r.mu.Lock()
+	defer r.mu.Unlock()
+	if msg.MinGeneration > r.minGeneration {
+		r.minGeneration = msg.MinGeneration
+	}
+	now := time.Now()
+	for characterId, revoked := range r.revoked {
+		// Tokens are only revoked until they expire anyway.
+		if now.After(revoked.expires) {
+			delete(r.revoked, characterId)
+		}
+	}
+	for _, revoked := range msg.Revoked {
+		if current, ok := r.revoked[revoked.CharacterId]; !ok || current.generation < revoked.Generation {
+			r.revoked[revoked.CharacterId] = sessionRevoked{generation: revoked.Generation, expires: time.Unix(int64(revoked.Expires), 0)}
+		}
+	}
+}
+
+func (r *SessionRevocations) Revoked(claims *SessionClaims) bool {
+	r.mu.RLock()
+	defer r.mu.RUnlock()
+	if claims.Generation < r.minGeneration {
+		return true
+	}
+	revoked, ok := r.revoked[claims.CharacterId]
+	return ok && claims.Generation <= revoked.generation
+}
+
+func (r *SessionRevocations) Start(ctx context.Context, m messaging.IMessaging) error {
+	// Follows the broadcasts, after taking the current set from the SessionService.
+	if _, err := m.Subscribe(ctx, "PUB.SESSION.REVOKED", func(ctx context.Context, msg *nats.Msg) {
+		revocations := &poq.SessionRevocationMessage{}
+		if err := proto.Unmarshal(msg.Data, revocations); err != nil {
+			log.Printf("%s.%s: err:%v", telemetry.GetPackageName(), telemetry.GetFunctionName(), err)
+			return
+		}
+		r.Apply(revocations)
+	}); err != nil {
+		return err
+	}
+	go func() {
+		res, err := m.Request(ctx, "REQ.SESSION.REVOCATIONS", []byte{}, time.Duration(10*float64(time.Second)))
+		if err != nil {
+			log.Printf("%s.%s: err:%v", telemetry.GetPackageName(), telemetry.GetFunctionName(), err)
+			return
+		}
+		revocations := &poq.SessionRevocationMessage{}
+		if err := proto.Unmarshal(res.Data, revocations); err != nil {
+			log.Printf("%s.%s: err:%v", telemetry.GetPackageName(), telemetry.GetFunctionName(), err)
+			return
+		}
+		r.Apply(revocations)
+	}()
+	return nil
+}
@@ -18,6 +18,7 @@ type LiveSystemListener struct {
 	messaging    messaging.IMessaging
 	grpcSendFunc grpcSendHandlerFn
 	id           int
+	characterId  int
 	cxl          chan error
 }
 
@@ -29,7 +30,19 @@ func (l *LiveSystemListener) Shutdown(ctx context.Context) {
 	l.cxl <- nil
 }
 
-func (l *LiveSystemListener) runSystemLiveInfoListener(ctx context.Context, topic string) {
+func (l *LiveSystemListener) sendCharacterLiveInfo(ctx context.Context, characterLiveInfo []*poq.CharacterLiveInfoMessage) {
+	for _, info := range characterLiveInfo {
+		if int(info.CharacterId) == l.characterId {
+			continue
+		}
+		sessionResponseMsg := &poq.SessionMessageResponse{
+			Type:              poq.SessionMessageType_CHARACTER_LIVE_INFO,
+			CharacterLiveInfo: info}
+		_ = l.grpcSendFunc(ctx, sessionResponseMsg)
+	}
+}
+
+func (l *LiveSystemListener) runSystemLiveInfoListener(ctx context.Context, topic string, feedTopic string) {
 
 	tracer := otel.GetTracerProvider().Tracer(telemetry.GetPackageName())
 	ctx, span := tracer.Start(ctx, telemetry.GetFunctionName())
@@ -56,6 +69,27 @@ func (l *LiveSystemListener) runSystemLiveInfoListener(ctx context.Context, topi
 			return
 		}
 	}()
+
+	if feedTopic != "" {
+		feedSub, _ := l.messaging.Subscribe(ctx, feedTopic, func(ctx context.Context, msg *nats.Msg) {
+
+			tracer := otel.GetTracerProvider().Tracer(telemetry.GetPackageName())
+			_, span := tracer.Start(ctx, telemetry.GetFunctionName())
+			defer span.End()
+
+			feedMsg := &poq.SystemCharacterFeedMessage{}
+			if err := proto.Unmarshal(msg.Data, feedMsg); err != nil {
+				span.RecordError(err)
+				return
+			}
+			l.sendCharacterLiveInfo(ctx, feedMsg.CharacterLiveInfo)
+		})
+		defer func() {
+			if err := feedSub.Unsubscribe(); err != nil {
+				return
+			}
+		}()
+	}
 	<-l.cxl
 	log.Printf("%s.%s: stopping listening for systemId:%d", telemetry.GetPackageName(), telemetry.GetFunctionName(), l.id)
 }
@@ -71,6 +105,7 @@ func (h *LoginHandler) MakeSystemLiveInfoListener(ctx context.Context, systemId
 		messaging:    h.messaging,
 		grpcSendFunc: grpcSendFn,
 		id:           systemId,
+		characterId:  characterId,
 		cxl:          make(chan error, 1),
 	}
 
@@ -88,7 +123,7 @@ func (h *LoginHandler) MakeSystemLiveInfoListener(ctx context.Context, systemId
 	} else if topicResponse.SystemTopics != nil {
 		liveRequestTopic = topicResponse.SystemTopics.RequestTopic
 		if topicResponse.SystemTopics.SubscribeTopic != "" {
-			go l.runSystemLiveInfoListener(ctx, topicResponse.SystemTopics.SubscribeTopic)
+			go l.runSystemLiveInfoListener(ctx, topicResponse.SystemTopics.SubscribeTopic, topicResponse.SystemTopics.FeedTopic)
 		}
 	}
 
@@ -109,6 +144,7 @@ func (h *LoginHandler) MakeSystemLiveInfoListener(ctx context.Context, systemId
 					SystemLiveInfo: infoResponse.SystemLiveInfo,
 				}
 				_ = l.grpcSendFunc(ctx, sessionResponseMsg)
+				l.sendCharacterLiveInfo(ctx, infoResponse.CharacterLiveInfo)
 			}
 		}
 	}
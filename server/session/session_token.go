@@ -0,0 +1,46 @@
+// Copyright (c) 2025 Jonathon Fletcher
+package session
+
+import (
+	"crypto/hmac"
+	"crypto/sha256"
+	"encoding/binary"
+	"encoding/hex"
+	"time"
+)
+
+// Matches common/sessions.py - hex of character_id (int32), generation (uint64) and
+// expires (uint32 epoch seconds), big endian, followed by the first 16 bytes of their
+// HMAC-SHA256.
+const (
+	sessionTokenPayloadSize = 16
+	sessionTokenMacSize     = 16
+)
+
+type SessionClaims struct {
+	CharacterId int32
+	Generation  uint64
+	Expires     time.Time
+}
+
+func VerifySessionToken(key []byte, token string) (*SessionClaims, bool) {
+	raw, err := hex.DecodeString(token)
+	if err != nil || len(raw) != sessionTokenPayloadSize+sessionTokenMacSize {
+		return nil, false
+	}
+	payload, mac := raw[:sessionTokenPayloadSize], raw[sessionTokenPayloadSize:]
+	h := hmac.New(sha256.New, key)
+	h.Write(payload)
+	if !hmac.Equal(mac, h.Sum(nil)[:sessionTokenMacSize]) {
+		return nil, false
+	}
+	claims := &SessionClaims{
+		CharacterId: int32(binary.BigEndian.Uint32(payload[0:4])),
+		Generation:  binary.BigEndian.Uint64(payload[4:12]),
+		Expires:     time.Unix(int64(binary.BigEndian.Uint32(payload[12:16])), 0),
+	}
+	if time.Now().After(claims.Expires) {
+		return nil, false
+	}
+	return claims, true
+}
@@ -0,0 +1,53 @@
+# Copyright (c) 2025 Jonathon Fletcher
+import asyncio
+import logging
+import os
+
+import dotenv
+
+import common.locations
+import common.messaging
+import common.service
+import common.telemetry
+import common.universe
+import services.character_service
+import services.chatter_service
+import services.session_service
+import services.system_service
+
+
+def make_services(msg_service: common.messaging.MessageService, names: list[str], /) -> list[common.service.ServiceManager]:
+    service_list = list()
+    for name in names:
+        match name:
+            case "system":
+                service_list.append(services.system_service.SystemService(msg_service, common.universe.load_universe(), presence_shm=os.environ.get("POQ_PRESENCE_SHM")))
+            case "character":
+                locations = common.locations.LocationStore(os.environ.get("POQ_LOCATIONS", "poq_locations.sqlite3"))
+                service_list.append(services.character_service.CharacterService(msg_service, common.universe.load_characters(), locations=locations, system_ids=common.universe.load_universe().keys()))
+            case "session":
+                service_list.append(services.session_service.SessionService(msg_service, common.universe.load_accounts()))
+            case "chatter":
+                service_list.append(services.chatter_service.ChatterService(msg_service))
+            case _:
+                raise ValueError(f"unknown service: {name}")
+    return service_list
+
+
+async def async_main(msg_service: common.messaging.MessageService, service_list: list[common.service.ServiceManager]):
+    for service in service_list:
+        await service.start()
+    await msg_service.run()
+    for service in reversed(service_list):
+        await service.stop()
+
+
+if __name__ == "__main__":
+    dotenv.load_dotenv()
+    common.telemetry.initialize_telemetry()
+    logging.basicConfig(level=logging.INFO)
+    names = [name.strip() for name in os.environ.get("POQ_SERVICES", "system,character,session,chatter").split(",") if name.strip()]
+    # All the services share one connection - hops between them never leave the process.
+    msg_service = common.messaging.MessageService(local_delivery=True)
+    service_list = make_services(msg_service, names)
+    asyncio.run(async_main(msg_service, service_list))
@@ -1,11 +1,14 @@
 # Copyright (c) 2025 Jonathon Fletcher
 import asyncio
+import bisect
 import inspect
-import json
 import logging
+import os
+import typing
 
 import dotenv
 
+import common.locations
 import common.messaging
 import common.service
 import common.telemetry
@@ -17,16 +20,20 @@ class CharacterInstance(common.service.ServiceInstance):
 
     character_id: int
     system_id: int
+    # REQ.SYSTEM.TOPIC is idempotent, so a slow reply is hedged rather than waited out.
+    topic_hedge: float = 0.25
 
-    def __init__(self, msg_service: common.messaging.MessageService, character_id: int, name: str, /):
+    def __init__(self, msg_service: common.messaging.MessageService, character_id: int, name: str, /, system_id: int = 1):
         super().__init__(msg_service)
         self.character_id = character_id
         self.name = name
-        self.system_id = 1
-        self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: DEFAULT system_id:{self.system_id}")
+        self.system_id = system_id
+        self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: system_id:{self.system_id}")
         self.publish_topic = f"PUB.CHARACTER.OUT.{self.character_id}"
         self.subscribe_topic = f"PUB.CHARACTER.IN.{self.character_id}"
         self.request_topic = f"REQ.CHARACTER.LIVE.{self.character_id}"
+        # Serialises moves against each other and against stop.
+        self.move_lock = asyncio.Lock()
 
     async def topics(self) -> poq.TopicMessage:
         return poq.TopicMessage(
@@ -56,14 +63,32 @@ class CharacterInstance(common.service.ServiceInstance):
     @common.telemetry.trace
     async def _update_system_presence(self, present: bool):
         request_msg = poq.SystemTopicRequest(system_id=self.system_id)
-        response_bytes = await self.msg_service.publish("REQ.SYSTEM.TOPIC", request_msg.SerializeToString(), True)
+        response_bytes = await self.msg_service.publish("REQ.SYSTEM.TOPIC", request_msg.SerializeToString(), True, hedge=self.topic_hedge)
         if response_bytes:
             response_msg = poq.SystemTopicResponse.FromString(response_bytes)
             if isinstance(response_msg, poq.SystemTopicResponse):
                 system_topics = response_msg.system_topics
                 system_set_presence_msg = poq.SystemSetLiveCharacterRequest(character_id=self.character_id, system_id=self.system_id, present=present)
+                # Straight away - a login waits on it, and a move right after must not overtake it.
                 await self.msg_service.publish(system_topics.publish_topic, system_set_presence_msg.SerializeToString(), False)
 
+    @common.telemetry.trace
+    async def move(self, system_id: int, /) -> bool:
+        async with self.move_lock:
+            request_msg = poq.SystemMoveRequest(character_id=self.character_id, from_system_id=self.system_id, to_system_id=system_id)
+            response_bytes = await self.msg_service.publish("REQ.SYSTEM.MOVE", request_msg.SerializeToString(), True)
+            if not response_bytes:
+                return False
+            response_msg = poq.SystemMoveResponse.FromString(response_bytes)
+            if not response_msg.ok:
+                return False
+
+            self.system_id = response_msg.system_id
+            live_info_msg = await self.live_info()
+            await self.msg_service.publish_latest(self.publish_topic, live_info_msg.SerializeToString())
+            self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: character_id:{self.character_id}, system_id:{self.system_id}")
+            return True
+
     @common.telemetry.trace
     async def character_sub_cb(self, topic: str, payload: bytes, /) -> bytes:
         msg = poq.SessionMessageRequest.FromString(payload)
@@ -76,18 +101,21 @@ class CharacterInstance(common.service.ServiceInstance):
         await self.msg_service.subscribe(self.subscribe_topic, self.character_sub_cb, False)
 
         live_info_msg = await self.live_info()
-        await self.msg_service.publish(self.publish_topic, live_info_msg.SerializeToString(), False)
+        await self.msg_service.publish_latest(self.publish_topic, live_info_msg.SerializeToString())
 
         await self._update_system_presence(True)
         self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: character_id:{self.character_id}")
         pass
 
     @common.telemetry.trace
-    async def stop(self):
-        await self._update_system_presence(False)
+    async def stop(self, /, notify_system: bool = True):
+        # A bulk stop leaves the system presence to the CharacterService, which sends it for all the characters at once.
+        async with self.move_lock:
+            if notify_system:
+                await self._update_system_presence(False)
 
         live_info_msg = await self.live_info(active=False)
-        await self.msg_service.publish(self.publish_topic, live_info_msg.SerializeToString(), False)
+        await self.msg_service.publish_latest(self.publish_topic, live_info_msg.SerializeToString())
 
         await self.msg_service.unsubscribe(self.subscribe_topic)
         await self.msg_service.unsubscribe(self.request_topic)
@@ -96,11 +124,35 @@ class CharacterInstance(common.service.ServiceInstance):
 
 class CharacterService(common.service.ServiceManager):
 
-    def __init__(self, msg_service: common.messaging.MessageService, characters: dict[int, common.universe.Character], /):
+    presence_chunk: int = 1000
+
+    def __init__(self, msg_service: common.messaging.MessageService, characters: dict[int, common.universe.Character], /,
+                 locations: common.locations.LocationStore | None = None, system_ids: typing.Collection[int] | None = None):
         super().__init__(msg_service, poq.ServiceType.CHARACTER_SERVICE)
         self.character_static_info = characters
+        # Where each character was last - without a store everyone starts in system 1.
+        self.locations = locations
+        # The systems of the universe - a stored location outside them (eg since removed)
+        # starts the character in system 1 too.
+        self.system_ids = set(system_ids) if system_ids is not None else None
+        self.character_static_version = common.universe.characters_version(characters)
         self.active_character_id: dict[int, CharacterInstance] = dict()
-
+        # The same character_ids in order, so a page of the presence dump is a bisect and
+        # a slice - kept by activate / deactivate.
+        self.active_character_order: list[int] = list()
+
+    def activate(self, character: CharacterInstance, /) -> None:
+        if character.character_id not in self.active_character_id:
+            bisect.insort(self.active_character_order, character.character_id)
+        self.active_character_id[character.character_id] = character
+
+    def deactivate(self, character_id: int, /) -> CharacterInstance | None:
+        character = self.active_character_id.pop(character_id, None)
+        if character is not None:
+            del self.active_character_order[bisect.bisect_left(self.active_character_order, character_id)]
+        return character
+
+    @common.service.memoize(4096)
     @common.telemetry.trace
     async def character_static_info_cb(self, topic: str, payload: bytes, /) -> bytes:
         msg = poq.CharacterStaticInfoRequest.FromString(payload)
@@ -110,7 +162,8 @@ class CharacterService(common.service.ServiceManager):
 
         if character_static_info:
             response = poq.CharacterStaticInfoResponse(ok=True,
-                character_static_info=poq.CharacterStaticInfoMessage(character_id=character_id, name=character_static_info.name))
+                character_static_info=poq.CharacterStaticInfoMessage(character_id=character_id, name=character_static_info.name,
+                                                                     version=self.character_static_version))
 
         self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {response=}")
         return response.SerializePartialToString()
@@ -127,12 +180,16 @@ class CharacterService(common.service.ServiceManager):
         previous_character = self.active_character_id.get(character_id)
         if previous_character:
             await previous_character.stop()
-            self.active_character_id.pop(character_id)
+            self.deactivate(character_id)
 
         character_static_info = self.character_static_info.get(character_id)
         if character_static_info:
-            character = CharacterInstance(self.msg_service, character_id, character_static_info.name)
-            self.active_character_id[character_id] = character
+            system_id = await self.locations.get(character_id) if self.locations else None
+            if system_id is not None and self.system_ids is not None and system_id not in self.system_ids:
+                self.logger.warning(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: character_id:{character_id}, unknown system_id:{system_id}")
+                system_id = None
+            character = CharacterInstance(self.msg_service, character_id, character_static_info.name, system_id=system_id or 1)
+            self.activate(character)
             await character.start()
             character_live_info = await character.live_info()
             response = poq.CharacterLoginResponse(ok=True, character_id=character.character_id, character_live_info=character_live_info)
@@ -151,13 +208,78 @@ class CharacterService(common.service.ServiceManager):
         character = self.active_character_id.get(character_id)
         if character:
             await character.stop()
-            self.active_character_id.pop(character_id)
+            self.deactivate(character_id)
             response = poq.CharacterLogoutResponse(ok=True)
 
         self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {msg=}")
 
         return response.SerializeToString()
 
+    async def stop_characters(self, character_ids: typing.Iterable[int], /) -> list[int]:
+        characters: list[CharacterInstance] = list()
+        for character_id in character_ids:
+            character = self.deactivate(character_id)
+            if character:
+                characters.append(character)
+
+        await self.bounded(character.stop(notify_system=False) for character in characters)
+
+        # Stopped characters no longer move, so their system_id is final.
+        for i in range(0, len(characters), self.presence_chunk):
+            presence = [poq.SystemSetLiveCharacterRequest(character_id=character.character_id, system_id=character.system_id, present=False)
+                        for character in characters[i:i + self.presence_chunk]]
+            request_msg = poq.SystemBulkSetLiveCharacterRequest(presence=presence)
+            await self.msg_service.publish("PUB.SYSTEM.PRESENCE", request_msg.SerializeToString(), False)
+
+        self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: characters:{len(characters)}")
+        return [character.character_id for character in characters]
+
+    @common.telemetry.trace
+    async def character_bulk_logout_cb(self, topic: str, payload: bytes, /) -> bytes:
+        msg = poq.CharacterBulkLogoutRequest.FromString(payload)
+
+        character_ids = await self.stop_characters(msg.character_id)
+        response = poq.CharacterBulkLogoutResponse(ok=True, character_id=character_ids)
+
+        self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: requested:{len(msg.character_id)}, stopped:{len(character_ids)}")
+        return response.SerializeToString()
+
+    @common.telemetry.trace
+    async def character_move_cb(self, topic: str, payload: bytes, /) -> bytes:
+        request = poq.CharacterMoveRequest.FromString(payload)
+
+        response = poq.CharacterMoveResponse(ok=False, character_id=request.character_id)
+        character = self.active_character_id.get(request.character_id)
+        if isinstance(character, CharacterInstance):
+            ok = await character.move(request.system_id)
+            if ok and self.locations:
+                self.locations.put(character.character_id, character.system_id)
+            response = poq.CharacterMoveResponse(ok=ok, character_id=request.character_id,
+                                                 character_live_info=await character.live_info())
+
+        self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name} {response=}")
+        return response.SerializeToString()
+
+    @common.telemetry.trace
+    async def character_presence_cb(self, topic: str, payload: bytes, /) -> bytes:
+        request = poq.CharacterPresenceRequest.FromString(payload)
+
+        # Paged by character_id so the dump can be followed with a cursor.
+        limit = min(request.limit or self.presence_chunk, self.presence_chunk)
+        start = bisect.bisect_right(self.active_character_order, request.after_character_id)
+        character_ids = self.active_character_order[start:start + limit + 1]
+        character_live_info = list()
+        for character_id in character_ids[:limit]:
+            # Characters can log out while earlier ones are read.
+            character = self.active_character_id.get(character_id)
+            if character:
+                character_live_info.append(await character.live_info())
+
+        response = poq.CharacterPresenceResponse(ok=True, character_live_info=character_live_info, more=len(character_ids) > limit)
+
+        self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: after:{request.after_character_id}, characters:{len(character_live_info)}, more:{response.more}")
+        return response.SerializeToString()
+
     @common.telemetry.trace
     async def character_topic_cb(self, topic: str, payload: bytes, /) -> bytes:
         request = poq.CharacterTopicRequest.FromString(payload)
@@ -171,34 +293,54 @@ class CharacterService(common.service.ServiceManager):
         self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name} {response=}")
         return response.SerializeToString()
 
+    def load(self) -> int:
+        return len(self.active_character_id)
+
+    def memory_structures(self) -> dict[str, typing.Any]:
+        structures = super().memory_structures()
+        structures["active_character_id"] = self.active_character_id
+        structures["active_character_order"] = self.active_character_order
+        structures["character_static_info"] = self.character_static_info
+        if self.locations is not None:
+            structures["locations.pending"] = self.locations.pending
+        return structures
+
     @common.telemetry.trace
     async def start(self):
         await super().start()
 
+        if self.locations:
+            await self.locations.start()
         await self.msg_service.subscribe("REQ.CHARACTER.STATIC", self.character_static_info_cb, True)
         await self.msg_service.subscribe("REQ.CHARACTER.LOGIN", self.character_login_cb, True)
         await self.msg_service.subscribe("REQ.CHARACTER.LOGOUT", self.character_logout_cb, True)
+        await self.msg_service.subscribe("REQ.CHARACTER.LOGOUT.BULK", self.character_bulk_logout_cb, True)
         await self.msg_service.subscribe("REQ.CHARACTER.TOPIC", self.character_topic_cb, True)
+        await self.msg_service.subscribe("REQ.CHARACTER.MOVE", self.character_move_cb, True, concurrent=True)
+        await self.msg_service.subscribe("REQ.CHARACTER.PRESENCE", self.character_presence_cb, True)
         self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}")
 
     @common.telemetry.trace
     async def stop(self):
 
+        await self.msg_service.unsubscribe("REQ.CHARACTER.PRESENCE")
+        await self.msg_service.unsubscribe("REQ.CHARACTER.MOVE")
         await self.msg_service.unsubscribe("REQ.CHARACTER.TOPIC")
+        await self.msg_service.unsubscribe("REQ.CHARACTER.LOGOUT.BULK")
         await self.msg_service.unsubscribe("REQ.CHARACTER.LOGOUT")
         await self.msg_service.unsubscribe("REQ.CHARACTER.LOGIN")
         await self.msg_service.unsubscribe("REQ.CHARACTER.STATIC")
 
-        for _, session in self.active_character_id.items():
-            await session.stop()
-        self.active_character_id.clear()
+        await self.stop_characters(list(self.active_character_id.keys()))
+        if self.locations:
+            await self.locations.stop()
 
         await super().stop()
         self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}")
 
 
-async def async_main(msg_service: common.messaging.MessageService, characters: dict):
-    service = CharacterService(msg_service, characters)
+async def async_main(msg_service: common.messaging.MessageService, characters: dict, locations: common.locations.LocationStore):
+    service = CharacterService(msg_service, characters, locations=locations, system_ids=common.universe.load_universe().keys())
     await service.start()
     await msg_service.run()
     await service.stop()
@@ -208,10 +350,7 @@ if __name__ == "__main__":
     dotenv.load_dotenv()
     common.telemetry.initialize_telemetry()
     logging.basicConfig(level=logging.INFO)
-    characters = dict()
-    with open('characters.json') as ifp:
-        for record in json.load(ifp):
-            system = common.universe.Character(**record)
-            characters[system.character_id] = system
+    characters = common.universe.load_characters()
+    locations = common.locations.LocationStore(os.environ.get("POQ_LOCATIONS", "poq_locations.sqlite3"))
     msg_service = common.messaging.MessageService()
-    asyncio.run(async_main(msg_service, characters))
+    asyncio.run(async_main(msg_service, characters, locations))
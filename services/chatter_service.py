@@ -2,6 +2,7 @@
 import asyncio
 import inspect
 import logging
+import typing
 
 import dotenv
 
@@ -33,7 +34,7 @@ class ChatterInstance(common.service.ServiceInstance):
     async def chatter_inbound_cb(self, topic: str, payload: bytes, /) -> bytes:
         msg = poq.ChatterMessage.FromString(payload)
         self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {msg=}")
-        await self.msg_service.publish(self.publish_topic, msg.SerializeToString(), False)
+        await self.msg_service.publish_batched(self.publish_topic, msg.SerializeToString())
 
     @common.telemetry.trace
     async def start(self):
@@ -71,6 +72,14 @@ class ChatterService(common.service.ServiceManager):
         self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name} {response=}")
         return response.SerializeToString()
 
+    def load(self) -> int:
+        return len(self.active_chatters)
+
+    def memory_structures(self) -> dict[str, typing.Any]:
+        structures = super().memory_structures()
+        structures["active_chatters"] = self.active_chatters
+        return structures
+
     @common.telemetry.trace
     async def start(self):
         await super().start()
@@ -84,8 +93,7 @@ class ChatterService(common.service.ServiceManager):
 
         await self.msg_service.unsubscribe("REQ.CHATTER.TOPIC")
 
-        for _, session in self.active_chatters.items():
-            await session.stop()
+        await self.stop_instances(self.active_chatters.values())
         self.active_chatters.clear()
         self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}")
 
@@ -1,16 +1,18 @@
 # Copyright (c) 2025 Jonathon Fletcher
 import asyncio
-import datetime
-import hashlib
 import inspect
-import json
 import logging
+import time
+import typing
 
 import dotenv
 
 import common.messaging
 import common.service
+import common.sessions
 import common.telemetry
+import common.timerwheel
+import common.universe
 import poq_pb2 as poq
 
 
@@ -18,17 +20,14 @@ class SessionInstance(common.service.ServiceInstance):
 
     session_id: str
     character_id: int
+    claims: common.sessions.SessionClaims
 
-    def new_session_id(self, character_id, /) -> str:
-        hash = hashlib.sha1()
-        hash.update(datetime.datetime.now(tz=datetime.UTC).isoformat().encode())
-        hash.update(str(character_id).encode())
-        return hash.hexdigest()
-
-    def __init__(self, msg_service: common.messaging.MessageService, character_id: int, /):
+    def __init__(self, msg_service: common.messaging.MessageService, claims: common.sessions.SessionClaims, session_id: str, /):
         super().__init__(msg_service)
-        self.character_id = character_id
-        self.session_id = self.new_session_id(self.character_id)
+        self.claims = claims
+        self.character_id = claims.character_id
+        # The signed token - any service with the key can check it without asking here.
+        self.session_id = session_id
         self.publish_topic = f"PUB.SESSION.OUT.{self.session_id}"
         self.subscribe_topic = f"PUB.SESSION.IN.{self.session_id}"
         self.request_topic = None
@@ -52,27 +51,80 @@ class SessionInstance(common.service.ServiceInstance):
         self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: session_id:{self.session_id}")
 
     @common.telemetry.trace
-    async def stop(self):
+    async def stop(self, /, logout: bool = True):
         stop_message = poq.SessionMessageResponse(type=poq.SessionMessageType.STOP)
         await self.msg_service.publish(self.publish_topic, stop_message.SerializeToString(), False)
         await self.msg_service.unsubscribe(self.subscribe_topic)
 
         # send character logout - fallback in case the client does not logout themselves
-        logoff_message = poq.CharacterLogoutRequest(character_id=self.character_id)
-        await self.msg_service.publish("REQ.CHARACTER.LOGOUT", logoff_message.SerializeToString(), False)
+        if logout:
+            logoff_message = poq.CharacterLogoutRequest(character_id=self.character_id)
+            await self.msg_service.publish("REQ.CHARACTER.LOGOUT", logoff_message.SerializeToString(), False)
 
         self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: session_id:{self.session_id}")
 
 
 class SessionService(common.service.ServiceManager):
 
-    def __init__(self, msg_service: common.messaging.MessageService, accounts: dict, /):
+    logout_chunk: int = 1000
+
+    def __init__(self, msg_service: common.messaging.MessageService, accounts: dict, /, session_timeout: float = 60.0, reap_interval: float = 1.0,
+                 tokens: common.sessions.SessionTokens | None = None, token_ttl: float = 86400.0):
         super().__init__(msg_service, poq.ServiceType.SESSION_SERVICE)
         self.accounts = accounts
+        self.tokens = tokens or common.sessions.SessionTokens(common.sessions.session_key())
+        self.token_ttl = token_ttl
+        # Milliseconds, so a restarted service issues later generations than before - and
+        # revokes everything it issued before (its sessions are gone).
+        self.generation = time.time_ns() // 1_000_000
+        self.tokens.min_generation = self.generation
         self.active_session_id: dict[str, SessionInstance] = dict()
         self.active_character_id: dict[int, str] = dict()
+        # A session that has not pinged for session_timeout is reaped.
+        self.session_timeout = session_timeout
+        self.reap_interval = reap_interval
+        self.session_expiry: common.timerwheel.TimerWheel = None
+        self.reap_task: asyncio.Task = None
         pass
 
+    def new_claims(self, character_id: int, /) -> common.sessions.SessionClaims:
+        self.generation = max(self.generation + 1, time.time_ns() // 1_000_000)
+        return common.sessions.SessionClaims(character_id, self.generation, int(time.time() + self.token_ttl))
+
+    async def revoke_sessions(self, sessions: list[SessionInstance], /) -> None:
+        # Only the changes are broadcast - followers joining later ask for the whole set.
+        for session in sessions:
+            self.tokens.revoke(session.claims)
+        revocations = self.tokens.revocations([session.claims for session in sessions])
+        await self.msg_service.publish("PUB.SESSION.REVOKED", revocations.SerializeToString(), False)
+
+    async def stop_sessions(self, sessions: list[SessionInstance], /) -> None:
+        # Sessions are stopped together and their characters logged out in bulk.
+        for session in sessions:
+            self.session_expiry.cancel(session.session_id)
+            self.active_session_id.pop(session.session_id, None)
+            if self.active_character_id.get(session.character_id) == session.session_id:
+                self.active_character_id.pop(session.character_id)
+        await self.revoke_sessions(sessions)
+        await self.bounded(session.stop(logout=False) for session in sessions)
+
+        for i in range(0, len(sessions), self.logout_chunk):
+            logout_message = poq.CharacterBulkLogoutRequest(character_id=[session.character_id for session in sessions[i:i + self.logout_chunk]])
+            await self.msg_service.publish("REQ.CHARACTER.LOGOUT.BULK", logout_message.SerializeToString(), True)
+
+    async def reap(self, /) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.reap_interval)
+            try:
+                expired = self.session_expiry.advance_to(loop.time())
+                sessions = [self.active_session_id[session_id] for session_id in expired if session_id in self.active_session_id]
+                if sessions:
+                    await self.stop_sessions(sessions)
+                    self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: expired:{len(sessions)}, active:{len(self.active_session_id)}")
+            except Exception as ex:
+                self.logger.error(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {ex!s}")
+
     @common.telemetry.trace
     async def session_start_cb(self, topic: str, payload: bytes, /) -> bytes:
         request = poq.SessionStartRequest.FromString(payload)
@@ -88,13 +140,17 @@ class SessionService(common.service.ServiceManager):
                 previous_session = self.active_session_id.get(previous_session_id)
                 if previous_session:
                     await previous_session.stop()
+                    self.session_expiry.cancel(previous_session.session_id)
                     self.active_character_id.pop(previous_session.character_id)
                     self.active_session_id.pop(previous_session.session_id)
+                    await self.revoke_sessions([previous_session])
 
             # Install new session
-            session = SessionInstance(self.msg_service, character_id)
+            claims = self.new_claims(character_id)
+            session = SessionInstance(self.msg_service, claims, self.tokens.issue(claims))
             self.active_session_id[session.session_id] = session
             self.active_character_id[character_id] = session.session_id
+            self.session_expiry.schedule(session.session_id, self.session_timeout)
             await session.start()
 
             response = poq.SessionStartResponse(
@@ -111,34 +167,78 @@ class SessionService(common.service.ServiceManager):
         request = poq.SessionStopRequest.FromString(payload)
 
         response = poq.SessionStopResponse(ok=False, session_id=request.session_id)
-        session = self.active_session_id.get(request.session_id)
+        # Forged and revoked tokens are turned away before the session table.
+        session = self.active_session_id.get(request.session_id) if self.tokens.verify(request.session_id, check_expiry=False) else None
         if session:
             await session.stop()
+            self.session_expiry.cancel(session.session_id)
             self.active_character_id.pop(session.character_id)
             self.active_session_id.pop(session.session_id)
+            await self.revoke_sessions([session])
             response = poq.SessionStopResponse(ok=True, session_id=request.session_id)
 
         self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: session_id:{request.session_id}")
 
         return response.SerializeToString()
 
+    @common.telemetry.trace
+    async def session_ping_cb(self, topic: str, payload: bytes, /) -> bytes:
+        request = poq.SessionPing.FromString(payload)
+
+        # An unknown (eg already reaped) or invalid session gets a pong without a session_id.
+        # The token's expiry only bounds opening the stream - a running session lasts as long
+        # as it pings.
+        response = poq.SessionPong()
+        if request.session_id in self.active_session_id and self.tokens.verify(request.session_id, check_expiry=False):
+            self.session_expiry.schedule(request.session_id, self.session_timeout)
+            response = poq.SessionPong(session_id=request.session_id)
+
+        return response.SerializeToString()
+
+    @common.telemetry.trace
+    async def session_revocations_cb(self, topic: str, payload: bytes, /) -> bytes:
+        return self.tokens.revocations().SerializeToString()
+
+    async def service_connected(self):
+        # Followers drop every token from before this start.
+        await self.msg_service.publish("PUB.SESSION.REVOKED", self.tokens.revocations().SerializeToString(), False)
+
+    def load(self) -> int:
+        return len(self.active_session_id)
+
+    def memory_structures(self) -> dict[str, typing.Any]:
+        structures = super().memory_structures()
+        structures["active_session_id"] = self.active_session_id
+        structures["active_character_id"] = self.active_character_id
+        structures["tokens.revoked"] = self.tokens.revoked
+        if self.session_expiry is not None:
+            structures["session_expiry"] = self.session_expiry
+        return structures
+
     @common.telemetry.trace
     async def start(self):
         await super().start()
 
+        self.session_expiry = common.timerwheel.TimerWheel(self.reap_interval, start=asyncio.get_running_loop().time())
         await self.msg_service.subscribe("REQ.SESSION.START", self.session_start_cb, True)
         await self.msg_service.subscribe("REQ.SESSION.STOP", self.session_stop_cb, True)
+        await self.msg_service.subscribe("REQ.SESSION.PING", self.session_ping_cb, True)
+        await self.msg_service.subscribe("REQ.SESSION.REVOCATIONS", self.session_revocations_cb, True)
+        self.reap_task = asyncio.create_task(self.reap())
         self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}")
 
     @common.telemetry.trace
     async def stop(self):
 
+        if self.reap_task:
+            self.reap_task.cancel()
+            self.reap_task = None
+        await self.msg_service.unsubscribe("REQ.SESSION.REVOCATIONS")
+        await self.msg_service.unsubscribe("REQ.SESSION.PING")
         await self.msg_service.unsubscribe("REQ.SESSION.STOP")
         await self.msg_service.unsubscribe("REQ.SESSION.START")
 
-        for _, session in self.active_session_id.items():
-            await session.stop()
-        self.active_session_id.clear()
+        await self.stop_sessions(list(self.active_session_id.values()))
 
         await super().stop()
         self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}")
@@ -155,10 +255,7 @@ if __name__ == "__main__":
     dotenv.load_dotenv()
     common.telemetry.initialize_telemetry()
     logging.basicConfig(level=logging.INFO)
-    accounts = dict()
-    with open('accounts.json') as ifp:
-        for record in json.load(ifp):
-            accounts[record['username']] = record['character_id']
+    accounts = common.universe.load_accounts()
 
     msg_service = common.messaging.MessageService()
     asyncio.run(async_main(msg_service, accounts))
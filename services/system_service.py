@@ -1,14 +1,19 @@
 # Copyright (c) 2025 Jonathon Fletcher
 import asyncio
+import collections
 import inspect
-import json
 import logging
+import os
+import time
+import typing
 
 import dotenv
 
 import common.messaging
+import common.presence
 import common.service
 import common.telemetry
+import common.timeseries
 import common.universe
 import poq_pb2 as poq
 
@@ -16,20 +21,38 @@ import poq_pb2 as poq
 class SystemInstance(common.service.ServiceInstance):
 
     system: common.universe.System
+    presence_index: dict[int, int]
+    feed_interval: float
+    character_live_info: dict[int, poq.CharacterLiveInfoMessage]
+    feed_pending: dict[int, poq.CharacterLiveInfoMessage]
 
-    def __init__(self, msg_service: common.messaging.MessageService, system: common.universe.System, /):
+    def __init__(self, msg_service: common.messaging.MessageService, system: common.universe.System, presence_index: dict[int, int], /, feed_interval: float = 0.1,
+                 replication: "SystemReplication" = None):
         super().__init__(msg_service)
         self.system = system
         self.system_presence = set()
+        # character_id -> system_id, shared by all the systems of the service.
+        self.presence_index = presence_index
+        self.replication = replication
+        # Set while the service is active, if it shares presence with readers on the host.
+        self.presence_table: common.presence.PresenceTable = None
+        # Set during a resync - the characters whose presence changed meanwhile.
+        self.touched: set[int] = None
+        self.feed_interval = feed_interval
+        self.character_live_info = dict()
+        self.feed_pending = dict()
+        self.feed_task: asyncio.Task = None
         self.publish_topic = f"PUB.SYSTEM.OUT.{self.system.system_id}"
         self.subscribe_topic = f"PUB.SYSTEM.IN.{self.system.system_id}"
         self.request_topic = f"REQ.SYSTEM.LIVE.{self.system.system_id}"
+        self.feed_topic = f"PUB.SYSTEM.FEED.{self.system.system_id}"
 
     async def topics(self) -> poq.TopicMessage:
         return poq.TopicMessage(
             subscribe_topic=self.publish_topic,
             publish_topic=self.subscribe_topic,
-            request_topic=self.request_topic)
+            request_topic=self.request_topic,
+            feed_topic=self.feed_topic)
 
     async def static_info(self) -> poq.SystemStaticInfoMessage:
         return poq.SystemStaticInfoMessage(system_id=self.system.system_id, name=self.system.name, neighbours=list(self.system.neighbours))
@@ -44,7 +67,7 @@ class SystemInstance(common.service.ServiceInstance):
         if request.system_id == self.system.system_id:
             system_live_info = await self.live_info()
             response = poq.SystemLiveInfoResponse(ok=True, system_id=self.system.system_id,
-                system_live_info=system_live_info)
+                system_live_info=system_live_info, character_live_info=list(self.character_live_info.values()))
 
         self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name} {response=}")
 
@@ -59,18 +82,76 @@ class SystemInstance(common.service.ServiceInstance):
 
         self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: system_id:{self.system.system_id}")
 
-        publish_update = False
-        if msg.present and msg.character_id not in self.system_presence:
-            self.system_presence.add(msg.character_id)
-            publish_update = True
-        elif msg.character_id in self.system_presence and not msg.present:
-            self.system_presence.remove(msg.character_id)
-            publish_update = True
-
-        if publish_update:
-            live_info = await self.live_info()
-            self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {self.publish_topic=}, {live_info=}")
-            await self.msg_service.publish(self.publish_topic, live_info.SerializeToString(), False)
+        if msg.present:
+            await self.update_presence({msg.character_id}, set())
+        else:
+            await self.update_presence(set(), {msg.character_id})
+
+    def apply_presence(self, arrived: set[int], departed: set[int], /) -> tuple[set[int], set[int]]:
+        # Just the state - a standby applies replicated changes without publishing them.
+        arrived = arrived.difference(self.system_presence)
+        departed = departed.intersection(self.system_presence)
+
+        self.system_presence.difference_update(departed)
+        self.system_presence.update(arrived)
+        for character_id in departed:
+            # Within a movement tick the arrival elsewhere may already be indexed.
+            if self.presence_index.get(character_id) == self.system.system_id:
+                del self.presence_index[character_id]
+        for character_id in arrived:
+            self.presence_index[character_id] = self.system.system_id
+        return arrived, departed
+
+    async def update_presence(self, arrived: set[int], departed: set[int], /) -> bool:
+        arrived, departed = self.apply_presence(arrived, departed)
+        if not arrived and not departed:
+            return False
+        if self.touched is not None:
+            self.touched.update(arrived)
+            self.touched.update(departed)
+        if self.replication:
+            self.replication.record(self.system.system_id, arrived, departed)
+        if self.presence_table:
+            self.presence_table.write(self.system.system_id, self.system_presence)
+
+        for character_id in departed:
+            self.character_live_info.pop(character_id, None)
+            self.feed_pending.pop(character_id, None)
+        for character_id in arrived:
+            # Placeholder until the character publishes its own live info.
+            self.feed(poq.CharacterLiveInfoMessage(character_id=character_id, system_id=self.system.system_id, active=True))
+
+        live_info = await self.live_info()
+        self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {self.publish_topic=}, {live_info=}")
+        await self.msg_service.publish_latest(self.publish_topic, live_info.SerializeToString())
+        return True
+
+    async def announce_presence(self, /) -> None:
+        # After a takeover - the replicated presence, with placeholder live info.
+        for character_id in self.system_presence:
+            self.feed(poq.CharacterLiveInfoMessage(character_id=character_id, system_id=self.system.system_id, active=True))
+        live_info = await self.live_info()
+        await self.msg_service.publish_latest(self.publish_topic, live_info.SerializeToString())
+
+    def feed(self, msg: poq.CharacterLiveInfoMessage, /) -> None:
+        if msg.character_id not in self.system_presence:
+            return
+        self.character_live_info[msg.character_id] = msg
+        # Changes are batched - only the latest live info of each local is sent.
+        self.feed_pending[msg.character_id] = msg
+        if self.feed_task is None:
+            self.feed_task = asyncio.create_task(self.feed_flush())
+
+    async def feed_flush(self, /) -> None:
+        try:
+            await asyncio.sleep(self.feed_interval)
+        finally:
+            self.feed_task = None
+        if not self.feed_pending:
+            return
+        msg = poq.SystemCharacterFeedMessage(system_id=self.system.system_id, character_live_info=list(self.feed_pending.values()))
+        self.feed_pending.clear()
+        await self.msg_service.publish(self.feed_topic, msg.SerializeToString(), False)
 
     @common.telemetry.trace
     async def start(self):
@@ -82,16 +163,421 @@ class SystemInstance(common.service.ServiceInstance):
     async def stop(self):
         await self.msg_service.unsubscribe(self.subscribe_topic)
         await self.msg_service.unsubscribe(self.request_topic)
+        if self.feed_task:
+            self.feed_task.cancel()
+            self.feed_task = None
+        self.feed_pending.clear()
+        self.character_live_info.clear()
         self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: system_id:{self.system.system_id}")
 
 
+class MovementEngine:
+
+    tick: float
+    pending: dict[int, tuple[int, int, asyncio.Future]]
+
+    def __init__(self, active_systems: dict[int, SystemInstance], tick: float, /):
+        self.logger = logging.getLogger()
+        self.active_systems = active_systems
+        self.tick = tick
+        self.pending = dict()
+        self.task: asyncio.Task = None
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, result: bool, /) -> None:
+        # The requester may have given up (and cancelled the future) already.
+        if not future.done():
+            future.set_result(result)
+
+    def submit(self, character_id: int, from_system_id: int, to_system_id: int, /) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        if character_id in self.pending:
+            # One move per character per tick.
+            future.set_result(False)
+        else:
+            self.pending[character_id] = (from_system_id, to_system_id, future)
+        return future
+
+    @common.telemetry.trace
+    async def apply(self, /) -> None:
+        if not self.pending:
+            return
+        moves, self.pending = self.pending, dict()
+
+        arrivals: dict[int, set[int]] = collections.defaultdict(set)
+        departures: dict[int, set[int]] = collections.defaultdict(set)
+        accepted: list[asyncio.Future] = list()
+        for character_id, (from_system_id, to_system_id, future) in moves.items():
+            source = self.active_systems.get(from_system_id)
+            if source is None or to_system_id not in self.active_systems or character_id not in source.system_presence:
+                self._resolve(future, False)
+                continue
+            departures[from_system_id].add(character_id)
+            arrivals[to_system_id].add(character_id)
+            accepted.append(future)
+
+        # One presence update (and so one publish) per touched system.
+        for system_id in departures.keys() | arrivals.keys():
+            await self.active_systems[system_id].update_presence(arrivals.get(system_id, set()), departures.get(system_id, set()))
+
+        for future in accepted:
+            self._resolve(future, True)
+
+        self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: moves:{len(moves)}, accepted:{len(accepted)}, systems:{len(departures.keys() | arrivals.keys())}")
+
+    async def run(self, /) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        while True:
+            deadline += self.tick
+            await asyncio.sleep(max(0, deadline - loop.time()))
+            try:
+                await self.apply()
+            except Exception as ex:
+                self.logger.error(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {ex!s}")
+
+    async def start(self, /) -> None:
+        self.task = asyncio.create_task(self.run())
+
+    async def stop(self, /) -> None:
+        if self.task:
+            self.task.cancel()
+            self.task = None
+        for _, _, future in self.pending.values():
+            self._resolve(future, False)
+        self.pending.clear()
+
+
+class SystemReplication:
+
+    topic: str = "PUB.SYSTEM.REPLICA"
+    request_topic: str = "REQ.SYSTEM.REPLICA"
+    heartbeat_interval: float
+    snapshot_interval: float
+    failover_heartbeats: int
+    failover_timeout: float
+    probe_timeout: float
+    epoch: int
+    sequence: int
+    pending: list[poq.SystemReplicaChange]
+
+    def __init__(self, msg_service: common.messaging.MessageService, active_systems: dict[int, SystemInstance], instance_id: str, /,
+                 heartbeat_interval: float = 0.1, snapshot_interval: float = 5.0, failover_heartbeats: int = 10, probe_timeout: float = 0.5):
+        self.logger = logging.getLogger()
+        self.msg_service = msg_service
+        self.active_systems = active_systems
+        self.instance_id = instance_id
+        self.heartbeat_interval = heartbeat_interval
+        self.snapshot_interval = snapshot_interval
+        # A standby only takes over once this many heartbeats in a row are missed, and the
+        # primary has not answered a snapshot request within probe_timeout.
+        self.failover_heartbeats = failover_heartbeats
+        self.failover_timeout = heartbeat_interval * failover_heartbeats
+        self.probe_timeout = probe_timeout
+        # Set by the SystemService - called when this standby takes over / the active
+        # service finds a newer one.
+        self.promote: typing.Callable[[], typing.Awaitable] = None
+        self.demote: typing.Callable[[], typing.Awaitable] = None
+        self.active = False
+        # A takeover starts a new epoch - anything from an older one is ignored, and an
+        # active service that hears a newer one stands down.
+        self.epoch = 0
+        self.primary_id: str = None
+        self.sequence = 0
+        self.pending = list()
+        self.flush_task: asyncio.Task = None
+        self.task: asyncio.Task = None
+        self.last_sent = 0.0
+        self.last_snapshot = 0.0
+        self.last_seen = 0.0
+        self.synced = False
+
+    def record(self, system_id: int, arrived: set[int], departed: set[int], /) -> None:
+        if not self.active:
+            return
+        self.pending.append(poq.SystemReplicaChange(system_id=system_id, arrived=arrived, departed=departed))
+        if self.flush_task is None:
+            self.flush_task = asyncio.create_task(self.flush())
+
+    def message(self, /, snapshot: bool = False, handover: bool = False) -> poq.SystemReplicaMessage:
+        changes = None
+        if snapshot:
+            changes = [poq.SystemReplicaChange(system_id=system_id, arrived=system.system_presence)
+                       for system_id, system in self.active_systems.items() if system.system_presence]
+        return poq.SystemReplicaMessage(instance_id=self.instance_id, epoch=self.epoch, sequence=self.sequence,
+                                        snapshot=snapshot, handover=handover, changes=changes)
+
+    async def send(self, msg: poq.SystemReplicaMessage, /) -> None:
+        self.last_sent = asyncio.get_running_loop().time()
+        await self.msg_service.publish(self.topic, msg.SerializeToString(), False)
+
+    async def flush(self, /) -> None:
+        # Every change made in this pass of the event loop (eg a whole movement tick) in one
+        # message, on the control connection so they arrive in order.
+        try:
+            await asyncio.sleep(0)
+        finally:
+            self.flush_task = None
+        if not self.pending or not self.active:
+            return
+        changes, self.pending = self.pending, list()
+        self.sequence += 1
+        msg = self.message()
+        msg.changes.extend(changes)
+        await self.send(msg)
+
+    def apply(self, msg: poq.SystemReplicaMessage, /) -> None:
+        for change in msg.changes:
+            system = self.active_systems.get(change.system_id)
+            if isinstance(system, SystemInstance):
+                system.apply_presence(set(change.arrived), set(change.departed))
+
+    def restore(self, msg: poq.SystemReplicaMessage, /) -> None:
+        presence = {change.system_id: set(change.arrived) for change in msg.changes}
+        for system_id, system in self.active_systems.items():
+            present = presence.get(system_id, set())
+            system.apply_presence(present.difference(system.system_presence), system.system_presence.difference(present))
+        self.sequence = msg.sequence
+        self.synced = True
+
+    async def resync(self, /) -> None:
+        response_bytes = await self.msg_service.publish(f"{self.request_topic}.{self.primary_id}", b"", True)
+        if not response_bytes:
+            self.logger.warning(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: no snapshot")
+            return
+        msg = poq.SystemReplicaMessage.FromString(response_bytes)
+        if msg.epoch == self.epoch and not self.active:
+            self.restore(msg)
+            self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: epoch:{self.epoch}, sequence:{self.sequence}, characters:{sum(len(c.arrived) for c in msg.changes)}")
+
+    async def replica_cb(self, topic: str, payload: bytes, /) -> None:
+        msg = poq.SystemReplicaMessage.FromString(payload)
+        if msg.instance_id == self.instance_id or msg.epoch < self.epoch:
+            return
+        if self.active:
+            # Two active services - the newer epoch (or else the higher instance_id) wins.
+            if msg.epoch == self.epoch and msg.instance_id < self.instance_id:
+                return
+            self.logger.warning(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: standing down for {msg.instance_id}, epoch:{msg.epoch}")
+            self.active = False
+            self.synced = False
+            await self.demote()
+
+        if msg.epoch > self.epoch or msg.instance_id != self.primary_id:
+            self.epoch, self.primary_id, self.synced = msg.epoch, msg.instance_id, False
+        self.last_seen = asyncio.get_running_loop().time()
+
+        if msg.snapshot:
+            self.restore(msg)
+        else:
+            # The first message from this primary - start from a snapshot. Messages queue
+            # behind it, and those it already covers are skipped.
+            if not self.synced:
+                await self.resync()
+            if self.synced and msg.sequence == self.sequence + 1:
+                self.apply(msg)
+                self.sequence = msg.sequence
+            elif self.synced and msg.sequence > self.sequence:
+                self.logger.warning(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: gap after sequence:{self.sequence}, got:{msg.sequence}")
+                self.synced = False
+                await self.resync()
+
+        if msg.handover:
+            await self.take_over()
+
+    async def replica_request_cb(self, topic: str, payload: bytes, /) -> bytes:
+        return self.message(snapshot=True).SerializeToString()
+
+    async def primary_alive(self, /) -> bool:
+        # Asked before taking over - a primary that answers was only slow (eg a stalled
+        # event loop), and the standby carries on from its snapshot instead.
+        if self.primary_id is None:
+            return False
+        response_bytes = await self.msg_service.publish(f"{self.request_topic}.{self.primary_id}", b"", True, timeout=self.probe_timeout)
+        if not response_bytes:
+            return False
+        msg = poq.SystemReplicaMessage.FromString(response_bytes)
+        self.last_seen = asyncio.get_running_loop().time()
+        if msg.epoch == self.epoch and not self.active:
+            self.restore(msg)
+        self.logger.warning(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {self.primary_id} silent but answering, epoch:{msg.epoch}")
+        return True
+
+    async def take_over(self, /) -> None:
+        self.epoch += 1
+        self.primary_id = self.instance_id
+        self.active = True
+        self.logger.warning(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: epoch:{self.epoch}, sequence:{self.sequence}")
+        await self.promote()
+        await self.send(self.message(snapshot=True))
+
+    async def run(self, /) -> None:
+        loop = asyncio.get_running_loop()
+        await self.msg_service.connected.wait()
+        self.last_seen = now = loop.time()
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                # A pass that comes late means this loop stalled, and the log may be queued
+                # behind it rather than missing - give it a pass to arrive.
+                previous, now = now, loop.time()
+                stalled = now - previous >= self.failover_timeout
+                if self.active:
+                    if now - self.last_snapshot >= self.snapshot_interval:
+                        self.last_snapshot = now
+                        await self.send(self.message(snapshot=True))
+                    elif now - self.last_sent >= self.heartbeat_interval:
+                        await self.send(self.message())
+                elif not stalled and now - self.last_seen >= self.failover_timeout and not await self.primary_alive():
+                    # Anything heard during the probe (eg a handover) counts.
+                    if not self.active and loop.time() - self.last_seen >= self.failover_timeout:
+                        await self.take_over()
+            except Exception as ex:
+                self.logger.error(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {ex!s}")
+
+    async def start(self, active: bool, /) -> None:
+        self.active = active
+        await self.msg_service.subscribe(self.topic, self.replica_cb, False)
+        # Snapshots are asked of the primary by name - never of another standby.
+        await self.msg_service.subscribe(f"{self.request_topic}.{self.instance_id}", self.replica_request_cb, False)
+        self.task = asyncio.create_task(self.run())
+
+    async def stop(self, /) -> None:
+        if self.task:
+            self.task.cancel()
+            self.task = None
+        if self.active:
+            # A clean stop hands over straight away rather than after failover_timeout.
+            await self.send(self.message(snapshot=True, handover=True))
+            self.active = False
+        await self.msg_service.unsubscribe(f"{self.request_topic}.{self.instance_id}")
+        await self.msg_service.unsubscribe(self.topic)
+
+
 class SystemService(common.service.ServiceManager):
 
-    def __init__(self, msg_service: common.messaging.MessageService, universe: dict, /):
+    presence_hedge: float = 0.5
+    region_max_jumps: int = 8
+
+    def __init__(self, msg_service: common.messaging.MessageService, universe: dict, /, movement_tick: float = 0.25, feed_interval: float = 0.1,
+                 standby: bool = False, presence_shm: str | None = None,
+                 history_resolutions: typing.Sequence[common.timeseries.Resolution] = common.timeseries.DEFAULT_RESOLUTIONS):
         super().__init__(msg_service, poq.ServiceType.SYSTEM_SERVICE)
         self.universe = universe
+        self.feed_interval = feed_interval
+        self.universe_version = common.universe.universe_version(universe)
         self.active_systems: dict[int, SystemInstance] = dict()
+        self.presence_index: dict[int, int] = dict()
+        self.movement = MovementEngine(self.active_systems, movement_tick)
+        self.presence_synced = asyncio.Event()
+        self.resync_lock = asyncio.Lock()
+        # A standby keeps the presence of the active service, and serves once it takes over.
+        self.standby = standby
+        self.serving = False
+        self.replication = SystemReplication(msg_service, self.active_systems, self.instance_id)
+        self.replication.promote = self.take_over
+        self.replication.demote = self.stand_down
+        self.resync_task: asyncio.Task = None
+        # Name of a shared memory segment for same-host presence readers (common.presence).
+        self.presence_shm = presence_shm
+        self.presence_table: common.presence.PresenceTable = None
+        # Population of every system, sampled at the finest resolution. A standby samples
+        # its replicated presence too, so the history survives a takeover.
+        self.history_resolutions = history_resolutions
+        self.history: common.timeseries.TimeSeries = None
+        self.history_task: asyncio.Task = None
 
+    @common.telemetry.trace
+    async def resync_presence(self, /) -> bool:
+        # One at a time - each pass covers every system anyway.
+        async with self.resync_lock:
+            # Logins, logouts and moves keep landing while the dump is paged in. Characters
+            # they touch are newer than the dump, and are left as they are.
+            touched: set[int] = set()
+            for system in self.active_systems.values():
+                system.touched = touched
+            try:
+                presence: dict[int, set[int]] = collections.defaultdict(set)
+                after_character_id = 0
+                while True:
+                    request = poq.CharacterPresenceRequest(after_character_id=after_character_id)
+                    response_bytes = await self.msg_service.publish("REQ.CHARACTER.PRESENCE", request.SerializeToString(), True, hedge=self.presence_hedge)
+                    if not response_bytes:
+                        self.logger.warning(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: no reply after character_id:{after_character_id}")
+                        return False
+                    response = poq.CharacterPresenceResponse.FromString(response_bytes)
+                    for character_live_info in response.character_live_info:
+                        presence[character_live_info.system_id].add(character_live_info.character_id)
+                        after_character_id = character_live_info.character_id
+                    if not response.more or not response.character_live_info:
+                        break
+
+                # One pass over every system, replacing whatever presence it held.
+                for system_id, system in self.active_systems.items():
+                    present = presence.get(system_id, set())
+                    await system.update_presence(present.difference(system.system_presence, touched), system.system_presence.difference(present, touched))
+            finally:
+                for system in self.active_systems.values():
+                    system.touched = None
+
+        self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: characters:{len(self.presence_index)}, systems:{len(presence)}, touched:{len(touched)}")
+        return True
+
+    def load(self) -> int:
+        return len(self.presence_index)
+
+    def memory_structures(self) -> dict[str, typing.Any]:
+        structures = super().memory_structures()
+        structures["active_systems"] = self.active_systems
+        structures["presence_index"] = self.presence_index
+        structures["movement.pending"] = self.movement.pending
+        structures["replication.pending"] = self.replication.pending
+        if self.history is not None:
+            structures["history"] = self.history
+        return structures
+
+    async def sample_history(self, /) -> None:
+        loop = asyncio.get_running_loop()
+        interval = self.history.levels[0].resolution.interval
+        deadline = loop.time()
+        while True:
+            deadline += interval
+            await asyncio.sleep(max(0, deadline - loop.time()))
+            try:
+                self.history.record([len(system.system_presence) for system in self.active_systems.values()], time.time())
+            except Exception as ex:
+                self.logger.error(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {ex!s}")
+
+    async def service_connected(self):
+        if self.standby:
+            return
+        try:
+            await self.resync_presence()
+        finally:
+            # Presence queries wait for the first resync, however it went.
+            self.presence_synced.set()
+
+    async def service_startup_cb(self, topic: str, payload: bytes, /) -> bytes:
+        await super().service_startup_cb(topic, payload)
+        msg = poq.ServiceStart.FromString(payload)
+        if msg.type == poq.ServiceType.CHARACTER_SERVICE and self.serving:
+            await self.resync_presence()
+
+    async def take_over(self, /) -> None:
+        await self.activate()
+        # The replicated presence is served straight away, then checked against the
+        # CharacterService for anything the old primary had not yet sent.
+        self.presence_synced.set()
+        await self.bounded(system.announce_presence() for system in self.active_systems.values() if system.system_presence)
+        self.resync_task = asyncio.create_task(self.resync_presence())
+        self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: characters:{len(self.presence_index)}")
+
+    async def stand_down(self, /) -> None:
+        self.presence_synced.clear()
+        await self.deactivate()
+        self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}")
+
+    @common.service.memoize()
     @common.telemetry.trace
     async def system_static_info_cb(self, topic: str, payload: bytes, /) -> bytes:
         request = poq.SystemStaticInfoRequest.FromString(payload)
@@ -106,6 +592,7 @@ class SystemService(common.service.ServiceManager):
 
         return response.SerializeToString()
 
+    @common.service.memoize()
     @common.telemetry.trace
     async def system_topic_cb(self, topic: str, payload: bytes, /) -> bytes:
         request = poq.SystemTopicRequest.FromString(payload)
@@ -119,18 +606,174 @@ class SystemService(common.service.ServiceManager):
         self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name} {response=}")
         return response.SerializeToString()
 
+    @common.telemetry.trace
+    async def system_move_cb(self, topic: str, payload: bytes, /) -> bytes:
+        request = poq.SystemMoveRequest.FromString(payload)
+        await self.presence_synced.wait()
+
+        response = poq.SystemMoveResponse(ok=False, character_id=request.character_id, system_id=request.from_system_id)
+        source = self.universe.get(request.from_system_id)
+        if isinstance(source, common.universe.System) and request.to_system_id in source.neighbours:
+            if await self.movement.submit(request.character_id, request.from_system_id, request.to_system_id):
+                response = poq.SystemMoveResponse(ok=True, character_id=request.character_id, system_id=request.to_system_id)
+
+        self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name} {response=}")
+        return response.SerializeToString()
+
+    @common.telemetry.trace
+    async def system_whereis_cb(self, topic: str, payload: bytes, /) -> bytes:
+        request = poq.SystemWhereIsRequest.FromString(payload)
+        await self.presence_synced.wait()
+
+        character_live_info = list()
+        for character_id in request.character_id:
+            system_id = self.presence_index.get(character_id, 0)
+            character_live_info.append(poq.CharacterLiveInfoMessage(character_id=character_id, system_id=system_id, active=system_id != 0))
+
+        # Only populated systems are listed - any other system is empty.
+        population = list()
+        if request.population:
+            for system_id, system in self.active_systems.items():
+                if system.system_presence:
+                    population.append(poq.SystemPopulationMessage(system_id=system_id, population=len(system.system_presence)))
+
+        response = poq.SystemWhereIsResponse(ok=True, character_live_info=character_live_info, population=population)
+
+        self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: characters:{len(character_live_info)}, systems:{len(population)}")
+        return response.SerializeToString()
+
+    @common.telemetry.trace
+    async def system_bulk_presence_cb(self, topic: str, payload: bytes, /) -> None:
+        msg = poq.SystemBulkSetLiveCharacterRequest.FromString(payload)
+
+        arrivals: dict[int, set[int]] = collections.defaultdict(set)
+        departures: dict[int, set[int]] = collections.defaultdict(set)
+        for presence in msg.presence:
+            if presence.present:
+                arrivals[presence.system_id].add(presence.character_id)
+            else:
+                departures[presence.system_id].add(presence.character_id)
+
+        # One presence update (and so one publish) per touched system.
+        for system_id in departures.keys() | arrivals.keys():
+            system = self.active_systems.get(system_id)
+            if isinstance(system, SystemInstance):
+                await system.update_presence(arrivals.get(system_id, set()), departures.get(system_id, set()))
+
+        self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: presence:{len(msg.presence)}, systems:{len(departures.keys() | arrivals.keys())}")
+
+    @common.telemetry.trace
+    async def character_out_cb(self, topic: str, payload: bytes, /) -> None:
+        msg = poq.CharacterLiveInfoMessage.FromString(payload)
+        system = self.active_systems.get(self.presence_index.get(msg.character_id))
+        if isinstance(system, SystemInstance):
+            system.feed(msg)
+
+    @common.service.memoize(1024)
     @common.telemetry.trace
     async def system_universe_cb(self, topic: str, payload: bytes, /) -> bytes:
-        _ = poq.UniverseRequest.FromString(payload)
+        request = poq.UniverseRequest.FromString(payload)
+
+        # Scoped - just the systems asked for, whatever version the client holds.
+        if request.system_id or request.system_ids:
+            system_ids = set(request.system_ids)
+            if request.system_id:
+                system_ids.update(common.universe.region(self.universe, request.system_id, min(request.jumps, self.region_max_jumps)))
+            system_list = [poq.SystemStaticInfoMessage(system_id=s.system_id, name=s.name, neighbours=list(s.neighbours))
+                           for s in (self.universe[system_id] for system_id in sorted(system_ids) if system_id in self.universe)]
+            response = poq.UniverseResponse(ok=True, systems=system_list, version=self.universe_version)
+            self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: system_id:{request.system_id}, jumps:{request.jumps}, systems:{len(system_list)}")
+            return response.SerializeToString()
+
+        # The client already holds this version of the universe - nothing to send.
+        if request.version == self.universe_version:
+            response = poq.UniverseResponse(ok=True, version=self.universe_version)
+            self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: version:{self.universe_version} unchanged")
+            return response.SerializeToString()
 
         system_list = list()
         for s in self.universe.values():
             s: common.universe.System
             system_list.append(poq.SystemStaticInfoMessage(system_id=s.system_id, name=s.name, neighbours=list(s.neighbours)))
 
-        response = poq.UniverseResponse(ok=True, systems=list(system_list))
+        response = poq.UniverseResponse(ok=True, systems=list(system_list), version=self.universe_version)
+
+        self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: version:{self.universe_version}")
+        return response.SerializeToString()
+
+    async def activate(self, /) -> None:
+        # The subscriptions that serve - only held by the active service.
+        self.serving = True
+        if self.presence_shm:
+            # Only the active service writes the table - a takeover starts a new one.
+            self.presence_table = common.presence.PresenceTable(self.presence_shm, list(self.active_systems.keys()))
+            for system_id, system in self.active_systems.items():
+                system.presence_table = self.presence_table
+                self.presence_table.write(system_id, system.system_presence)
+        await self.start_instances(self.active_systems.values())
+
+        await self.msg_service.subscribe("REQ.SYSTEM.STATIC", self.system_static_info_cb, True)
+        await self.msg_service.subscribe("REQ.SYSTEM.TOPIC", self.system_topic_cb, True)
+        await self.msg_service.subscribe("REQ.SYSTEM.WHEREIS", self.system_whereis_cb, True)
+        await self.msg_service.subscribe("REQ.SYSTEM.HISTORY", self.system_history_cb, True)
+        await self.msg_service.subscribe("PUB.SYSTEM.PRESENCE", self.system_bulk_presence_cb, False)
+
+        await self.movement.start()
+        await self.msg_service.subscribe("REQ.SYSTEM.MOVE", self.system_move_cb, True, concurrent=True)
+
+        await self.msg_service.subscribe("REQ.UNIVERSE.STATIC", self.system_universe_cb, True)
+        await self.msg_service.subscribe("PUB.CHARACTER.OUT.*", self.character_out_cb, False)
+        self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}")
+
+    async def deactivate(self, /) -> None:
+        self.serving = False
+        if self.resync_task:
+            self.resync_task.cancel()
+            self.resync_task = None
+        await self.msg_service.unsubscribe("PUB.CHARACTER.OUT.*")
+        await self.msg_service.unsubscribe("REQ.UNIVERSE.STATIC")
 
+        await self.msg_service.unsubscribe("REQ.SYSTEM.MOVE")
+        await self.movement.stop()
+
+        await self.msg_service.unsubscribe("PUB.SYSTEM.PRESENCE")
+        await self.msg_service.unsubscribe("REQ.SYSTEM.HISTORY")
+        await self.msg_service.unsubscribe("REQ.SYSTEM.WHEREIS")
+        await self.msg_service.unsubscribe("REQ.SYSTEM.TOPIC")
+        await self.msg_service.unsubscribe("REQ.SYSTEM.STATIC")
+
+        await self.stop_instances(self.active_systems.values())
+        if self.presence_table:
+            for system in self.active_systems.values():
+                system.presence_table = None
+            self.presence_table.close()
+            self.presence_table = None
         self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}")
+
+    @common.telemetry.trace
+    async def system_history_cb(self, topic: str, payload: bytes, /) -> bytes:
+        request = poq.SystemHistoryRequest.FromString(payload)
+
+        level = self.history.level(request.resolution or self.history.levels[0].resolution.name)
+        if level is None:
+            return poq.SystemHistoryResponse(ok=False, resolution=request.resolution).SerializeToString()
+
+        system_ids = set(request.system_ids)
+        if request.system_id:
+            system_ids.update(common.universe.region(self.universe, request.system_id, min(request.jumps, self.region_max_jumps)))
+
+        start_time = 0
+        systems = list()
+        for system_id in sorted(system_ids):
+            index = self.history.index.get(system_id)
+            if index is None:
+                continue
+            first, means, peaks = level.series(index, request.points)
+            start_time = first * level.resolution.interval
+            systems.append(poq.SystemHistoryMessage(system_id=system_id, mean=means, peak=peaks))
+
+        response = poq.SystemHistoryResponse(ok=True, resolution=level.resolution.name, interval=level.resolution.interval, start_time=start_time, systems=systems)
+        self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: resolution:{level.resolution.name}, systems:{len(systems)}")
         return response.SerializeToString()
 
     @common.telemetry.trace
@@ -138,33 +781,39 @@ class SystemService(common.service.ServiceManager):
         await super().start()
 
         for _, system in self.universe.items():
-            s = SystemInstance(self.msg_service, system)
-            await s.start()
+            s = SystemInstance(self.msg_service, system, self.presence_index, feed_interval=self.feed_interval, replication=self.replication)
             self.active_systems[s.system.system_id] = s
 
-        await self.msg_service.subscribe("REQ.SYSTEM.STATIC", self.system_static_info_cb, True)
-        await self.msg_service.subscribe("REQ.SYSTEM.TOPIC", self.system_topic_cb, True)
+        self.history = common.timeseries.TimeSeries(list(self.active_systems.keys()), self.history_resolutions)
+        self.history_task = asyncio.create_task(self.sample_history())
+        self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: {self.history}")
 
-        await self.msg_service.subscribe("REQ.UNIVERSE.STATIC", self.system_universe_cb, True)
-        self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}")
+        await self.replication.start(not self.standby)
+        if not self.standby:
+            await self.activate()
+        self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}: standby:{self.standby}")
 
     @common.telemetry.trace
     async def stop(self):
-        await self.msg_service.unsubscribe("REQ.UNIVERSE.STATIC")
-
-        await self.msg_service.unsubscribe("REQ.SYSTEM.TOPIC")
-        await self.msg_service.unsubscribe("REQ.SYSTEM.STATIC")
+        if self.serving:
+            await self.deactivate()
+        # Hands over to the standby, if this is the active service.
+        await self.replication.stop()
+        if self.history_task:
+            self.history_task.cancel()
+            self.history_task = None
 
-        for _, session in self.active_systems.items():
-            await session.stop()
         self.active_systems.clear()
+        self.presence_index.clear()
+        self.presence_synced.clear()
         self.logger.info(f"{self.__class__.__name__}.{inspect.currentframe().f_code.co_name}")
 
         await super().stop()
 
 
 async def async_main(msg_service: common.messaging.MessageService, universe: dict):
-    service = SystemService(msg_service, universe)
+    service = SystemService(msg_service, universe, standby=os.environ.get("POQ_SYSTEM_STANDBY", "").lower() in ("1", "true"),
+                            presence_shm=os.environ.get("POQ_PRESENCE_SHM"))
     await service.start()
     await msg_service.run()
     await service.stop()
@@ -174,10 +823,6 @@ if __name__ == "__main__":
     dotenv.load_dotenv()
     common.telemetry.initialize_telemetry()
     logging.basicConfig(level=logging.INFO)
-    universe: dict[int, common.universe.System] = dict()
-    with open('universe.json') as ifp:
-        for record in json.load(ifp):
-            system = common.universe.System(**record)
-            universe[system.system_id] = system
+    universe = common.universe.load_universe()
     msg_service = common.messaging.MessageService()
     asyncio.run(async_main(msg_service, universe))
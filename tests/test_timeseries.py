@@ -0,0 +1,42 @@
+# Copyright (c) 2025 Jonathon Fletcher
+import unittest
+
+import common.timeseries
+
+
+class TimeSeriesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.history = common.timeseries.TimeSeries([1, 2], (common.timeseries.Resolution("1s", 1, 10), common.timeseries.Resolution("5s", 5, 4)))
+
+    def test_jitter_at_bucket_boundaries(self):
+        # Samples a second apart, either side of the boundaries - one point each, no zeros.
+        for i, timestamp in enumerate((100.999, 102.001, 102.999, 104.002, 104.998, 106.001)):
+            self.history.record([i + 1, 7], timestamp)
+        first, means, peaks = self.history.level("1s").series(1, 0)
+        self.assertEqual(first, 100)
+        self.assertEqual(means, [7.0] * 5)
+        self.assertEqual(self.history.level("1s").series(0, 0)[1], [1.0, 2.0, 3.0, 4.0, 5.0])
+
+    def test_clock_step_back(self):
+        for i, timestamp in enumerate((200.0, 201.0, 199.5, 202.0)):
+            self.history.record([i + 1, 1], timestamp)
+        self.assertEqual(self.history.level("1s").series(0, 0), (200, [1.0, 2.0, 3.0], [1, 2, 3]))
+
+    def test_missed_samples_are_zero(self):
+        # A real gap (eg the service paused) is still recorded as nothing there.
+        for timestamp in (300.0, 301.0, 304.0, 305.0):
+            self.history.record([3, 3], timestamp)
+        self.assertEqual(self.history.level("1s").series(0, 0)[1], [3.0, 3.0, 0.0, 0.0, 3.0])
+
+    def test_coarser_level(self):
+        for i in range(12):
+            self.history.record([i, 0], 500.0 + i + (-0.03 if i % 2 else 0.02))
+        first, means, peaks = self.history.level("5s").series(0, 0)
+        self.assertEqual(first, 100)
+        self.assertEqual(means, [2.0, 7.0])
+        self.assertEqual(peaks, [4, 9])
+
+
+if __name__ == "__main__":
+    unittest.main()